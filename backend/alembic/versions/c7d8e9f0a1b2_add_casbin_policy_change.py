@@ -0,0 +1,42 @@
+"""add_casbin_policy_change
+
+Journal des changements de policies Casbin : l'id sert de version
+partagée entre workers.
+
+Revision ID: c7d8e9f0a1b2
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c7d8e9f0a1b2"
+down_revision = "a1b2c3d4e5f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "t_casbin_policy_change",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("subject_type", sa.String(length=20), nullable=False),
+        sa.Column("subject_id", sa.String(length=36), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_t_casbin_policy_change_created_at"),
+        "t_casbin_policy_change",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_t_casbin_policy_change_created_at"),
+        table_name="t_casbin_policy_change",
+    )
+    op.drop_table("t_casbin_policy_change")
@@ -0,0 +1,53 @@
+"""add_notification_outbox
+
+Outbox des notifications de planning, drainée par un worker dédié.
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "d8e9f0a1b2c3"
+down_revision = "c7d8e9f0a1b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "t_notification_outbox",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("planning_id", sa.String(length=36), nullable=False),
+        sa.Column("membre_id", sa.String(length=36), nullable=False),
+        sa.Column("event", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("available_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_t_notification_outbox_key",
+        "t_notification_outbox",
+        ["planning_id", "membre_id", "event"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_t_notification_outbox_due",
+        "t_notification_outbox",
+        ["status", "available_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_t_notification_outbox_due", table_name="t_notification_outbox")
+    op.drop_index("ix_t_notification_outbox_key", table_name="t_notification_outbox")
+    op.drop_table("t_notification_outbox")
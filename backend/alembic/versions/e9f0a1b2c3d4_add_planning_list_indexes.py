@@ -0,0 +1,38 @@
+"""add_planning_list_indexes
+
+Index composites des listes de plannings (filtre campus/ministère +
+pagination keyset sur date_debut, id) et du chargement slots/affectations.
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "e9f0a1b2c3d4"
+down_revision = "d8e9f0a1b2c3"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_t_activite_campus_date", "t_activite", ["campus_id", "date_debut", "id"]),
+    (
+        "ix_t_activite_ministere_date",
+        "t_activite",
+        ["ministere_organisateur_id", "date_debut", "id"],
+    ),
+    ("ix_t_slot_planning_date", "t_slot", ["planning_id", "date_debut", "id"]),
+    ("ix_t_affectation_slot", "t_affectation", ["slot_id"]),
+    ("ix_t_affectation_membre_slot", "t_affectation", ["membre_id", "slot_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
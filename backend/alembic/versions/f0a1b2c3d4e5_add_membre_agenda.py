@@ -0,0 +1,68 @@
+"""add_membre_agenda
+
+Agenda matérialisé des membres : une ligne par affectation d'un planning
+actif, lue par parcours d'index (membre, campus, date_debut). Rempli ici
+à partir des affectations existantes, puis tenu à jour par l'application.
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "f0a1b2c3d4e5"
+down_revision = "e9f0a1b2c3d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "t_membre_agenda",
+        sa.Column("affectation_id", sa.String(), nullable=False),
+        sa.Column("membre_id", sa.String(length=36), nullable=False),
+        sa.Column("campus_id", sa.String(length=36), nullable=False),
+        sa.Column("planning_id", sa.String(length=36), nullable=False),
+        sa.Column("date_debut", sa.DateTime(), nullable=False),
+        sa.Column("date_fin", sa.DateTime(), nullable=False),
+        sa.Column("nom_creneau", sa.String(length=100), nullable=False),
+        sa.Column("role_code", sa.String(length=50), nullable=False),
+        sa.Column("statut_affectation_code", sa.String(length=20), nullable=False),
+        sa.Column("activite_type", sa.String(length=100), nullable=False),
+        sa.Column("lieu", sa.String(length=255), nullable=True),
+        sa.Column("campus_nom", sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["affectation_id"], ["t_affectation.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("affectation_id"),
+    )
+    op.create_index(
+        "ix_t_membre_agenda_range",
+        "t_membre_agenda",
+        ["membre_id", "campus_id", "date_debut"],
+        unique=False,
+    )
+    op.execute("""
+        INSERT INTO t_membre_agenda (
+            affectation_id, membre_id, campus_id, planning_id, date_debut,
+            date_fin, nom_creneau, role_code, statut_affectation_code,
+            activite_type, lieu, campus_nom
+        )
+        SELECT a.id, a.membre_id, act.campus_id, s.planning_id, s.date_debut,
+               s.date_fin, s.nom_creneau, a.role_code, a.statut_affectation_code,
+               act.type, act.lieu, c.nom
+        FROM t_affectation a
+        JOIN t_slot s ON s.id = a.slot_id
+        JOIN t_planningservice p ON p.id = s.planning_id
+        JOIN t_activite act ON act.id = p.activite_id
+        JOIN t_campus c ON c.id = act.campus_id
+        WHERE p.deleted_at IS NULL AND act.deleted_at IS NULL
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_t_membre_agenda_range", table_name="t_membre_agenda")
+    op.drop_table("t_membre_agenda")
@@ -0,0 +1,93 @@
+"""indisponibilite_date_columns
+
+Dates d'indisponibilité en colonnes DATE natives (auparavant des chaînes
+ISO), et index (membre_id, date_debut, date_fin) pour les recherches de
+chevauchement par membre.
+
+L'ancien validateur n'imposait que 1 <= jour <= 31 : des valeurs comme
+2026-02-30 peuvent exister et feraient échouer le cast. Une passe
+préalable les normalise (jour borné à la fin du mois, forme YYYY-MM-DD) et
+remplace par NULL ce qui n'est pas une date.
+
+Revision ID: f1a2b3c4d5e6
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+import calendar
+from datetime import date
+from typing import Optional
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "f1a2b3c4d5e6"
+down_revision = "f0a1b2c3d4e5"
+branch_labels = None
+depends_on = None
+
+
+def normalize_date(value: Optional[str]) -> Optional[str]:
+    """Chaîne acceptée par l'ancien validateur → date ISO valide, sinon None."""
+    if value is None:
+        return None
+    try:
+        year, month, day = map(int, value.split("-"))
+        last_day = calendar.monthrange(year, month)[1]
+        return date(year, month, min(max(day, 1), last_day)).isoformat()
+    except ValueError:
+        return None
+
+
+def _normalize_rows() -> None:
+    table = sa.table(
+        "t_indisponibilite",
+        sa.column("id", sa.String),
+        sa.column("date_debut", sa.String),
+        sa.column("date_fin", sa.String),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(table.c.id, table.c.date_debut, table.c.date_fin)
+    ).all()
+    for row_id, debut, fin in rows:
+        cleaned = (normalize_date(debut), normalize_date(fin))
+        if cleaned != (debut, fin):
+            bind.execute(
+                table.update()
+                .where(table.c.id == row_id)
+                .values(date_debut=cleaned[0], date_fin=cleaned[1])
+            )
+
+
+def upgrade() -> None:
+    _normalize_rows()
+    with op.batch_alter_table("t_indisponibilite") as batch:
+        for column in ("date_debut", "date_fin"):
+            batch.alter_column(
+                column,
+                existing_type=sa.String(),
+                type_=sa.Date(),
+                existing_nullable=True,
+                postgresql_using=f"{column}::date",
+            )
+    op.create_index(
+        "ix_t_indisponibilite_periode",
+        "t_indisponibilite",
+        ["membre_id", "date_debut", "date_fin"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_t_indisponibilite_periode", table_name="t_indisponibilite")
+    with op.batch_alter_table("t_indisponibilite") as batch:
+        for column in ("date_debut", "date_fin"):
+            batch.alter_column(
+                column,
+                existing_type=sa.Date(),
+                type_=sa.String(),
+                existing_nullable=True,
+                postgresql_using=f"to_char({column}, 'YYYY-MM-DD')",
+            )
@@ -0,0 +1,29 @@
+"""membre_agenda_campus_index
+
+Index (campus_id, date_debut) sur t_membre_agenda pour les statistiques
+de charge d'un campus sur une période.
+
+Revision ID: f2a3b4c5d6e7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "f2a3b4c5d6e7"
+down_revision = "f1a2b3c4d5e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_t_membre_agenda_campus_date",
+        "t_membre_agenda",
+        ["campus_id", "date_debut"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_t_membre_agenda_campus_date", table_name="t_membre_agenda")
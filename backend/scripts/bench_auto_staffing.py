@@ -0,0 +1,95 @@
+"""Benchmark du remplissage automatique sur des campus synthétiques.
+
+Usage (aucune base requise, le solveur tourne en mémoire) :
+    python scripts/bench_auto_staffing.py [100x52 300x52 500x104]
+
+Chaque argument MEMBRESxSEMAINES génère un campus : 3 services par
+semaine, 4 créneaux par service (2 à 4 places, 1 rôle parmi 6), chaque
+membre détenant 1 à 3 rôles et ~10 % de jours indisponibles. Affiche la
+durée de résolution, le taux de remplissage, l'écart de charge et les
+semaines consécutives.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from services.auto_staffing_service import (  # noqa: E402
+    SlotDemand,
+    StaffingCandidate,
+    solve_staffing,
+)
+
+ROLES = ("CHANT", "BATTERIE", "CLAVIER", "SON", "ACCUEIL", "PROJECTION")
+SERVICES = ((0, 19), (3, 19), (6, 9))  # (jour de la semaine, heure)
+CRENEAUX_PAR_SERVICE = 4
+
+
+def synthetic_campus(
+    nb_membres: int, nb_semaines: int, seed: int = 42
+) -> Tuple[List[SlotDemand], List[StaffingCandidate]]:
+    """Créneaux et candidats reproductibles (graine fixe)."""
+    rng = random.Random(seed)
+    lundi = datetime(2030, 1, 7)
+    demands = []
+    for semaine in range(nb_semaines):
+        for jour, heure in SERVICES:
+            debut = lundi + timedelta(weeks=semaine, days=jour, hours=heure)
+            for c in range(CRENEAUX_PAR_SERVICE):
+                demands.append(
+                    SlotDemand(
+                        slot_id=f"s{semaine}-{jour}-{c}",
+                        planning_id=f"p{semaine}-{jour}",
+                        debut=debut,
+                        fin=debut + timedelta(hours=2),
+                        manquants=rng.randint(2, 4),
+                        roles=frozenset({ROLES[(semaine + jour + c) % len(ROLES)]}),
+                    )
+                )
+    jours = [(lundi + timedelta(days=d)).date() for d in range(nb_semaines * 7)]
+    candidates = [
+        StaffingCandidate(
+            membre_id=f"m{i}",
+            roles=tuple(rng.sample(ROLES, rng.randint(1, 3))),
+            indisponible={j for j in jours if rng.random() < 0.1},
+        )
+        for i in range(nb_membres)
+    ]
+    return demands, candidates
+
+
+def run(nb_membres: int, nb_semaines: int) -> None:
+    demands, candidates = synthetic_campus(nb_membres, nb_semaines)
+    started = time.perf_counter()
+    choix, manques = solve_staffing(demands, candidates)
+    elapsed = time.perf_counter() - started
+
+    places = sum(d.manquants for d in demands)
+    charges = [c.charge for c in candidates if c.charge]
+    print(
+        f"{nb_membres:>5} membres x {nb_semaines:>3} sem. | "
+        f"{len(demands):>6} créneaux | {elapsed * 1000:8.1f} ms | "
+        f"rempli {100 * len(choix) / places:5.1f} % "
+        f"({sum(manques.values())} manquants) | "
+        f"charge min/max/σ {min(charges, default=0)}/{max(charges, default=0)}/"
+        f"{statistics.pstdev(charges) if charges else 0:.2f} | "
+        f"semaines consécutives {sum(c.enchaine for c in choix)}"
+    )
+
+
+def main(sizes: List[Tuple[int, int]]) -> None:
+    for nb_membres, nb_semaines in sizes:
+        run(nb_membres, nb_semaines)
+
+
+if __name__ == "__main__":
+    main(
+        [tuple(map(int, arg.split("x"))) for arg in sys.argv[1:]]  # type: ignore[misc]
+        or [(100, 52), (300, 52), (500, 104)]
+    )
@@ -0,0 +1,190 @@
+"""Benchmark lecture des plannings complets : graphe ORM vs projection.
+
+Usage (base de TEST uniquement, tout est annulé en fin de run) :
+    DATABASE_URL=... python scripts/bench_planning_read.py [1000 10000]
+
+Les arguments sont des nombres de slots (10 slots et 2 affectations par
+planning). Vérifie aussi que les deux chemins produisent le même JSON.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, cast
+from uuid import uuid4
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+from sqlmodel import Session, col, select  # noqa: E402
+
+from conf.db.database import Database  # noqa: E402
+from models import (  # noqa: E402
+    Activite,
+    Campus,
+    Membre,
+    Ministere,
+    Organisation,
+    PlanningService,
+)
+from models.planning_model import PlanningFullRead  # noqa: E402
+from models.schema_db_model import (  # noqa: E402
+    Affectation,
+    Slot,
+    StatutAffectation,
+    StatutPlanning,
+)
+from repositories.planning_repository import PlanningRepository  # noqa: E402
+from services.planing_service import PlanningServiceSvc  # noqa: E402
+
+SLOTS_PER_PLANNING = 10
+
+
+def seed(session: Session, nb_slots: int) -> str:
+    """Insère nb_slots slots répartis sur des plannings d'un nouveau campus."""
+    session.merge(StatutPlanning(code="BROUILLON", libelle="Brouillon"))
+    session.merge(StatutAffectation(code="PROPOSE", libelle="Propose"))
+    org = Organisation(nom=f"Bench {uuid4()}", date_creation="2024-01-01")
+    session.add(org)
+    session.flush()
+    campus = Campus(nom=f"Bench {uuid4()}", ville="V", pays="F", organisation_id=org.id)
+    ministere = Ministere(nom=f"Bench {uuid4()}", date_creation="2024-01-01")
+    membres = [Membre(nom=f"M{i}", prenom="Bench", email=None) for i in range(20)]
+    session.add_all([campus, ministere, *membres])
+    session.flush()
+
+    now = datetime.now()
+    activites, plannings, slots, affectations = [], [], [], []
+    for p in range(nb_slots // SLOTS_PER_PLANNING):
+        act_id, plan_id = str(uuid4()), str(uuid4())
+        debut = now + timedelta(days=p)
+        activites.append(
+            {
+                "id": act_id,
+                "type": "Culte",
+                "date_debut": debut,
+                "date_fin": debut + timedelta(hours=3),
+                "campus_id": campus.id,
+                "ministere_organisateur_id": ministere.id,
+            }
+        )
+        plannings.append(
+            {"id": plan_id, "activite_id": act_id, "statut_code": "BROUILLON"}
+        )
+        for s in range(SLOTS_PER_PLANNING):
+            slot_id = str(uuid4())
+            slots.append(
+                {
+                    "id": slot_id,
+                    "planning_id": plan_id,
+                    "nom_creneau": f"Créneau {s}",
+                    "date_debut": debut + timedelta(minutes=10 * s),
+                    "date_fin": debut + timedelta(minutes=10 * s + 10),
+                    "nb_personnes_requis": 2,
+                }
+            )
+            for a in range(2):
+                affectations.append(
+                    {
+                        "id": str(uuid4()),
+                        "slot_id": slot_id,
+                        "membre_id": membres[(s + a) % len(membres)].id,
+                        "role_code": "BENCH",
+                        "statut_affectation_code": "PROPOSE",
+                        "presence_confirmee": False,
+                        "ministere_id": ministere.id if a else None,
+                    }
+                )
+    for model, rows in (
+        (Activite, activites),
+        (PlanningService, plannings),
+        (Slot, slots),
+        (Affectation, affectations),
+    ):
+        for start in range(0, len(rows), 1000):
+            session.exec(  # type: ignore[call-overload]
+                insert(cast(Any, model).__table__).values(rows[start : start + 1000])
+            )
+    session.flush()
+    return campus.id
+
+
+def orm_read(session: Session, campus_id: str) -> list:
+    """Ancien chemin : graphe ORM (selectinload) + model_validate."""
+    svc = PlanningServiceSvc(session)
+    query = (
+        select(PlanningService)
+        .join(Activite)
+        .where(Activite.campus_id == campus_id)
+        .options(
+            selectinload(PlanningService.activite),  # type: ignore[arg-type]
+            selectinload(PlanningService.slots)  # type: ignore[arg-type]
+            .selectinload(Slot.affectations)  # type: ignore[arg-type]
+            .selectinload(Affectation.membre),  # type: ignore[arg-type]
+            selectinload(PlanningService.slots)  # type: ignore[arg-type]
+            .selectinload(Slot.affectations)  # type: ignore[arg-type]
+            .selectinload(Affectation.ministere),  # type: ignore[arg-type]
+        )
+    )
+    result = []
+    for planning in session.exec(query).unique().all():
+        dto = PlanningFullRead.model_validate(planning)
+        if planning.activite:
+            dto.activite = svc._build_activite_full(  # pylint: disable=W0212
+                planning.activite
+            )
+        result.append(dto)
+    return result
+
+
+def projection_read(session: Session, campus_id: str) -> list:
+    return PlanningRepository(session).list_full_projection(
+        col(Activite.campus_id) == campus_id
+    )
+
+
+def _as_json(dtos: list) -> list:
+    data = [d.model_dump(mode="json") for d in dtos]
+    for planning in data:
+        planning["slots"].sort(key=lambda s: (s["date_debut"], s["id"]))
+        for slot in planning["slots"]:
+            slot["affectations"].sort(key=lambda a: a["id"])
+    return sorted(data, key=lambda p: p["id"])
+
+
+def _timed(session: Session, fn, campus_id: str, runs: int = 3):
+    best, result = float("inf"), []
+    for _ in range(runs):
+        session.expunge_all()
+        started = time.perf_counter()
+        result = fn(session, campus_id)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(sizes: list[int]) -> None:
+    engine = Database.get_engine()
+    if os.getenv("ENV") == "production" or "test" not in str(engine.url):
+        print("❌ Benchmark réservé à une base de test.")
+        sys.exit(1)
+    for nb_slots in sizes:
+        with engine.connect() as conn:
+            trans = conn.begin()
+            session = Session(bind=conn, join_transaction_mode="create_savepoint")
+            campus_id = seed(session, nb_slots)
+            orm_s, orm_res = _timed(session, orm_read, campus_id)
+            proj_s, proj_res = _timed(session, projection_read, campus_id)
+            same = _as_json(orm_res) == _as_json(proj_res)
+            print(
+                f"{nb_slots:>6} slots | ORM {orm_s * 1000:8.1f} ms | "
+                f"projection {proj_s * 1000:8.1f} ms | x{orm_s / proj_s:4.1f} | "
+                f"JSON identique : {'oui' if same else 'NON'}"
+            )
+            session.close()
+            trans.rollback()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000])
@@ -24,6 +24,12 @@ class Database:
             cls._engine = create_engine(
                 url, connect_args=connect_args, poolclass=poolclass, echo=False
             )
+            # pylint: disable=import-outside-toplevel
+            from repositories.membre_agenda_repository import (
+                register_agenda_listeners,
+            )
+
+            register_agenda_listeners()
         return cls._engine
 
     @classmethod
@@ -1,6 +1,6 @@
 # pylint: disable=too-many-lines
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Type, TypeVar
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -1167,17 +1167,19 @@ class SeedService:
                 Indisponibilite.motif == data["motif"],
             )
         ).first()
+        debut = date.fromisoformat(data["date_debut"])
+        fin = date.fromisoformat(data["date_fin"])
         if existing:
-            existing.date_debut = data["date_debut"]
-            existing.date_fin = data["date_fin"]
+            existing.date_debut = debut
+            existing.date_fin = fin
             existing.validee = data["validee"]
             self.db.add(existing)
             self.db.flush()
         else:
             indispo = Indisponibilite(
                 membre_id=membre_id,
-                date_debut=data["date_debut"],
-                date_fin=data["date_fin"],
+                date_debut=debut,
+                date_fin=fin,
                 motif=data["motif"],
                 validee=data["validee"],
             )
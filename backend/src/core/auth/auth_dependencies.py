@@ -17,6 +17,7 @@ from models.schema_db_model import MembreCampusLink
 
 from .auth_repository import AuthRepository
 from .auth_utils import _affectation_valide, _role_name
+from .principal_cache import principal_cache
 
 
 def get_current_active_user(
@@ -64,25 +65,20 @@ def get_current_active_user(
             detail="Token invalide: jti manquant",
         )
 
-    repo = AuthRepository(db)
-
-    # 3. VERIFICATION DE LA BLACKLIST (Logout)
-    # On vérifie avant de charger l'utilisateur pour économiser une requête si révoqué
-    if repo.is_token_revoked(jti):
+    # 3. Cache des principaux (jti) — un hit évite blacklist + chargement user
+    entry = principal_cache.get(jti)
+    if entry is not None and entry.revoked:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Cette session a été fermée (déconnexion)",
         )
 
-    # 4. Récupération de l'utilisateur
-    user = repo.get_user_by_username(username)
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Utilisateur introuvable"
-        )
+    if entry is not None:
+        user = principal_cache.attach(entry, db)
+    else:
+        user = _load_principal(db, jti, username, payload.get("exp"))
 
-    # 5. Ta validation stricte du statut actif
+    # 4. Ta validation stricte du statut actif
     if not user.actif:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Utilisateur inactif"
@@ -95,6 +91,30 @@ def get_current_active_user(
     return user
 
 
+def _load_principal(
+    db: Session, jti: str, username: str, token_exp: Optional[float]
+) -> Utilisateur:
+    """Vérifie la blacklist puis charge l'utilisateur (chemin miss du cache)."""
+    repo = AuthRepository(db)
+
+    # On vérifie avant de charger l'utilisateur pour économiser une requête si révoqué
+    if repo.is_token_revoked(jti):
+        principal_cache.mark_revoked(jti, token_exp)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Cette session a été fermée (déconnexion)",
+        )
+
+    user = repo.get_user_by_username(username)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Utilisateur introuvable"
+        )
+
+    principal_cache.store(jti, user, token_exp)
+    return user
+
+
 class RoleChecker:
     """Vérifie si l'utilisateur possède un rôle actif et valide temporellement."""
 
@@ -238,6 +258,8 @@ class CasbinGuard:
     - Si l'enforcer n'est pas encore initialisé, délègue à fallback_roles.
     - Super Admin : bypass total.
     - Domain résolu depuis path_params ou query_params (ministere_id).
+    - Refus mémorisés (cache négatif) : pas de resynchronisation répétée.
+    - Journal des policies relu au plus toutes les CASBIN_SYNC_INTERVAL_MS.
     """
 
     def __init__(
@@ -259,14 +281,21 @@ class CasbinGuard:
     ) -> list[str]:
         from .casbin_enforcer import (  # pylint: disable=import-outside-toplevel
             WILDCARD_DOMAIN,
-            build_enforcer,
+            enforce,
             get_enforcer,
+            is_denial_cached,
+            refresh_policies_if_due,
+            remember_denial,
+            sync_user_groupings,
         )
 
         enf = get_enforcer()
         if enf is None:
             return self._fallback(user)
 
+        # Rattrape les changements de policies publiés par les autres workers
+        refresh_policies_if_due()
+
         if _is_super_admin(user):
             return [RoleName.SUPER_ADMIN.name]
 
@@ -275,25 +304,29 @@ class CasbinGuard:
             or request.query_params.get("ministere_id")
             or WILDCARD_DOMAIN
         )
+        casbin_request = (user.id, domain, self.obj, self.act)
 
-        if not enf.enforce(user.id, domain, self.obj, self.act):
-            # L'enforcer peut être périmé après un reset/seed DB.
-            # Si le fallback confirme que l'utilisateur a bien le rôle
-            # en base, on reconstruit l'enforcer et on réessaie une fois.
+        if enforce(enf, casbin_request):
+            return [user.id]
+
+        # Refus récent : on répond 403 sans resynchroniser (pas de tempête).
+        if not is_denial_cached(casbin_request):
+            # Les groupings de l'utilisateur peuvent être périmés après un
+            # reset/seed DB. Si le fallback confirme le rôle en base, on
+            # resynchronise ce seul utilisateur et on réessaie une fois.
             try:
                 self._fallback(user)
-                build_enforcer(db)
-                enf = get_enforcer()
+                sync_user_groupings(db, user.id)
+                if enforce(enf, casbin_request):
+                    return [user.id]
             except HTTPException:
-                enf = None
+                pass
+            remember_denial(casbin_request)
 
-            if enf is None or not enf.enforce(user.id, domain, self.obj, self.act):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Droits insuffisants pour cette action",
-                )
-
-        return [user.id]
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Droits insuffisants pour cette action",
+        )
 
 
 def get_active_campus(
@@ -7,6 +7,8 @@ from sqlmodel import Session, delete, select
 from models import AffectationRole, TokenBlacklist, Utilisateur
 from models.schema_db_model import Role
 
+from .revoked_filter import revoked_filter
+
 
 class AuthRepository:
     """Accès aux données pour l'authentification."""
@@ -48,9 +50,17 @@ class AuthRepository:
         revoked_token = TokenBlacklist(jti=jti, expires_at=expires_at)
         self.db.add(revoked_token)
         self.db.flush()
+        revoked_filter.add(jti)
 
     def is_token_revoked(self, jti: str) -> bool:
-        """Vérifie si un JTI est présent dans la table des révocations."""
+        """Vérifie si un JTI est présent dans la table des révocations.
+
+        Le filtre de Bloom écarte sans requête les JTI jamais révoqués ;
+        la table n'est lue que sur un positif.
+        """
+        revoked_filter.sync_if_due(self.db)
+        if not revoked_filter.might_contain(jti):
+            return False
         statement = select(TokenBlacklist).where(TokenBlacklist.jti == jti)
         return self.db.exec(statement).first() is not None
 
@@ -58,10 +68,13 @@ class AuthRepository:
         """Supprime les JTI dont la date d'expiration est dépassée.
 
         Appelé à chaque login pour limiter la croissance de la table
-        t_revoked_tokens sans nécessiter de job externe.
+        t_revoked_tokens sans nécessiter de job externe. Le filtre des
+        révocations est reconstruit si des lignes ont été supprimées.
         """
         now = datetime.now(tz=timezone.utc)
-        self.db.exec(  # type: ignore[call-overload]
+        result = self.db.exec(  # type: ignore[call-overload]
             delete(TokenBlacklist).where(cast(Any, TokenBlacklist.expires_at) <= now)
         )
         self.db.flush()
+        if result.rowcount:
+            revoked_filter.load(self.db)
@@ -7,6 +7,7 @@ from sqlmodel import Session
 from core.audit import audit
 from core.auth.auth_repository import AuthRepository
 from core.auth.auth_utils import _affectation_valide
+from core.auth.principal_cache import principal_cache
 from core.auth.security import (
     create_access_token,
     create_refresh_token,
@@ -166,6 +167,7 @@ class AuthService:
                 jti=jti,
                 expires_at=datetime.fromtimestamp(exp_ts, tz=timezone.utc),
             )
+            principal_cache.mark_revoked(jti, exp_ts)
 
         response = self._build_token_response(user)
         self.db.commit()
@@ -192,6 +194,7 @@ class AuthService:
         hashed_new_password: str = get_password_hash(new_password)
         self.repo.update_password(user, hashed_new_password)
         self.db.commit()
+        principal_cache.invalidate_user(utilisateur_id)
         audit("password_changed", user_id=utilisateur_id)
 
     def logout(self, token_payload: dict) -> None:
@@ -207,6 +210,7 @@ class AuthService:
         expires_at = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
         self.repo.add_to_blacklist(jti=jti, expires_at=expires_at)
         self.db.commit()
+        principal_cache.mark_revoked(jti, exp_timestamp)
         audit(
             "logout",
             user_id=token_payload.get("user_id"),
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import casbin  # type: ignore[import-untyped]
 from casbin_sqlalchemy_adapter import Adapter  # type: ignore[import-untyped]
 from sqlalchemy.orm import selectinload
-from sqlmodel import Session, select
+from sqlmodel import Session, col, delete, func, or_, select
 
 from conf.db.database import Database
+from core.settings import settings as stng
 from mla_enum import RoleName
-from models.schema_db_model import AffectationRole, Role
+from models.schema_db_model import AffectationRole, CasbinPolicyChange, Role
 
 from .auth_utils import _affectation_valide, _role_name
 
@@ -39,11 +43,46 @@ CONF_PATH = os.path.join(os.path.dirname(__file__), "casbin_model.conf")
 WILDCARD_DOMAIN = "*"
 
 
+# Requête Casbin : (sub, dom, obj, act)
+CasbinRequest = Tuple[str, str, str, str]
+# Policy p (sub, dom, obj, act) et grouping g (user, role, dom)
+PolicyRule = Tuple[str, str, str, str]
+GroupingRule = Tuple[str, str, str]
+
+# Borne du cache négatif — au-delà, il est vidé plutôt que balayé
+_DENIED_MAX_ENTRIES = 10_000
+
+# Sujets du journal t_casbin_policy_change
+SUBJECT_USER = "user"
+SUBJECT_ROLE = "role"
+
+# Les ids (séquence) peuvent être committés dans le désordre : on relit
+# les changements récents pour rattraper ceux committés après une version
+# plus haute déjà vue.
+_CHANGE_OVERLAP = timedelta(seconds=10)
+# Au-delà, un worker redémarré repart de build_enforcer()
+_CHANGE_RETENTION = timedelta(days=1)
+
+
 @dataclass
 class _EnforcerState:
-    """Singleton mutable contenant l'enforcer après démarrage."""
+    """Singleton mutable contenant l'enforcer après démarrage.
+
+    denied : cache négatif (requête → échéance monotonic) pour que les
+    refus répétés ne déclenchent ni resynchronisation ni rebuild.
+    version : dernier id de t_casbin_policy_change appliqué localement.
+    recent : ids déjà appliqués dans la fenêtre de recouvrement.
+    policy_lock : sérialise enforce() et les mises à jour delta, pour
+    qu'aucune évaluation ne voie un sujet entre retrait et ré-ajout.
+    """
 
     enforcer: Optional[casbin.Enforcer] = field(default=None)
+    denied: Dict[CasbinRequest, float] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    policy_lock: threading.Lock = field(default_factory=threading.Lock)
+    version: int = 0
+    last_check: float = 0.0
+    recent: Dict[int, datetime] = field(default_factory=dict)
 
 
 _state = _EnforcerState()
@@ -57,6 +96,45 @@ def get_enforcer() -> Optional[casbin.Enforcer]:
 def set_enforcer(enf: Optional[casbin.Enforcer]) -> None:
     """Injecte un enforcer (usage test uniquement)."""
     _state.enforcer = enf
+    clear_denials()
+
+
+def enforce(enf: casbin.Enforcer, request: CasbinRequest) -> bool:
+    """Évalue une requête sous le verrou des policies."""
+    with _state.policy_lock:
+        return bool(enf.enforce(*request))
+
+
+def is_denial_cached(request: CasbinRequest) -> bool:
+    """True si la requête a été refusée récemment (cache négatif vivant)."""
+    with _state.lock:
+        deadline = _state.denied.get(request)
+        if deadline is None:
+            return False
+        if deadline <= time.monotonic():
+            del _state.denied[request]
+            return False
+        return True
+
+
+def remember_denial(request: CasbinRequest) -> None:
+    """Mémorise un refus pour CASBIN_DENY_CACHE_SECONDS."""
+    if stng.CASBIN_DENY_CACHE_SECONDS <= 0:
+        return
+    with _state.lock:
+        if len(_state.denied) >= _DENIED_MAX_ENTRIES:
+            _state.denied.clear()
+        _state.denied[request] = time.monotonic() + stng.CASBIN_DENY_CACHE_SECONDS
+
+
+def clear_denials(utilisateur_id: Optional[str] = None) -> None:
+    """Oublie les refus d'un utilisateur, ou tous si utilisateur_id est None."""
+    with _state.lock:
+        if utilisateur_id is None:
+            _state.denied.clear()
+            return
+        for request in [r for r in _state.denied if r[0] == utilisateur_id]:
+            del _state.denied[request]
 
 
 def _add_default_policies(enf: casbin.Enforcer) -> None:
@@ -79,42 +157,54 @@ def _add_default_policies(enf: casbin.Enforcer) -> None:
         enf.add_policy(role, dom, obj, act)
 
 
-def _add_role_permission_policies(enf: casbin.Enforcer, db: Session) -> None:
+def _role_permission_rules(
+    db: Session, role_id: Optional[str] = None
+) -> List[PolicyRule]:
     """Traduit les permissions DB des rôles custom en policies Casbin.
 
     Les rôles built-in sont couverts par _add_default_policies.
     Les rôles créés via l'UI n'ont pas de policies statiques :
     cette fonction les génère depuis t_role_permission.
+    role_id restreint la traduction à un seul rôle (mise à jour delta).
     """
     built_in = {r.name for r in RoleName}
-    roles = db.exec(
-        select(Role).options(  # type: ignore[arg-type]
-            selectinload(Role.permissions)  # type: ignore[arg-type]
-        )
-    ).all()
+    stmt = select(Role).options(  # type: ignore[arg-type]
+        selectinload(Role.permissions)  # type: ignore[arg-type]
+    )
+    if role_id is not None:
+        stmt = stmt.where(Role.id == role_id)
+    roles = db.exec(stmt).all()
 
+    rules: List[PolicyRule] = []
     for role in roles:
         role_name = _role_name(role.libelle or "")
         if role_name in built_in:
             continue  # déjà couvert par _add_default_policies
         for perm in role.permissions:
             for obj, act in _PERMISSION_TO_CASBIN.get(perm.code, []):
-                enf.add_policy(role_name, WILDCARD_DOMAIN, obj, act)
+                rules.append((role_name, WILDCARD_DOMAIN, obj, act))
+    return rules
 
 
-def _add_groupings(enf: casbin.Enforcer, db: Session) -> None:
+def _grouping_rules(
+    db: Session, utilisateur_id: Optional[str] = None
+) -> List[GroupingRule]:
     """Convertit les AffectationRole actives en grouping policies Casbin.
 
     - Affectation sans contexte → g(user_id, role, '*').
     - Affectation avec contexte → g(user_id, role, ministere_id).
+    utilisateur_id restreint la conversion à un seul utilisateur.
     """
     stmt = (
         select(AffectationRole)
         .options(selectinload(AffectationRole.role))  # type: ignore[arg-type]
         .options(selectinload(AffectationRole.contextes))  # type: ignore[arg-type]
     )
+    if utilisateur_id is not None:
+        stmt = stmt.where(AffectationRole.utilisateur_id == utilisateur_id)
     affectations = db.exec(stmt).all()
 
+    rules: List[GroupingRule] = []
     for aff in affectations:
         if not (aff.role and aff.role.libelle is not None):
             continue
@@ -124,12 +214,13 @@ def _add_groupings(enf: casbin.Enforcer, db: Session) -> None:
         role = _role_name(aff.role.libelle)
 
         # Grouping global '*' — permet l'accès aux ressources non scopées (chants…)
-        enf.add_grouping_policy(aff.utilisateur_id, role, WILDCARD_DOMAIN)
+        rules.append((aff.utilisateur_id, role, WILDCARD_DOMAIN))
 
         # Groupings scopés en plus, pour les vérifications par ministère
         for ctx in aff.contextes:
             if ctx.ministere_id and ctx.ministere_id != WILDCARD_DOMAIN:
-                enf.add_grouping_policy(aff.utilisateur_id, role, ctx.ministere_id)
+                rules.append((aff.utilisateur_id, role, ctx.ministere_id))
+    return rules
 
 
 def build_enforcer(db: Session) -> None:
@@ -137,12 +228,144 @@ def build_enforcer(db: Session) -> None:
 
     À appeler une seule fois au démarrage (lifespan FastAPI).
     L'adaptateur SQLAlchemy crée la table casbin_rule si absente.
+    L'enforcer est entièrement construit avant d'être publié.
     """
     engine: Any = Database.get_engine()
     adapter: Any = Adapter(engine)
     enf: casbin.Enforcer = casbin.Enforcer(CONF_PATH, adapter)
     enf.clear_policy()
     _add_default_policies(enf)
-    _add_role_permission_policies(enf, db)
-    _add_groupings(enf, db)
-    _state.enforcer = enf
+    for rule in _role_permission_rules(db):
+        enf.add_policy(*rule)
+    for grouping in _grouping_rules(db):
+        enf.add_grouping_policy(*grouping)
+    with _state.policy_lock:
+        _state.enforcer = enf
+    _state.version = _latest_change_id(db)
+    _state.recent.clear()
+    _state.last_check = time.monotonic()
+    clear_denials()
+
+
+def sync_user_groupings(db: Session, utilisateur_id: str) -> None:
+    """Recalcule les grouping policies d'un seul utilisateur.
+
+    À appeler après toute modification de ses AffectationRole
+    (les changements doivent être flushés). Sans effet si l'enforcer
+    n'est pas initialisé. Les règles sont lues hors verrou ; retrait et
+    ré-ajout se font sous policy_lock, atomiquement pour enforce().
+    """
+    enf = get_enforcer()
+    if enf is None:
+        return
+    groupings = _grouping_rules(db, utilisateur_id=utilisateur_id)
+    with _state.policy_lock:
+        enf.remove_filtered_grouping_policy(0, utilisateur_id)
+        for grouping in groupings:
+            enf.add_grouping_policy(*grouping)
+    clear_denials(utilisateur_id)
+
+
+def sync_role_policies(db: Session, role_id: str) -> None:
+    """Recalcule les policies d'un rôle custom après changement de permissions."""
+    enf = get_enforcer()
+    if enf is None:
+        return
+    role = db.get(Role, role_id)
+    if role is None:
+        return
+    role_name = _role_name(role.libelle or "")
+    if role_name in {r.name for r in RoleName}:
+        return  # policies statiques (_add_default_policies)
+    rules = _role_permission_rules(db, role_id=role_id)
+    with _state.policy_lock:
+        enf.remove_filtered_policy(0, role_name)
+        for rule in rules:
+            enf.add_policy(*rule)
+    # Tous les titulaires du rôle sont concernés
+    clear_denials()
+
+
+# ------------------------------------------------------------------ #
+#  SYNCHRONISATION MULTI-WORKERS
+# ------------------------------------------------------------------ #
+
+
+def _latest_change_id(db: Session) -> int:
+    return (
+        db.exec(
+            select(func.max(CasbinPolicyChange.id))  # pylint: disable=not-callable
+        ).one()
+        or 0
+    )
+
+
+def publish_policy_change(db: Session, subject_type: str, subject_id: str) -> None:
+    """Journalise un changement de policies dans la transaction courante.
+
+    Les autres workers le rejouent via refresh_policies(). Les entrées
+    plus anciennes que la rétention sont purgées au passage.
+    """
+    now = datetime.now(tz=timezone.utc)
+    db.exec(  # type: ignore[call-overload]
+        delete(CasbinPolicyChange).where(
+            col(CasbinPolicyChange.created_at) < now - _CHANGE_RETENTION
+        )
+    )
+    db.add(CasbinPolicyChange(subject_type=subject_type, subject_id=subject_id))
+    db.flush()
+
+
+def refresh_policies(db: Session) -> int:
+    """Rejoue les changements publiés depuis la version locale.
+
+    Seuls les sujets concernés sont resynchronisés. Retourne leur nombre.
+    """
+    if get_enforcer() is None:
+        return 0
+    now = datetime.now(tz=timezone.utc)
+    rows = db.exec(
+        select(CasbinPolicyChange)
+        .where(
+            or_(
+                col(CasbinPolicyChange.id) > _state.version,
+                col(CasbinPolicyChange.created_at) >= now - _CHANGE_OVERLAP,
+            )
+        )
+        .order_by(col(CasbinPolicyChange.id))
+    ).all()
+    fresh = {r.id: r for r in rows if r.id is not None and r.id not in _state.recent}
+
+    subjects = {(r.subject_type, r.subject_id) for r in fresh.values()}
+    for subject_type, subject_id in subjects:
+        if subject_type == SUBJECT_ROLE:
+            sync_role_policies(db, subject_id)
+        else:
+            sync_user_groupings(db, subject_id)
+
+    with _state.lock:
+        for change_id, change in fresh.items():
+            _state.recent[change_id] = change.created_at
+            _state.version = max(_state.version, change_id)
+        horizon = (now - _CHANGE_OVERLAP).replace(tzinfo=None)
+        for change_id, created_at in list(_state.recent.items()):
+            if created_at.replace(tzinfo=None) < horizon:
+                del _state.recent[change_id]
+    return len(subjects)
+
+
+def refresh_policies_if_due() -> None:
+    """Vérifie le journal au plus une fois par CASBIN_SYNC_INTERVAL_MS.
+
+    Utilise sa propre session : la vérification ne dépend pas de la
+    transaction de la requête en cours.
+    """
+    if _state.enforcer is None:
+        return
+    now = time.monotonic()
+    with _state.lock:
+        if (now - _state.last_check) * 1000 < stng.CASBIN_SYNC_INTERVAL_MS:
+            return
+        _state.last_check = now
+    with Session(Database.get_engine()) as db:
+        refresh_policies(db)
@@ -0,0 +1,134 @@
+"""Cache TTL des principaux authentifiés, indexé par jti.
+
+Évite, pour chaque requête d'un même token, la lecture de t_revoked_tokens
+et le chargement de l'utilisateur (affectations → rôle → permissions,
+contextes, membre). Les entrées conservent un instantané détaché de
+l'utilisateur, rattaché à la session de la requête via merge(load=False)
+— aucun SQL n'est émis sur un hit.
+
+La cohérence repose sur l'invalidation explicite (logout, changement de
+mot de passe, rôles/affectations, profil) ; le TTL borne la fraîcheur
+pour les autres workers.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlmodel import Session
+
+from core.settings import settings as stng
+from core.ttl_cache import TTLCache
+from models import Utilisateur
+
+
+@dataclass
+class PrincipalEntry:
+    """Principal résolu pour un jti : instantané utilisateur + statut révoqué."""
+
+    user_id: Optional[str]
+    membre_id: Optional[str]
+    snapshot: Optional[Utilisateur]
+    revoked: bool
+    expires_at: float
+
+
+class PrincipalCache(TTLCache[str, PrincipalEntry]):
+    """Cache LRU à durée de vie bornée, partagé par le process."""
+
+    def get(self, jti: str) -> Optional[PrincipalEntry]:
+        """Retourne l'entrée vivante du jti (compte un hit ou un miss)."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[jti]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(jti)
+            self.hits += 1
+            return entry
+
+    def store(self, jti: str, user: Utilisateur, token_exp: Optional[float]) -> None:
+        """Mémorise un instantané détaché de l'utilisateur pour ce jti."""
+        if not self.enabled:
+            return
+        self._put(
+            jti,
+            PrincipalEntry(
+                user_id=user.id,
+                membre_id=user.membre_id,
+                snapshot=_detach(user),
+                revoked=False,
+                expires_at=self._deadline(token_exp),
+            ),
+        )
+
+    def mark_revoked(self, jti: str, token_exp: Optional[float] = None) -> None:
+        """Enregistre la révocation d'un jti (les hits suivants renvoient 401)."""
+        if not self.enabled:
+            return
+        self._put(
+            jti,
+            PrincipalEntry(
+                user_id=None,
+                membre_id=None,
+                snapshot=None,
+                revoked=True,
+                expires_at=self._deadline(token_exp),
+            ),
+        )
+
+    def attach(self, entry: PrincipalEntry, db: Session) -> Utilisateur:
+        """Rattache l'instantané à la session de la requête, sans SQL."""
+        assert entry.snapshot is not None
+        return db.merge(entry.snapshot, load=False)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Supprime toutes les entrées (non révoquées) d'un utilisateur."""
+        self._drop(lambda e: e.user_id == user_id)
+
+    def invalidate_membre(self, membre_id: str) -> None:
+        """Supprime les entrées des utilisateurs liés à ce membre."""
+        self._drop(lambda e: e.membre_id == membre_id)
+
+    def _deadline(self, token_exp: Optional[float]) -> float:
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        return time.monotonic() + ttl
+
+    def _put(self, jti: str, entry: PrincipalEntry) -> None:
+        with self._lock:
+            self._insert(jti, entry)
+
+    def _drop(self, predicate: Callable[[PrincipalEntry], bool]) -> None:
+        with self._lock:
+            stale = [
+                jti
+                for jti, entry in self._entries.items()
+                if not entry.revoked and predicate(entry)
+            ]
+            for jti in stale:
+                del self._entries[jti]
+
+
+def _detach(user: Utilisateur) -> Utilisateur:
+    """Copie le graphe chargé dans une session éphémère puis la ferme.
+
+    La copie n'appartient à aucune session : elle ne sera jamais expirée
+    par un commit de la requête d'origine.
+    """
+    with Session() as holder:
+        snapshot = holder.merge(user, load=False)
+    return snapshot
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=stng.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=stng.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,159 @@
+"""Filtre de Bloom des JTI révoqués — évite t_revoked_tokens sur le chemin nominal.
+
+Un test négatif garantit que le token n'est pas révoqué : la base n'est
+consultée que sur un positif (vrai ou faux positif). Le filtre est :
+- construit au démarrage depuis les révocations non expirées ;
+- alimenté localement par add_to_blacklist ;
+- resynchronisé par watermark (revoked_at) pour converger entre workers ;
+- reconstruit après un purge_expired_tokens effectif (un Bloom ne supprime pas).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlmodel import Session, col, select
+
+from core.settings import settings as stng
+from models import TokenBlacklist
+
+# Recouvrement du watermark : tolère les commits concurrents arrivés en retard
+_WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+class BloomFilter:
+    """Filtre de Bloom à double hachage (blake2b) sur un bytearray."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class RevokedTokenFilter:
+    """Ensemble probabiliste des JTI révoqués, partagé par le process."""
+
+    def __init__(
+        self, capacity: int, error_rate: float, sync_interval_seconds: float
+    ) -> None:
+        self.sync_interval_seconds = sync_interval_seconds
+        self._sizing = (capacity, error_rate)
+        self._counters: Counter[str] = Counter()
+        self._bloom: Optional[BloomFilter] = None
+        self._watermark: Optional[datetime] = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """(Re)construit le filtre depuis les révocations non expirées."""
+        now = datetime.now(tz=timezone.utc)
+        rows = db.exec(
+            select(TokenBlacklist.jti, TokenBlacklist.revoked_at).where(
+                col(TokenBlacklist.expires_at) > now
+            )
+        ).all()
+        capacity, error_rate = self._sizing
+        bloom = BloomFilter(max(capacity, 2 * len(rows)), error_rate)
+        for jti, _ in rows:
+            bloom.add(jti)
+        with self._lock:
+            self._bloom = bloom
+            self._watermark = _max_revoked_at(rows, None)
+            self._last_sync = time.monotonic()
+
+    def sync(self, db: Session) -> None:
+        """Ajoute les révocations postérieures au watermark (autres workers)."""
+        if self._bloom is None:
+            self.load(db)
+            return
+        stmt = select(TokenBlacklist.jti, TokenBlacklist.revoked_at)
+        if self._watermark is not None:
+            stmt = stmt.where(
+                col(TokenBlacklist.revoked_at) > self._watermark - _WATERMARK_OVERLAP
+            )
+        rows = db.exec(stmt).all()
+        with self._lock:
+            for jti, _ in rows:
+                self._bloom.add(jti)
+            self._watermark = _max_revoked_at(rows, self._watermark)
+            self._last_sync = time.monotonic()
+
+    def sync_if_due(self, db: Session) -> None:
+        """Charge le filtre au premier appel, puis le resynchronise par intervalle."""
+        if (
+            self._bloom is None
+            or time.monotonic() - self._last_sync >= self.sync_interval_seconds
+        ):
+            self.sync(db)
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def might_contain(self, jti: str) -> bool:
+        """False ⇒ non révoqué (certain). True ⇒ vérifier en base."""
+        with self._lock:
+            self._counters["checks"] += 1
+            positive = self._bloom is None or jti in self._bloom
+            if positive:
+                self._counters["db_lookups"] += 1
+            return positive
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._watermark = None
+            self._last_sync = 0.0
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "checks": self._counters["checks"],
+                "db_lookups": self._counters["db_lookups"],
+                "size": self._bloom.count if self._bloom else 0,
+            }
+
+
+def _max_revoked_at(
+    rows: Iterable[Tuple[str, datetime]], current: Optional[datetime]
+) -> Optional[datetime]:
+    watermark = current
+    for _, revoked_at in rows:
+        if revoked_at.tzinfo is None:
+            revoked_at = revoked_at.replace(tzinfo=timezone.utc)
+        if watermark is None or revoked_at > watermark:
+            watermark = revoked_at
+    return watermark
+
+
+revoked_filter = RevokedTokenFilter(
+    capacity=stng.REVOKED_FILTER_CAPACITY,
+    error_rate=stng.REVOKED_FILTER_ERROR_RATE,
+    sync_interval_seconds=stng.REVOKED_FILTER_SYNC_SECONDS,
+)
@@ -109,6 +109,16 @@ class ErrorRegistry:
         message="Chant introuvable dans ce campus.",
         http_status=status.HTTP_404_NOT_FOUND,
     )
+    PLAN_019 = ErrorDetail(
+        code="PLAN_019",
+        message="Curseur de pagination invalide.",
+        http_status=status.HTTP_400_BAD_REQUEST,
+    )
+    PLAN_020 = ErrorDetail(
+        code="PLAN_020",
+        message="Périmètre requis : planning_id, ministere_id ou campus_id.",
+        http_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
     TMPL_003 = ErrorDetail(
         code="TMPL_003",
         message="Template introuvable.",
@@ -189,6 +199,31 @@ class ErrorRegistry:
         message="Vous n'êtes pas le membre concerné par cette affectation.",
         http_status=status.HTTP_403_FORBIDDEN,
     )
+    ASGN_ALREADY_ASSIGNED = ErrorDetail(
+        code="ASGN_009",
+        message="Le membre est déjà affecté au slot {id}.",
+        http_status=status.HTTP_409_CONFLICT,
+    )
+    ASGN_MINISTERE_NOT_FOUND = ErrorDetail(
+        code="ASGN_010",
+        message="Ministère {id} introuvable.",
+        http_status=status.HTTP_404_NOT_FOUND,
+    )
+    ASGN_STAFFING_SCOPE = ErrorDetail(
+        code="ASGN_011",
+        message="Périmètre requis : planning_id ou serie_id (l'un ou l'autre).",
+        http_status=status.HTTP_422_UNPROCESSABLE_CONTENT,
+    )
+    ASGN_STATS_SCOPE = ErrorDetail(
+        code="ASGN_012",
+        message="Périmètre requis : ministere_id et/ou campus_id.",
+        http_status=status.HTTP_422_UNPROCESSABLE_CONTENT,
+    )
+    ASGN_STATS_CHRONOLOGY = ErrorDetail(
+        code="ASGN_013",
+        message="La date de fin doit être postérieure ou égale à la date de début.",
+        http_status=status.HTTP_422_UNPROCESSABLE_CONTENT,
+    )
 
     # --- DOMAINE WORKFLOW (WKFL) ---
     WORKFLOW_INVALID_TRANSITION = ErrorDetail(
@@ -260,6 +295,11 @@ class ErrorRegistry:
         message="La date de début ne peut pas être dans le passé.",
         http_status=status.HTTP_422_UNPROCESSABLE_CONTENT,
     )
+    INDISP_MATRIX_RANGE_TOO_LONG = ErrorDetail(
+        code="INDISP_008",
+        message="La matrice de disponibilité est limitée à {max} jours.",
+        http_status=status.HTTP_422_UNPROCESSABLE_CONTENT,
+    )
 
     # --- DOMAINE CORE / GÉNÉRIQUE (CORE) ---
 
@@ -664,6 +704,11 @@ class ErrorRegistry:
         message="jour_semaine requis pour récurrence HEBDOMADAIRE",
         http_status=status.HTTP_422_UNPROCESSABLE_ENTITY,
     )
+    SERIE_004 = ErrorDetail(
+        code="SERIE_004",
+        message="Série {id} introuvable.",
+        http_status=status.HTTP_404_NOT_FOUND,
+    )
 
     # --- DOMAINE CHANTS / SONGBOOK (SONG) ---
     SONG_CAT_NOT_FOUND = ErrorDetail(
@@ -0,0 +1,134 @@
+"""Cache versionné des données de référence (statuts, catalogue, rôles).
+
+Les référentiels (t_statut_*, t_categorierole, t_rolecompetence,
+t_ministere_role_config, t_role, ministères rattachés aux campus) changent
+rarement mais sont relus par des endpoints chauds. Les valeurs mises en
+cache sont des instantanés immuables (tuples, modèles Read) — jamais des
+objets ORM liés à une session.
+
+Cohérence :
+- chaque domaine porte un numéro de version ; invalidate() l'incrémente et
+  purge ses entrées. Une entrée dérivée de plusieurs domaines (depends)
+  retient leurs versions et n'est servie que si aucune n'a bougé. Un
+  chargement démarré sous une version antérieure n'est pas mémorisé (pas
+  de valeur périmée réinsérée par une requête lente) ;
+- une écriture invalide aussitôt, puis une seconde fois à la fin de la
+  transaction (commit ou rollback) : tant qu'elle n'est pas terminée, la
+  session qui écrit lit ses domaines modifiés sans passer par le cache ;
+- le TTL borne la fraîcheur pour les autres workers.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from core.settings import settings as stng
+from core.ttl_cache import TTLCache
+
+V = TypeVar("V")
+
+STATUTS = "statuts"
+CATALOGUE = "catalogue"
+MINISTERE_ROLES = "ministere_roles"
+RBAC_ROLES = "rbac_roles"
+CAMPUS_MINISTERES = "campus_ministeres"
+
+_PENDING_KEY = "reference_cache_pending"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    versions: Tuple[int, ...]
+    expires_at: float
+    value: Any
+
+
+class ReferenceCache(TTLCache[Tuple[str, Hashable], _Entry]):
+    """Cache LRU à durée de vie bornée, versionné par domaine."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        super().__init__(ttl_seconds, max_entries)
+        self._versions: Counter[str] = Counter()
+
+    def get_or_load(
+        self,
+        db: Session,
+        domain: str,
+        key: Hashable,
+        loader: Callable[[], V],
+        *,
+        depends: Tuple[str, ...] = (),
+    ) -> V:
+        """Retourne la valeur en cache, ou la charge via loader et la mémorise.
+
+        depends : autres domaines dont la valeur est dérivée.
+        """
+        domains = (domain, *depends)
+        pending = db.info.get(_PENDING_KEY, ())
+        if not self.enabled or any(d in pending for d in domains):
+            return loader()
+        with self._lock:
+            versions = tuple(self._versions[d] for d in domains)
+            entry = self._entries.get((domain, key))
+            if (
+                entry is not None
+                and entry.versions == versions
+                and entry.expires_at > time.monotonic()
+            ):
+                self._entries.move_to_end((domain, key))
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            # Invalidé pendant le chargement : la valeur est peut-être périmée
+            if tuple(self._versions[d] for d in domains) == versions:
+                self._insert(
+                    (domain, key),
+                    _Entry(versions, time.monotonic() + self.ttl_seconds, value),
+                )
+        return value
+
+    def invalidate(self, db: Optional[Session], *domains: str) -> None:
+        """Périme les domaines ; avec une session, ré-invalide en fin de transaction."""
+        with self._lock:
+            for domain in domains:
+                self._versions[domain] += 1
+            stale = [k for k in self._entries if k[0] in domains]
+            for k in stale:
+                del self._entries[k]
+        if db is not None:
+            pending: Set[str] = db.info.setdefault(_PENDING_KEY, set())
+            pending.update(domains)
+
+    def version(self, domain: str) -> int:
+        with self._lock:
+            return self._versions[domain]
+
+    def _extra_stats(self) -> Dict[str, Any]:
+        # clear() conserve les versions : seules les entrées sont purgées
+        return {"versions": dict(self._versions)}
+
+
+reference_cache = ReferenceCache(
+    ttl_seconds=stng.REFERENCE_CACHE_TTL_SECONDS,
+    max_entries=stng.REFERENCE_CACHE_MAX_ENTRIES,
+)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _invalidate_on_transaction_end(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Fin de la transaction racine : les écritures sont visibles (ou annulées)."""
+    if transaction.parent is not None:
+        return
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        reference_cache.invalidate(None, *pending)
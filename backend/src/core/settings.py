@@ -33,6 +33,20 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Cache des principaux authentifiés (par jti) — 0 désactive le cache
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    # Filtre de Bloom des JTI révoqués (resynchronisé toutes les N secondes)
+    REVOKED_FILTER_CAPACITY: int = 100_000
+    REVOKED_FILTER_ERROR_RATE: float = 0.001
+    REVOKED_FILTER_SYNC_SECONDS: int = 5
+    # Durée de mémorisation d'un refus Casbin (évite les resynchronisations)
+    CASBIN_DENY_CACHE_SECONDS: int = 30
+    # Intervalle minimal entre deux lectures du journal des policies (multi-workers)
+    CASBIN_SYNC_INTERVAL_MS: int = 1000
+    # Cache des données de référence (statuts, catalogue, rôles) — 0 le désactive
+    REFERENCE_CACHE_TTL_SECONDS: int = 60
+    REFERENCE_CACHE_MAX_ENTRIES: int = 1024
 
     # --- SUPERADMIN BOOTSTRAP ---
     SUPERADMIN_USERNAME: str = "superadmin"
@@ -0,0 +1,61 @@
+"""Socle des caches process : LRU borné, durée de vie, compteurs hits/misses.
+
+Partagé par le cache des principaux (core.auth.principal_cache) et celui
+des référentiels (core.reference_cache) ; chacun définit ses entrées, son
+expiration et son invalidation.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+E = TypeVar("E")
+
+
+class TTLCache(Generic[K, E]):
+    """Cache LRU à durée de vie bornée, thread-safe."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, E]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                **self._extra_stats(),
+            }
+
+    def _extra_stats(self) -> Dict[str, Any]:
+        """Compteurs propres à la sous-classe (appelé sous verrou)."""
+        return {}
+
+    def _insert(self, key: K, entry: E) -> None:
+        """Insère en tête LRU et évince au-delà de max_entries (sous verrou)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -10,6 +10,7 @@ from sqlmodel import Session
 
 from conf.db.database import Database
 from core.auth.casbin_enforcer import build_enforcer
+from core.auth.revoked_filter import revoked_filter
 from core.bootstrap import bootstrap_superadmin
 from core.exceptions.exceptions_handlers import register_exception_handlers
 from core.rate_limit import limiter
@@ -26,6 +27,7 @@ async def lifespan(_app: FastAPI):
     with Session(Database.get_engine()) as db:
         bootstrap_superadmin(db)
         build_enforcer(db)
+        revoked_filter.load(db)
     yield
     Database.disconnect()
 
@@ -41,10 +41,18 @@ class AffectationStatusCode(str, Enum):
     RETARD = "RETARD"
 
 
+class OutboxStatus(str, Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
 __all__ = [
     "RoleName",
     "VoixEnum",
     "NiveauChantre",
     "PlanningStatusCode",
     "AffectationStatusCode",
+    "OutboxStatus",
 ]
@@ -1,9 +1,12 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, model_validator
 from sqlmodel import Field, SQLModel
 
+from core.exceptions.app_exception import AppException
+from core.message import ErrorRegistry
+
 
 class AffectationBase(SQLModel):
     slot_id: str = Field(foreign_key="t_slot.id", ondelete="CASCADE")
@@ -30,6 +33,40 @@ class AffectationRead(AffectationBase):
     id: str
 
 
+MAX_BULK_AFFECTATIONS = 500
+
+
+class AffectationBulkItem(SQLModel):
+    slot_id: str
+    membre_id: str
+    role_code: str = Field(max_length=50)
+    ministere_id: Optional[str] = None
+
+
+class AffectationBulkCreate(SQLModel):
+    """Lot d'affectations ; all_or_nothing : aucune écriture si un item échoue."""
+
+    items: List[AffectationBulkItem] = Field(
+        min_length=1, max_length=MAX_BULK_AFFECTATIONS
+    )
+    all_or_nothing: bool = False
+
+
+class AffectationBulkError(SQLModel):
+    """Item rejeté : index dans le lot et première règle non respectée."""
+
+    index: int
+    slot_id: str
+    membre_id: str
+    code: str
+    message: str
+
+
+class AffectationBulkResult(SQLModel):
+    created: List[AffectationRead] = Field(default_factory=list)
+    errors: List[AffectationBulkError] = Field(default_factory=list)
+
+
 class AffectationMemberRead(BaseModel):
     """Vue enrichie d'une affectation pour un membre (page mes-affectations)."""
 
@@ -66,10 +103,109 @@ class AffectationMemberRead(BaseModel):
         }
 
 
+class AutoStaffingRequest(SQLModel):
+    """
+    Remplissage automatique des créneaux d'un planning ou d'une série.
+
+    role_codes : rôles à pourvoir (défaut : tous ceux activés pour le
+    ministère). appliquer=False : propositions seules, rien n'est écrit.
+    """
+
+    planning_id: Optional[str] = None
+    serie_id: Optional[str] = None
+    ministere_id: str
+    role_codes: Optional[List[str]] = None
+    appliquer: bool = False
+
+    @model_validator(mode="after")
+    def validate_scope(self) -> "AutoStaffingRequest":
+        if bool(self.planning_id) == bool(self.serie_id):
+            raise AppException(ErrorRegistry.ASGN_STAFFING_SCOPE)
+        return self
+
+
+class AutoStaffingProposition(SQLModel):
+    slot_id: str
+    planning_id: str
+    membre_id: str
+    role_code: str
+    date_debut: datetime
+
+
+class AutoStaffingManque(SQLModel):
+    """Créneau resté incomplet faute de candidat éligible."""
+
+    slot_id: str
+    planning_id: str
+    manquants: int
+
+
+class AutoStaffingResult(SQLModel):
+    propositions: List[AutoStaffingProposition]
+    non_pourvus: List[AutoStaffingManque]
+    charge: Dict[str, int] = Field(
+        description="Services par membre candidat sur la période (existants + proposés)"
+    )
+    semaines_consecutives: int = Field(
+        description="Propositions qui suivent ou précèdent une semaine déjà servie"
+    )
+    appliquee: bool
+
+
+class ChargeMembreRead(SQLModel):
+    """
+    Charge et assiduité d'un membre sur la période.
+
+    confirmes : CONFIRME et statuts de pointage (PRESENT, ABSENT, RETARD).
+    Taux en %, None sans dénominateur ; écarts en jours entre deux
+    services consécutifs du périmètre.
+    """
+
+    membre_id: str
+    nom: str
+    prenom: str
+    total: int = 0
+    proposes: int = 0
+    confirmes: int = 0
+    refuses: int = 0
+    presents: int = 0
+    absents: int = 0
+    retards: int = 0
+    taux_confirmation: Optional[float] = None
+    taux_presence: Optional[float] = None
+    ecart_moyen_jours: Optional[float] = None
+    ecart_min_jours: Optional[float] = None
+    premier_service: Optional[datetime] = None
+    dernier_service: Optional[datetime] = None
+
+
+class StatistiquesChargeRead(SQLModel):
+    """Charge par membre, du plus sollicité au moins sollicité."""
+
+    date_debut: date
+    date_fin: date
+    ministere_id: Optional[str] = None
+    campus_id: Optional[str] = None
+    total_affectations: int
+    moyenne_par_membre: float
+    membres: List[ChargeMembreRead]
+
+
 __all__ = [
     "AffectationBase",
+    "AffectationBulkCreate",
+    "AffectationBulkError",
+    "AffectationBulkItem",
+    "AffectationBulkResult",
     "AffectationCreate",
     "AffectationMemberRead",
     "AffectationRead",
     "AffectationUpdate",
+    "AutoStaffingManque",
+    "AutoStaffingProposition",
+    "AutoStaffingRequest",
+    "AutoStaffingResult",
+    "ChargeMembreRead",
+    "MAX_BULK_AFFECTATIONS",
+    "StatistiquesChargeRead",
 ]
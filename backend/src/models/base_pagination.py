@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from sqlmodel import SQLModel
 
@@ -12,3 +12,11 @@ class PaginatedResponse(SQLModel, Generic[T]):
     offset: int
     data: List[T]
     model_config = {"from_attributes": True}
+
+
+class CursorPage(SQLModel, Generic[T]):
+    """Page keyset : next_cursor est absent sur la dernière page."""
+
+    data: List[T]
+    next_cursor: Optional[str] = None
+    limit: int
@@ -1,5 +1,5 @@
 from datetime import date as DateType
-from typing import Optional
+from typing import Any, List, Optional
 
 from pydantic import ConfigDict, field_validator, model_validator
 from sqlmodel import Field, SQLModel
@@ -8,15 +8,28 @@ from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 
 
+def _parse_iso_date(v: Any) -> Optional[DateType]:
+    """Date ISO YYYY-MM-DD (chaîne ou date) → date ; INDISP_001 sinon."""
+    if v is None or isinstance(v, DateType):
+        return v
+    try:
+        parsed = DateType.fromisoformat(v)
+    except (TypeError, ValueError) as e:
+        raise AppException(ErrorRegistry.INDISP_INVALID_ISO_FORMAT) from e
+    if parsed.year <= 1900:
+        raise AppException(ErrorRegistry.INDISP_INVALID_ISO_FORMAT)
+    return parsed
+
+
 # -------------------------
 # BASE
 # -------------------------
 class IndisponibiliteBase(SQLModel):
-    date_debut: Optional[str] = Field(
+    date_debut: Optional[DateType] = Field(
         default=None,
         description="Date de début d'indisponibilité (format ISO YYYY-MM-DD)",
     )
-    date_fin: Optional[str] = Field(
+    date_fin: Optional[DateType] = Field(
         default=None,
         description="Date de fin d'indisponibilité (format ISO YYYY-MM-DD)",
     )
@@ -34,21 +47,10 @@ class IndisponibiliteBase(SQLModel):
         description="Ministère concerné (null = global)",
     )
 
-    @field_validator("date_debut", "date_fin")
+    @field_validator("date_debut", "date_fin", mode="before")
     @classmethod
-    def validate_date_iso(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        try:
-            parts = v.split("-")
-            if len(parts) != 3:
-                raise ValueError
-            year, month, day = map(int, parts)
-            if not (1 <= month <= 12 and 1 <= day <= 31 and year > 1900):
-                raise ValueError
-        except Exception as e:
-            raise AppException(ErrorRegistry.INDISP_INVALID_ISO_FORMAT) from e
-        return v
+    def validate_date_iso(cls, v: Any) -> Optional[DateType]:
+        return _parse_iso_date(v)
 
     @model_validator(mode="after")
     def validate_date_range(self) -> "IndisponibiliteBase":
@@ -67,8 +69,7 @@ class IndisponibiliteCreate(IndisponibiliteBase):
     @model_validator(mode="after")
     def validate_not_past(self) -> "IndisponibiliteCreate":
         if self.date_debut:
-            today = DateType.today().isoformat()
-            if self.date_debut < today:
+            if self.date_debut < DateType.today():
                 raise AppException(ErrorRegistry.INDISP_PAST_DATE)
         return self
 
@@ -91,27 +92,16 @@ class IndisponibiliteReadFull(IndisponibiliteRead):
 # UPDATE
 # -------------------------
 class IndisponibiliteUpdate(SQLModel):
-    date_debut: Optional[str] = None
-    date_fin: Optional[str] = None
+    date_debut: Optional[DateType] = None
+    date_fin: Optional[DateType] = None
     motif: Optional[str] = None
     validee: Optional[bool] = None
     ministere_id: Optional[str] = None
 
-    @field_validator("date_debut", "date_fin")
+    @field_validator("date_debut", "date_fin", mode="before")
     @classmethod
-    def validate_date_iso(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        try:
-            parts = v.split("-")
-            if len(parts) != 3:
-                raise ValueError
-            year, month, day = map(int, parts)
-            if not (1 <= month <= 12 and 1 <= day <= 31 and year > 1900):
-                raise ValueError
-        except Exception as e:
-            raise AppException(ErrorRegistry.INDISP_INVALID_ISO_FORMAT) from e
-        return v
+    def validate_date_iso(cls, v: Any) -> Optional[DateType]:
+        return _parse_iso_date(v)
 
     @model_validator(mode="after")
     def validate_date_range(self) -> "IndisponibiliteUpdate":
@@ -121,10 +111,44 @@ class IndisponibiliteUpdate(SQLModel):
         return self
 
 
+# -------------------------
+# MATRICE DE DISPONIBILITÉ
+# -------------------------
+MAX_MATRICE_JOURS = 366
+
+
+class MatriceMembreRead(SQLModel):
+    id: str
+    nom: str
+    prenom: str
+    actif: bool
+
+
+class MatriceDisponibiliteRead(SQLModel):
+    """
+    Disponibilité et éligibilité membre × jour d'un ministère, en tableaux.
+
+    Les listes `membres`, `eligibilite` et `disponibilite` sont alignées :
+    - eligibilite[i] : masque de bits sur `roles` (bit k = rôle roles[k] détenu) ;
+    - disponibilite[i] : un caractère par jour de [date_debut, date_fin],
+      "1" disponible, "0" indisponible.
+    """
+
+    ministere_id: str
+    date_debut: DateType
+    date_fin: DateType
+    roles: List[str]
+    membres: List[MatriceMembreRead]
+    eligibilite: List[int]
+    disponibilite: List[str]
+
+
 __all__ = [
     "IndisponibiliteBase",
     "IndisponibiliteCreate",
     "IndisponibiliteRead",
     "IndisponibiliteReadFull",
     "IndisponibiliteUpdate",
+    "MatriceDisponibiliteRead",
+    "MatriceMembreRead",
 ]
@@ -205,6 +205,18 @@ class PlanningRepertoireUpdate(BaseModel):
     chant_ids: List[str]
 
 
+class PlanningWindow(BaseModel):
+    """Fenêtre et pagination keyset (date_debut, id) des listes de plannings.
+
+    date_from : défaut = maintenant - 7 jours ; date_to : borne exclusive.
+    """
+
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    cursor: Optional[str] = None
+    limit: int = Field(default=50, ge=1, le=200)
+
+
 class PlanningFullRead(PlanningServiceBase):
     id: str
     template_id: Optional[str] = None
@@ -240,6 +252,7 @@ __all__ = [
     "MemberSummaryRead",
     "ViewContext",
     "ActiviteFullRead",
+    "PlanningWindow",
     # Répertoire de chants
     "PlanningChantRead",
     "PlanningRepertoireUpdate",
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
 
+from sqlalchemy import Column, Index, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 from models.affectation_model import AffectationBase
@@ -284,7 +285,17 @@ class Membre(MembreBase, table=True):  # type: ignore
 
 class Activite(ActiviteBase, table=True):  # type: ignore
     __tablename__ = "t_activite"
-    __table_args__ = {"extend_existing": True}
+    # Listes de plannings : filtre campus/ministère + keyset (date_debut, id)
+    __table_args__ = (
+        Index("ix_t_activite_campus_date", "campus_id", "date_debut", "id"),
+        Index(
+            "ix_t_activite_ministere_date",
+            "ministere_organisateur_id",
+            "date_debut",
+            "id",
+        ),
+        {"extend_existing": True},
+    )
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     deleted_at: Optional[datetime] = Field(default=None, index=True)
     campus_id: str = Field(foreign_key="t_campus.id", ondelete="CASCADE")
@@ -298,7 +309,10 @@ class Activite(ActiviteBase, table=True):  # type: ignore
 
 class Slot(SlotBase, table=True):  # type: ignore
     __tablename__ = "t_slot"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_t_slot_planning_date", "planning_id", "date_debut", "id"),
+        {"extend_existing": True},
+    )
     __mapper_args__ = {"confirm_deleted_rows": False}
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     planning: Optional["PlanningService"] = Relationship(back_populates="slots")
@@ -334,7 +348,11 @@ class StatutAffectation(SQLModel, table=True):  # type: ignore
 
 class Affectation(AffectationBase, table=True):  # type: ignore
     __tablename__ = "t_affectation"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_t_affectation_slot", "slot_id"),
+        Index("ix_t_affectation_membre_slot", "membre_id", "slot_id"),
+        {"extend_existing": True},
+    )
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
 
     slot: Optional[Slot] = Relationship(back_populates="affectations")
@@ -345,6 +363,39 @@ class Affectation(AffectationBase, table=True):  # type: ignore
     ministere: Optional["Ministere"] = Relationship()
 
 
+class MembreAgenda(SQLModel, table=True):  # type: ignore
+    """Agenda matérialisé : une ligne par affectation d'un planning actif.
+
+    Projection dénormalisée affectation → slot → planning → activité →
+    campus, tenue à jour par repositories.membre_agenda_repository (flush
+    ORM et écritures ensemblistes) et supprimée en cascade avec
+    l'affectation. L'agenda d'un membre se lit par un seul parcours
+    d'index (membre, campus, date_debut) ; les statistiques de charge d'un
+    campus parcourent (campus, date_debut).
+    """
+
+    __tablename__ = "t_membre_agenda"
+    __table_args__ = (
+        Index("ix_t_membre_agenda_range", "membre_id", "campus_id", "date_debut"),
+        Index("ix_t_membre_agenda_campus_date", "campus_id", "date_debut"),
+        {"extend_existing": True},
+    )
+    affectation_id: str = Field(
+        foreign_key="t_affectation.id", ondelete="CASCADE", primary_key=True
+    )
+    membre_id: str = Field(max_length=36)
+    campus_id: str = Field(max_length=36)
+    planning_id: str = Field(max_length=36)
+    date_debut: datetime
+    date_fin: datetime
+    nom_creneau: str = Field(max_length=100)
+    role_code: str = Field(max_length=50)
+    statut_affectation_code: str = Field(max_length=20)
+    activite_type: str = Field(max_length=100)
+    lieu: Optional[str] = Field(default=None, max_length=255)
+    campus_nom: str = Field(max_length=100)
+
+
 # -------------------------
 # 5. GOUVERNANCE & SÉCURITÉ
 # -------------------------
@@ -378,7 +429,10 @@ class Responsabilite(SQLModel, table=True):  # type: ignore
 
 class Indisponibilite(IndisponibiliteBase, table=True):  # type: ignore
     __tablename__ = "t_indisponibilite"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_t_indisponibilite_periode", "membre_id", "date_debut", "date_fin"),
+        {"extend_existing": True},
+    )
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     membre_id: str = Field(foreign_key="t_membre.id", ondelete="CASCADE")
     ministere_id: Optional[str] = Field(
@@ -411,6 +465,51 @@ class TokenBlacklist(SQLModel, table=True):  # type: ignore
     revoked_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class CasbinPolicyChange(SQLModel, table=True):  # type: ignore
+    """Journal des changements de policies Casbin (version = id croissant).
+
+    Chaque worker relit les lignes postérieures à sa version et ne
+    resynchronise que les sujets concernés (utilisateur ou rôle).
+    """
+
+    __tablename__ = "t_casbin_policy_change"
+    __table_args__ = {"extend_existing": True}
+    id: Optional[int] = Field(default=None, primary_key=True)
+    subject_type: str = Field(max_length=20)  # "user" | "role"
+    subject_id: str = Field(max_length=36)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), index=True
+    )
+
+
+class NotificationOutbox(SQLModel, table=True):  # type: ignore
+    """Outbox des notifications de planning (une ligne par membre et événement).
+
+    Écrite dans la transaction du changement de statut, puis drainée par
+    le worker notification.outbox_worker. payload : liste JSON des
+    données de notification à rendre pour ce membre.
+    """
+
+    __tablename__ = "t_notification_outbox"
+    __table_args__ = (
+        Index("ix_t_notification_outbox_key", "planning_id", "membre_id", "event"),
+        Index("ix_t_notification_outbox_due", "status", "available_at"),
+        {"extend_existing": True},
+    )
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    planning_id: str = Field(max_length=36)
+    membre_id: str = Field(max_length=36)
+    event: str = Field(max_length=20)  # PlanningStatusCode (PUBLIE | ANNULE)
+    payload: str = Field(sa_column=Column(Text, nullable=False))
+    status: str = Field(default="PENDING", max_length=20)  # OutboxStatus
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, max_length=500)
+    available_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    locked_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    sent_at: Optional[datetime] = None
+
+
 # -------------------------
 # 6. RBAC & ÉQUIPES
 # -------------------------
@@ -597,6 +696,9 @@ __all__ = [
     "Responsabilite",
     "Utilisateur",
     "TokenBlacklist",
+    "CasbinPolicyChange",
+    "NotificationOutbox",
+    "MembreAgenda",
     "Equipe",
     "EquipeMembre",
     "Role",
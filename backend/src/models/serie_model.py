@@ -57,8 +57,13 @@ class PlanningSerieItem(SQLModel):
 
 
 class GenerateSeriesResponse(SQLModel):
-    """Résultat de la génération : identifiant de série + plannings créés."""
+    """Résultat de la génération : identifiant de série + plannings créés.
+
+    `conflits` liste les plannings qui existaient déjà sur les dates
+    générées (même détection que la prévisualisation).
+    """
 
     serie_id: str
     total: int
     plannings: List[PlanningSerieItem]
+    conflits: List[ConflitDate] = []
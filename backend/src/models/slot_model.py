@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import model_validator
 from sqlmodel import Field, SQLModel
 
+# Quota appliqué quand nb_personnes_requis n'est pas renseigné
+DEFAULT_NB_PERSONNES_REQUIS = 2
+
 
 class SlotBase(SQLModel):
     planning_id: str = Field(foreign_key="t_planningservice.id", ondelete="CASCADE")
@@ -33,9 +36,43 @@ class SlotRead(SlotBase):
     id: str
 
 
+class SlotFillRead(SQLModel):
+    """Remplissage d'un créneau : affectations vs nb_personnes_requis."""
+
+    slot_id: str
+    planning_id: str
+    nb_personnes_requis: int
+    nb_affectes: int
+    rempli: bool
+
+
+class PlanningFillRead(SQLModel):
+    """Remplissage agrégé des créneaux d'un planning."""
+
+    planning_id: str
+    total_slots: int
+    filled_slots: int
+
+
+class StaffingMetricsRead(SQLModel):
+    """Couverture des besoins en personnes sur un périmètre de plannings."""
+
+    total_slots: int
+    filled_slots: int
+    personnes_requises: int
+    personnes_affectees: int
+    taux_remplissage: float = Field(description="% de créneaux remplis")
+    plannings: List[PlanningFillRead]
+    slots: List[SlotFillRead]
+
+
 __all__ = [
+    "DEFAULT_NB_PERSONNES_REQUIS",
+    "PlanningFillRead",
     "SlotBase",
     "SlotCreate",
+    "SlotFillRead",
     "SlotRead",
     "SlotUpdate",
+    "StaffingMetricsRead",
 ]
@@ -8,6 +8,20 @@ class Settings(BaseSettings):
     SMTP_PASS: str = ""
     EMAIL_FROM: str = "noreply@planning-mla.com"
     APP_URL: str = "http://localhost:3000"
+    # Envoi groupé : connexions simultanées, messages par lot, retry/backoff
+    SMTP_POOL_SIZE: int = 4
+    SMTP_BATCH_SIZE: int = 20
+    SMTP_MAX_RETRIES: int = 3
+    SMTP_RETRY_BACKOFF_SECONDS: float = 0.5
+    # Worker de l'outbox : lots réclamés, lots traités en parallèle, reprises,
+    # rétention des lignes envoyées
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_CONCURRENCY: int = 2
+    OUTBOX_POLL_SECONDS: float = 2.0
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_SECONDS: float = 60.0
+    OUTBOX_LEASE_SECONDS: float = 300.0
+    OUTBOX_RETENTION_DAYS: int = 7
 
     model_config = SettingsConfigDict(env_file=".env")
 
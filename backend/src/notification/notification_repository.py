@@ -1,20 +1,39 @@
-from email.message import EmailMessage
+from email.message import EmailMessage, Message
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-
-import aiosmtplib
+from typing import Optional, Sequence
 
 from .config import settings
+from .smtp_delivery import DeliveryReport, SmtpDeliveryEngine
 
 
 class EmailRepository:
-    """Gère l'envoi physique de l'email via SMTP (aiosmtplib async)."""
+    """Gère l'envoi physique de l'email via SMTP (aiosmtplib async).
+
+    Les envois passent par un SmtpDeliveryEngine : un lot de messages
+    partage un pool de connexions au lieu d'une connexion par message.
+    """
+
+    def __init__(self, engine: Optional[SmtpDeliveryEngine] = None) -> None:
+        self.engine = engine or SmtpDeliveryEngine.from_settings()
 
     @staticmethod
-    def _build_mixed_message(
+    def build_html_message(
+        subject: str, recipient: str, html_content: str
+    ) -> EmailMessage:
+        """Construit un message HTML simple (avec alternative texte)."""
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = settings.EMAIL_FROM
+        msg["To"] = recipient
+        msg.set_content("Veuillez utiliser un client email compatible HTML.")
+        msg.add_alternative(html_content, subtype="html")
+        return msg
+
+    @staticmethod
+    def build_mixed_message(
         subject: str,
-        from_addr: str,
         recipient: str,
         html_content: str,
         *,
@@ -24,7 +43,7 @@ class EmailRepository:
         """Construit un message multipart/mixed (HTML + pièce jointe .ics)."""
         msg = MIMEMultipart("mixed")
         msg["Subject"] = subject
-        msg["From"] = from_addr
+        msg["From"] = settings.EMAIL_FROM
         msg["To"] = recipient
         alt = MIMEMultipart("alternative")
         alt.attach(
@@ -42,25 +61,15 @@ class EmailRepository:
         msg.attach(ics_part)
         return msg
 
+    async def send_messages(self, messages: Sequence[Message]) -> DeliveryReport:
+        """Envoie un lot de messages via le pool SMTP."""
+        return await self.engine.deliver(messages)
+
     async def send_html_email(
         self, subject: str, recipient: str, html_content: str
     ) -> None:
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = settings.EMAIL_FROM
-        msg["To"] = recipient
-        msg.set_content("Veuillez utiliser un client email compatible HTML.")
-        msg.add_alternative(html_content, subtype="html")
-
-        use_tls = settings.SMTP_PORT == 465
-        async with aiosmtplib.SMTP(
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            use_tls=use_tls,
-            start_tls=not use_tls,
-        ) as server:
-            await server.login(settings.SMTP_USER, settings.SMTP_PASS)
-            await server.send_message(msg)
+        msg = self.build_html_message(subject, recipient, html_content)
+        await self.send_messages([msg])
 
     async def send_html_email_with_ics(
         self,
@@ -72,20 +81,11 @@ class EmailRepository:
         ics_filename: str,
     ) -> None:
         """Envoie un email HTML avec un fichier .ics en pièce jointe."""
-        msg = self._build_mixed_message(
+        msg = self.build_mixed_message(
             subject,
-            settings.EMAIL_FROM,
             recipient,
             html_content,
             ics_bytes=ics_bytes,
             ics_filename=ics_filename,
         )
-        use_tls = settings.SMTP_PORT == 465
-        async with aiosmtplib.SMTP(
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            use_tls=use_tls,
-            start_tls=not use_tls,
-        ) as server:
-            await server.login(settings.SMTP_USER, settings.SMTP_PASS)
-            await server.send_message(msg)
+        await self.send_messages([msg])
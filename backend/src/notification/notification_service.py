@@ -2,6 +2,8 @@ import logging
 import os
 import urllib.parse
 from datetime import datetime, timezone
+from email.message import Message
+from typing import List, Sequence
 from uuid import uuid4
 
 from jinja2 import Environment, FileSystemLoader
@@ -13,6 +15,7 @@ from .notification_schemas import (
     PlanningNotification,
     PlanningPublishedNotification,
 )
+from .smtp_delivery import DeliveryReport
 
 logger = logging.getLogger(__name__)
 
@@ -110,79 +113,112 @@ class EmailService:
         ]
         return "\r\n".join(lines).encode("utf-8")
 
+    def render_published(self, data: PlanningPublishedNotification) -> Message:
+        """Construit l'email de publication (HTML + invitation .ics)."""
+        template = self.jinja_env.get_template("planning_published.html")
+        date_str = data.date_activite.strftime("%A %d %B %Y").capitalize()
+        google_url = self._build_google_calendar_url(data)
+        html_content = template.render(
+            prenom=data.prenom,
+            nom=data.nom,
+            type_activite=data.type_activite,
+            date_activite=date_str,
+            heure_debut=data.heure_debut,
+            heure_fin=data.heure_fin,
+            lieu=data.lieu,
+            campus_nom=data.campus_nom,
+            ministere_nom=data.ministere_nom,
+            nom_creneau=data.nom_creneau,
+            role_code=data.role_code,
+            app_url=settings.APP_URL,
+            google_calendar_url=google_url,
+        )
+        subject = f"✅ Planning publié – {data.type_activite}" f" du {date_str}"
+        return self.repository.build_mixed_message(
+            subject,
+            str(data.email),
+            html_content,
+            ics_bytes=self._build_ics_content(data),
+            ics_filename=f"planning_{data.date_activite.strftime('%Y%m%d')}.ics",
+        )
+
+    def render_cancelled(self, data: PlanningCancelledNotification) -> Message:
+        """Construit l'email d'annulation."""
+        template = self.jinja_env.get_template("planning_cancelled.html")
+        date_str = data.date_activite.strftime("%A %d %B %Y").capitalize()
+        html_content = template.render(
+            prenom=data.prenom,
+            nom=data.nom,
+            type_activite=data.type_activite,
+            date_activite=date_str,
+            campus_nom=data.campus_nom,
+            ministere_nom=data.ministere_nom,
+            motif=data.motif,
+        )
+        subject = f"❌ Planning annulé – {data.type_activite}" f" du {date_str}"
+        return self.repository.build_html_message(
+            subject, str(data.email), html_content
+        )
+
+    async def _send_batch(self, messages: List[Message], event: str) -> DeliveryReport:
+        report = await self.repository.send_messages(messages)
+        logger.info(
+            "Notifications %s : %d/%d envoyées (%.1f msg/s)",
+            event,
+            report.sent,
+            len(messages),
+            report.messages_per_second,
+        )
+        return report
+
     async def notify_planning_published(
         self, data: PlanningPublishedNotification
     ) -> None:
         """Notifie un membre affecté que son planning a été publié."""
-        try:
-            template = self.jinja_env.get_template("planning_published.html")
-            date_str = data.date_activite.strftime("%A %d %B %Y").capitalize()
-            google_url = self._build_google_calendar_url(data)
-            html_content = template.render(
-                prenom=data.prenom,
-                nom=data.nom,
-                type_activite=data.type_activite,
-                date_activite=date_str,
-                heure_debut=data.heure_debut,
-                heure_fin=data.heure_fin,
-                lieu=data.lieu,
-                campus_nom=data.campus_nom,
-                ministere_nom=data.ministere_nom,
-                nom_creneau=data.nom_creneau,
-                role_code=data.role_code,
-                app_url=settings.APP_URL,
-                google_calendar_url=google_url,
-            )
-            ics_bytes = self._build_ics_content(data)
-            ics_filename = f"planning_{data.date_activite.strftime('%Y%m%d')}.ics"
-            subject = f"✅ Planning publié – {data.type_activite}" f" du {date_str}"
-            await self.repository.send_html_email_with_ics(
-                subject=subject,
-                recipient=str(data.email),
-                html_content=html_content,
-                ics_bytes=ics_bytes,
-                ics_filename=ics_filename,
-            )
-        except (
-            Exception
-        ) as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-            logger.error(
-                "Échec notification publication — %s %s <%s>: %s",
-                data.prenom,
-                data.nom,
-                data.email,
-                exc,
-            )
+        await self.notify_planning_published_batch([data])
 
     async def notify_planning_cancelled(
         self, data: PlanningCancelledNotification
     ) -> None:
         """Notifie un membre affecté que son planning a été annulé."""
-        try:
-            template = self.jinja_env.get_template("planning_cancelled.html")
-            date_str = data.date_activite.strftime("%A %d %B %Y").capitalize()
-            html_content = template.render(
-                prenom=data.prenom,
-                nom=data.nom,
-                type_activite=data.type_activite,
-                date_activite=date_str,
-                campus_nom=data.campus_nom,
-                ministere_nom=data.ministere_nom,
-                motif=data.motif,
-            )
-            subject = f"❌ Planning annulé – {data.type_activite}" f" du {date_str}"
-            await self.repository.send_html_email(
-                subject=subject,
-                recipient=str(data.email),
-                html_content=html_content,
-            )
-        except (
-            Exception
-        ) as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-            logger.error(
-                "Échec notification annulation — %s %s <%s>: %s",
-                data.prenom,
-                data.nom,
-                data.email,
-                exc,
-            )
+        await self.notify_planning_cancelled_batch([data])
+
+    async def notify_planning_published_batch(
+        self, notifications: Sequence[PlanningPublishedNotification]
+    ) -> DeliveryReport:
+        """Notifie tous les membres d'un planning publié en un envoi groupé."""
+        messages: List[Message] = []
+        for data in notifications:
+            try:
+                messages.append(self.render_published(data))
+            except (
+                Exception
+            ) as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Échec notification publication — %s %s <%s>: %s",
+                    data.prenom,
+                    data.nom,
+                    data.email,
+                    exc,
+                )
+        return await self._send_batch(messages, "publication")
+
+    async def notify_planning_cancelled_batch(
+        self, notifications: Sequence[PlanningCancelledNotification]
+    ) -> DeliveryReport:
+        """Notifie tous les membres d'un planning annulé en un envoi groupé."""
+        messages: List[Message] = []
+        for data in notifications:
+            try:
+                messages.append(self.render_cancelled(data))
+            except (
+                Exception
+            ) as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Échec notification annulation — %s %s <%s>: %s",
+                    data.prenom,
+                    data.nom,
+                    data.email,
+                    exc,
+                )
+        return await self._send_batch(messages, "annulation")
@@ -0,0 +1,248 @@
+"""Worker de l'outbox des notifications de planning (t_notification_outbox).
+
+Processus séparé de l'API : `python -m notification.outbox_worker`.
+Chaque « voie » (concurrency) réclame un lot de lignes dues via
+SELECT … FOR UPDATE SKIP LOCKED, rend les emails, les envoie via le pool
+SMTP puis marque chaque ligne SENT, ou la replanifie (backoff) jusqu'à
+OUTBOX_MAX_ATTEMPTS avec seulement ses messages non délivrés. Un refus
+définitif (5xx) la passe directement FAILED. Plusieurs workers peuvent
+tourner en parallèle ; une ligne PROCESSING dont le bail expire est
+reprise. Les lignes SENT sont purgées après OUTBOX_RETENTION_DAYS.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from email.message import Message
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+
+from sqlmodel import Session
+
+from conf.db.database import Database
+from mla_enum.custom_enum import PlanningStatusCode
+from models import NotificationOutbox
+from repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+
+from .config import settings
+from .notification_repository import EmailRepository
+from .notification_schemas import (
+    PlanningCancelledNotification,
+    PlanningPublishedNotification,
+)
+from .notification_service import EmailService
+from .smtp_delivery import DeliveryReport
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], ContextManager[Session]]
+
+
+@dataclass(frozen=True)
+class OutboxPolicy:
+    """Paramètres de drainage de l'outbox."""
+
+    batch_size: int = 100
+    concurrency: int = 2
+    poll_seconds: float = 2.0
+    max_attempts: int = 5
+    retry_seconds: float = 60.0
+    lease_seconds: float = 300.0
+    retention_days: int = 7
+
+    @classmethod
+    def from_settings(cls) -> "OutboxPolicy":
+        return cls(
+            batch_size=settings.OUTBOX_BATCH_SIZE,
+            concurrency=settings.OUTBOX_CONCURRENCY,
+            poll_seconds=settings.OUTBOX_POLL_SECONDS,
+            max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+            retry_seconds=settings.OUTBOX_RETRY_SECONDS,
+            lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+            retention_days=settings.OUTBOX_RETENTION_DAYS,
+        )
+
+
+@dataclass
+class _Rendering:
+    """Emails rendus d'un lot.
+
+    owners : id(message) → (id de ligne, rang de l'élément dans son payload).
+    broken : id de ligne → erreur de rendu.
+    """
+
+    messages: List[Message] = field(default_factory=list)
+    owners: Dict[int, Tuple[str, int]] = field(default_factory=dict)
+    broken: Dict[str, str] = field(default_factory=dict)
+
+
+def _default_session() -> Session:
+    return Session(Database.get_engine(), expire_on_commit=False)
+
+
+class OutboxWorker:
+    """Draine l'outbox : lots réclamés en parallèle, envoi groupé par lot."""
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        policy: Optional[OutboxPolicy] = None,
+        session_factory: Optional[SessionFactory] = None,
+    ) -> None:
+        self.email_service = email_service
+        self.policy = policy or OutboxPolicy.from_settings()
+        self.session_factory = session_factory or _default_session
+
+    async def drain(self) -> int:
+        """Traite les lignes dues jusqu'à épuisement ; retourne le nombre traité."""
+        lanes = max(1, self.policy.concurrency)
+        counts = await asyncio.gather(*(self._lane() for _ in range(lanes)))
+        if sum(counts):
+            self.purge_sent()
+        return sum(counts)
+
+    def purge_sent(self) -> int:
+        """Supprime les lignes SENT au-delà de la rétention."""
+        with self.session_factory() as db:
+            purged = NotificationOutboxRepository(db).purge_sent(
+                timedelta(days=self.policy.retention_days)
+            )
+            db.commit()
+        return purged
+
+    async def run_forever(self) -> None:
+        while True:
+            if await self.drain() == 0:
+                await asyncio.sleep(self.policy.poll_seconds)
+
+    async def _lane(self) -> int:
+        total = 0
+        while True:
+            processed = await self.process_batch()
+            if processed == 0:
+                return total
+            total += processed
+
+    async def process_batch(self) -> int:
+        """Réclame, envoie et solde un lot ; retourne sa taille (0 si file vide)."""
+        policy = self.policy
+        with self.session_factory() as db:
+            repo = NotificationOutboxRepository(db)
+            rows = repo.claim(policy.batch_size, policy.lease_seconds)
+            if not rows:
+                db.commit()
+                return 0
+            rendering = self._render_rows(rows)
+            db.commit()
+
+            report = await self.email_service.repository.send_messages(
+                rendering.messages
+            )
+            failed = self._settle(repo, rows, rendering, report)
+            # Données illisibles : inutile de réessayer
+            for row in rows:
+                if row.id in rendering.broken:
+                    repo.mark_failed(
+                        [row], rendering.broken[row.id], 0, policy.retry_seconds
+                    )
+            db.commit()
+        logger.info(
+            f"Outbox : {len(rows)} lignes, {report.sent} emails envoyés, "
+            f"{failed} en échec SMTP, {len(rendering.broken)} illisibles"
+        )
+        return len(rows)
+
+    def _settle(
+        self,
+        repo: NotificationOutboxRepository,
+        rows: List[NotificationOutbox],
+        rendering: _Rendering,
+        report: DeliveryReport,
+    ) -> int:
+        """Solde les lignes rendues d'après le bilan ; retourne le nombre en échec.
+
+        Une ligne en échec ne garde dans son payload que les éléments non
+        délivrés ; elle passe FAILED si tous ses refus sont définitifs.
+        """
+        errors: Dict[str, Dict[int, str]] = {}
+        permanent: Dict[str, bool] = {}
+        for failure in report.failures:
+            row_id, index = rendering.owners[id(failure.message)]
+            errors.setdefault(row_id, {})[index] = failure.error
+            permanent[row_id] = permanent.get(row_id, True) and failure.permanent
+
+        repo.mark_sent(
+            [r.id for r in rows if r.id not in errors and r.id not in rendering.broken]
+        )
+        for row in rows:
+            if row.id not in errors:
+                continue
+            items = json.loads(row.payload)
+            row.payload = json.dumps([items[i] for i in sorted(errors[row.id])])
+            repo.mark_failed(
+                [row],
+                "; ".join(sorted(set(errors[row.id].values()))),
+                0 if permanent[row.id] else self.policy.max_attempts,
+                self.policy.retry_seconds,
+            )
+        return len(errors)
+
+    def _render_rows(self, rows: List[NotificationOutbox]) -> _Rendering:
+        """Rend les emails de chaque ligne."""
+        rendering = _Rendering()
+        for row in rows:
+            try:
+                rendered = [
+                    self._render(row.event, item) for item in json.loads(row.payload)
+                ]
+            except (
+                Exception
+            ) as exc:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                logger.error(f"Outbox {row.id} : rendu impossible : {exc}")
+                rendering.broken[row.id] = f"Rendu impossible : {exc}"
+                continue
+            for index, message in enumerate(rendered):
+                rendering.owners[id(message)] = (row.id, index)
+                rendering.messages.append(message)
+        return rendering
+
+    def _render(self, event: str, item: dict) -> Message:
+        if event == PlanningStatusCode.PUBLIE.value:
+            return self.email_service.render_published(
+                PlanningPublishedNotification.model_validate(item)
+            )
+        if event == PlanningStatusCode.ANNULE.value:
+            return self.email_service.render_cancelled(
+                PlanningCancelledNotification.model_validate(item)
+            )
+        raise ValueError(f"Événement inconnu : {event}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Draine l'outbox des notifications de planning."
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Vide la file puis s'arrête."
+    )
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    policy = OutboxPolicy.from_settings()
+    if args.concurrency:
+        policy = replace(policy, concurrency=args.concurrency)
+    if args.batch_size:
+        policy = replace(policy, batch_size=args.batch_size)
+
+    logging.basicConfig(level=logging.INFO)
+    worker = OutboxWorker(EmailService(EmailRepository()), policy)
+    asyncio.run(worker.drain() if args.once else worker.run_forever())
+
+
+if __name__ == "__main__":
+    main()
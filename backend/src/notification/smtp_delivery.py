@@ -0,0 +1,194 @@
+"""Moteur d'envoi SMTP groupé : pool de connexions, lots, retry/backoff.
+
+Un envoi de N messages ouvre au plus pool_size connexions (TLS + login
+une seule fois par connexion). Chaque connexion consomme des lots de
+batch_size messages depuis une file commune, ce qui borne la concurrence
+et répartit la charge. Les erreurs transitoires (déconnexion, 4xx,
+timeout) déclenchent une reconnexion et un nouvel essai avec backoff
+exponentiel ; les refus définitifs (5xx) ne sont pas réessayés.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import List, Optional, Sequence
+
+import aiosmtplib
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FailedDelivery:
+    """Message non délivré ; permanent : refus 5xx, inutile de réessayer."""
+
+    message: Message
+    error: str
+    permanent: bool
+
+
+@dataclass
+class DeliveryReport:
+    """Bilan d'un envoi groupé."""
+
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    connections: int = 0
+    seconds: float = 0.0
+    failures: List[FailedDelivery] = field(default_factory=list)
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds > 0 else 0.0
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """Refus définitif du serveur (code 5xx) : inutile de réessayer."""
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return all(err.code >= 500 for err in exc.recipients)
+    if isinstance(exc, aiosmtplib.SMTPResponseException):
+        return exc.code >= 500
+    return False
+
+
+@dataclass(frozen=True)
+class SmtpEndpoint:
+    """Paramètres de connexion au serveur SMTP."""
+
+    hostname: str
+    port: int
+    username: str = ""
+    password: str = ""
+    use_tls: bool = False
+    start_tls: Optional[bool] = None
+    timeout: float = 30.0
+
+    @classmethod
+    def from_settings(cls) -> "SmtpEndpoint":
+        use_tls = settings.SMTP_PORT == 465
+        return cls(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASS,
+            use_tls=use_tls,
+            start_tls=not use_tls,
+        )
+
+
+class SmtpDeliveryEngine:
+    """Envoie des lots de messages sur un pool de connexions SMTP."""
+
+    def __init__(
+        self,
+        endpoint: SmtpEndpoint,
+        *,
+        pool_size: int = 4,
+        batch_size: int = 20,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ) -> None:
+        self.endpoint = endpoint
+        self.pool_size = max(1, pool_size)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+
+    @classmethod
+    def from_settings(cls) -> "SmtpDeliveryEngine":
+        return cls(
+            SmtpEndpoint.from_settings(),
+            pool_size=settings.SMTP_POOL_SIZE,
+            batch_size=settings.SMTP_BATCH_SIZE,
+            max_retries=settings.SMTP_MAX_RETRIES,
+            backoff_seconds=settings.SMTP_RETRY_BACKOFF_SECONDS,
+        )
+
+    async def deliver(self, messages: Sequence[Message]) -> DeliveryReport:
+        """Envoie tous les messages et retourne le bilan (jamais d'exception)."""
+        report = DeliveryReport()
+        if not messages:
+            return report
+        started = time.perf_counter()
+
+        batches: "asyncio.Queue[List[Message]]" = asyncio.Queue()
+        for start in range(0, len(messages), self.batch_size):
+            batches.put_nowait(list(messages[start : start + self.batch_size]))
+
+        workers = min(self.pool_size, batches.qsize())
+        await asyncio.gather(*(self._worker(batches, report) for _ in range(workers)))
+
+        report.seconds = time.perf_counter() - started
+        logger.info(
+            f"SMTP : {report.sent} envoyés, {report.failed} échecs, "
+            f"{report.retries} retries sur {report.connections} connexions "
+            f"({report.messages_per_second:.1f} msg/s)"
+        )
+        return report
+
+    async def _worker(
+        self, batches: "asyncio.Queue[List[Message]]", report: DeliveryReport
+    ) -> None:
+        """Une connexion du pool : consomme les lots jusqu'à épuisement."""
+        client: Optional[aiosmtplib.SMTP] = None
+        try:
+            while not batches.empty():
+                batch = batches.get_nowait()
+                for message in batch:
+                    client = await self._send_with_retry(client, message, report)
+        finally:
+            if client is not None and client.is_connected:
+                try:
+                    await client.quit()
+                except aiosmtplib.SMTPException:
+                    client.close()
+
+    async def _send_with_retry(
+        self,
+        client: Optional[aiosmtplib.SMTP],
+        message: Message,
+        report: DeliveryReport,
+    ) -> Optional[aiosmtplib.SMTP]:
+        """Envoie un message ; retourne la connexion (éventuellement renouvelée)."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                if client is None or not client.is_connected:
+                    client = await self._connect(report)
+                await client.send_message(message)
+                report.sent += 1
+                return client
+            except (aiosmtplib.SMTPException, OSError, asyncio.TimeoutError) as exc:
+                permanent = _is_permanent(exc)
+                if permanent or attempt == self.max_retries:
+                    report.failed += 1
+                    report.failures.append(
+                        FailedDelivery(message, str(exc) or repr(exc), permanent)
+                    )
+                    logger.error(f"Échec SMTP définitif <{message['To']}> : {exc}")
+                    return client
+                report.retries += 1
+                if client is not None:
+                    client.close()
+                    client = None
+                await asyncio.sleep(self.backoff_seconds * (2**attempt))
+        return client
+
+    async def _connect(self, report: DeliveryReport) -> aiosmtplib.SMTP:
+        ep = self.endpoint
+        client = aiosmtplib.SMTP(
+            hostname=ep.hostname,
+            port=ep.port,
+            use_tls=ep.use_tls,
+            start_tls=ep.start_tls,
+            timeout=ep.timeout,
+        )
+        await client.connect()
+        if ep.username:
+            await client.login(ep.username, ep.password)
+        report.connections += 1
+        return client
@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Any, Collection, Dict, List, Set, Tuple
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, or_, tuple_
+from sqlmodel import Session, col, select
 
-from models import Affectation, Slot
+from models import Affectation, Membre, PlanningService, Slot
 from repositories.base_repository import BaseRepository
+from repositories.membre_agenda_repository import AgendaKeys, MembreAgendaRepository
 
 
 class AffectationRepository(BaseRepository[Affectation]):
@@ -25,3 +28,111 @@ class AffectationRepository(BaseRepository[Affectation]):
         )
         results = self.db.exec(statement).all()
         return len(results) > 0
+
+    def bulk_insert(self, rows: List[dict], batch_size: int = 500) -> int:
+        written = super().bulk_insert(rows, batch_size)
+        self._refresh_agenda(rows)
+        return written
+
+    def bulk_update(self, rows: List[dict]) -> int:
+        written = super().bulk_update(rows)
+        self._refresh_agenda(rows)
+        return written
+
+    def expire_loaded_lists(self, rows: List[dict]) -> None:
+        """Après un INSERT hors ORM : périme les listes d'affectations chargées."""
+        for model, key in ((Slot, "slot_id"), (Membre, "membre_id")):
+            for obj_id in {row[key] for row in rows}:
+                obj = self.db.identity_map.get(self.db.identity_key(model, obj_id))
+                if obj is not None:
+                    self.db.expire(obj, ["affectations"])
+
+    def _refresh_agenda(self, rows: List[dict]) -> None:
+        """Écritures hors ORM : le listener de flush ne les voit pas."""
+        keys = AgendaKeys()
+        keys.add_rows(Affectation, rows)
+        MembreAgendaRepository(self.db).refresh(keys)
+
+    def assigned_pairs(
+        self, pairs: Collection[Tuple[str, str]]
+    ) -> Set[Tuple[str, str]]:
+        """Couples (membre_id, slot_id) déjà affectés, en une requête indexée."""
+        # pylint: disable=no-member
+        if not pairs:
+            return set()
+        rows = self.db.exec(
+            select(Affectation.membre_id, Affectation.slot_id).where(
+                tuple_(col(Affectation.membre_id), col(Affectation.slot_id)).in_(
+                    list(pairs)
+                )
+            )
+        ).all()
+        return {(row[0], row[1]) for row in rows}
+
+    def get_sync_state(self, slot_ids: Collection[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Affectations des slots donnés (id, membre, statut), groupées par slot
+        puis indexées par id, en une requête.
+        """
+        # pylint: disable=no-member
+        grouped: Dict[str, Dict[str, Any]] = {slot_id: {} for slot_id in slot_ids}
+        if not slot_ids:
+            return grouped
+        rows = self.db.exec(
+            select(
+                Affectation.id,
+                Affectation.slot_id,
+                Affectation.membre_id,
+                Affectation.statut_affectation_code,
+            ).where(col(Affectation.slot_id).in_(list(slot_ids)))
+        ).all()
+        for aff_id, slot_id, membre_id, statut in rows:
+            grouped[slot_id][aff_id] = {
+                "id": aff_id,
+                "membre_id": membre_id,
+                "statut_affectation_code": statut,
+            }
+        return grouped
+
+    def delete_for_sync(self, slot_ids: Collection[str], ids: Collection[str]) -> int:
+        """Supprime en une requête les affectations des slots retirés et des ids."""
+        # pylint: disable=no-member
+        conditions: List[Any] = []
+        if slot_ids:
+            conditions.append(col(Affectation.slot_id).in_(list(slot_ids)))
+        if ids:
+            conditions.append(col(Affectation.id).in_(list(ids)))
+        if not conditions:
+            return 0
+        result = self.db.exec(  # type: ignore[call-overload]
+            delete(Affectation).where(or_(*conditions))
+        )
+        return result.rowcount
+
+    def busy_intervals(
+        self, membre_ids: Collection[str], start: datetime, end: datetime
+    ) -> List[Tuple[str, str, datetime, datetime]]:
+        """
+        (membre_id, slot_id, début, fin) des affectations de ces membres dont
+        le slot commence dans [start, end], plannings supprimés exclus.
+        """
+        # pylint: disable=no-member
+        if not membre_ids:
+            return []
+        rows = self.db.exec(
+            select(
+                Affectation.membre_id,
+                Affectation.slot_id,
+                Slot.date_debut,
+                Slot.date_fin,
+            )
+            .join(Slot, col(Slot.id) == col(Affectation.slot_id))
+            .join(PlanningService, col(PlanningService.id) == col(Slot.planning_id))
+            .where(
+                col(Affectation.membre_id).in_(list(membre_ids)),
+                col(Slot.date_debut) >= start,
+                col(Slot.date_debut) <= end,
+                PlanningService.deleted_at == None,  # noqa: E711
+            )
+        ).all()
+        return [(row[0], row[1], row[2], row[3]) for row in rows]
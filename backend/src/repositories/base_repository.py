@@ -1,9 +1,10 @@
 # src/repositories/base_repository.py
-from typing import Any, Generic, List, Optional, Type, TypeVar, cast
+from typing import Any, Collection, Generic, List, Optional, Type, TypeVar, cast
 
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.strategy_options import Load
-from sqlmodel import Session, SQLModel, func, select
+from sqlmodel import Session, SQLModel, col, func, select
 
 T = TypeVar("T", bound=SQLModel)
 
@@ -67,6 +68,40 @@ class BaseRepository(Generic[T]):
         # pylint: disable=not-callable
         return self.db.exec(select(func.count()).select_from(self.model)).one()
 
+    def bulk_insert(self, rows: List[dict], batch_size: int = 500) -> int:
+        """
+        INSERT multi-lignes (`insert().values([...])`) par lots, hors ORM.
+        Les ids doivent être pré-générés : rien n'est ajouté à l'identity map.
+        Retourne le nombre de lignes écrites.
+        """
+        table = cast(Any, self.model).__table__
+        for start in range(0, len(rows), batch_size):
+            self.db.exec(  # type: ignore[call-overload]
+                insert(table).values(rows[start : start + batch_size])
+            )
+        return len(rows)
+
+    def bulk_update(self, rows: List[dict]) -> int:
+        """
+        UPDATE par clé primaire en un executemany : chaque dict porte `id` et
+        les seules colonnes modifiées. L'identity map n'est pas synchronisée,
+        à l'appelant d'expirer les objets chargés. Retourne le nombre de lignes.
+        """
+        if rows:
+            self.db.exec(update(self.model), params=rows)  # type: ignore[call-overload]
+        return len(rows)
+
+    def delete_by_ids(self, ids: Collection[str]) -> int:
+        """DELETE ensembliste par ids ; retourne le nombre de lignes supprimées."""
+        # pylint: disable=no-member
+        if not ids:
+            return 0
+        model_id = cast(Any, self.model).id
+        result = self.db.exec(  # type: ignore[call-overload]
+            delete(self.model).where(col(model_id).in_(list(ids)))
+        )
+        return result.rowcount
+
     def update(self, db_obj: T, update_data: dict) -> T:
         for key, value in update_data.items():
             setattr(db_obj, key, value)
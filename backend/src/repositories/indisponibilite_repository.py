@@ -1,8 +1,9 @@
 # src/repositories/indisponibilite_repository.py
-from typing import Any, List, Optional, cast
+from datetime import date
+from typing import Any, Collection, List, Optional, Set, Tuple, cast
 
 from sqlalchemy.orm import selectinload
-from sqlmodel import Session, col, select
+from sqlmodel import Session, col, func, or_, select
 
 from models.schema_db_model import (
     Indisponibilite,
@@ -24,6 +25,55 @@ class IndisponibiliteRepository(BaseRepository[Indisponibilite]):
             selectinload(cast(Any, Indisponibilite.ministere)),
         )
 
+    def search(
+        self,
+        *,
+        campus_id: Optional[str] = None,
+        membre_id: Optional[str] = None,
+        validee_only: bool = False,
+        ministere_id: Optional[str] = None,
+        date_debut: Optional[date] = None,
+        date_fin: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Indisponibilite], int]:
+        """
+        Recherche filtrée et paginée côté SQL.
+
+        Les filtres, le COUNT(*) et le LIMIT/OFFSET sont exécutés par la base ;
+        les relations membre/ministère ne sont chargées que pour la page.
+        `date_debut`/`date_fin` sélectionnent les périodes qui chevauchent
+        la fenêtre. Retourne (page, total).
+        """
+        stmt = select(Indisponibilite)
+        if campus_id:
+            stmt = stmt.join(
+                MembreCampusLink,
+                col(MembreCampusLink.membre_id) == col(Indisponibilite.membre_id),
+            ).where(MembreCampusLink.campus_id == campus_id)
+        if membre_id:
+            stmt = stmt.where(Indisponibilite.membre_id == membre_id)
+        if validee_only:
+            stmt = stmt.where(col(Indisponibilite.validee) == True)  # noqa: E712
+        if ministere_id:
+            stmt = stmt.where(Indisponibilite.ministere_id == ministere_id)
+        if date_debut:
+            stmt = stmt.where(col(Indisponibilite.date_fin) >= date_debut)
+        if date_fin:
+            stmt = stmt.where(col(Indisponibilite.date_debut) <= date_fin)
+
+        count_stmt = select(func.count()).select_from(  # pylint: disable=not-callable
+            stmt.subquery()
+        )
+        total = self.db.exec(count_stmt).one()
+
+        page_stmt = self._eager_stmt(
+            stmt.order_by(col(Indisponibilite.date_debut), col(Indisponibilite.id))
+        ).offset(offset)
+        if limit is not None:
+            page_stmt = page_stmt.limit(limit)
+        return list(self.db.exec(page_stmt).all()), total
+
     def get_by_membre(self, membre_id: str) -> List[Indisponibilite]:
         """Indisponibilités d'un membre (toutes)."""
         stmt = self._eager_stmt(
@@ -82,8 +132,8 @@ class IndisponibiliteRepository(BaseRepository[Indisponibilite]):
     def get_overlapping(
         self,
         membre_id: str,
-        date_debut: str,
-        date_fin: str,
+        date_debut: date,
+        date_fin: date,
         ministere_id: Optional[str],
         *,
         exclude_id: Optional[str] = None,
@@ -98,3 +148,69 @@ class IndisponibiliteRepository(BaseRepository[Indisponibilite]):
         if exclude_id:
             stmt = stmt.where(Indisponibilite.id != exclude_id)
         return list(self.db.exec(stmt).all())
+
+    def get_membres_indisponibles(
+        self,
+        membre_ids: Collection[str],
+        debut: date,
+        fin: Optional[date] = None,
+        *,
+        validee_only: bool = False,
+    ) -> Set[str]:
+        """
+        Membres (parmi membre_ids) indisponibles le jour `debut`, ou sur au
+        moins un jour de la fenêtre [debut, fin].
+
+        Une seule requête, servie par ix_t_indisponibilite_periode.
+        """
+        # pylint: disable=no-member
+        if not membre_ids:
+            return set()
+        stmt = select(Indisponibilite.membre_id).where(
+            col(Indisponibilite.membre_id).in_(list(membre_ids)),
+            col(Indisponibilite.date_debut) <= (fin or debut),
+            col(Indisponibilite.date_fin) >= debut,
+        )
+        if validee_only:
+            stmt = stmt.where(col(Indisponibilite.validee) == True)  # noqa: E712
+        return set(self.db.exec(stmt.distinct()).all())
+
+    def get_periodes(
+        self,
+        membre_ids: Collection[str],
+        debut: date,
+        fin: date,
+        *,
+        ministere_id: Optional[str] = None,
+        validee_only: bool = False,
+    ) -> List[Tuple[str, date, date]]:
+        """
+        (membre_id, date_debut, date_fin) des indisponibilités qui chevauchent
+        [debut, fin] ; avec ministere_id : globales ou propres à ce ministère.
+        """
+        # pylint: disable=no-member
+        if not membre_ids:
+            return []
+        stmt = select(
+            Indisponibilite.membre_id,
+            col(Indisponibilite.date_debut),
+            col(Indisponibilite.date_fin),
+        ).where(
+            col(Indisponibilite.membre_id).in_(list(membre_ids)),
+            col(Indisponibilite.date_debut) <= fin,
+            col(Indisponibilite.date_fin) >= debut,
+        )
+        if ministere_id:
+            stmt = stmt.where(
+                or_(
+                    col(Indisponibilite.ministere_id).is_(None),
+                    Indisponibilite.ministere_id == ministere_id,
+                )
+            )
+        if validee_only:
+            stmt = stmt.where(col(Indisponibilite.validee) == True)  # noqa: E712
+        # Les bornes NULL sont exclues par les comparaisons SQL
+        return [
+            (row[0], cast(date, row[1]), cast(date, row[2]))
+            for row in self.db.exec(stmt).all()
+        ]
@@ -0,0 +1,344 @@
+"""Agenda matérialisé des membres (t_membre_agenda) : maintenance et lecture.
+
+Les lignes sont recalculées depuis les tables sources par un
+INSERT … SELECT … ON CONFLICT filtré sur les clés modifiées :
+- flush ORM : listeners enregistrés par register_agenda_listeners()
+  (appelé par Database.get_engine) ; les événements d'insert/update des
+  modèles sources collectent les clés, after_flush rafraîchit si besoin ;
+- écritures ensemblistes : AffectationRepository et SlotRepository
+  rafraîchissent après bulk_insert / bulk_update ;
+- suppressions : cascade de la FK vers t_affectation.
+Un planning ou une activité supprimé(e) logiquement retire ses lignes.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import and_, delete, event, func, inspect, not_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import object_session
+from sqlmodel import Session, SQLModel, col, select
+
+from mla_enum.custom_enum import AffectationStatusCode
+from models import Activite, Affectation, Campus, Membre, PlanningService, Slot
+from models.membre_model import MemberAgendaEntryRead
+from models.schema_db_model import MembreAgenda
+from repositories.base_repository import BaseRepository
+
+# Colonnes de t_membre_agenda, dans l'ordre de la projection source
+_COLUMNS = (
+    "affectation_id",
+    "membre_id",
+    "campus_id",
+    "planning_id",
+    "date_debut",
+    "date_fin",
+    "nom_creneau",
+    "role_code",
+    "statut_affectation_code",
+    "activite_type",
+    "lieu",
+    "campus_nom",
+)
+
+# Colonnes sources dont la modification change l'agenda
+_PROJECTED: Dict[Type[SQLModel], Tuple[str, ...]] = {
+    Affectation: ("membre_id", "slot_id", "role_code", "statut_affectation_code"),
+    Slot: ("planning_id", "date_debut", "date_fin", "nom_creneau"),
+    PlanningService: ("activite_id", "deleted_at"),
+    Activite: ("type", "lieu", "campus_id", "deleted_at"),
+    Campus: ("nom",),
+}
+
+# Upsert ON CONFLICT selon le dialecte (Postgres en prod, SQLite possible)
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Clés collectées pendant le flush en cours (session.info)
+_INFO_KEY = "membre_agenda_keys"
+
+
+@dataclass
+class AgendaKeys:
+    """Lignes sources modifiées ; prune : des lignes ont pu devenir inactives."""
+
+    affectation_ids: Set[str] = field(default_factory=set)
+    slot_ids: Set[str] = field(default_factory=set)
+    planning_ids: Set[str] = field(default_factory=set)
+    activite_ids: Set[str] = field(default_factory=set)
+    campus_ids: Set[str] = field(default_factory=set)
+    prune: bool = False
+
+    def add(self, obj: Any) -> None:
+        """Enregistre un objet source modifié (ignoré si rien de projeté n'a changé)."""
+        columns = _PROJECTED.get(type(obj))
+        if columns is None:
+            return
+        state = inspect(obj)
+        changed = {name for name in columns if state.attrs[name].history.has_changes()}
+        if "deleted_at" in changed:
+            self.prune = True
+        if changed:
+            self._ids(type(obj)).add(obj.id)
+
+    def add_rows(self, model: Type[SQLModel], rows: Iterable[dict]) -> None:
+        """Lignes écrites hors ORM (dicts portant id et les colonnes écrites)."""
+        columns = _PROJECTED[model]
+        self._ids(model).update(
+            row["id"] for row in rows if any(name in row for name in columns)
+        )
+
+    def _ids(self, model: Type[SQLModel]) -> Set[str]:
+        return {
+            Affectation: self.affectation_ids,
+            Slot: self.slot_ids,
+            PlanningService: self.planning_ids,
+            Activite: self.activite_ids,
+            Campus: self.campus_ids,
+        }[model]
+
+    def conditions(self) -> List[Any]:
+        # pylint: disable=no-member
+        pairs = (
+            (Affectation.id, self.affectation_ids),
+            (Affectation.slot_id, self.slot_ids),
+            (Slot.planning_id, self.planning_ids),
+            (PlanningService.activite_id, self.activite_ids),
+            (Activite.campus_id, self.campus_ids),
+        )
+        return [col(column).in_(sorted(ids)) for column, ids in pairs if ids]
+
+
+def _source(*conditions: Any) -> Any:
+    """Affectations jointes jusqu'au campus, projetées dans l'ordre de _COLUMNS."""
+    return (
+        select(  # type: ignore[call-overload]
+            Affectation.id,
+            Affectation.membre_id,
+            Activite.campus_id,
+            Slot.planning_id,
+            Slot.date_debut,
+            Slot.date_fin,
+            Slot.nom_creneau,
+            Affectation.role_code,
+            Affectation.statut_affectation_code,
+            Activite.type,
+            Activite.lieu,
+            Campus.nom,
+        )
+        .join(Slot, col(Slot.id) == col(Affectation.slot_id))
+        .join(PlanningService, col(PlanningService.id) == col(Slot.planning_id))
+        .join(Activite, col(Activite.id) == col(PlanningService.activite_id))
+        .join(Campus, col(Campus.id) == col(Activite.campus_id))
+        .where(*conditions)
+    )
+
+
+# membre, nom, prénom, total, proposés, confirmés, refusés, présents,
+# absents, retards, écart moyen / min (jours), premier / dernier service
+ChargeRow = Tuple[
+    str,
+    str,
+    str,
+    int,
+    int,
+    int,
+    int,
+    int,
+    int,
+    int,
+    Optional[float],
+    Optional[float],
+    datetime,
+    datetime,
+]
+
+_POINTAGE = (
+    AffectationStatusCode.PRESENT.value,
+    AffectationStatusCode.ABSENT.value,
+    AffectationStatusCode.RETARD.value,
+)
+
+
+def _live() -> Any:
+    """Planning et activité non supprimés logiquement."""
+    # pylint: disable=no-member
+    return and_(
+        col(PlanningService.deleted_at).is_(None),
+        col(Activite.deleted_at).is_(None),
+    )
+
+
+class MembreAgendaRepository(BaseRepository[MembreAgenda]):
+    def __init__(self, db: Session):
+        super().__init__(db, MembreAgenda)
+
+    def refresh(self, keys: AgendaKeys) -> None:
+        """Recalcule les lignes issues des clés (1 upsert, + 1 DELETE si prune)."""
+        conditions = keys.conditions()
+        if not conditions:
+            return
+        table = MembreAgenda.__table__  # type: ignore[attr-defined]
+        scope = or_(*conditions)
+        if keys.prune:
+            inactive = _source(scope, not_(_live())).with_only_columns(
+                col(Affectation.id)
+            )
+            self.db.exec(  # type: ignore[call-overload]
+                delete(table).where(table.c.affectation_id.in_(inactive))
+            )
+        insert = _INSERTS[self.db.get_bind().dialect.name]
+        upsert: Any = insert(table).from_select(_COLUMNS, _source(scope, _live()))
+        self.db.exec(  # type: ignore[call-overload]
+            upsert.on_conflict_do_update(
+                index_elements=["affectation_id"],
+                set_={name: upsert.excluded[name] for name in _COLUMNS[1:]},
+            )
+        )
+
+    def list_range(
+        self, membre_id: str, campus_id: str, start: datetime, end: datetime
+    ) -> List[MemberAgendaEntryRead]:
+        """Entrées du membre sur le campus et la période (parcours d'index)."""
+        # pylint: disable=no-member
+        rows = self.db.exec(
+            select(  # type: ignore[call-overload]
+                *(getattr(MembreAgenda, name) for name in _COLUMNS)
+            )
+            .where(
+                MembreAgenda.membre_id == membre_id,
+                MembreAgenda.campus_id == campus_id,
+                col(MembreAgenda.date_debut) >= start,
+                col(MembreAgenda.date_debut) <= end,
+            )
+            .order_by(col(MembreAgenda.date_debut), col(MembreAgenda.affectation_id))
+        ).all()
+        entries = []
+        for row in rows:
+            data = dict(zip(_COLUMNS, row))
+            data["activite_nom"] = data["activite_type"]
+            entries.append(MemberAgendaEntryRead.model_validate(data))
+        return entries
+
+    def charge_by_membre(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        ministere_id: Optional[str] = None,
+        campus_id: Optional[str] = None,
+    ) -> List[ChargeRow]:
+        """
+        Charge par membre sur [start, end[ en une requête groupée : LAG
+        (fenêtre par membre) donne l'écart avec le service précédent du
+        périmètre, puis comptes filtrés par statut. Ministère : celui de
+        l'affectation, sinon l'organisateur de l'activité.
+        """
+        # pylint: disable=not-callable,no-member
+        conditions = [
+            col(MembreAgenda.date_debut) >= start,
+            col(MembreAgenda.date_debut) < end,
+        ]
+        if campus_id:
+            conditions.append(col(MembreAgenda.campus_id) == campus_id)
+        rows: Any = select(
+            col(MembreAgenda.membre_id),
+            col(MembreAgenda.date_debut),
+            col(MembreAgenda.statut_affectation_code).label("statut"),
+            func.lag(MembreAgenda.date_debut)
+            .over(
+                partition_by=col(MembreAgenda.membre_id),
+                order_by=(
+                    col(MembreAgenda.date_debut),
+                    col(MembreAgenda.affectation_id),
+                ),
+            )
+            .label("precedent"),
+        )
+        if ministere_id:
+            # ministere_id de l'affectation est facultatif : à défaut, celui
+            # qui organise l'activité du planning
+            rows = (
+                rows.join(
+                    Affectation,
+                    col(Affectation.id) == col(MembreAgenda.affectation_id),
+                )
+                .join(
+                    PlanningService,
+                    col(PlanningService.id) == col(MembreAgenda.planning_id),
+                )
+                .join(Activite, col(Activite.id) == col(PlanningService.activite_id))
+            )
+            conditions.append(
+                func.coalesce(
+                    Affectation.ministere_id, Activite.ministere_organisateur_id
+                )
+                == ministere_id
+            )
+        sub = rows.where(*conditions).subquery()
+
+        ecart = func.extract("epoch", sub.c.date_debut - sub.c.precedent) / 86400
+
+        def nb(*codes: str) -> Any:
+            return func.count().filter(sub.c.statut.in_(codes))
+
+        stmt = (
+            select(  # type: ignore[call-overload]
+                sub.c.membre_id,
+                Membre.nom,
+                Membre.prenom,
+                func.count(),
+                nb(AffectationStatusCode.PROPOSE.value),
+                nb(AffectationStatusCode.CONFIRME.value, *_POINTAGE),
+                nb(AffectationStatusCode.REFUSE.value),
+                *(nb(code) for code in _POINTAGE),
+                func.avg(ecart),
+                func.min(ecart),
+                func.min(sub.c.date_debut),
+                func.max(sub.c.date_debut),
+            )
+            .join(Membre, col(Membre.id) == sub.c.membre_id)
+            .group_by(sub.c.membre_id, col(Membre.nom), col(Membre.prenom))
+            .order_by(func.count().desc(), col(Membre.nom), sub.c.membre_id)
+        )
+        return [tuple(row) for row in self.db.exec(stmt).all()]  # type: ignore[misc]
+
+
+def _pending_keys(target: Any) -> Optional[AgendaKeys]:
+    session = object_session(target)
+    if session is None:
+        return None
+    return session.info.setdefault(_INFO_KEY, AgendaKeys())
+
+
+def _collect_insert(_mapper: Any, _connection: Any, target: Any) -> None:
+    keys = _pending_keys(target)
+    if keys is not None:
+        keys.affectation_ids.add(target.id)
+
+
+def _collect_update(_mapper: Any, _connection: Any, target: Any) -> None:
+    keys = _pending_keys(target)
+    if keys is not None:
+        keys.add(target)
+
+
+def _refresh_agenda_after_flush(session: Session, _flush_context: Any) -> None:
+    """Répercute dans l'agenda les écritures ORM du flush (même transaction)."""
+    keys = session.info.pop(_INFO_KEY, None)
+    if keys is not None:
+        MembreAgendaRepository(session).refresh(keys)
+
+
+def register_agenda_listeners() -> None:
+    """Branche la maintenance de l'agenda sur les flush ORM (idempotent).
+
+    Seuls les modèles sources déclenchent une collecte ; un flush qui ne
+    les touche pas ne coûte qu'une lecture de session.info.
+    """
+    if event.contains(Session, "after_flush", _refresh_agenda_after_flush):
+        return
+    event.listen(Affectation, "after_insert", _collect_insert)
+    for model in _PROJECTED:
+        event.listen(model, "after_update", _collect_update)
+    event.listen(Session, "after_flush", _refresh_agenda_after_flush)
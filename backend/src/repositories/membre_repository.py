@@ -1,6 +1,6 @@
-from typing import Any, List, Optional, cast
+from typing import Any, Collection, Dict, List, Optional, Tuple, cast
 
-from sqlalchemy import exists
+from sqlalchemy import and_, exists
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, col, distinct, func, select
 
@@ -9,6 +9,8 @@ from models import Membre
 from models.schema_db_model import (
     AffectationRole,
     Campus,
+    MembreCampusLink,
+    MembreMinistereLink,
     MembreRole,
     Role,
     Utilisateur,
@@ -29,6 +31,13 @@ def _exclude_superadmin_clause():
     )
 
 
+# (« prénom nom », actif, rattaché au ministère demandé)
+MembreEligibiliteRow = Tuple[str, bool, bool]
+
+# (id, nom, prénom, actif)
+MembreMinistereRow = Tuple[str, str, str, bool]
+
+
 class MembreRepository(BaseRepository[Membre]):
     def __init__(self, db: Session):
         super().__init__(db, Membre)
@@ -147,3 +156,55 @@ class MembreRepository(BaseRepository[Membre]):
         if result:
             self.db.refresh(result)
         return result
+
+    def get_eligibilite(
+        self, membre_ids: Collection[str], ministere_id: str
+    ) -> Dict[str, MembreEligibiliteRow]:
+        """Nom, statut actif et rattachement au ministère des membres (1 requête)."""
+        # pylint: disable=no-member
+        if not membre_ids:
+            return {}
+        rows = self.db.exec(
+            select(  # type: ignore[call-overload]
+                Membre.id,
+                Membre.prenom,
+                Membre.nom,
+                Membre.actif,
+                MembreMinistereLink.ministere_id,
+            )
+            .outerjoin(
+                MembreMinistereLink,
+                and_(
+                    col(MembreMinistereLink.membre_id) == col(Membre.id),
+                    col(MembreMinistereLink.ministere_id) == ministere_id,
+                ),
+            )
+            .where(col(Membre.id).in_(list(membre_ids)))
+        ).all()
+        return {
+            row[0]: (f"{row[1]} {row[2]}", row[3], row[4] is not None) for row in rows
+        }
+
+    def list_for_ministere(
+        self, ministere_id: str, campus_id: Optional[str] = None
+    ) -> List[MembreMinistereRow]:
+        """Membres non supprimés rattachés au ministère, triés par nom (1 requête)."""
+        stmt = (
+            select(Membre.id, Membre.nom, Membre.prenom, Membre.actif)
+            .join(
+                MembreMinistereLink,
+                col(MembreMinistereLink.membre_id) == col(Membre.id),
+            )
+            .where(
+                MembreMinistereLink.ministere_id == ministere_id,
+                Membre.deleted_at == None,  # noqa: E711
+            )
+        )
+        if campus_id:
+            stmt = stmt.join(
+                MembreCampusLink, col(MembreCampusLink.membre_id) == col(Membre.id)
+            ).where(MembreCampusLink.campus_id == campus_id)
+        rows = self.db.exec(
+            stmt.order_by(col(Membre.nom), col(Membre.prenom), col(Membre.id))
+        ).all()
+        return [(row[0], row[1], row[2], row[3]) for row in rows]
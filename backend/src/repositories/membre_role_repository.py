@@ -1,6 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Collection, List, Optional, Set, Tuple
 
-from sqlmodel import Session
+from sqlalchemy import tuple_
+from sqlmodel import Session, col, select
 
 from models import MembreRole
 
@@ -26,3 +27,41 @@ class MembreRoleRepository(BaseRepository[MembreRole]):
             MembreRole.membre_id == m_id, MembreRole.role_code == r_code.strip().upper()
         )
         return self.db.exec(statement).unique().first()
+
+    def held_roles(self, pairs: Collection[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """Sous-ensemble des couples (membre_id, role_code) détenus, en une requête."""
+        # pylint: disable=no-member
+        if not pairs:
+            return set()
+        rows = self.db.exec(
+            select(MembreRole.membre_id, MembreRole.role_code).where(
+                tuple_(col(MembreRole.membre_id), col(MembreRole.role_code)).in_(
+                    list(pairs)
+                )
+            )
+        ).all()
+        return {(row[0], row[1]) for row in rows}
+
+    def roles_of_membres(
+        self, membre_ids: Collection[str], role_codes: Collection[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Couples (membre_id, role_code) détenus parmi ces membres et rôles ;
+        pour chaque membre, le rôle principal d'abord.
+        """
+        # pylint: disable=no-member
+        if not membre_ids or not role_codes:
+            return []
+        rows = self.db.exec(
+            select(MembreRole.membre_id, MembreRole.role_code)
+            .where(
+                col(MembreRole.membre_id).in_(list(membre_ids)),
+                col(MembreRole.role_code).in_(list(role_codes)),
+            )
+            .order_by(
+                col(MembreRole.membre_id),
+                col(MembreRole.is_principal).desc(),
+                col(MembreRole.role_code),
+            )
+        ).all()
+        return [(row[0], row[1]) for row in rows]
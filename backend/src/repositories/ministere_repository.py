@@ -1,6 +1,6 @@
-from typing import Any, List, Optional, cast
+from typing import Any, Collection, List, Optional, Set, cast
 
-from sqlmodel import Session
+from sqlmodel import Session, col, select
 
 from models import Ministere
 from repositories.base_repository import BaseRepository
@@ -32,3 +32,16 @@ class MinistereRepository(BaseRepository[Ministere]):
         """Récupère la liste paginée avec les relations chargées."""
         rels = load_relations if load_relations is not None else self.relations
         return super().get_paginated(limit, offset, load_relations=rels)
+
+    def active_ids(self, ids: Collection[str]) -> Set[str]:
+        """Sous-ensemble des ministères existants et non supprimés (1 requête)."""
+        # pylint: disable=no-member
+        if not ids:
+            return set()
+        rows = self.db.exec(
+            select(Ministere.id).where(
+                col(Ministere.id).in_(list(ids)),
+                Ministere.deleted_at == None,  # noqa: E711
+            )
+        ).all()
+        return set(rows)
@@ -0,0 +1,148 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Sequence
+from uuid import uuid4
+
+from sqlalchemy import and_, delete, or_, update
+from sqlmodel import Session, col, select
+
+from mla_enum.custom_enum import OutboxStatus
+from models import NotificationOutbox
+from repositories.base_repository import BaseRepository
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class NotificationOutboxRepository(BaseRepository[NotificationOutbox]):
+    def __init__(self, db: Session):
+        super().__init__(db, NotificationOutbox)
+
+    def enqueue(
+        self, planning_id: str, event: str, payloads: Dict[str, List[dict]]
+    ) -> int:
+        """
+        Écrit une ligne par membre pour (planning, event), dans la transaction
+        courante. Une ligne encore PENDING pour la même clé est réécrite
+        (dernier contenu) au lieu d'être dupliquée. Retourne le nombre de
+        lignes insérées.
+        """
+        # pylint: disable=no-member
+        if not payloads:
+            return 0
+        pending = self.db.exec(
+            select(NotificationOutbox)
+            .where(
+                NotificationOutbox.planning_id == planning_id,
+                NotificationOutbox.event == event,
+                NotificationOutbox.status == OutboxStatus.PENDING.value,
+                col(NotificationOutbox.membre_id).in_(list(payloads)),
+            )
+            .with_for_update()
+        ).all()
+        now = _now()
+        for row in pending:
+            row.payload = json.dumps(payloads[row.membre_id])
+            row.available_at = now
+            self.db.add(row)
+        existing = {row.membre_id for row in pending}
+        rows = [
+            {
+                "id": str(uuid4()),
+                "planning_id": planning_id,
+                "membre_id": membre_id,
+                "event": event,
+                "payload": json.dumps(items),
+                "status": OutboxStatus.PENDING.value,
+                "attempts": 0,
+                "available_at": now,
+                "created_at": now,
+            }
+            for membre_id, items in payloads.items()
+            if membre_id not in existing
+        ]
+        return self.bulk_insert(rows)
+
+    def claim(self, limit: int, lease_seconds: float) -> List[NotificationOutbox]:
+        """
+        Verrouille jusqu'à `limit` lignes dues (SKIP LOCKED : plusieurs workers
+        se partagent la file) et les passe en PROCESSING. Une ligne PROCESSING
+        dont le bail a expiré (worker tombé) est reprise.
+        """
+        # pylint: disable=no-member
+        now = _now()
+        stmt = (
+            select(NotificationOutbox)
+            .where(
+                or_(
+                    and_(
+                        col(NotificationOutbox.status) == OutboxStatus.PENDING.value,
+                        col(NotificationOutbox.available_at) <= now,
+                    ),
+                    and_(
+                        col(NotificationOutbox.status) == OutboxStatus.PROCESSING.value,
+                        col(NotificationOutbox.locked_at)
+                        < now - timedelta(seconds=lease_seconds),
+                    ),
+                )
+            )
+            .order_by(col(NotificationOutbox.available_at))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = list(self.db.exec(stmt).all())
+        for row in rows:
+            row.status = OutboxStatus.PROCESSING.value
+            row.locked_at = now
+            row.attempts += 1
+            self.db.add(row)
+        self.db.flush()
+        return rows
+
+    def mark_sent(self, ids: Sequence[str]) -> None:
+        # pylint: disable=no-member
+        if not ids:
+            return
+        self.db.exec(  # type: ignore[call-overload]
+            update(NotificationOutbox)
+            .where(col(NotificationOutbox.id).in_(list(ids)))
+            .values(
+                status=OutboxStatus.SENT.value,
+                sent_at=_now(),
+                locked_at=None,
+                last_error=None,
+            )
+        )
+
+    def mark_failed(
+        self,
+        rows: Sequence[NotificationOutbox],
+        error: str,
+        max_attempts: int,
+        retry_seconds: float,
+    ) -> None:
+        """Replanifie avec backoff exponentiel, ou FAILED après max_attempts."""
+        now = _now()
+        for row in rows:
+            row.locked_at = None
+            row.last_error = error[:500]
+            if row.attempts >= max_attempts:
+                row.status = OutboxStatus.FAILED.value
+            else:
+                row.status = OutboxStatus.PENDING.value
+                delay = retry_seconds * (2 ** (row.attempts - 1))
+                row.available_at = now + timedelta(seconds=delay)
+            self.db.add(row)
+        self.db.flush()
+
+    def purge_sent(self, retention: timedelta) -> int:
+        """Supprime les lignes SENT envoyées avant la rétention."""
+        # pylint: disable=no-member
+        result = self.db.exec(  # type: ignore[call-overload]
+            delete(NotificationOutbox).where(
+                col(NotificationOutbox.status) == OutboxStatus.SENT.value,
+                col(NotificationOutbox.sent_at) < _now() - retention,
+            )
+        )
+        return result.rowcount
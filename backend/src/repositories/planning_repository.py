@@ -1,11 +1,14 @@
 # src/repositories/planning_repository.py
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from sqlalchemy import delete, literal, tuple_
 from sqlalchemy.orm import joinedload, selectinload
-from sqlmodel import Session, and_, select
+from sqlmodel import Session, and_, col, select
 
-from models import Activite, PlanningService
-from models.schema_db_model import Affectation, MembreRole, Slot
+from models import Activite, Campus, Membre, Ministere, PlanningService
+from models.planning_model import PlanningFullRead
+from models.schema_db_model import Affectation, MembreRole, PlanningChantLink, Slot
 
 from .base_repository import BaseRepository
 
@@ -22,6 +25,218 @@ class PlanningRepository(BaseRepository[PlanningService]):
         )
         return self.db.exec(statement).all()
 
+    def list_by_ministere_in_range(
+        self, ministere_id: str, date_debut: datetime, date_fin: datetime
+    ) -> List[Tuple[str, str, datetime]]:
+        """
+        Plannings actifs d'un ministère dont l'activité débute dans
+        [date_debut, date_fin], en une seule requête.
+        Retourne des tuples (planning_id, activite_type, activite_date_debut)
+        triés par date de début.
+        """
+        statement = (
+            select(PlanningService.id, Activite.type, Activite.date_debut)
+            .join(Activite, col(Activite.id) == PlanningService.activite_id)
+            .where(
+                Activite.ministere_organisateur_id == ministere_id,
+                Activite.date_debut >= date_debut,
+                Activite.date_debut <= date_fin,
+                PlanningService.deleted_at == None,  # noqa: E711
+            )
+            .order_by(col(Activite.date_debut), col(PlanningService.id))
+        )
+        return [(row[0], row[1], row[2]) for row in self.db.exec(statement).all()]
+
+    def list_full_projection(
+        self,
+        *conditions: Any,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[PlanningFullRead]:
+        """
+        Plannings complets (activité + slots + affectations) en projection :
+        3 SELECT colonnaires assemblés par regroupement de dicts, sans
+        entités ORM ni identity map. `conditions` filtre PlanningService /
+        Activite. Tri : plannings par (date_debut, id), slots par
+        (date_debut, id), affectations par id.
+        `after` / `limit` : pagination keyset sur (Activite.date_debut, id).
+        """
+        if after is not None:
+            conditions += (
+                tuple_(col(Activite.date_debut), col(PlanningService.id))
+                > tuple_(literal(after[0]), literal(after[1])),
+            )
+        plannings = self._project_plannings(conditions, limit)
+        if not plannings:
+            return []
+        slots = self._project_slots(plannings)
+        self._project_affectations(slots)
+        return [PlanningFullRead.model_validate(p) for p in plannings.values()]
+
+    def _project_plannings(
+        self, conditions: Sequence[Any], limit: Optional[int]
+    ) -> Dict[str, dict]:
+        statement = (
+            select(  # type: ignore[call-overload]
+                PlanningService.id,
+                PlanningService.statut_code,
+                PlanningService.template_id,
+                Activite.id,
+                Activite.type,
+                Activite.date_debut,
+                Activite.date_fin,
+                Activite.lieu,
+                Activite.description,
+                Activite.campus_id,
+                Activite.ministere_organisateur_id,
+                Campus.nom,
+                Ministere.nom,
+            )
+            .join(Activite, col(Activite.id) == PlanningService.activite_id)
+            .outerjoin(Campus, col(Campus.id) == Activite.campus_id)
+            .outerjoin(
+                Ministere, col(Ministere.id) == Activite.ministere_organisateur_id
+            )
+            .where(PlanningService.deleted_at == None, *conditions)  # noqa: E711
+            .order_by(col(Activite.date_debut), col(PlanningService.id))
+            .limit(limit)
+        )
+        plannings: Dict[str, dict] = {}
+        for row in self.db.exec(statement).all():
+            plannings[row[0]] = {
+                "id": row[0],
+                "statut_code": row[1],
+                "activite_id": row[3],
+                "template_id": row[2],
+                "activite": {
+                    "id": row[3],
+                    "type": row[4],
+                    "date_debut": row[5],
+                    "date_fin": row[6],
+                    "lieu": row[7],
+                    "description": row[8],
+                    "campus_id": row[9],
+                    "ministere_organisateur_id": row[10],
+                    "campus_nom": row[11],
+                    "ministere_organisateur_nom": row[12],
+                },
+                "slots": [],
+            }
+        return plannings
+
+    def _project_slots(self, plannings: Dict[str, dict]) -> Dict[str, dict]:
+        # pylint: disable=no-member
+        statement = (
+            select(  # type: ignore[call-overload]
+                Slot.id,
+                Slot.planning_id,
+                Slot.nom_creneau,
+                Slot.date_debut,
+                Slot.date_fin,
+                Slot.nb_personnes_requis,
+            )
+            .where(col(Slot.planning_id).in_(list(plannings)))
+            .order_by(col(Slot.date_debut), col(Slot.id))
+        )
+        slots: Dict[str, dict] = {}
+        for row in self.db.exec(statement).all():
+            slot = {
+                "id": row[0],
+                "nom_creneau": row[2],
+                "date_debut": row[3],
+                "date_fin": row[4],
+                "nb_personnes_requis": row[5],
+                "affectations": [],
+            }
+            slots[row[0]] = slot
+            plannings[row[1]]["slots"].append(slot)
+        return slots
+
+    def _project_affectations(self, slots: Dict[str, dict]) -> None:
+        # pylint: disable=no-member
+        if not slots:
+            return
+        statement = (
+            select(  # type: ignore[call-overload]
+                Affectation.id,
+                Affectation.slot_id,
+                Affectation.statut_affectation_code,
+                Affectation.role_code,
+                Affectation.ministere_id,
+                Membre.id,
+                Membre.nom,
+                Membre.prenom,
+                Ministere.nom,
+            )
+            .outerjoin(Membre, col(Membre.id) == Affectation.membre_id)
+            .outerjoin(Ministere, col(Ministere.id) == Affectation.ministere_id)
+            .where(col(Affectation.slot_id).in_(list(slots)))
+            .order_by(col(Affectation.id))
+        )
+        for row in self.db.exec(statement).all():
+            slots[row[1]]["affectations"].append(
+                {
+                    "id": row[0],
+                    "statut_affectation_code": row[2],
+                    "role_code": row[3],
+                    "membre": (
+                        {"id": row[5], "nom": row[6], "prenom": row[7]}
+                        if row[5]
+                        else None
+                    ),
+                    "ministere_id": row[4],
+                    "ministere_nom": row[8],
+                }
+            )
+
+    def list_serie_plannings(self, serie_id: str) -> List[Tuple[str, Any, str]]:
+        """(id, activite_id, statut_code) des plannings d'une série."""
+        rows = self.db.exec(
+            select(
+                PlanningService.id,
+                PlanningService.activite_id,
+                PlanningService.statut_code,
+            ).where(PlanningService.serie_id == serie_id)
+        ).all()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def delete_cascade(
+        self, planning_ids: Sequence[str], activite_ids: Sequence[str]
+    ) -> Dict[str, int]:
+        """
+        Supprime des plannings et toute leur descendance, une requête par
+        table (affectations → slots → liens chants → plannings → activités).
+        Retourne le nombre de lignes supprimées par table.
+        """
+        # pylint: disable=no-member
+        ids = list(planning_ids)
+        slot_ids = select(Slot.id).where(col(Slot.planning_id).in_(ids))
+        statements: List[Tuple[str, Any]] = [
+            (
+                "affectations",
+                delete(Affectation).where(col(Affectation.slot_id).in_(slot_ids)),
+            ),
+            ("slots", delete(Slot).where(col(Slot.planning_id).in_(ids))),
+            (
+                "chants",
+                delete(PlanningChantLink).where(
+                    col(PlanningChantLink.planning_id).in_(ids)
+                ),
+            ),
+            (
+                "plannings",
+                delete(PlanningService).where(col(PlanningService.id).in_(ids)),
+            ),
+        ]
+        if activite_ids:
+            statements.append(
+                (
+                    "activites",
+                    delete(Activite).where(col(Activite.id).in_(list(activite_ids))),
+                )
+            )
+        return {table: self.db.exec(stmt).rowcount for table, stmt in statements}
+
     def get_with_slots(self, planning_id: str) -> Optional[PlanningService]:
         """Récupère un planning avec tous ses slots chargés."""
         statement = (
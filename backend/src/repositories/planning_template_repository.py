@@ -1,12 +1,15 @@
 """Repository pour les templates de planning."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, col, select
 
 from models.schema_db_model import (
+    Activite,
+    PlanningService,
     PlanningTemplate,
     PlanningTemplateRole,
     PlanningTemplateRoleMembre,
@@ -14,6 +17,9 @@ from models.schema_db_model import (
 )
 from repositories.base_repository import BaseRepository
 
+# (template, usage_count, last_used_at, nb_creneaux)
+TemplateStatsRow = Tuple[PlanningTemplate, int, Optional[datetime], int]
+
 
 class PlanningTemplateRepository(BaseRepository[PlanningTemplate]):
     """CRUD repository pour PlanningTemplate."""
@@ -63,6 +69,75 @@ class PlanningTemplateRepository(BaseRepository[PlanningTemplate]):
         )
         return list(self.db.exec(stmt).all())
 
+    def list_with_stats(
+        self,
+        *,
+        campus_id: Optional[str] = None,
+        ministere_id: Optional[str] = None,
+        visibility: Optional[Any] = None,
+    ) -> List[TemplateStatsRow]:
+        """Liste les templates avec usage_count, last_used_at et nb_creneaux.
+
+        Une seule requête : les statistiques sont agrégées dans deux
+        sous-requêtes GROUP BY jointes en LEFT OUTER JOIN. `visibility`
+        est une clause SQL optionnelle appliquée au WHERE.
+        Tri : last_used_at DESC NULLS LAST.
+        """
+        stmt = self._stats_statement()
+        if campus_id:
+            stmt = stmt.where(PlanningTemplate.campus_id == campus_id)
+        if ministere_id:
+            stmt = stmt.where(PlanningTemplate.ministere_id == ministere_id)
+        if visibility is not None:
+            stmt = stmt.where(visibility)
+        return [(row[0], row[1], row[2], row[3]) for row in self.db.exec(stmt).all()]
+
+    def get_with_stats(self, template_id: str) -> Optional[TemplateStatsRow]:
+        """Retourne (template, usage_count, last_used_at, nb_creneaux) ou None."""
+        stmt = self._stats_statement().where(PlanningTemplate.id == template_id)
+        row = self.db.exec(stmt).first()
+        return (row[0], row[1], row[2], row[3]) if row else None
+
+    def _stats_statement(self):  # type: ignore[no-untyped-def]
+        """SELECT template + statistiques agrégées (usage, dernière date, slots)."""
+        # pylint: disable=not-callable,no-member
+        usage = (
+            select(
+                PlanningService.template_id,
+                func.count(col(PlanningService.id)).label("usage_count"),
+                func.max(Activite.date_debut).label("last_used_at"),
+            )
+            .outerjoin(Activite, col(Activite.id) == PlanningService.activite_id)
+            .where(
+                col(PlanningService.template_id).is_not(None),
+                col(PlanningService.deleted_at).is_(None),
+            )
+            .group_by(col(PlanningService.template_id))
+            .subquery()
+        )
+        creneaux = (
+            select(
+                PlanningTemplateSlot.template_id,
+                func.count(col(PlanningTemplateSlot.id)).label("nb_creneaux"),
+            )
+            .group_by(col(PlanningTemplateSlot.template_id))
+            .subquery()
+        )
+        return (
+            select(
+                PlanningTemplate,
+                func.coalesce(usage.c.usage_count, 0),
+                usage.c.last_used_at,
+                func.coalesce(creneaux.c.nb_creneaux, 0),
+            )
+            .outerjoin(usage, usage.c.template_id == PlanningTemplate.id)
+            .outerjoin(creneaux, creneaux.c.template_id == PlanningTemplate.id)
+            .order_by(
+                usage.c.last_used_at.desc().nullslast(),
+                desc(col(PlanningTemplate.created_at)),
+            )
+        )
+
     def increment_used_count(self, template_id: str) -> None:
         """Incrémente le compteur d'utilisation du template."""
         template = self.get_by_id(template_id)
@@ -70,3 +145,27 @@ class PlanningTemplateRepository(BaseRepository[PlanningTemplate]):
             template.used_count += 1
             self.db.add(template)
             self.db.flush()
+
+    def roles_by_slot_name(
+        self, template_ids: Collection[str]
+    ) -> Dict[Tuple[str, str], Set[str]]:
+        """(template_id, nom_creneau) → codes de rôles du créneau (1 requête)."""
+        # pylint: disable=no-member
+        roles: Dict[Tuple[str, str], Set[str]] = {}
+        if not template_ids:
+            return roles
+        rows = self.db.exec(
+            select(
+                PlanningTemplateSlot.template_id,
+                PlanningTemplateSlot.nom_creneau,
+                PlanningTemplateRole.role_code,
+            )
+            .join(
+                PlanningTemplateRole,
+                col(PlanningTemplateRole.slot_id) == col(PlanningTemplateSlot.id),
+            )
+            .where(col(PlanningTemplateSlot.template_id).in_(list(template_ids)))
+        ).all()
+        for template_id, nom_creneau, role_code in rows:
+            roles.setdefault((template_id, nom_creneau), set()).add(role_code)
+        return roles
@@ -1,9 +1,105 @@
-from sqlmodel import Session
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
 
-from models import Slot
+from sqlalchemy import func
+from sqlmodel import Session, col, select
+
+from models import DEFAULT_NB_PERSONNES_REQUIS, Activite, PlanningService, Slot
+from models.schema_db_model import Affectation
 from repositories.base_repository import BaseRepository
+from repositories.membre_agenda_repository import AgendaKeys, MembreAgendaRepository
+
+# (slot_id, planning_id, template_id, nom_creneau, début, fin, quota, nb_affectations)
+SlotDemandRow = Tuple[str, str, Optional[str], str, datetime, datetime, int, int]
 
 
 class SlotRepository(BaseRepository[Slot]):
     def __init__(self, db: Session):
         super().__init__(db, Slot)
+
+    def get_sync_state(self, planning_id: str) -> Dict[str, Dict[str, Any]]:
+        """Colonnes éditables des slots d'un planning, indexées par id (1 requête)."""
+        columns = ("id", "nom_creneau", "date_debut", "date_fin", "nb_personnes_requis")
+        rows = self.db.exec(
+            select(  # type: ignore[call-overload]
+                *(getattr(Slot, name) for name in columns)
+            ).where(Slot.planning_id == planning_id)
+        ).all()
+        return {row[0]: dict(zip(columns, row)) for row in rows}
+
+    def bulk_update(self, rows: List[dict]) -> int:
+        written = super().bulk_update(rows)
+        # Hors ORM : l'agenda des affectations de ces slots est recalculé ici
+        keys = AgendaKeys()
+        keys.add_rows(Slot, rows)
+        MembreAgendaRepository(self.db).refresh(keys)
+        return written
+
+    def live_ids(self, ids: Collection[str]) -> Set[str]:
+        """Sous-ensemble des slots existants dont le planning n'est pas supprimé."""
+        # pylint: disable=no-member
+        if not ids:
+            return set()
+        rows = self.db.exec(
+            select(Slot.id)
+            .join(
+                PlanningService,
+                col(PlanningService.id) == col(Slot.planning_id),
+            )
+            .where(
+                col(Slot.id).in_(list(ids)),
+                PlanningService.deleted_at == None,  # noqa: E711
+            )
+        ).all()
+        return set(rows)
+
+    def fill_counts(self, *conditions: Any) -> List[Tuple[str, str, int, int]]:
+        """
+        (slot_id, planning_id, quota, nb_affectations) de chaque slot des
+        plannings non supprimés filtrés par conditions (Slot, PlanningService,
+        Activite). Une seule requête groupée : aucune affectation n'est chargée.
+        """
+        # pylint: disable=not-callable,assignment-from-no-return
+        quota = func.coalesce(Slot.nb_personnes_requis, DEFAULT_NB_PERSONNES_REQUIS)
+        stmt = (
+            select(Slot.id, Slot.planning_id, quota, func.count(col(Affectation.id)))
+            .join(
+                PlanningService,
+                col(PlanningService.id) == col(Slot.planning_id),
+            )
+            .join(Activite, col(Activite.id) == col(PlanningService.activite_id))
+            .outerjoin(Affectation, col(Affectation.slot_id) == col(Slot.id))
+            .where(PlanningService.deleted_at == None, *conditions)  # noqa: E711
+            .group_by(col(Slot.id))
+            .order_by(col(Slot.planning_id), col(Slot.date_debut), col(Slot.id))
+        )
+        return [(row[0], row[1], row[2], row[3]) for row in self.db.exec(stmt).all()]
+
+    def staffing_demand(self, *conditions: Any) -> List[SlotDemandRow]:
+        """
+        Créneaux des plannings non supprimés filtrés par conditions (Slot,
+        PlanningService), avec quota et nombre d'affectations (1 requête groupée).
+        """
+        # pylint: disable=not-callable,assignment-from-no-return
+        quota = func.coalesce(Slot.nb_personnes_requis, DEFAULT_NB_PERSONNES_REQUIS)
+        stmt = (
+            select(  # type: ignore[call-overload]
+                Slot.id,
+                Slot.planning_id,
+                PlanningService.template_id,
+                Slot.nom_creneau,
+                Slot.date_debut,
+                Slot.date_fin,
+                quota,
+                func.count(col(Affectation.id)),
+            )
+            .join(
+                PlanningService,
+                col(PlanningService.id) == col(Slot.planning_id),
+            )
+            .outerjoin(Affectation, col(Affectation.slot_id) == col(Slot.id))
+            .where(PlanningService.deleted_at == None, *conditions)  # noqa: E711
+            .group_by(col(Slot.id), col(PlanningService.template_id))
+            .order_by(col(Slot.date_debut), col(Slot.id))
+        )
+        return [tuple(row) for row in self.db.exec(stmt).all()]
@@ -3,9 +3,10 @@ Router admin — capabilities et permissions des rôles.
 
 Préfixe : /admin
 Accès : CAMPUS_ADMIN (lecture) / ROLE_MANAGE (écriture).
+Expose aussi les compteurs des caches process (lecture).
 """
 
-from typing import Any, List, cast
+from typing import Any, Dict, List, cast
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import selectinload
@@ -14,9 +15,16 @@ from sqlmodel import Session, delete, select
 from conf.db.database import Database
 from core.audit import audit
 from core.auth.auth_dependencies import CasbinGuard, get_current_active_user
-from core.auth.casbin_enforcer import build_enforcer
+from core.auth.casbin_enforcer import (
+    SUBJECT_ROLE,
+    publish_policy_change,
+    sync_role_policies,
+)
+from core.auth.principal_cache import principal_cache
+from core.auth.revoked_filter import revoked_filter
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import RBAC_ROLES, reference_cache
 from mla_enum import RoleName
 from models import Utilisateur
 from models.permission_model import (
@@ -89,6 +97,25 @@ def list_capabilities(
     return [PermissionCodeRead(id=p.id, code=p.code) for p in perms]
 
 
+# ------------------------------------------------------------------ #
+#  CACHES
+# ------------------------------------------------------------------ #
+
+
+@router.get(
+    "/cache-stats",
+    status_code=status.HTTP_200_OK,
+    summary="Compteurs des caches du process (principaux, révocations, référentiels)",
+    dependencies=[_READ_GUARD],
+)
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {
+        "auth_cache": principal_cache.stats(),
+        "revoked_filter": revoked_filter.stats(),
+        "reference_cache": reference_cache.stats(),
+    }
+
+
 # ------------------------------------------------------------------ #
 #  RÔLES + PERMISSIONS
 # ------------------------------------------------------------------ #
@@ -132,6 +159,7 @@ def create_role(
     db.add(role)
     db.flush()
     db.refresh(role)
+    reference_cache.invalidate(db, RBAC_ROLES)
     audit("role_created", user_id=current_user.id, role_libelle=payload.libelle)
     return RoleWithPermissionsRead(id=role.id, libelle=role.libelle, permissions=[])
 
@@ -166,6 +194,7 @@ def delete_role(
         delete(RolePermission).where(cast(Any, RolePermission.role_id) == role_id)
     )
     db.delete(role)
+    reference_cache.invalidate(db, RBAC_ROLES)
 
 
 @router.patch(
@@ -216,5 +245,8 @@ def update_role_permissions(
         role_id=role_id,
         permissions=",".join(payload.permission_codes),
     )
-    build_enforcer(db)
+    publish_policy_change(db, SUBJECT_ROLE, role_id)
+    sync_role_policies(db, role_id)
+    # Les principaux en cache portent les permissions du rôle : on repart à zéro
+    principal_cache.clear()
     return _role_to_read(updated)
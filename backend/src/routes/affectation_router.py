@@ -1,15 +1,29 @@
 # src/routes/affectation_router.py
+from datetime import date
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
 
 from conf.db.database import Database
 from core.auth.auth_dependencies import CapabilityChecker, get_current_active_user
 from mla_enum.custom_enum import AffectationStatusCode
-from models import AffectationCreate, AffectationRead, AffectationUpdate, Utilisateur
+from models import (
+    AffectationBulkCreate,
+    AffectationBulkResult,
+    AffectationCreate,
+    AffectationRead,
+    AffectationUpdate,
+    AutoStaffingRequest,
+    AutoStaffingResult,
+    StatistiquesChargeRead,
+    Utilisateur,
+)
 from models.affectation_model import AffectationMemberRead
 from models.base_pagination import PaginatedResponse
 from routes.deps import STANDARD_ADMIN_ONLY_DEPS
 from services.affectation_service import AffectationService
+from services.auto_staffing_service import AutoStaffingService
 
 from .base_route_factory import CRUDRouterFactory
 
@@ -46,6 +60,25 @@ def get_pending_count(
     return service.get_pending_count(current_user.membre_id)
 
 
+@me_router.get(
+    "/statistiques",
+    response_model=StatistiquesChargeRead,
+    dependencies=[Depends(CapabilityChecker(["PLANNING_WRITE"]))],
+)
+def get_statistiques_charge(
+    date_debut: date,
+    date_fin: date,
+    *,
+    ministere_id: Optional[str] = None,
+    campus_id: Optional[str] = None,
+    db: Session = Depends(Database.get_db_for_route),
+) -> StatistiquesChargeRead:
+    """Charge, confirmation, présence et écart entre services par membre."""
+    return AffectationService(db).get_statistiques_charge(
+        date_debut, date_fin, ministere_id=ministere_id, campus_id=campus_id
+    )
+
+
 # Factory CRUD — génère GET /, GET /all, GET /{id}, POST /, PATCH /{id}, DELETE /{id}
 factory = CRUDRouterFactory(
     service_class=AffectationService,
@@ -62,6 +95,33 @@ router = factory.router
 admin_or_resp = Depends(CapabilityChecker(["PLANNING_WRITE"]))
 
 
+@router.post(
+    "/bulk",
+    response_model=AffectationBulkResult,
+    dependencies=[admin_or_resp],
+)
+def assign_members_bulk(
+    payload: AffectationBulkCreate,
+    db: Session = Depends(Database.get_db_for_route),
+) -> AffectationBulkResult:
+    """Affecte un lot de membres en une requête ; erreurs rapportées par item."""
+    service = AffectationService(db)
+    return service.assign_members_bulk(payload)
+
+
+@router.post(
+    "/auto-staffing",
+    response_model=AutoStaffingResult,
+    dependencies=[admin_or_resp],
+)
+def auto_staff(
+    payload: AutoStaffingRequest,
+    db: Session = Depends(Database.get_db_for_route),
+) -> AutoStaffingResult:
+    """Propose (et, si appliquer, crée) les affectations des créneaux incomplets."""
+    return AutoStaffingService(db).propose(payload)
+
+
 @router.patch("/{affectation_id}/my-status")
 def change_my_affectation_status(
     affectation_id: str,
@@ -1,4 +1,5 @@
 # src/routes/indisponibilite_router.py
+from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, status
@@ -12,6 +13,7 @@ from models.indisponibilite_model import (
     IndisponibiliteCreate,
     IndisponibiliteRead,
     IndisponibiliteReadFull,
+    MatriceDisponibiliteRead,
 )
 from models.schema_db_model import Indisponibilite
 from routes.dependance import get_current_membre
@@ -81,8 +83,8 @@ def delete_my_indisponibilite(
 def list_by_campus(
     campus_id: str,
     ministere_id: Optional[str] = None,
-    date_debut: Optional[str] = None,
-    date_fin: Optional[str] = None,
+    date_debut: Optional[date] = None,
+    date_fin: Optional[date] = None,
     validee_only: bool = False,
     *,
     limit: int = Query(20, ge=1, le=200),
@@ -134,11 +136,35 @@ def admin_delete_indisponibilite(
 )
 def get_validated_for_period(
     campus_id: str,
-    date_debut: str,
-    date_fin: str,
+    date_debut: date,
+    date_fin: date,
     db: Session = Depends(Database.get_session),
 ) -> list[IndisponibiliteReadFull]:
     """Indisponibilités validées chevauchant une période (pour le planning)."""
     return IndisponibiliteService(db).get_validated_for_campus_period(
         campus_id, date_debut, date_fin
     )
+
+
+@router.get(
+    "/ministere/{ministere_id}/matrice",
+    response_model=MatriceDisponibiliteRead,
+    dependencies=[admin_or_resp],
+)
+def get_matrice_disponibilite(
+    ministere_id: str,
+    date_debut: date,
+    date_fin: date,
+    *,
+    campus_id: Optional[str] = None,
+    validee_only: bool = False,
+    db: Session = Depends(Database.get_session),
+) -> MatriceDisponibiliteRead:
+    """Matrice membre × jour (disponibilité, éligibilité) pour l'éditeur de planning."""
+    return IndisponibiliteService(db).get_matrice_disponibilite(
+        ministere_id,
+        date_debut,
+        date_fin,
+        campus_id=campus_id,
+        validee_only=validee_only,
+    )
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Optional
 
-from fastapi import BackgroundTasks, Depends, Query, status
+from fastapi import Depends, Query, status
 from sqlmodel import Session
 
 from conf.db.database import Database
@@ -18,17 +19,18 @@ from models import (
     PlanningServiceUpdate,
     SlotCreate,
     SlotRead,
+    StaffingMetricsRead,
     Utilisateur,
 )
+from models.base_pagination import CursorPage
 from models.planning_model import (
     PlanningChantRead,
     PlanningFullCreate,
     PlanningFullRead,
     PlanningFullUpdate,
     PlanningRepertoireUpdate,
+    PlanningWindow,
 )
-from notification.notification_repository import EmailRepository
-from notification.notification_service import EmailService
 from routes.deps import STANDARD_ADMIN_ONLY_DEPS
 from services.planing_service import PlanningServiceSvc
 from services.slot_service import SlotService
@@ -38,6 +40,25 @@ from .base_route_factory import CRUDRouterFactory
 # Dépendance partagée pour la gestion du planning (RESPONSABLE+ requis)
 planning_manager = Depends(CapabilityChecker(["PLANNING_WRITE"]))
 
+
+def planning_window(
+    date_from: Optional[datetime] = Query(
+        None, alias="from", description="Début de fenêtre (défaut : J-7)"
+    ),
+    date_to: Optional[datetime] = Query(
+        None, alias="to", description="Fin de fenêtre (exclusive)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor de la page précédente"
+    ),
+    limit: int = Query(50, ge=1, le=200),
+) -> PlanningWindow:
+    """Fenêtre de dates + pagination keyset des listes de plannings."""
+    return PlanningWindow(
+        date_from=date_from, date_to=date_to, cursor=cursor, limit=limit
+    )
+
+
 # Configuration du Router Factory pour Planning
 factory = CRUDRouterFactory(
     service_class=PlanningServiceSvc,
@@ -141,17 +162,10 @@ def update_full_planning_endpoint(
 def change_planning_status(
     planning_id: str,
     new_status: PlanningStatusCode,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(Database.get_db_for_route),
 ):
     svc = PlanningServiceSvc(db)
-    email_svc = EmailService(EmailRepository())
-    svc.update_planning_status(
-        planning_id,
-        new_status,
-        background_tasks=background_tasks,
-        email_service=email_svc,
-    )
+    svc.update_planning_status(planning_id, new_status, notify=True)
     return {"data": svc.get_full_planning(planning_id)}
 
 
@@ -173,6 +187,22 @@ def delete_full_planning_endpoint(
     svc.delete_full_planning(planning_id)
 
 
+@router.delete(
+    "/series/{serie_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Suppression d'une série de plannings",
+    description=(
+        "Supprime tous les plannings générés avec ce serie_id, leurs slots, "
+        "affectations, répertoires et activités. Refusé si l'un d'eux est publié."
+    ),
+    dependencies=[planning_manager],
+)
+def delete_serie_endpoint(
+    serie_id: str, db: Session = Depends(Database.get_db_for_route)
+):
+    PlanningServiceSvc(db).delete_serie(serie_id)
+
+
 @router.get("/{planning_id}/full", response_model=DataResponse[PlanningFullRead])
 def read_full_planning(
     planning_id: str,
@@ -185,59 +215,96 @@ def read_full_planning(
 
 @router.get(
     "/my/calendar",
-    response_model=DataListResponse[PlanningFullRead],
+    response_model=CursorPage[PlanningFullRead],
     summary="Plannings personnels de l'utilisateur connecté",
     description=(
-        "Retourne tous les plannings complets où l'utilisateur connecté "
-        "est affecté dans au moins un créneau."
+        "Retourne les plannings complets où l'utilisateur connecté "
+        "est affecté dans au moins un créneau (fenêtre from/to, paginé)."
     ),
 )
 def list_my_calendar(
     campus_id: str = Depends(get_active_campus),
+    window: PlanningWindow = Depends(planning_window),
     current_user: Utilisateur = Depends(get_current_active_user),
     db: Session = Depends(Database.get_db_for_route),
 ):
     if not current_user.membre_id:
-        return {"data": []}
+        return CursorPage[PlanningFullRead](data=[], limit=window.limit)
     svc = PlanningServiceSvc(db)
-    return {"data": svc.list_my_plannings_full(current_user.membre_id, campus_id)}
+    return svc.list_my_plannings_full(current_user.membre_id, campus_id, window)
 
 
 @router.get(
     "/by-ministere/{ministere_id}",
-    response_model=DataListResponse[PlanningFullRead],
+    response_model=CursorPage[PlanningFullRead],
     summary="Plannings d'un ministère",
     description=(
-        "Retourne tous les plannings complets (activité + slots + affectations) "
-        "organisés par un ministère donné. Accessible à tout utilisateur authentifié."
+        "Retourne les plannings complets (activité + slots + affectations) "
+        "organisés par un ministère donné, triés par date puis paginés par "
+        "curseur (next_cursor). Accessible à tout utilisateur authentifié."
     ),
 )
 def list_by_ministere(
     ministere_id: str,
     campus_id: Optional[str] = Query(None),
+    window: PlanningWindow = Depends(planning_window),
     db: Session = Depends(Database.get_db_for_route),
     current_user: Utilisateur = Depends(get_current_active_user),
 ):
     svc = PlanningServiceSvc(db)
-    return {"data": svc.list_by_ministere(ministere_id, current_user, campus_id)}
+    return svc.list_by_ministere(ministere_id, current_user, campus_id, window)
 
 
 @router.get(
     "/by-campus/{campus_id}",
-    response_model=DataListResponse[PlanningFullRead],
+    response_model=CursorPage[PlanningFullRead],
     summary="Plannings d'un campus",
     description=(
-        "Retourne tous les plannings complets (activité + slots + affectations) "
-        "dont l'activité se déroule sur le campus spécifié."
+        "Retourne les plannings complets (activité + slots + affectations) "
+        "dont l'activité se déroule sur le campus spécifié, triés par date "
+        "puis paginés par curseur (next_cursor)."
     ),
 )
 def list_by_campus(
     campus_id: str,
+    window: PlanningWindow = Depends(planning_window),
     db: Session = Depends(Database.get_db_for_route),
     current_user: Utilisateur = Depends(get_current_active_user),
 ):
     svc = PlanningServiceSvc(db)
-    return {"data": svc.list_by_campus(campus_id, current_user)}
+    return svc.list_by_campus(campus_id, current_user, window)
+
+
+@router.get(
+    "/metrics/staffing",
+    response_model=DataResponse[StaffingMetricsRead],
+    summary="Couverture des créneaux (remplissage)",
+    description=(
+        "Nombre de créneaux, créneaux remplis et affectations vs "
+        "nb_personnes_requis, par planning et par créneau, pour un planning, "
+        "un ministère organisateur ou un campus (filtres cumulables). "
+        "La fenêtre from/to porte sur le début de l'activité."
+    ),
+)
+def get_staffing_metrics(
+    *,
+    planning_id: Optional[str] = Query(None),
+    ministere_id: Optional[str] = Query(None),
+    campus_id: Optional[str] = Query(None),
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    db: Session = Depends(Database.get_db_for_route),
+    _: Utilisateur = Depends(get_current_active_user),
+):
+    svc = SlotService(db)
+    metrics = svc.get_fill_metrics(
+        planning_id=planning_id,
+        ministere_id=ministere_id,
+        campus_id=campus_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return {"data": metrics}
 
 
 @router.get(
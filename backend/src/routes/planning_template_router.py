@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import Session
 
 from conf.db.database import Database
@@ -100,18 +100,28 @@ def preview_series(
 )
 def generate_series(
     payload: GenerateSeriesRequest,
+    response: Response,
     current_user: Utilisateur = Depends(get_current_active_user),
     svc: SerieService = Depends(_get_serie_svc),
 ) -> GenerateSeriesResponse:
-    """Crée N plannings en BROUILLON depuis un template avec un serie_id commun."""
+    """Crée N plannings en BROUILLON depuis un template avec un serie_id commun.
+
+    La volumétrie de l'écriture en masse est exposée dans les en-têtes
+    `X-Rows-Written` et `X-Rows-Per-Second`.
+    """
     ministere_id, campus_id = _resolve_ministere_campus(current_user)
     created_by_id = str(current_user.membre_id or "")
-    return svc.generate_series(
+    result = svc.generate_series(
         payload,
         created_by_id=created_by_id,
         ministere_id=ministere_id,
         campus_id=campus_id,
     )
+    stats = svc.last_write_stats
+    if stats is not None:
+        response.headers["X-Rows-Written"] = str(stats.rows)
+        response.headers["X-Rows-Per-Second"] = f"{stats.rows_per_second:.0f}"
+    return result
 
 
 @router.post(
@@ -1,21 +1,73 @@
 import logging
-from typing import Any, List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Set, Tuple
+from uuid import uuid4
 
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from core.workflow_engine import WorkflowEngine, affectation_transitions
 from mla_enum.custom_enum import AffectationStatusCode, PlanningStatusCode
-from models import Affectation, PlanningService, Slot
+from models import (
+    DEFAULT_NB_PERSONNES_REQUIS,
+    Affectation,
+    AffectationBulkCreate,
+    AffectationBulkError,
+    AffectationBulkItem,
+    AffectationBulkResult,
+    AffectationRead,
+    ChargeMembreRead,
+    PlanningService,
+    Slot,
+    StatistiquesChargeRead,
+)
 from models.affectation_model import AffectationMemberRead
 from models.base_pagination import PaginatedResponse
+from repositories.affectation_repository import AffectationRepository
+from repositories.membre_agenda_repository import ChargeRow, MembreAgendaRepository
+from repositories.membre_repository import MembreRepository
+from repositories.membre_role_repository import MembreRoleRepository
+from repositories.ministere_repository import MinistereRepository
 from repositories.planning_repository import PlanningRepository
+from repositories.slot_repository import SlotRepository
 from services.validation_engine import ValidationEngine
 
 logger = logging.getLogger(__name__)
 
 
+def _taux(part: int, base: int) -> Optional[float]:
+    return round(part / base * 100, 2) if base else None
+
+
+def _jours(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(float(value), 2)
+
+
+def _charge_membre(row: ChargeRow) -> ChargeMembreRead:
+    """Ligne de MembreAgendaRepository.charge_by_membre → modèle de lecture."""
+    return ChargeMembreRead(
+        membre_id=row[0],
+        nom=row[1],
+        prenom=row[2],
+        total=row[3],
+        proposes=row[4],
+        confirmes=row[5],
+        refuses=row[6],
+        presents=row[7],
+        absents=row[8],
+        retards=row[9],
+        taux_confirmation=_taux(row[5], row[3]),
+        # RETARD compte comme présent ; base : affectations pointées
+        taux_presence=_taux(row[7] + row[9], row[7] + row[8] + row[9]),
+        ecart_moyen_jours=_jours(row[10]),
+        ecart_min_jours=_jours(row[11]),
+        premier_service=row[12],
+        dernier_service=row[13],
+    )
+
+
 class AffectationService:
     def __init__(self, db: Session):
         self.db = db
@@ -23,16 +75,6 @@ class AffectationService:
         self.validator = ValidationEngine()
         self.workflow = WorkflowEngine[AffectationStatusCode](affectation_transitions)
 
-    @staticmethod
-    def _extract_ministere_id(a_data: Any) -> Optional[str]:
-        """Extrait ministere_id depuis un dict ou un objet Pydantic."""
-        raw = (
-            a_data.get("ministere_id")
-            if isinstance(a_data, dict)
-            else getattr(a_data, "ministere_id", None)
-        )
-        return raw if isinstance(raw, str) else None
-
     def _validate_pointing_status(self, planning: Optional[PlanningService]):
         """
         Mutualisation de la règle métier :
@@ -80,6 +122,89 @@ class AffectationService:
         )
         return self.repo.create_affectation(new_affectation)
 
+    def assign_members_bulk(
+        self, payload: AffectationBulkCreate
+    ) -> AffectationBulkResult:
+        """
+        Valide puis insère un lot d'affectations (statut PROPOSE).
+
+        Une requête par règle pour tout le lot (slot actif, ministère,
+        compétence, doublon) puis un INSERT multi-lignes des items valides.
+        Chaque item rejeté est rapporté avec son index ; les autres sont
+        insérés, sauf si all_or_nothing.
+        """
+        items = payload.items
+        slot_ids = SlotRepository(self.db).live_ids({i.slot_id for i in items})
+        ministere_ids = MinistereRepository(self.db).active_ids(
+            {i.ministere_id for i in items if i.ministere_id}
+        )
+        held = MembreRoleRepository(self.db).held_roles(
+            {(i.membre_id, i.role_code) for i in items}
+        )
+        aff_repo = AffectationRepository(self.db)
+        taken = aff_repo.assigned_pairs({(i.membre_id, i.slot_id) for i in items})
+
+        errors: List[AffectationBulkError] = []
+        rows: List[dict] = []
+        for index, item in enumerate(items):
+            error = self._bulk_item_error(item, slot_ids, ministere_ids, held, taken)
+            if error:
+                errors.append(
+                    AffectationBulkError(
+                        index=index,
+                        slot_id=item.slot_id,
+                        membre_id=item.membre_id,
+                        code=error.code,
+                        message=error.message,
+                    )
+                )
+                continue
+            # Un doublon au sein du lot est rejeté comme un doublon en base
+            taken.add((item.membre_id, item.slot_id))
+            rows.append(
+                {
+                    "id": str(uuid4()),
+                    "slot_id": item.slot_id,
+                    "membre_id": item.membre_id,
+                    "role_code": item.role_code,
+                    "statut_affectation_code": AffectationStatusCode.PROPOSE.value,
+                    "presence_confirmee": False,
+                    "ministere_id": item.ministere_id,
+                }
+            )
+        if errors and payload.all_or_nothing:
+            return AffectationBulkResult(errors=errors)
+
+        aff_repo.bulk_insert(rows)
+        aff_repo.expire_loaded_lists(rows)
+        return AffectationBulkResult(
+            created=[AffectationRead.model_validate(row) for row in rows],
+            errors=errors,
+        )
+
+    @staticmethod
+    def _bulk_item_error(
+        item: AffectationBulkItem,
+        slot_ids: Set[str],
+        ministere_ids: Set[str],
+        held: Set[Tuple[str, str]],
+        taken: Set[Tuple[str, str]],
+    ) -> Optional[AppException]:
+        """Première règle violée par l'item, évaluée en mémoire."""
+        if item.slot_id not in slot_ids:
+            return AppException(ErrorRegistry.ASGN_SLOT_NOT_FOUND, id=item.slot_id)
+        if item.ministere_id and item.ministere_id not in ministere_ids:
+            return AppException(
+                ErrorRegistry.ASGN_MINISTERE_NOT_FOUND, id=item.ministere_id
+            )
+        if (item.membre_id, item.role_code) not in held:
+            return AppException(
+                ErrorRegistry.ASGN_MEMBER_MISSING_ROLE, role=item.role_code
+            )
+        if (item.membre_id, item.slot_id) in taken:
+            return AppException(ErrorRegistry.ASGN_ALREADY_ASSIGNED, id=item.slot_id)
+        return None
+
     def update_affectation_status(
         self, affectation_id: str, new_status: AffectationStatusCode
     ) -> Affectation:
@@ -161,83 +286,68 @@ class AffectationService:
         )
         return len(self.db.exec(stmt).all())
 
-    def sync_affectations(self, slot_id: str, affectations_data: List[Any]):
-        """Gère le delta (Add/Update/Delete) des affectations pour un slot."""
-        db_affs = self.db.exec(
-            select(Affectation).where(Affectation.slot_id == slot_id)
-        ).all()
-        current_map = {a.id: a for a in db_affs}
-
-        payload_ids = {
-            getattr(a, "id", None) for a in affectations_data if getattr(a, "id", None)
-        }
-
-        # 1. DELETE
-        for a_id, aff_obj in current_map.items():
-            if a_id not in payload_ids:
-                self.db.delete(aff_obj)
-
-        # 2. UPSERT
-        for a_data in affectations_data:
-            potential_id = getattr(a_data, "id", None)
-
-            # Si l'ID existe et est connu en base -> UPDATE
-            if isinstance(potential_id, str) and potential_id in current_map:
-                status = getattr(a_data, "statut_affectation_code", None)
-                if status:
-                    self.update_affectation_status(
-                        potential_id, AffectationStatusCode(status)
-                    )
-
-            # Sinon -> CREATE
-            else:
-                m_id: Any = getattr(a_data, "membre_id", None)
-                r_code: Any = getattr(a_data, "role_code", None)
-
-                raw_status = getattr(a_data, "statut_affectation_code", None) or (
-                    a_data.get("statut_affectation_code")
-                    if isinstance(a_data, dict)
-                    else None
-                )
-                requested_status = (
-                    AffectationStatusCode(raw_status) if raw_status else None
-                )
-
-                if isinstance(a_data, dict):
-                    m_id = m_id or a_data.get("membre_id")
-                    r_code = r_code or a_data.get("role_code")
-
-                if isinstance(m_id, str) and isinstance(r_code, str):
-                    self.assign_member_to_slot(
-                        slot_id=slot_id,
-                        membre_id=m_id,
-                        role_code=r_code,
-                        status=requested_status,
-                        ministere_id=self._extract_ministere_id(a_data),
-                    )
-                else:
-                    if not potential_id:
-                        # Utilisation du registre pour le logging consistant
-                        logger.warning(
-                            ErrorRegistry.Affectation_DATA_INCOMPLETE.message.format(
-                                id=slot_id
-                            )
-                        )
-
-    def delete_by_slot(self, slot_id: str) -> None:
-        """Supprime toutes les affectations liées à un créneau."""
-        db_affs = self.db.exec(
-            select(Affectation).where(Affectation.slot_id == slot_id)
-        ).all()
-        for aff in db_affs:
-            self.db.delete(aff)
-        self.db.flush()
-
     def is_slot_filled(self, slot: Slot) -> bool:
-        """Détermine si un créneau a atteint son quota de personnes."""
-        # On utilise une valeur par défaut de 2 si nb_personnes_requis est None
-        quota = slot.nb_personnes_requis if slot.nb_personnes_requis is not None else 2
-        return len(slot.affectations) >= quota
+        """Détermine si un créneau a atteint son quota de personnes (COUNT SQL)."""
+        quota = (
+            slot.nb_personnes_requis
+            if slot.nb_personnes_requis is not None
+            else DEFAULT_NB_PERSONNES_REQUIS
+        )
+        count = self.db.exec(
+            select(func.count()).where(  # pylint: disable=not-callable
+                Affectation.slot_id == slot.id
+            )
+        ).one()
+        return count >= quota
+
+    def get_statistiques_charge(
+        self,
+        date_debut: date,
+        date_fin: date,
+        *,
+        ministere_id: Optional[str] = None,
+        campus_id: Optional[str] = None,
+    ) -> StatistiquesChargeRead:
+        """
+        Charge et assiduité par membre sur la période, agrégées en SQL sur
+        l'agenda matérialisé (aucune affectation chargée). Périmètre
+        ministère : les membres actifs sans affectation figurent à zéro.
+        """
+        if not ministere_id and not campus_id:
+            raise AppException(ErrorRegistry.ASGN_STATS_SCOPE)
+        if date_fin < date_debut:
+            raise AppException(ErrorRegistry.ASGN_STATS_CHRONOLOGY)
+        if ministere_id and not MinistereRepository(self.db).active_ids({ministere_id}):
+            raise AppException(ErrorRegistry.ASGN_MINISTERE_NOT_FOUND, id=ministere_id)
+
+        membres = [
+            _charge_membre(row)
+            for row in MembreAgendaRepository(self.db).charge_by_membre(
+                datetime.combine(date_debut, time.min),
+                datetime.combine(date_fin + timedelta(days=1), time.min),
+                ministere_id=ministere_id,
+                campus_id=campus_id,
+            )
+        ]
+        if ministere_id:
+            servis = {m.membre_id for m in membres}
+            membres.extend(
+                ChargeMembreRead(membre_id=m[0], nom=m[1], prenom=m[2])
+                for m in MembreRepository(self.db).list_for_ministere(
+                    ministere_id, campus_id
+                )
+                if m[3] and m[0] not in servis
+            )
+        total = sum(m.total for m in membres)
+        return StatistiquesChargeRead(
+            date_debut=date_debut,
+            date_fin=date_fin,
+            ministere_id=ministere_id,
+            campus_id=campus_id,
+            total_affectations=total,
+            moyenne_par_membre=round(total / len(membres), 2) if membres else 0.0,
+            membres=membres,
+        )
 
     def get_stats_from_list(self, affectations: list) -> dict:
         """Calcule les statistiques brutes sur une liste d'affectations."""
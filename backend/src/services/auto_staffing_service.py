@@ -0,0 +1,342 @@
+"""
+Remplissage automatique des créneaux (planning ou série).
+
+Contraintes dures : rôle détenu (MembreRole) parmi ceux activés pour le
+ministère et requis par le créneau, rattachement actif au ministère,
+indisponibilités validées, pas de chevauchement horaire, quota
+nb_personnes_requis. Objectifs : équilibrer la charge entre membres et
+éviter les semaines consécutives.
+
+Les créneaux sont traités dans l'ordre chronologique ; pour chacun, les
+candidats sont dépilés d'un tas trié par charge jusqu'à ce que plus aucun
+ne puisse battre les meilleurs retenus (coût = charge + pénalité si la
+semaine précédente ou suivante est déjà servie). Coût : O(S·k·log M) en
+pratique pour S créneaux, k places et M membres.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from sqlmodel import Session, col, select
+
+from core.exceptions.app_exception import AppException
+from core.message import ErrorRegistry
+from mla_enum.custom_enum import AffectationStatusCode
+from models import (
+    AutoStaffingManque,
+    AutoStaffingProposition,
+    AutoStaffingRequest,
+    AutoStaffingResult,
+    PlanningService,
+    Slot,
+)
+from repositories.affectation_repository import AffectationRepository
+from repositories.indisponibilite_repository import IndisponibiliteRepository
+from repositories.membre_repository import MembreRepository
+from repositories.membre_role_repository import MembreRoleRepository
+from repositories.ministere_repository import MinistereRepository
+from repositories.planning_template_repository import PlanningTemplateRepository
+from repositories.slot_repository import SlotRepository
+from services.reference_data_service import ReferenceDataService
+
+# Une semaine consécutive « coûte » autant qu'un service de plus
+BACK_TO_BACK_PENALTY = 1
+
+
+def _semaine(moment: datetime) -> int:
+    """Numéro de semaine absolu (lundi → dimanche)."""
+    return (moment.toordinal() - 1) // 7
+
+
+@dataclass(frozen=True)
+class SlotDemand:
+    slot_id: str
+    planning_id: str
+    debut: datetime
+    fin: datetime
+    manquants: int
+    roles: FrozenSet[str]
+
+
+@dataclass
+class StaffingCandidate:
+    """Membre éligible au ministère et son état au fil de la résolution."""
+
+    membre_id: str
+    roles: Tuple[str, ...]  # par ordre de préférence
+    indisponible: Set[date] = field(default_factory=set)
+    occupe: List[Tuple[datetime, datetime]] = field(default_factory=list)
+    slots: Set[str] = field(default_factory=set)
+    semaines: Set[int] = field(default_factory=set)
+    charge: int = 0
+
+    def role_pour(self, demand: SlotDemand) -> Optional[str]:
+        return next((role for role in self.roles if role in demand.roles), None)
+
+    def disponible(self, demand: SlotDemand) -> bool:
+        return (
+            demand.slot_id not in self.slots
+            and demand.debut.date() not in self.indisponible
+            and demand.fin.date() not in self.indisponible
+            and not any(d < demand.fin and demand.debut < f for d, f in self.occupe)
+        )
+
+    def enchaine(self, semaine: int) -> bool:
+        return semaine - 1 in self.semaines or semaine + 1 in self.semaines
+
+    def retenir(self, demand: SlotDemand) -> None:
+        self.charge += 1
+        self.slots.add(demand.slot_id)
+        self.occupe.append((demand.debut, demand.fin))
+        self.semaines.add(_semaine(demand.debut))
+
+
+@dataclass(frozen=True)
+class StaffingChoice:
+    demand: SlotDemand
+    membre_id: str
+    role_code: str
+    enchaine: bool
+
+
+def solve_staffing(
+    demands: Iterable[SlotDemand],
+    candidates: List[StaffingCandidate],
+    *,
+    penalty: int = BACK_TO_BACK_PENALTY,
+) -> Tuple[List[StaffingChoice], Dict[str, int]]:
+    """
+    Affecte glouton par créneau, candidats tirés d'un tas (charge, index).
+
+    Retourne les choix et, par créneau, le nombre de places non pourvues.
+    Met à jour l'état (charge, occupations) des candidats.
+    """
+    heap = [(cand.charge, i) for i, cand in enumerate(candidates)]
+    heapq.heapify(heap)
+    choix: List[StaffingChoice] = []
+    manques: Dict[str, int] = {}
+    for demand in sorted(demands, key=lambda d: (d.debut, d.slot_id)):
+        if demand.manquants <= 0:
+            continue
+        semaine = _semaine(demand.debut)
+        # (coût, index, rôle, enchaîne) des meilleurs candidats, triés
+        retenus: List[Tuple[int, int, str, bool]] = []
+        sortis: List[int] = []
+        while heap:
+            charge, i = heap[0]
+            if charge != candidates[i].charge:  # entrée périmée
+                heapq.heappop(heap)
+                continue
+            if len(retenus) >= demand.manquants and charge >= retenus[-1][0]:
+                break  # coût ≥ charge : plus personne ne peut faire mieux
+            heapq.heappop(heap)
+            sortis.append(i)
+            cand = candidates[i]
+            role = cand.role_pour(demand)
+            if role is None or not cand.disponible(demand):
+                continue
+            enchaine = cand.enchaine(semaine)
+            insort(retenus, (charge + penalty * enchaine, i, role, enchaine))
+            del retenus[demand.manquants :]
+        for _, i, role, enchaine in retenus:
+            candidates[i].retenir(demand)
+            choix.append(
+                StaffingChoice(demand, candidates[i].membre_id, role, enchaine)
+            )
+        for i in sortis:
+            heapq.heappush(heap, (candidates[i].charge, i))
+        if len(retenus) < demand.manquants:
+            manques[demand.slot_id] = demand.manquants - len(retenus)
+    return choix, manques
+
+
+class AutoStaffingService:
+    """Charge le périmètre en requêtes ensemblistes, résout, écrit en masse."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def propose(self, payload: AutoStaffingRequest) -> AutoStaffingResult:
+        """
+        Propositions d'affectations (statut PROPOSE si appliquer=True) pour
+        les créneaux incomplets du planning ou de la série.
+        """
+        if not MinistereRepository(self.db).active_ids({payload.ministere_id}):
+            raise AppException(ErrorRegistry.MINST_NOT_FOUND, id=payload.ministere_id)
+        demands = self._load_demands(payload)
+        candidates = self._load_candidates(payload.ministere_id, demands)
+        choix, manques = solve_staffing(demands, candidates)
+
+        if payload.appliquer and choix:
+            rows = [
+                {
+                    "id": str(uuid4()),
+                    "slot_id": c.demand.slot_id,
+                    "membre_id": c.membre_id,
+                    "role_code": c.role_code,
+                    "statut_affectation_code": AffectationStatusCode.PROPOSE.value,
+                    "presence_confirmee": False,
+                    "ministere_id": payload.ministere_id,
+                }
+                for c in choix
+            ]
+            aff_repo = AffectationRepository(self.db)
+            aff_repo.bulk_insert(rows)
+            aff_repo.expire_loaded_lists(rows)
+
+        by_slot = {d.slot_id: d for d in demands}
+        return AutoStaffingResult(
+            propositions=[
+                AutoStaffingProposition(
+                    slot_id=c.demand.slot_id,
+                    planning_id=c.demand.planning_id,
+                    membre_id=c.membre_id,
+                    role_code=c.role_code,
+                    date_debut=c.demand.debut,
+                )
+                for c in choix
+            ],
+            non_pourvus=[
+                AutoStaffingManque(
+                    slot_id=slot_id,
+                    planning_id=by_slot[slot_id].planning_id,
+                    manquants=manquants,
+                )
+                for slot_id, manquants in manques.items()
+            ],
+            charge={c.membre_id: c.charge for c in candidates},
+            semaines_consecutives=sum(c.enchaine for c in choix),
+            appliquee=payload.appliquer and bool(choix),
+        )
+
+    def _load_demands(self, payload: AutoStaffingRequest) -> List[SlotDemand]:
+        """Créneaux du périmètre et rôles requis (template, sinon demande)."""
+        scope: Any = (
+            col(Slot.planning_id) == payload.planning_id
+            if payload.planning_id
+            else col(PlanningService.serie_id) == payload.serie_id
+        )
+        rows = SlotRepository(self.db).staffing_demand(scope)
+        if not rows:
+            self._check_scope_exists(payload)
+            return []
+        demanded = self._demanded_roles(payload)
+        template_roles = PlanningTemplateRepository(self.db).roles_by_slot_name(
+            {row[2] for row in rows if row[2]}
+        )
+        demands = []
+        for row in rows:
+            # row : slot, planning, template, nom, début, fin, quota, nb affectés
+            template = template_roles.get((row[2] or "", row[3]))
+            required = demanded & template if template is not None else demanded
+            if required:  # sinon aucun rôle de ce ministère : hors périmètre
+                demands.append(
+                    SlotDemand(
+                        row[0],
+                        row[1],
+                        row[4],
+                        row[5],
+                        row[6] - row[7],
+                        frozenset(required),
+                    )
+                )
+        return demands
+
+    def _demanded_roles(self, payload: AutoStaffingRequest) -> Set[str]:
+        """Rôles activés pour le ministère, restreints à role_codes si fourni."""
+        configured = {
+            role.code
+            for role in ReferenceDataService(self.db).active_roles_of_ministere(
+                payload.ministere_id
+            )
+        }
+        if payload.role_codes is None:
+            return configured
+        return configured & set(payload.role_codes)
+
+    def _check_scope_exists(self, payload: AutoStaffingRequest) -> None:
+        """Périmètre vide : 404 si le planning ou la série n'existe pas."""
+        if payload.planning_id:
+            planning = self.db.get(PlanningService, payload.planning_id)
+            if planning is None or planning.deleted_at is not None:
+                raise AppException(
+                    ErrorRegistry.VALIDATION_PLANNING_NOT_FOUND, id=payload.planning_id
+                )
+            return
+        found = self.db.exec(
+            select(PlanningService.id).where(
+                PlanningService.serie_id == payload.serie_id,
+                PlanningService.deleted_at == None,  # noqa: E711
+            )
+        ).first()
+        if found is None:
+            raise AppException(ErrorRegistry.SERIE_004, id=payload.serie_id)
+
+    def _load_candidates(
+        self, ministere_id: str, demands: List[SlotDemand]
+    ) -> List[StaffingCandidate]:
+        """Membres actifs du ministère avec rôles, indisponibilités et occupations."""
+        if not demands:
+            return []
+        held: Dict[str, List[str]] = {}
+        actifs = [
+            m[0]
+            for m in MembreRepository(self.db).list_for_ministere(ministere_id)
+            if m[3]
+        ]
+        for membre_id, role_code in MembreRoleRepository(self.db).roles_of_membres(
+            actifs, set().union(*(d.roles for d in demands))
+        ):
+            held.setdefault(membre_id, []).append(role_code)
+        candidates = {
+            membre_id: StaffingCandidate(membre_id, tuple(held[membre_id]))
+            for membre_id in sorted(held)
+        }
+        start = min(d.debut for d in demands)
+        end = max(d.fin for d in demands)
+        self._mark_indisponibilites(candidates, ministere_id, start, end)
+        self._mark_occupations(candidates, start, end)
+        return list(candidates.values())
+
+    def _mark_indisponibilites(
+        self,
+        candidates: Dict[str, StaffingCandidate],
+        ministere_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Jours couverts par une indisponibilité validée, bornés à la période."""
+        for membre_id, debut, fin in IndisponibiliteRepository(self.db).get_periodes(
+            candidates,
+            start.date(),
+            end.date(),
+            ministere_id=ministere_id,
+            validee_only=True,
+        ):
+            jour = max(debut, start.date())
+            while jour <= min(fin, end.date()):
+                candidates[membre_id].indisponible.add(jour)
+                jour += timedelta(days=1)
+
+    def _mark_occupations(
+        self, candidates: Dict[str, StaffingCandidate], start: datetime, end: datetime
+    ) -> None:
+        """Affectations existantes : créneaux tenus, charge et semaines servies."""
+        # Semaines voisines comprises, pour la pénalité d'enchaînement
+        for membre_id, slot_id, debut, fin in AffectationRepository(
+            self.db
+        ).busy_intervals(
+            candidates, start - timedelta(days=7), end + timedelta(days=7)
+        ):
+            cand = candidates[membre_id]
+            cand.slots.add(slot_id)
+            cand.occupe.append((debut, fin))
+            cand.semaines.add(_semaine(debut))
+            if start <= debut <= end:
+                cand.charge += 1
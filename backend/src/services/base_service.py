@@ -1,12 +1,13 @@
 import logging
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Tuple, TypeVar
 
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, SQLModel
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import reference_cache
 from models.base_pagination import PaginatedResponse
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,9 @@ T = TypeVar("T", bound=SQLModel)
 
 
 class BaseService(Generic[C, R, U, T]):
+    # Domaines du cache de référence périmés par les écritures de ce service
+    reference_domains: Tuple[str, ...] = ()
+
     def __init__(self, repo: Any, resource_name: str = "Resource"):
         self.repo = repo
         self.resource_name = resource_name
@@ -50,6 +54,7 @@ class BaseService(Generic[C, R, U, T]):
         try:
             self.repo.update(obj, update_data)
             self._after_delete_hook(obj)
+            self._invalidate_references()
         except IntegrityError as exc:
             raise AppException(
                 ErrorRegistry.CORE_ACTION_IMPOSSIBLE, resource=self.resource_name
@@ -57,12 +62,16 @@ class BaseService(Generic[C, R, U, T]):
 
     def create(self, data: C) -> T:
         db_obj = self.repo.model.model_validate(data)
-        return self.repo.create(db_obj)
+        created = self.repo.create(db_obj)
+        self._invalidate_references()
+        return created
 
     def update(self, identifiant: str, data: U) -> T:
         obj = self.get_one(identifiant)
         update_data = data.model_dump(exclude_unset=True)
-        return self.repo.update(obj, update_data)
+        updated = self.repo.update(obj, update_data)
+        self._invalidate_references()
+        return updated
 
     def _after_delete_hook(self, obj: T) -> None:
         """
@@ -70,6 +79,10 @@ class BaseService(Generic[C, R, U, T]):
         pour gérer les cascades spécifiques.
         """
 
+    def _invalidate_references(self) -> None:
+        if self.reference_domains:
+            reference_cache.invalidate(self.db, *self.reference_domains)
+
     def _execute_with_flush(self, operation_callable):
         """Exécute une opération de repo, flush et gère les erreurs d'intégrité."""
         try:
@@ -14,6 +14,13 @@ from sqlmodel import Session, col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import (
+    CAMPUS_MINISTERES,
+    CATALOGUE,
+    MINISTERE_ROLES,
+    RBAC_ROLES,
+    STATUTS,
+)
 from mla_enum.custom_enum import (
     AffectationStatusCode,
     PlanningStatusCode,
@@ -24,6 +31,8 @@ from models.campus_config_model import (
     CategorieSetupItem,
     MinistereSetupItem,
 )
+from models.categorie_role_model import CategorieRoleRead
+from models.role_competence_model import RoleCompetenceRead
 from models.schema_db_model import (
     Campus,
     CampusMinistereLink,
@@ -35,6 +44,7 @@ from models.schema_db_model import (
     StatutAffectation,
     StatutPlanning,
 )
+from services.reference_data_service import ReferenceDataService
 
 
 class _SetupCounters(TypedDict):
@@ -52,6 +62,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.refs = ReferenceDataService(db)
 
     # ------------------------------------------------------------------ #
     #  HELPERS PRIVÉS
@@ -106,6 +117,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(new_cat)
         self.db.flush()
         self.db.refresh(new_cat)
+        self.refs.invalidate(CATALOGUE)
         return new_cat, True
 
     def _find_or_create_role_competence(
@@ -135,6 +147,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(new_role)
         self.db.flush()
         self.db.refresh(new_role)
+        self.refs.invalidate(CATALOGUE)
         return new_role, True
 
     def _find_or_create_rbac_role(
@@ -150,6 +163,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(new_role)
         self.db.flush()
         self.db.refresh(new_role)
+        self.refs.invalidate(RBAC_ROLES)
         return new_role, True
 
     def _ensure_campus_ministere_link(
@@ -173,6 +187,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         )
         self.db.add(link)
         self.db.flush()
+        self.refs.invalidate(CAMPUS_MINISTERES)
         return True
 
     def _init_statut_planning(self) -> List[StatutPlanning]:
@@ -187,6 +202,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
                 sp = StatutPlanning(code=code.value)
                 self.db.add(sp)
                 self.db.flush()
+                self.refs.invalidate(STATUTS)
                 result.append(sp)
         return result
 
@@ -205,6 +221,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
                 )
                 self.db.add(sa)
                 self.db.flush()
+                self.refs.invalidate(STATUTS)
                 result.append(sa)
         return result
 
@@ -269,6 +286,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
             raise AppException(ErrorRegistry.CONF_MINISTERE_LINK_NOT_FOUND)
         self.db.delete(link)
         self.db.flush()
+        self.refs.invalidate(CAMPUS_MINISTERES)
 
     def list_all_ministeres(self) -> List[Ministere]:
         """Liste tous les ministères actifs du système (tous campus)."""
@@ -331,6 +349,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
             )
         self.db.delete(cat)
         self.db.flush()
+        self.refs.invalidate(CATALOGUE)
 
     def list_categories_of_ministere(
         self,
@@ -406,6 +425,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
             )
         self.db.delete(role)
         self.db.flush()
+        self.refs.invalidate(CATALOGUE, MINISTERE_ROLES)
 
     # ------------------------------------------------------------------ #
     #  MÉTHODES PUBLIQUES — MinistereRoleConfig (RC-160)
@@ -438,6 +458,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(config)
         self.db.flush()
         self.db.refresh(config)
+        self.refs.invalidate(MINISTERE_ROLES)
         return config, True
 
     def deactivate_role_for_ministere(
@@ -452,6 +473,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
             raise AppException(ErrorRegistry.MINST_ROLE_NOT_FOUND)
         self.db.delete(config)
         self.db.flush()
+        self.refs.invalidate(MINISTERE_ROLES)
 
     def activate_category_for_ministere(
         self,
@@ -485,39 +507,26 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
                 created += 1
         if created:
             self.db.flush()
+            self.refs.invalidate(MINISTERE_ROLES)
         return created
 
     def list_roles_of_ministere(
         self,
         ministere_id: str,
-    ) -> List[RoleCompetence]:
-        """Retourne les rôles compétences actifs pour ce ministère."""
-        stmt = (
-            select(RoleCompetence)
-            .join(
-                MinistereRoleConfig,
-                col(MinistereRoleConfig.role_code) == col(RoleCompetence.code),
-            )
-            .where(MinistereRoleConfig.ministere_id == ministere_id)
-        )
-        return list(self.db.exec(stmt).all())
+    ) -> List[RoleCompetenceRead]:
+        """Retourne les rôles compétences actifs pour ce ministère (en cache)."""
+        return list(self.refs.active_roles_of_ministere(ministere_id))
 
     def list_categories_with_active_roles(
         self,
         ministere_id: str,
-    ) -> List[Tuple[CategorieRole, List[RoleCompetence]]]:
+    ) -> List[Tuple[CategorieRoleRead, List[RoleCompetenceRead]]]:
         """
         Retourne toutes les catégories du catalogue global, chacune
         annotée avec la liste de ses rôles actifs pour ce ministère.
         Les catégories sans rôle actif sont incluses (liste vide).
         """
-        cats = list(self.db.exec(select(CategorieRole)).all())
-        active_roles = self.list_roles_of_ministere(ministere_id)
-        active_by_cat: Dict[str, List[RoleCompetence]] = {}
-        for role in active_roles:
-            bucket = active_by_cat.setdefault(role.categorie_code, [])
-            bucket.append(role)
-        return [(cat, active_by_cat.get(cat.code, [])) for cat in cats]
+        return self.refs.roles_by_categorie(ministere_id)
 
     # ------------------------------------------------------------------ #
     #  MÉTHODES PUBLIQUES — Mises à jour
@@ -541,6 +550,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(min_)
         self.db.flush()
         self.db.refresh(min_)
+        self.refs.invalidate(CAMPUS_MINISTERES)
         return min_
 
     def update_categorie(
@@ -562,6 +572,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(cat)
         self.db.flush()
         self.db.refresh(cat)
+        self.refs.invalidate(CATALOGUE)
         return cat
 
     def update_role_competence(
@@ -588,6 +599,7 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
         self.db.add(role)
         self.db.flush()
         self.db.refresh(role)
+        self.refs.invalidate(CATALOGUE, MINISTERE_ROLES)
         return role
 
     # ------------------------------------------------------------------ #
@@ -629,12 +641,17 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
     # ------------------------------------------------------------------ #
 
     def get_campus_summary(self, campus_id: str) -> Dict[str, Any]:
-        """Retourne un résumé de la configuration d'un campus."""
+        """
+        Retourne un résumé de la configuration d'un campus.
+
+        L'arbre ministères → catégories → rôles actifs est chargé en un
+        nombre fixe de requêtes et mis en cache par campus et version de
+        la configuration (catalogue, activations, rattachements).
+        """
         campus = self.db.get(Campus, campus_id)
         if not campus:
             raise AppException(ErrorRegistry.CONF_CAMPUS_NOT_FOUND)
-        ministeres = self.list_ministeres_of_campus(campus_id)
-        ministeres_data = self._build_ministeres_data(ministeres)
+        ministeres_data = self.refs.ministeres_tree(campus_id)
         sp_list = self._get_statut_planning_codes()
         sa_list = self._get_statut_affectation_codes()
         return {
@@ -645,50 +662,13 @@ class CampusConfigService:  # pylint: disable=too-many-public-methods
             "statuts_affectation": sa_list,
         }
 
-    def _build_ministeres_data(
-        self,
-        ministeres: List[Ministere],
-    ) -> List[Dict[str, Any]]:
-        """Construit la liste des ministères avec leurs rôles actifs par catégorie."""
-        result: List[Dict[str, Any]] = []
-        for ministere in ministeres:
-            cats_with_roles = self.list_categories_with_active_roles(str(ministere.id))
-            cats_data = self._format_cats_with_roles(cats_with_roles)
-            result.append(
-                {
-                    "id": str(ministere.id),
-                    "nom": ministere.nom,
-                    "description": getattr(ministere, "description", None),
-                    "categories": cats_data,
-                }
-            )
-        return result
-
-    def _format_cats_with_roles(
-        self,
-        cats_with_roles: List[Tuple[CategorieRole, List[RoleCompetence]]],
-    ) -> List[Dict[str, Any]]:
-        """Formate les catégories avec leurs rôles actifs pour le résumé."""
-        return [
-            {
-                "code": cat.code,
-                "libelle": cat.libelle,
-                "description": cat.description,
-                "roles_actifs": [{"code": r.code, "libelle": r.libelle} for r in roles],
-            }
-            for cat, roles in cats_with_roles
-            if roles  # n'inclut que les catégories avec au moins un rôle actif
-        ]
-
     def _get_statut_planning_codes(self) -> List[str]:
-        """Retourne les codes de statuts planning présents en DB."""
-        stmt = select(StatutPlanning)
-        return [sp.code for sp in self.db.exec(stmt).all()]
+        """Retourne les codes de statuts planning présents en DB (en cache)."""
+        return list(self.refs.statut_planning_codes())
 
     def _get_statut_affectation_codes(self) -> List[str]:
-        """Retourne les codes de statuts affectation présents en DB."""
-        stmt = select(StatutAffectation)
-        return [sa.code for sa in self.db.exec(stmt).all()]
+        """Retourne les codes de statuts affectation présents en DB (en cache)."""
+        return list(self.refs.statut_affectation_codes())
 
     # ------------------------------------------------------------------ #
     #  SETUP COMPLET
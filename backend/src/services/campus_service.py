@@ -5,6 +5,7 @@ from sqlmodel import Session, col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import CAMPUS_MINISTERES, reference_cache
 from models import Campus, CampusCreate, CampusRead, CampusUpdate
 from models.schema_db_model import Ministere  # Import du modèle pour la liaison
 from repositories.campus_repository import CampusRepository
@@ -68,6 +69,7 @@ class CampusService(BaseService[CampusCreate, CampusRead, CampusUpdate, Campus])
         try:
             self.db.add(campus_db)
             self.db.flush()
+            reference_cache.invalidate(self.db, CAMPUS_MINISTERES)
             return campus_db
         except Exception as e:
             self.db.rollback()
@@ -89,6 +91,7 @@ class CampusService(BaseService[CampusCreate, CampusRead, CampusUpdate, Campus])
         campus_db.ministeres.append(ministere)
         self.db.add(campus_db)
         self.db.flush()
+        reference_cache.invalidate(self.db, CAMPUS_MINISTERES)
         return campus_db
 
     def get_details(self, campus_id: str) -> Campus:
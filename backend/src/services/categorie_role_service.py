@@ -2,6 +2,7 @@ from sqlmodel import Session
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import CATALOGUE
 from models import (
     CategorieRole,
     CategorieRoleCreate,
@@ -17,6 +18,8 @@ class CategorieRoleService(
         CategorieRoleCreate, CategorieRoleRead, CategorieRoleUpdate, CategorieRole
     ]
 ):
+    reference_domains = (CATALOGUE,)
+
     def __init__(self, db: Session):
         self.repo = CategorieRoleRepository(db)
         super().__init__(self.repo, resource_name="Catégorie de Rôle")
@@ -27,9 +30,13 @@ class CategorieRoleService(
             raise AppException(ErrorRegistry.ROLE_CAT_DUPLICATE, code=data.code)
 
         db_obj = CategorieRole.model_validate(data)
-        return self.repo.create(db_obj)
+        created = self.repo.create(db_obj)
+        self._invalidate_references()
+        return created
 
     def update(self, identifiant: str, data: CategorieRoleUpdate) -> CategorieRole:
         db_obj = self.get_one(identifiant)
         update_data = data.model_dump(exclude_unset=True)
-        return self.repo.update(db_obj, update_data)
+        updated = self.repo.update(db_obj, update_data)
+        self._invalidate_references()
+        return updated
@@ -1,18 +1,25 @@
 # src/services/indisponibilite_service.py
-from typing import Optional
+from datetime import date
+from typing import Dict, List, Optional
 
 from sqlmodel import Session
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
-from models import Membre
+from models import Membre, Ministere
 from models.base_pagination import PaginatedResponse
 from models.indisponibilite_model import (
+    MAX_MATRICE_JOURS,
     IndisponibiliteCreate,
     IndisponibiliteReadFull,
+    MatriceDisponibiliteRead,
+    MatriceMembreRead,
 )
 from models.schema_db_model import Indisponibilite
 from repositories.indisponibilite_repository import IndisponibiliteRepository
+from repositories.membre_repository import MembreRepository
+from repositories.membre_role_repository import MembreRoleRepository
+from services.reference_data_service import ReferenceDataService
 
 
 class IndisponibiliteService:
@@ -43,8 +50,8 @@ class IndisponibiliteService:
     def _check_no_overlap(
         self,
         membre_id: str,
-        date_debut: str,
-        date_fin: str,
+        date_debut: date,
+        date_fin: date,
         ministere_id: Optional[str],
         *,
         exclude_id: Optional[str] = None,
@@ -111,9 +118,7 @@ class IndisponibiliteService:
         offset: int = 0,
     ) -> PaginatedResponse[IndisponibiliteReadFull]:
         """Vue membre : indisponibilités paginées."""
-        rows = self.repo.get_by_membre(membre_id)
-        total = len(rows)
-        page = rows[offset : offset + limit]
+        page, total = self.repo.search(membre_id=membre_id, limit=limit, offset=offset)
         return PaginatedResponse(
             total=total,
             limit=limit,
@@ -149,22 +154,21 @@ class IndisponibiliteService:
         *,
         validee_only: bool = False,
         ministere_id: Optional[str] = None,
-        date_debut: Optional[str] = None,
-        date_fin: Optional[str] = None,
+        date_debut: Optional[date] = None,
+        date_fin: Optional[date] = None,
         limit: int = 20,
         offset: int = 0,
     ) -> PaginatedResponse[IndisponibiliteReadFull]:
         """Vue admin : indisponibilités filtrées et paginées d'un campus."""
-        rows = self.repo.get_by_campus(campus_id)
-        rows = self._apply_filters(
-            rows,
+        page, total = self.repo.search(
+            campus_id=campus_id,
             validee_only=validee_only,
             ministere_id=ministere_id,
             date_debut=date_debut,
             date_fin=date_fin,
+            limit=limit,
+            offset=offset,
         )
-        total = len(rows)
-        page = rows[offset : offset + limit]
         return PaginatedResponse(
             total=total,
             limit=limit,
@@ -172,30 +176,6 @@ class IndisponibiliteService:
             data=[self._build_full(r) for r in page],
         )
 
-    def _apply_filters(
-        self,
-        rows: list[Indisponibilite],
-        *,
-        validee_only: bool,
-        ministere_id: Optional[str],
-        date_debut: Optional[str],
-        date_fin: Optional[str],
-    ) -> list[Indisponibilite]:
-        """Filtre en mémoire après la requête principale."""
-        if validee_only:
-            rows = [r for r in rows if r.validee]
-        if ministere_id:
-            rows = [r for r in rows if r.ministere_id == ministere_id]
-        if date_debut:
-            rows = [
-                r for r in rows if r.date_fin is not None and r.date_fin >= date_debut
-            ]
-        if date_fin:
-            rows = [
-                r for r in rows if r.date_debut is not None and r.date_debut <= date_fin
-            ]
-        return rows
-
     def admin_delete(self, indisp_id: str) -> None:
         """Suppression admin (sans restriction de statut)."""
         indisp = self._get_or_404(indisp_id)
@@ -205,18 +185,100 @@ class IndisponibiliteService:
     def get_validated_for_campus_period(
         self,
         campus_id: str,
-        date_debut: str,
-        date_fin: str,
+        date_debut: date,
+        date_fin: date,
     ) -> list[IndisponibiliteReadFull]:
         """Indisponibilités validées qui chevauchent une période."""
-        rows = self.repo.get_by_campus(campus_id)
-        active = [
-            r
-            for r in rows
-            if r.validee
-            and r.date_debut is not None
-            and r.date_fin is not None
-            and r.date_debut <= date_fin
-            and r.date_fin >= date_debut
-        ]
-        return [self._build_full(r) for r in active]
+        rows, _ = self.repo.search(
+            campus_id=campus_id,
+            validee_only=True,
+            date_debut=date_debut,
+            date_fin=date_fin,
+        )
+        return [self._build_full(r) for r in rows]
+
+    def get_matrice_disponibilite(
+        self,
+        ministere_id: str,
+        date_debut: date,
+        date_fin: date,
+        *,
+        campus_id: Optional[str] = None,
+        validee_only: bool = False,
+    ) -> MatriceDisponibiliteRead:
+        """
+        Matrice membre × jour d'un ministère, en un nombre fixe de requêtes
+        (ministère, membres, rôles détenus, indisponibilités ; les rôles du
+        ministère viennent du cache des référentiels).
+        """
+        if date_fin < date_debut:
+            raise AppException(ErrorRegistry.INDISP_INVALID_CHRONOLOGY)
+        if (date_fin - date_debut).days >= MAX_MATRICE_JOURS:
+            raise AppException(
+                ErrorRegistry.INDISP_MATRIX_RANGE_TOO_LONG, max=MAX_MATRICE_JOURS
+            )
+        ministere = self.db.get(Ministere, ministere_id)
+        if not ministere or ministere.deleted_at is not None:
+            raise AppException(ErrorRegistry.MINST_NOT_FOUND, id=ministere_id)
+
+        membres = MembreRepository(self.db).list_for_ministere(ministere_id, campus_id)
+        membre_ids = [m[0] for m in membres]
+        roles = sorted(
+            role.code
+            for role in ReferenceDataService(self.db).active_roles_of_ministere(
+                ministere_id
+            )
+        )
+        lignes = self._lignes_disponibilite(
+            membre_ids,
+            date_debut,
+            date_fin,
+            ministere_id=ministere_id,
+            validee_only=validee_only,
+        )
+        return MatriceDisponibiliteRead(
+            ministere_id=ministere_id,
+            date_debut=date_debut,
+            date_fin=date_fin,
+            roles=roles,
+            membres=[
+                MatriceMembreRead(id=m[0], nom=m[1], prenom=m[2], actif=m[3])
+                for m in membres
+            ],
+            eligibilite=self._masques_roles(membre_ids, roles),
+            disponibilite=lignes,
+        )
+
+    def _masques_roles(self, membre_ids: List[str], roles: List[str]) -> List[int]:
+        """Par membre, masque de bits des rôles détenus (bit k = roles[k])."""
+        bits = {code: 1 << k for k, code in enumerate(roles)}
+        masques: Dict[str, int] = dict.fromkeys(membre_ids, 0)
+        for membre_id, role_code in MembreRoleRepository(self.db).roles_of_membres(
+            membre_ids, roles
+        ):
+            masques[membre_id] |= bits[role_code]
+        return [masques[membre_id] for membre_id in membre_ids]
+
+    def _lignes_disponibilite(
+        self,
+        membre_ids: List[str],
+        date_debut: date,
+        date_fin: date,
+        *,
+        ministere_id: str,
+        validee_only: bool,
+    ) -> List[str]:
+        """Par membre, un caractère par jour : "1" disponible, "0" indisponible."""
+        nb_jours = (date_fin - date_debut).days + 1
+        lignes = {membre_id: bytearray(b"1" * nb_jours) for membre_id in membre_ids}
+        for membre_id, debut, fin in self.repo.get_periodes(
+            membre_ids,
+            date_debut,
+            date_fin,
+            ministere_id=ministere_id,
+            validee_only=validee_only,
+        ):
+            start = max((debut - date_debut).days, 0)
+            end = min((fin - date_debut).days + 1, nb_jours)
+            lignes[membre_id][start:end] = b"0" * (end - start)
+        return [lignes[membre_id].decode() for membre_id in membre_ids]
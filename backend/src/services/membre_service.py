@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from sqlmodel import Session, select
 
+from core.auth.principal_cache import principal_cache
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from models import Membre, MembreCreate, MembreRead, MembreUpdate, Utilisateur
@@ -68,6 +69,7 @@ class MembreService(BaseService[MembreCreate, MembreRead, MembreUpdate, Membre])
 
         self.db.add(db_membre)
         self.db.flush()
+        principal_cache.invalidate_membre(db_membre.id)
         return db_membre
 
     def link_utilisateur(self, user_id: str, membre_id: str) -> Utilisateur:
@@ -91,6 +93,7 @@ class MembreService(BaseService[MembreCreate, MembreRead, MembreUpdate, Membre])
         self.db.add(user)
         self.db.flush()
         self.db.refresh(user)
+        principal_cache.invalidate_user(user.id)
         return user
 
     def delete(self, identifiant: str) -> None:
@@ -110,6 +113,7 @@ class MembreService(BaseService[MembreCreate, MembreRead, MembreUpdate, Membre])
 
         self.db.add(db_membre)
         self.db.flush()
+        principal_cache.invalidate_membre(db_membre.id)
 
     def _sync_relations(
         self,
@@ -5,6 +5,7 @@ from sqlmodel import Session, col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import CAMPUS_MINISTERES
 from models import Ministere, MinistereCreate, MinistereRead, MinistereUpdate
 from models.schema_db_model import Campus  # Import du modèle de table
 from repositories.campus_repository import CampusRepository
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 class MinistereService(
     BaseService[MinistereCreate, MinistereRead, MinistereUpdate, Ministere]
 ):
+    reference_domains = (CAMPUS_MINISTERES,)
+
     def __init__(self, db: Session):
         super().__init__(repo=MinistereRepository(db), resource_name="Ministère")
         self.db = db
@@ -41,7 +44,9 @@ class MinistereService(
         else:
             raise AppException(ErrorRegistry.MINST_CAMPUS_REQUIRED)
 
-        return self._execute_with_flush(lambda: self.repo.create(db_obj))
+        created = self._execute_with_flush(lambda: self.repo.create(db_obj))
+        self._invalidate_references()
+        return created
 
     def update(self, identifiant: str, data: MinistereUpdate) -> Ministere:
         """
@@ -56,7 +61,11 @@ class MinistereService(
         if data.campus_ids is not None:
             self._sync_campuses(obj_db, data.campus_ids)
 
-        return self._execute_with_flush(lambda: self.repo.update(obj_db, update_data))
+        updated = self._execute_with_flush(
+            lambda: self.repo.update(obj_db, update_data)
+        )
+        self._invalidate_references()
+        return updated
 
     def _sync_campuses(self, ministere: Ministere, campus_ids: List[str]) -> None:
         """
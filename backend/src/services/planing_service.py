@@ -1,12 +1,11 @@
 import logging
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Any, List, Optional, Sequence, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
-from fastapi import BackgroundTasks
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, col, select
 
-from core.auth.auth_utils import _role_name
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from core.workflow_engine import WorkflowEngine, planning_transitions
@@ -22,6 +21,7 @@ from models import (
     Utilisateur,
 )
 from models.activite_model import ActiviteFullRead
+from models.base_pagination import CursorPage
 from models.chant_model import Chant
 from models.membre_model import MemberAgendaResponse
 from models.planning_model import (
@@ -30,6 +30,7 @@ from models.planning_model import (
     PlanningFullRead,
     PlanningFullUpdate,
     PlanningRepertoireUpdate,
+    PlanningWindow,
     ViewContext,
 )
 from models.schema_db_model import (
@@ -45,32 +46,33 @@ from notification.notification_schemas import (
     PlanningCancelledNotification,
     PlanningPublishedNotification,
 )
-from notification.notification_service import EmailService
+from repositories.membre_agenda_repository import MembreAgendaRepository
+from repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from repositories.planning_repository import PlanningRepository
 from repositories.planning_template_repository import PlanningTemplateRepository
 from services.activite_service import ActiviteService
+from services.reference_data_service import ReferenceDataService
 from services.slot_service import SlotService
-from utils.utils_func import extract_field
+from utils.utils_func import decode_cursor, encode_cursor, extract_field
 
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
 
-def _is_admin_or_super(user: Utilisateur) -> bool:
+def _is_admin_or_super(user: Utilisateur, refs: ReferenceDataService) -> bool:
     """True si l'utilisateur possède un rôle Admin ou Super Admin actif."""
     today = date.today()
     for aff in user.affectations:
-        if not (aff.role and aff.role.libelle):
-            continue
         if not aff.active:
             continue
         if aff.dateDebut is not None and aff.dateDebut > today:
             continue
         if aff.dateFin is not None and aff.dateFin < today:
             continue
-        libelle = aff.role.libelle
-        name = _role_name(libelle)
+        name = refs.affectation_role_name(aff)
         if name in {RoleName.SUPER_ADMIN.name, RoleName.ADMIN.name}:
             return True
     return False
@@ -92,11 +94,13 @@ class PlanningServiceSvc(
         # Injection des services dépendants pour éviter les réinstanciations
         self.activite_svc = ActiviteService(self.db)
         self.slot_svc = SlotService(self.db)
+        self.refs = ReferenceDataService(self.db)
 
     def _collect_notification_data_published(
         self, planning_id: str
-    ) -> List[PlanningPublishedNotification]:
-        """Construit la liste des notifications de publication (1 par affectation)."""
+    ) -> List[Tuple[str, PlanningPublishedNotification]]:
+        """Construit les couples (membre_id, notification) de publication
+        (1 par affectation)."""
         query = (
             select(PlanningService)
             .where(PlanningService.id == planning_id)
@@ -114,7 +118,7 @@ class PlanningServiceSvc(
         campus_nom, ministere_nom = self._resolve_activite_names(
             activite.campus_id, activite.ministere_organisateur_id
         )
-        notifications: List[PlanningPublishedNotification] = []
+        notifications: List[Tuple[str, PlanningPublishedNotification]] = []
         for slot in planning.slots:
             heure_debut = slot.date_debut.strftime("%H:%M")
             heure_fin = slot.date_fin.strftime("%H:%M")
@@ -123,29 +127,33 @@ class PlanningServiceSvc(
                 if not membre or not membre.email:
                     continue
                 notifications.append(
-                    PlanningPublishedNotification(
-                        email=membre.email,
-                        prenom=membre.prenom,
-                        nom=membre.nom,
-                        type_activite=activite.type,
-                        date_activite=activite.date_debut.date(),
-                        heure_debut=heure_debut,
-                        heure_fin=heure_fin,
-                        lieu=activite.lieu,
-                        campus_nom=campus_nom or "",
-                        ministere_nom=ministere_nom or "",
-                        nom_creneau=slot.nom_creneau,
-                        role_code=aff.role_code,
-                        date_debut_dt=slot.date_debut,
-                        date_fin_dt=slot.date_fin,
+                    (
+                        membre.id,
+                        PlanningPublishedNotification(
+                            email=membre.email,
+                            prenom=membre.prenom,
+                            nom=membre.nom,
+                            type_activite=activite.type,
+                            date_activite=activite.date_debut.date(),
+                            heure_debut=heure_debut,
+                            heure_fin=heure_fin,
+                            lieu=activite.lieu,
+                            campus_nom=campus_nom or "",
+                            ministere_nom=ministere_nom or "",
+                            nom_creneau=slot.nom_creneau,
+                            role_code=aff.role_code,
+                            date_debut_dt=slot.date_debut,
+                            date_fin_dt=slot.date_fin,
+                        ),
                     )
                 )
         return notifications
 
     def _collect_notification_data_cancelled(
         self, planning_id: str, motif: Optional[str] = None
-    ) -> List[PlanningCancelledNotification]:
-        """Construit la liste des notifications d'annulation (1 par membre unique)."""
+    ) -> List[Tuple[str, PlanningCancelledNotification]]:
+        """Construit les couples (membre_id, notification) d'annulation
+        (1 par membre unique)."""
         query = (
             select(PlanningService)
             .where(PlanningService.id == planning_id)
@@ -166,7 +174,7 @@ class PlanningServiceSvc(
         type_activite = activite.type
         date_activite = activite.date_debut.date()
         seen: set[str] = set()
-        notifications: List[PlanningCancelledNotification] = []
+        notifications: List[Tuple[str, PlanningCancelledNotification]] = []
         for slot in planning.slots:
             for aff in slot.affectations:
                 membre = aff.membre
@@ -174,35 +182,42 @@ class PlanningServiceSvc(
                     continue
                 seen.add(membre.id)
                 notifications.append(
-                    PlanningCancelledNotification(
-                        email=membre.email,
-                        prenom=membre.prenom,
-                        nom=membre.nom,
-                        type_activite=type_activite,
-                        date_activite=date_activite,
-                        campus_nom=campus_nom or "",
-                        ministere_nom=ministere_nom or "",
-                        motif=motif,
+                    (
+                        membre.id,
+                        PlanningCancelledNotification(
+                            email=membre.email,
+                            prenom=membre.prenom,
+                            nom=membre.nom,
+                            type_activite=type_activite,
+                            date_activite=date_activite,
+                            campus_nom=campus_nom or "",
+                            ministere_nom=ministere_nom or "",
+                            motif=motif,
+                        ),
                     )
                 )
         return notifications
 
-    def _dispatch_status_notifications(
-        self,
-        planning_id: str,
-        new_status: PlanningStatusCode,
-        background_tasks: BackgroundTasks,
-        email_service: EmailService,
-    ) -> None:
-        """Enqueue les emails de notification selon le nouveau statut."""
+    def _enqueue_status_notifications(
+        self, planning_id: str, new_status: PlanningStatusCode
+    ) -> int:
+        """Écrit les notifications du nouveau statut dans l'outbox (même
+        transaction que le changement de statut). L'envoi est fait par
+        notification.outbox_worker : la latence de la requête ne dépend
+        pas du nombre de destinataires."""
+        pairs: Sequence[Tuple[str, Any]]
         if new_status == PlanningStatusCode.PUBLIE:
-            notifs_p = self._collect_notification_data_published(planning_id)
-            for np in notifs_p:
-                background_tasks.add_task(email_service.notify_planning_published, np)
+            pairs = self._collect_notification_data_published(planning_id)
         elif new_status == PlanningStatusCode.ANNULE:
-            notifs_a = self._collect_notification_data_cancelled(planning_id)
-            for na in notifs_a:
-                background_tasks.add_task(email_service.notify_planning_cancelled, na)
+            pairs = self._collect_notification_data_cancelled(planning_id)
+        else:
+            return 0
+        payloads: Dict[str, List[dict]] = defaultdict(list)
+        for membre_id, notif in pairs:
+            payloads[membre_id].append(notif.model_dump(mode="json"))
+        return NotificationOutboxRepository(self.db).enqueue(
+            planning_id, new_status.value, payloads
+        )
 
     def _resolve_activite_names(
         self, campus_id: str, ministere_id: str
@@ -215,19 +230,6 @@ class PlanningServiceSvc(
             ministere.nom if ministere else None,
         )
 
-    def _enrich_plannings_list(
-        self, plannings: Sequence[PlanningService]
-    ) -> List[PlanningFullRead]:
-        """Valide et enrichit chaque planning avec les noms résolus du campus
-        et du ministère organisateur (campus_nom, ministere_organisateur_nom)."""
-        result = []
-        for p in plannings:
-            dto = PlanningFullRead.model_validate(p)
-            if p.activite:
-                dto.activite = self._build_activite_full(p.activite)
-            result.append(dto)
-        return result
-
     def _build_activite_full(self, activite: Activite) -> ActiviteFullRead:
         """Construit un ActiviteFullRead avec noms résolus."""
         campus_nom, ministere_nom = self._resolve_activite_names(
@@ -264,8 +266,7 @@ class PlanningServiceSvc(
         new_status: PlanningStatusCode,
         auto_flush: bool = True,
         *,
-        background_tasks: Optional[BackgroundTasks] = None,
-        email_service: Optional[EmailService] = None,
+        notify: bool = False,
     ) -> PlanningService:
         """Met à jour le statut avec gestion du workflow et notifications."""
         planning = self.get_one(planning_id)
@@ -285,10 +286,8 @@ class PlanningServiceSvc(
         if auto_flush:
             self.db.flush()
 
-        if background_tasks and email_service:
-            self._dispatch_status_notifications(
-                planning_id, new_status, background_tasks, email_service
-            )
+        if notify:
+            self._enqueue_status_notifications(planning_id, new_status)
 
         return planning
 
@@ -406,9 +405,7 @@ class PlanningServiceSvc(
             )
 
         try:
-            self.slot_svc.delete_by_planning(planning_id)
-            self.db.delete(planning)
-            self.db.flush()
+            self._delete_cascade([(planning_id, activite_id)])
 
             if not activite_id:
                 logger.warning(
@@ -416,8 +413,6 @@ class PlanningServiceSvc(
                         id=planning_id
                     )
                 )
-            else:
-                self.activite_svc.hard_delete(str(activite_id))
 
             logger.info(f"Full Delete réussi : Planning {planning_id}")
         except AppException:
@@ -430,6 +425,36 @@ class PlanningServiceSvc(
             )
             raise e
 
+    def delete_serie(self, serie_id: str) -> int:
+        """
+        Supprime tous les plannings d'une série (et leur descendance) en une
+        requête par table. Tout ou rien : refusé si un planning est publié.
+        Retourne le nombre de plannings supprimés.
+        """
+        rows = self.repo.list_serie_plannings(serie_id)
+        if not rows:
+            raise AppException(ErrorRegistry.SERIE_004, id=serie_id)
+
+        for _, _, statut_code in rows:
+            if statut_code == PlanningStatusCode.PUBLIE.value:
+                raise AppException(
+                    ErrorRegistry.PLANNING_DELETE_IMPOSSIBLE, status=statut_code
+                )
+
+        deleted = self._delete_cascade([(p_id, a_id) for p_id, a_id, _ in rows])
+        logger.info(f"Série {serie_id} supprimée : {deleted}")
+        return deleted["plannings"]
+
+    def _delete_cascade(
+        self, plannings: List[Tuple[str, Optional[str]]]
+    ) -> Dict[str, int]:
+        """Suppression ensembliste (planning_id, activite_id) ; flush préalable."""
+        self.db.flush()
+        return self.repo.delete_cascade(
+            [p_id for p_id, _ in plannings],
+            sorted({str(a_id) for _, a_id in plannings if a_id}),
+        )
+
     # Dans la classe PlanningServiceSvc :
 
     def get_full_planning(self, planning_id: str) -> PlanningFullRead:
@@ -458,7 +483,7 @@ class PlanningServiceSvc(
                 raise AppException(ErrorRegistry.PLAN_NOT_FOUND)
 
             # 2. Délégation aux services spécialisés
-            total, filled = self.slot_svc.get_slots_metrics(planning_db.slots)
+            total, filled = self.slot_svc.get_slots_metrics(planning_id)
 
             # 3. Calcul du Workflow (propre au Planning)
             current_status = PlanningStatusCode(planning_db.statut_code)
@@ -487,7 +512,7 @@ class PlanningServiceSvc(
         self, ministere_id: str, current_user: Utilisateur
     ) -> None:
         """Lève PLAN_016 si l'user n'est pas admin et n'appartient pas au ministère."""
-        if _is_admin_or_super(current_user):
+        if _is_admin_or_super(current_user, self.refs):
             return
         if not current_user.membre_id:
             raise AppException(ErrorRegistry.PLAN_016)
@@ -501,7 +526,7 @@ class PlanningServiceSvc(
 
     def _assert_campus_access(self, campus_id: str, current_user: Utilisateur) -> None:
         """Lève PLAN_017 si l'user n'est pas admin et n'appartient pas au campus."""
-        if _is_admin_or_super(current_user):
+        if _is_admin_or_super(current_user, self.refs):
             return
         if not current_user.membre_id:
             raise AppException(ErrorRegistry.PLAN_017)
@@ -513,39 +538,49 @@ class PlanningServiceSvc(
         if not link:
             raise AppException(ErrorRegistry.PLAN_017)
 
+    def _list_full_page(
+        self, conditions: List[Any], window: Optional[PlanningWindow]
+    ) -> CursorPage[PlanningFullRead]:
+        """Applique la fenêtre de dates et la pagination keyset (date_debut, id)."""
+        window = window or PlanningWindow()
+        date_from = window.date_from or datetime.now() - timedelta(days=7)
+        conditions.append(Activite.date_debut >= date_from)
+        if window.date_to:
+            conditions.append(Activite.date_debut < window.date_to)
+        after = None
+        if window.cursor:
+            try:
+                after = decode_cursor(window.cursor)
+            except ValueError as e:
+                raise AppException(ErrorRegistry.PLAN_019) from e
+
+        items = self.repo.list_full_projection(
+            *conditions, after=after, limit=window.limit + 1
+        )
+        next_cursor = None
+        if len(items) > window.limit:
+            items = items[: window.limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                cast(ActiviteFullRead, last.activite).date_debut, last.id
+            )
+        return CursorPage(data=items, next_cursor=next_cursor, limit=window.limit)
+
     def list_by_ministere(
         self,
         ministere_id: str,
         current_user: Utilisateur,
         campus_id: Optional[str] = None,
-    ) -> List[PlanningFullRead]:
-        """Retourne tous les plannings complets dont l'activité est organisée
+        window: Optional[PlanningWindow] = None,
+    ) -> CursorPage[PlanningFullRead]:
+        """Retourne les plannings complets dont l'activité est organisée
         par un ministère donné, avec activite + slots + affectations chargés."""
         self._assert_ministere_access(ministere_id, current_user)
-        cutoff = datetime.now() - timedelta(days=7)
         try:
-            query = (
-                select(PlanningService)
-                .join(Activite)
-                .where(Activite.ministere_organisateur_id == ministere_id)
-                .where(Activite.date_debut >= cutoff)
-                .where(
-                    PlanningService.deleted_at == None  # noqa: E711
-                )  # pylint: disable=C0121
-                .options(
-                    selectinload(cast(Any, PlanningService.activite)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.membre)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.ministere)),
-                )
-            )
+            conditions: List[Any] = [Activite.ministere_organisateur_id == ministere_id]
             if campus_id:
-                query = query.where(Activite.campus_id == campus_id)
-            results = self.db.exec(query).unique().all()
-            return self._enrich_plannings_list(results)
+                conditions.append(Activite.campus_id == campus_id)
+            return self._list_full_page(conditions, window)
         except Exception as e:
             logger.error(f"Erreur list_by_ministere {ministere_id}: {str(e)}")
             raise
@@ -554,102 +589,53 @@ class PlanningServiceSvc(
         self,
         membre_id: str,
         campus_id: Optional[str] = None,
-    ) -> List[PlanningFullRead]:
-        """Retourne tous les plannings complets où l'utilisateur connecté
+        window: Optional[PlanningWindow] = None,
+    ) -> CursorPage[PlanningFullRead]:
+        """Retourne les plannings complets où l'utilisateur connecté
         est affecté dans au moins un slot (vue calendrier personnelle)."""
-        cutoff = datetime.now() - timedelta(days=7)
         try:
-            query = (
-                select(PlanningService)
-                .join(cast(Any, PlanningService.slots))
-                .join(cast(Any, Slot.affectations))
+            affecte = (
+                select(Slot.planning_id)
                 .join(
-                    Activite,
-                    cast(Any, PlanningService.activite_id) == cast(Any, Activite.id),
+                    Affectation,
+                    col(cast(Any, Affectation.slot_id)) == col(cast(Any, Slot.id)),
                 )
                 .where(Affectation.membre_id == membre_id)
-                .where(Activite.date_debut >= cutoff)
-                .where(
-                    PlanningService.deleted_at == None  # noqa: E711
-                )  # pylint: disable=C0121
-                .options(
-                    selectinload(cast(Any, PlanningService.activite)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.membre)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.ministere)),
-                )
             )
+            conditions: List[Any] = [
+                col(PlanningService.id).in_(affecte),  # pylint: disable=no-member
+            ]
             if campus_id:
-                query = query.where(Activite.campus_id == campus_id)
-            results = self.db.exec(query).unique().all()
-            return self._enrich_plannings_list(results)
+                conditions.append(Activite.campus_id == campus_id)
+            return self._list_full_page(conditions, window)
         except Exception as e:
             logger.error(f"Erreur list_my_plannings_full {membre_id}: {str(e)}")
             raise
 
     def list_by_campus(
-        self, campus_id: str, current_user: Utilisateur
-    ) -> List[PlanningFullRead]:
-        """Retourne tous les plannings complets dont l'activité se déroule
+        self,
+        campus_id: str,
+        current_user: Utilisateur,
+        window: Optional[PlanningWindow] = None,
+    ) -> CursorPage[PlanningFullRead]:
+        """Retourne les plannings complets dont l'activité se déroule
         sur un campus donné, avec activite + slots + affectations chargés."""
         self._assert_campus_access(campus_id, current_user)
-        cutoff = datetime.now() - timedelta(days=7)
         try:
-            query = (
-                select(PlanningService)
-                .join(Activite)
-                .where(Activite.campus_id == campus_id)
-                .where(Activite.date_debut >= cutoff)
-                .where(
-                    PlanningService.deleted_at == None  # noqa: E711
-                )  # pylint: disable=C0121
-                .options(
-                    selectinload(cast(Any, PlanningService.activite)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.membre)),
-                    selectinload(cast(Any, PlanningService.slots))
-                    .selectinload(cast(Any, Slot.affectations))
-                    .selectinload(cast(Any, Affectation.ministere)),
-                )
-            )
-            results = self.db.exec(query).unique().all()
-            return self._enrich_plannings_list(results)
+            return self._list_full_page([Activite.campus_id == campus_id], window)
         except Exception as e:
             logger.error(f"Erreur list_by_campus {campus_id}: {str(e)}")
             raise
 
     def get_member_agenda_full(
         self, membre_id: str, campus_id: str, start: datetime, end: datetime
-    ):
-        # 1. Requête SQL avec jointures (optimisation des performances)
-        query = (
-            select(Affectation)
-            .join(Slot)
-            .join(PlanningService)
-            .join(Activite)
-            .where(Affectation.membre_id == membre_id)
-            .where(Activite.campus_id == campus_id)
-            .where(Slot.date_debut >= start)
-            .where(Slot.date_debut <= end)
-            .options(
-                selectinload(cast(Any, Affectation.slot))
-                .selectinload(cast(Any, Slot.planning))
-                .selectinload(cast(Any, PlanningService.activite))
-                .selectinload(cast(Any, Activite.campus))
-            )
+    ) -> MemberAgendaResponse:
+        """Agenda du membre : un parcours d'index sur t_membre_agenda."""
+        entries = MembreAgendaRepository(self.db).list_range(
+            membre_id, campus_id, start, end
         )
-        results = self.db.exec(query).all()
-        affectations = list(results)
-
-        # 2. Appel au SlotService (qui lui-même appellera AffectationService)
-        entries = self.slot_svc.map_affectations_to_entries(affectations)
-        stats = self.slot_svc.get_agenda_statistics(affectations)
-
-        # 3. Rassemblement final
+        # Statistiques de la période, sur les entrées déjà lues
+        stats = self.slot_svc.get_agenda_statistics(entries)
         return MemberAgendaResponse(
             period_start=start, period_end=end, statistics=stats, entries=entries
         )
@@ -1,14 +1,14 @@
 """Service métier pour les templates de planning."""
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, and_, false, or_
 from sqlalchemy.orm import selectinload
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
-from core.auth.auth_utils import _role_name
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from mla_enum import RoleName
@@ -31,8 +31,6 @@ from models.planning_template_model import (
 )
 from models.schema_db_model import (
     Activite,
-    Affectation,
-    Indisponibilite,
     Membre,
     PlanningService,
     PlanningTemplate,
@@ -42,32 +40,49 @@ from models.schema_db_model import (
     Slot,
     Utilisateur,
 )
+from repositories.affectation_repository import AffectationRepository
+from repositories.indisponibilite_repository import IndisponibiliteRepository
+from repositories.membre_repository import MembreEligibiliteRow, MembreRepository
 from repositories.planning_template_repository import (
     PlanningTemplateRepository,
+    TemplateStatsRow,
 )
+from repositories.slot_repository import SlotRepository
+from services.reference_data_service import ReferenceDataService
 
 
-def _get_user_role_names(user: Utilisateur) -> List[str]:
+def _get_user_role_names(user: Utilisateur, refs: ReferenceDataService) -> List[str]:
     """Extrait les noms Casbin des rôles d'un utilisateur."""
-    return [
-        _role_name(aff.role.libelle)
-        for aff in user.affectations
-        if aff.role and aff.role.libelle is not None
-    ]
+    names = (refs.affectation_role_name(aff) for aff in user.affectations)
+    return [name for name in names if name is not None]
 
 
-def _is_admin_or_super(user: Utilisateur) -> bool:
+def _is_admin_or_super(user: Utilisateur, refs: ReferenceDataService) -> bool:
     """Vrai si l'user est ADMIN ou SUPER_ADMIN."""
-    roles = _get_user_role_names(user)
+    roles = _get_user_role_names(user, refs)
     return RoleName.SUPER_ADMIN.name in roles or RoleName.ADMIN.name in roles
 
 
+@dataclass
+class _ApplyContext:
+    """Données préchargées et résultats accumulés d'une application de template."""
+
+    ministere_id: str
+    planning_date_str: str
+    membres: Dict[str, MembreEligibiliteRow]
+    indisponibles: Set[str]
+    affectations: List[dict] = field(default_factory=list)
+    avertissements: List[WarningIndispo] = field(default_factory=list)
+    ignores: List[WarningMembreIgnore] = field(default_factory=list)
+
+
 class PlanningTemplateSvc:
     """Service pour la gestion des templates de planning."""
 
     def __init__(self, db: Session) -> None:
         self.db = db
         self.repo = PlanningTemplateRepository(db)
+        self.refs = ReferenceDataService(db)
 
     # ── Lecture ────────────────────────────────────────────────────────
 
@@ -101,7 +116,7 @@ class PlanningTemplateSvc:
         - CAMPUS    → tous les responsables du campus
         Admin/Super Admin voient MINISTERE + CAMPUS + leurs propres PRIVE.
         """
-        is_admin = _is_admin_or_super(user)
+        is_admin = _is_admin_or_super(user, self.refs)
         campus_filter = self._resolve_campus_filter(user)
         membre = user.membre
         membre_id = str(membre.id) if membre else ""
@@ -123,30 +138,44 @@ class PlanningTemplateSvc:
         membre = user.membre
         return membre.campus_principal_id if membre else None
 
-    def _is_visible(
-        self,
-        tpl: PlanningTemplate,
+    @staticmethod
+    def _visibility_clause(
         *,
         membre_id: str,
         accessible_ministere_ids: List[str],
         campus_filter: Optional[str],
         is_admin: bool,
-    ) -> bool:
-        """Retourne True si l'utilisateur peut voir ce template."""
-        if tpl.created_by_id == membre_id:
-            return True
-        if tpl.visibilite == VisibiliteTemplate.PRIVE:
-            return False
+    ) -> ColumnElement[bool]:
+        """Traduit les règles de visibilité US-99 en clause SQL."""
+        # pylint: disable=no-member
+        own = col(PlanningTemplate.created_by_id) == membre_id
         if is_admin:
-            return True
-        if tpl.visibilite == VisibiliteTemplate.MINISTERE:
-            return (
-                tpl.campus_id == campus_filter
-                and tpl.ministere_id in accessible_ministere_ids
+            return or_(
+                own,
+                col(PlanningTemplate.visibilite) != VisibiliteTemplate.PRIVE.value,
             )
-        if tpl.visibilite == VisibiliteTemplate.CAMPUS:
-            return tpl.campus_id == campus_filter
-        return False
+        same_campus = (
+            col(PlanningTemplate.campus_id) == campus_filter
+            if campus_filter
+            else false()
+        )
+        in_ministere = (
+            col(PlanningTemplate.ministere_id).in_(accessible_ministere_ids)
+            if accessible_ministere_ids
+            else false()
+        )
+        return or_(
+            own,
+            and_(
+                col(PlanningTemplate.visibilite) == VisibiliteTemplate.MINISTERE.value,
+                same_campus,
+                in_ministere,
+            ),
+            and_(
+                col(PlanningTemplate.visibilite) == VisibiliteTemplate.CAMPUS.value,
+                same_campus,
+            ),
+        )
 
     @staticmethod
     def _compute_section(tpl: PlanningTemplate, *, membre_id: str) -> str:
@@ -166,79 +195,45 @@ class PlanningTemplateSvc:
         accessible_ministere_ids: List[str],
         is_admin: bool,
     ) -> List[PlanningTemplateListItem]:
-        """Charge templates + filtre visibilité + calcule stats et section."""
-        stmt = select(PlanningTemplate)
-        if campus_filter:
-            stmt = stmt.where(PlanningTemplate.campus_id == campus_filter)
-        if ministere_filter:
-            stmt = stmt.where(PlanningTemplate.ministere_id == ministere_filter)
-        templates = list(self.db.exec(stmt).all())
-        items: List[PlanningTemplateListItem] = []
-        for tpl in templates:
-            if not self._is_visible(
-                tpl,
-                membre_id=membre_id,
-                accessible_ministere_ids=accessible_ministere_ids,
-                campus_filter=campus_filter,
-                is_admin=is_admin,
-            ):
-                continue
-            stats = self._compute_usage_stats(tpl.id)
-            nb_creneaux = self._compute_nb_creneaux(tpl.id)
-            section = self._compute_section(tpl, membre_id=membre_id)
-            items.append(
-                PlanningTemplateListItem(
-                    id=tpl.id,
-                    nom=tpl.nom,
-                    description=tpl.description,
-                    ministere_id=tpl.ministere_id,
-                    campus_id=tpl.campus_id,
-                    activite_type=tpl.activite_type,
-                    nb_creneaux=nb_creneaux,
-                    usage_count=stats[0],
-                    last_used_at=stats[1],
-                    created_at=tpl.created_at,
-                    visibilite=tpl.visibilite,
-                    section=section,
-                )
-            )
-        items.sort(
-            key=lambda x: (
-                x.last_used_at is None,
-                -(x.last_used_at.timestamp() if x.last_used_at else 0),
-            )
+        """Charge templates visibles + stats en une requête, calcule la section."""
+        visibility = self._visibility_clause(
+            membre_id=membre_id,
+            accessible_ministere_ids=accessible_ministere_ids,
+            campus_filter=campus_filter,
+            is_admin=is_admin,
         )
-        return items
-
-    def _compute_usage_stats(self, template_id: str) -> tuple[int, Optional[datetime]]:
-        """Retourne (usage_count, last_used_at) depuis t_planningservice."""
-        count_stmt = (
-            select(func.count())  # pylint: disable=not-callable
-            .select_from(PlanningService)
-            .where(
-                PlanningService.template_id == template_id,
-                PlanningService.deleted_at == None,  # noqa: E711
-            )
+        rows = self.repo.list_with_stats(
+            campus_id=campus_filter,
+            ministere_id=ministere_filter,
+            visibility=visibility,
         )
-        count = self.db.exec(count_stmt).one()
-
-        max_stmt = select(func.max(Activite.date_debut)).where(
-            PlanningService.template_id == template_id,
-            PlanningService.activite_id == Activite.id,
-            PlanningService.deleted_at == None,  # noqa: E711
-        )
-        last_used = self.db.exec(max_stmt).one()
-        return (count or 0, last_used)
+        return [
+            self._to_list_item(
+                row, section=self._compute_section(row[0], membre_id=membre_id)
+            )
+            for row in rows
+        ]
 
-    def _compute_nb_creneaux(self, template_id: str) -> int:
-        """Retourne le nombre de créneaux du template."""
-        stmt = (
-            select(func.count())  # pylint: disable=not-callable
-            .select_from(PlanningTemplateSlot)
-            .where(PlanningTemplateSlot.template_id == template_id)
+    @staticmethod
+    def _to_list_item(
+        row: TemplateStatsRow, *, section: str
+    ) -> PlanningTemplateListItem:
+        """Convertit une ligne (template, usage, dernière date, nb) en DTO."""
+        tpl, usage_count, last_used_at, nb_creneaux = row
+        return PlanningTemplateListItem(
+            id=tpl.id,
+            nom=tpl.nom,
+            description=tpl.description,
+            ministere_id=tpl.ministere_id,
+            campus_id=tpl.campus_id,
+            activite_type=tpl.activite_type,
+            nb_creneaux=nb_creneaux,
+            usage_count=usage_count,
+            last_used_at=last_used_at,
+            created_at=tpl.created_at,
+            visibilite=tpl.visibilite,
+            section=section,
         )
-        result = self.db.exec(stmt).one()
-        return result or 0
 
     # ── Lecture full US-95 ─────────────────────────────────────────────
 
@@ -455,22 +450,10 @@ class PlanningTemplateSvc:
         self.db.add(new_tpl)
         self.db.flush()
         self._copy_slots(source, new_tpl.id)
-        stats = self._compute_usage_stats(new_tpl.id)
-        nb = self._compute_nb_creneaux(new_tpl.id)
-        return PlanningTemplateListItem(
-            id=new_tpl.id,
-            nom=new_tpl.nom,
-            description=new_tpl.description,
-            ministere_id=new_tpl.ministere_id,
-            campus_id=new_tpl.campus_id,
-            activite_type=new_tpl.activite_type,
-            nb_creneaux=nb,
-            usage_count=stats[0],
-            last_used_at=stats[1],
-            created_at=new_tpl.created_at,
-            visibilite=new_tpl.visibilite,
-            section="mes_templates",
-        )
+        row = self.repo.get_with_stats(new_tpl.id)
+        if row is None:
+            raise AppException(ErrorRegistry.TMPL_003)
+        return self._to_list_item(row, section="mes_templates")
 
     def _copy_slots(self, source: PlanningTemplate, new_template_id: str) -> None:
         """Copie tous les créneaux, rôles et membres suggérés du template."""
@@ -546,7 +529,7 @@ class PlanningTemplateSvc:
         self, template: PlanningTemplate, user: Utilisateur
     ) -> None:
         """Lève TMPL_004 si l'utilisateur n'a pas accès au template."""
-        if _is_admin_or_super(user):
+        if _is_admin_or_super(user, self.refs):
             return
         membre = user.membre
         membre_id = str(membre.id) if membre else ""
@@ -695,35 +678,40 @@ class PlanningTemplateSvc:
         Crée des slots et des affectations PROPOSE pour chaque membre suggéré
         éligible (actif, dans le bon ministère).
         Retourne un résultat avec warnings indispo et membres ignorés.
+
+        Les membres suggérés et leurs indisponibilités sont chargés en une
+        requête chacun, puis slots et affectations sont insérés par lots.
         """
         template = self.repo.get_with_slots(template_id)
         if not template:
             raise AppException(ErrorRegistry.TMPL_003)
         planning = self._load_planning_with_activite(planning_id)
         activite: Activite = planning.activite  # type: ignore[assignment]
-        ministere_id = activite.ministere_organisateur_id
-        planning_date = activite.date_debut.date()
-        avertissements: List[WarningIndispo] = []
-        ignores: List[WarningMembreIgnore] = []
-        nb_creees = 0
+        ctx = self._load_apply_context(
+            {
+                ms.membre_id
+                for tpl_slot in template.slots
+                for role in tpl_slot.roles
+                for ms in role.membres_suggeres
+            },
+            ministere_id=activite.ministere_organisateur_id,
+            planning_date_str=str(activite.date_debut.date()),
+        )
+        slots: List[Slot] = []
         for tpl_slot in template.slots:
             slot = self._create_real_slot(planning_id, tpl_slot, activite)
+            slots.append(slot)
             for role in tpl_slot.roles:
-                counts = self._apply_role_membres(
-                    role,
-                    slot=slot,
-                    ministere_id=ministere_id,
-                    planning_date_str=str(planning_date),
-                )
-                nb_creees += counts[0]
-                avertissements.extend(counts[1])
-                ignores.extend(counts[2])
-        self.db.flush()
+                self._apply_role_membres(role, slot=slot, ctx=ctx)
+        SlotRepository(self.db).bulk_insert([slot.model_dump() for slot in slots])
+        AffectationRepository(self.db).bulk_insert(ctx.affectations)
+        # Insertions hors ORM : la collection déjà chargée est périmée
+        self.db.expire(planning, ["slots"])
         return ApplyTemplateResult(
             planning_id=planning_id,
-            affectations_creees=nb_creees,
-            avertissements_indispo=avertissements,
-            membres_ignores=ignores,
+            affectations_creees=len(ctx.affectations),
+            avertissements_indispo=ctx.avertissements,
+            membres_ignores=ctx.ignores,
         )
 
     def _load_planning_with_activite(self, planning_id: str) -> PlanningService:
@@ -740,87 +728,72 @@ class PlanningTemplateSvc:
             raise AppException(ErrorRegistry.PLAN_014)
         return planning
 
-    def _create_real_slot(
+    def _load_apply_context(
         self,
+        membre_ids: Set[str],
+        *,
+        ministere_id: str,
+        planning_date_str: str,
+    ) -> _ApplyContext:
+        """Précharge éligibilité et indisponibilités des membres suggérés."""
+        return _ApplyContext(
+            ministere_id=ministere_id,
+            planning_date_str=planning_date_str,
+            membres=MembreRepository(self.db).get_eligibilite(membre_ids, ministere_id),
+            indisponibles=IndisponibiliteRepository(self.db).get_membres_indisponibles(
+                membre_ids, date.fromisoformat(planning_date_str)
+            ),
+        )
+
+    @staticmethod
+    def _create_real_slot(
         planning_id: str,
         tpl_slot: PlanningTemplateSlot,
         activite: Activite,
     ) -> Slot:
-        """Crée un Slot réel depuis un slot de template."""
+        """Construit un Slot réel, hors session, depuis un slot de template."""
         debut = activite.date_debut + timedelta(minutes=tpl_slot.offset_debut_minutes)
         fin = activite.date_debut + timedelta(minutes=tpl_slot.offset_fin_minutes)
-        slot = Slot(
+        return Slot(
+            id=str(uuid4()),
             planning_id=planning_id,
             nom_creneau=tpl_slot.nom_creneau,
             date_debut=debut,
             date_fin=fin,
             nb_personnes_requis=tpl_slot.nb_personnes_requis,
         )
-        self.db.add(slot)
-        self.db.flush()
-        return slot
 
     def _apply_role_membres(
         self,
         role: PlanningTemplateRole,
         *,
         slot: Slot,
-        ministere_id: str,
-        planning_date_str: str,
-    ) -> Tuple[int, List[WarningIndispo], List[WarningMembreIgnore]]:
-        """Crée les affectations pour tous les membres suggérés d'un rôle."""
-        nb = 0
-        warns: List[WarningIndispo] = []
-        ignores: List[WarningMembreIgnore] = []
+        ctx: _ApplyContext,
+    ) -> None:
+        """Prépare les affectations de tous les membres suggérés d'un rôle."""
         for ms in role.membres_suggeres:
-            aff, w_i, w_ig = self._apply_membre_suggere(
+            self._apply_membre_suggere(
                 ms.membre_id,
                 slot=slot,
                 role_code=role.role_code,
-                ministere_id=ministere_id,
-                planning_date_str=planning_date_str,
+                ministere_id=ctx.ministere_id,
+                planning_date_str=ctx.planning_date_str,
+                ctx=ctx,
             )
-            if aff is not None:
-                nb += 1
-            if w_i is not None:
-                warns.append(w_i)
-            if w_ig is not None:
-                ignores.append(w_ig)
-        return nb, warns, ignores
 
+    @staticmethod
     def _check_membre_eligibilite(
-        self,
-        membre: Membre,
-        *,
-        ministere_id: str,
+        eligibilite: MembreEligibiliteRow,
     ) -> Optional[str]:
         """Retourne la raison d'exclusion ou None si éligible."""
-        if not membre.actif:
+        _nom, actif, dans_ministere = eligibilite
+        if not actif:
             return "introuvable"
-        ids = [str(m.id) for m in (membre.ministeres or [])]
-        if ministere_id not in ids:
+        if not dans_ministere:
             return "hors_ministere"
         return None
 
-    def _check_indisponibilite(
-        self,
-        *,
-        membre_id: str,
-        planning_date_str: str,
-    ) -> bool:
-        """Retourne True si le membre est indisponible à la date donnée."""
-        stmt = select(Indisponibilite).where(
-            Indisponibilite.membre_id == membre_id,
-        )
-        rows = self.db.exec(stmt).all()
-        for row in rows:
-            if row.date_debut is None or row.date_fin is None:
-                continue
-            if row.date_debut <= planning_date_str <= row.date_fin:
-                return True
-        return False
-
-    def _apply_membre_suggere(
+    def _apply_membre_suggere(  # pylint: disable=too-many-arguments
         self,
         membre_id: str,
         *,
@@ -828,55 +801,58 @@ class PlanningTemplateSvc:
         role_code: str,
         ministere_id: str,
         planning_date_str: str,
+        ctx: Optional[_ApplyContext] = None,
     ) -> Tuple[
-        Optional[Affectation],
+        Optional[dict],
         Optional[WarningIndispo],
         Optional[WarningMembreIgnore],
     ]:
-        """Tente de créer une affectation pour un membre suggéré."""
-        membre = self.db.get(Membre, membre_id)
-        if membre is None:
-            return (
-                None,
-                None,
-                WarningMembreIgnore(
-                    membre_id=membre_id,
-                    membre_nom="Inconnu",
-                    role_code=role_code,
-                    raison="introuvable",
-                ),
+        """Tente de préparer l'affectation d'un membre suggéré.
+
+        Sans ctx (appel isolé), les données du membre sont chargées ici.
+        La ligne et les avertissements sont aussi accumulés dans ctx.
+        """
+        if ctx is None:
+            ctx = self._load_apply_context(
+                {membre_id},
+                ministere_id=ministere_id,
+                planning_date_str=planning_date_str,
             )
-        raison = self._check_membre_eligibilite(membre, ministere_id=ministere_id)
+        eligibilite = ctx.membres.get(membre_id)
+        membre_nom = eligibilite[0] if eligibilite else "Inconnu"
+        raison = (
+            "introuvable"
+            if eligibilite is None
+            else self._check_membre_eligibilite(eligibilite)
+        )
         if raison is not None:
-            return (
-                None,
-                None,
-                WarningMembreIgnore(
-                    membre_id=membre_id,
-                    membre_nom=f"{membre.prenom} {membre.nom}",
-                    role_code=role_code,
-                    raison=raison,
-                ),
+            ignore = WarningMembreIgnore(
+                membre_id=membre_id,
+                membre_nom=membre_nom,
+                role_code=role_code,
+                raison=raison,
             )
+            ctx.ignores.append(ignore)
+            return None, None, ignore
         w_indispo: Optional[WarningIndispo] = None
-        if self._check_indisponibilite(
-            membre_id=membre_id,
-            planning_date_str=planning_date_str,
-        ):
+        if membre_id in ctx.indisponibles:
             w_indispo = WarningIndispo(
                 membre_id=membre_id,
-                membre_nom=f"{membre.prenom} {membre.nom}",
+                membre_nom=membre_nom,
                 creneau_nom=slot.nom_creneau,
                 role_code=role_code,
             )
-        affectation = Affectation(
-            slot_id=slot.id,
-            membre_id=membre_id,
-            role_code=role_code,
-            statut_affectation_code="PROPOSE",
-            ministere_id=ministere_id,
-        )
-        self.db.add(affectation)
+            ctx.avertissements.append(w_indispo)
+        affectation = {
+            "id": str(uuid4()),
+            "slot_id": slot.id,
+            "membre_id": membre_id,
+            "role_code": role_code,
+            "statut_affectation_code": "PROPOSE",
+            "presence_confirmee": False,
+            "ministere_id": ministere_id,
+        }
+        ctx.affectations.append(affectation)
         return affectation, w_indispo, None
 
     @staticmethod
@@ -4,6 +4,12 @@ from typing import Any, List, Optional, cast
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, col, select
 
+from core.auth.casbin_enforcer import (
+    SUBJECT_USER,
+    publish_policy_change,
+    sync_user_groupings,
+)
+from core.auth.principal_cache import principal_cache
 from core.auth.security import get_password_hash
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
@@ -26,10 +32,10 @@ from models.schema_db_model import (
     CampusMinistereLink,
     MembreCampusLink,
     MembreMinistereLink,
-    MinistereRoleConfig,
 )
 from repositories.membre_repository import _exclude_superadmin_clause
 from services.membre_service import MembreService
+from services.reference_data_service import ReferenceDataService
 
 from .base_service import BaseService
 
@@ -42,6 +48,7 @@ class ProfileService(
     def __init__(self, db: Session):
         self.db = db
         self.membre_svc = MembreService(db)
+        self.refs = ReferenceDataService(db)
         # Fix W0231: Appel du constructeur parent avec le repo adéquat
         super().__init__(repo=self.membre_svc.repo, resource_name="Profile")
 
@@ -79,13 +86,7 @@ class ProfileService(
         if not ministere_ids:
             return
 
-        stmt = select(MinistereRoleConfig.role_code).where(
-            col(MinistereRoleConfig.role_code).in_(role_codes),
-            col(MinistereRoleConfig.ministere_id).in_(  # pylint: disable=no-member
-                ministere_ids
-            ),
-        )
-        configured = set(self.db.exec(stmt).all())
+        configured = self.refs.configured_role_codes(ministere_ids)
         unconfigured = [c for c in role_codes if c not in configured]
         if unconfigured:
             raise AppException(
@@ -140,6 +141,8 @@ class ProfileService(
         # Créer les nouvelles affectations
         for role_id in roles_ids:
             self.db.add(AffectationRole(utilisateur_id=utilisateur.id, role_id=role_id))
+        publish_policy_change(self.db, SUBJECT_USER, utilisateur.id)
+        principal_cache.invalidate_user(utilisateur.id)
 
     def create(self, data: ProfilCreateFull) -> ProfilReadFull:
         try:
@@ -168,6 +171,8 @@ class ProfileService(
                 self._sync_utilisateur_roles(db_user, roles_ids)
 
             self.db.commit()
+            if roles_ids:
+                sync_user_groupings(self.db, db_user.id)
             logger.info(f"Profil créé avec succès : {db_membre.email}")
 
             return self.get_one(db_membre.id)
@@ -203,24 +208,13 @@ class ProfileService(
             if data.role_codes is not None:
                 self._sync_roles(db_membre, data.role_codes)
 
+            regrouped_user_id: Optional[str] = None
             if data.utilisateur:
-                if not db_membre.utilisateur:
-                    raise AppException(ErrorRegistry.PROFIL_USER_LINK_MISSING)
-
-                user_update = data.utilisateur.model_dump(
-                    exclude_unset=True, exclude={"roles_ids"}
-                )
-                for key, value in user_update.items():
-                    if key == "password" and value:
-                        value = get_password_hash(value)
-                    setattr(db_membre.utilisateur, key, value)
-                self.db.add(db_membre.utilisateur)
-
-                roles_ids = data.utilisateur.roles_ids
-                if roles_ids is not None:
-                    self._sync_utilisateur_roles(db_membre.utilisateur, roles_ids)
+                regrouped_user_id = self._update_utilisateur(db_membre, data)
 
             self.db.commit()
+            if regrouped_user_id:
+                sync_user_groupings(self.db, regrouped_user_id)
             return self.get_one(identifiant)
         except AppException:
             self.db.rollback()
@@ -232,6 +226,32 @@ class ProfileService(
                 ErrorRegistry.CORE_ACTION_IMPOSSIBLE, resource="Profile"
             ) from e
 
+    def _update_utilisateur(
+        self, db_membre: Membre, data: ProfilUpdateFull
+    ) -> Optional[str]:
+        """Applique la mise à jour du compte lié.
+
+        Retourne l'id utilisateur si ses rôles applicatifs ont été resynchronisés.
+        """
+        if not db_membre.utilisateur or not data.utilisateur:
+            raise AppException(ErrorRegistry.PROFIL_USER_LINK_MISSING)
+
+        user_update = data.utilisateur.model_dump(
+            exclude_unset=True, exclude={"roles_ids"}
+        )
+        for key, value in user_update.items():
+            if key == "password" and value:
+                value = get_password_hash(value)
+            setattr(db_membre.utilisateur, key, value)
+        self.db.add(db_membre.utilisateur)
+        principal_cache.invalidate_user(db_membre.utilisateur.id)
+
+        roles_ids = data.utilisateur.roles_ids
+        if roles_ids is None:
+            return None
+        self._sync_utilisateur_roles(db_membre.utilisateur, roles_ids)
+        return db_membre.utilisateur.id
+
     def get_one(self, identifiant: str) -> ProfilReadFull:
         db_obj = self._get_db_obj(identifiant)
         return ProfilReadFull.model_validate(db_obj)
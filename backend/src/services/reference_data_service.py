@@ -0,0 +1,203 @@
+"""
+Accès en lecture aux données de référence, via le cache versionné.
+
+Les écritures sur ces référentiels doivent appeler invalidate() avec le
+domaine concerné (cf. core.reference_cache). Les rôles actifs d'un
+ministère embarquent le libellé des rôles : toute écriture sur le
+catalogue invalide aussi MINISTERE_ROLES.
+"""
+
+import copy
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlmodel import Session, col, select
+
+from core.auth.auth_utils import _role_name
+from core.reference_cache import (
+    CAMPUS_MINISTERES,
+    CATALOGUE,
+    MINISTERE_ROLES,
+    RBAC_ROLES,
+    STATUTS,
+    reference_cache,
+)
+from models import CategorieRoleRead, RoleCompetenceRead
+from models.schema_db_model import (
+    AffectationRole,
+    CampusMinistereLink,
+    CategorieRole,
+    Ministere,
+    MinistereRoleConfig,
+    Role,
+    RoleCompetence,
+    StatutAffectation,
+    StatutPlanning,
+)
+
+
+class ReferenceDataService:
+    """Lectures des référentiels, mémorisées par process."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def invalidate(self, *domains: str) -> None:
+        """À appeler après toute écriture sur un référentiel."""
+        reference_cache.invalidate(self.db, *domains)
+
+    def statut_planning_codes(self) -> Tuple[str, ...]:
+        return reference_cache.get_or_load(
+            self.db,
+            STATUTS,
+            "planning",
+            lambda: tuple(self.db.exec(select(StatutPlanning.code)).all()),
+        )
+
+    def statut_affectation_codes(self) -> Tuple[str, ...]:
+        return reference_cache.get_or_load(
+            self.db,
+            STATUTS,
+            "affectation",
+            lambda: tuple(self.db.exec(select(StatutAffectation.code)).all()),
+        )
+
+    def categories(self) -> Tuple[CategorieRoleRead, ...]:
+        """Catalogue global des catégories de rôles."""
+        return reference_cache.get_or_load(
+            self.db,
+            CATALOGUE,
+            "categories",
+            lambda: tuple(
+                CategorieRoleRead.model_validate(cat)
+                for cat in self.db.exec(select(CategorieRole)).all()
+            ),
+        )
+
+    def active_roles_of_ministere(
+        self, ministere_id: str
+    ) -> Tuple[RoleCompetenceRead, ...]:
+        """Rôles compétences activés pour un ministère (t_ministere_role_config)."""
+
+        def load() -> Tuple[RoleCompetenceRead, ...]:
+            stmt = (
+                select(RoleCompetence)
+                .join(
+                    MinistereRoleConfig,
+                    col(MinistereRoleConfig.role_code) == col(RoleCompetence.code),
+                )
+                .where(MinistereRoleConfig.ministere_id == ministere_id)
+            )
+            return tuple(
+                RoleCompetenceRead.model_validate(role)
+                for role in self.db.exec(stmt).all()
+            )
+
+        return reference_cache.get_or_load(self.db, MINISTERE_ROLES, ministere_id, load)
+
+    def configured_role_codes(self, ministere_ids: Iterable[str]) -> Set[str]:
+        """Union des codes de rôles activés pour ces ministères."""
+        return {
+            role.code
+            for ministere_id in ministere_ids
+            for role in self.active_roles_of_ministere(ministere_id)
+        }
+
+    def rbac_role_names(self) -> Mapping[str, str]:
+        """id de t_role → nom Casbin (ex : 'SUPER_ADMIN')."""
+        return reference_cache.get_or_load(
+            self.db,
+            RBAC_ROLES,
+            "names",
+            lambda: MappingProxyType(
+                {
+                    role_id: _role_name(libelle)
+                    for role_id, libelle in self.db.exec(
+                        select(Role.id, Role.libelle)
+                    ).all()
+                }
+            ),
+        )
+
+    def affectation_role_name(self, aff: AffectationRole) -> Optional[str]:
+        """Nom Casbin du rôle d'une affectation, sans charger aff.role."""
+        name = self.rbac_role_names().get(aff.role_id)
+        if name is None and aff.role and aff.role.libelle is not None:
+            # Rôle créé dans la transaction en cours : pas encore en cache
+            name = _role_name(aff.role.libelle)
+        return name
+
+    def ministeres_tree(self, campus_id: str) -> List[Dict[str, Any]]:
+        """Ministères du campus → catégories → rôles actifs (copie modifiable)."""
+        tree = reference_cache.get_or_load(
+            self.db,
+            CAMPUS_MINISTERES,
+            campus_id,
+            lambda: self._load_ministeres_tree(campus_id),
+            depends=(CATALOGUE, MINISTERE_ROLES),
+        )
+        return copy.deepcopy(list(tree))
+
+    def _load_ministeres_tree(self, campus_id: str) -> Tuple[Dict[str, Any], ...]:
+        """Construit l'arbre en nombre fixe de requêtes, quel que soit le campus."""
+        # pylint: disable=no-member
+        ministeres = self.db.exec(
+            select(Ministere.id, Ministere.nom)
+            .join(
+                CampusMinistereLink,
+                col(CampusMinistereLink.ministere_id) == col(Ministere.id),
+            )
+            .where(CampusMinistereLink.campus_id == campus_id)
+            .where(Ministere.deleted_at == None)  # noqa: E711
+        ).all()
+        # ministère → catégorie → rôles actifs
+        active: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        ministere_ids = [ministere_id for ministere_id, _ in ministeres]
+        if ministere_ids:
+            rows = self.db.exec(
+                select(
+                    MinistereRoleConfig.ministere_id,
+                    RoleCompetence.code,
+                    RoleCompetence.libelle,
+                    RoleCompetence.categorie_code,
+                )
+                .join(
+                    RoleCompetence,
+                    col(MinistereRoleConfig.role_code) == col(RoleCompetence.code),
+                )
+                .where(col(MinistereRoleConfig.ministere_id).in_(ministere_ids))
+            ).all()
+            for ministere_id, code, libelle, categorie_code in rows:
+                by_cat = active.setdefault(ministere_id, {})
+                by_cat.setdefault(categorie_code, []).append(
+                    {"code": code, "libelle": libelle}
+                )
+        categories = self.categories()
+        return tuple(
+            {
+                "id": ministere_id,
+                "nom": nom,
+                "description": None,  # t_ministere n'a pas de description
+                "categories": [
+                    {
+                        "code": cat.code,
+                        "libelle": cat.libelle,
+                        "description": cat.description,
+                        "roles_actifs": active[ministere_id][cat.code],
+                    }
+                    for cat in categories
+                    # n'inclut que les catégories avec au moins un rôle actif
+                    if cat.code in active.get(ministere_id, {})
+                ],
+            }
+            for ministere_id, nom in ministeres
+        )
+
+    def roles_by_categorie(
+        self, ministere_id: str
+    ) -> List[Tuple[CategorieRoleRead, List[RoleCompetenceRead]]]:
+        """Toutes les catégories, annotées de leurs rôles actifs pour le ministère."""
+        active_by_cat: Dict[str, List[RoleCompetenceRead]] = {}
+        for role in self.active_roles_of_ministere(ministere_id):
+            active_by_cat.setdefault(role.categorie_code, []).append(role)
+        return [(cat, active_by_cat.get(cat.code, [])) for cat in self.categories()]
@@ -4,6 +4,7 @@ from sqlmodel import Session
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from core.reference_cache import CATALOGUE, MINISTERE_ROLES
 from models import (
     CategorieRole,
     RoleCompetence,
@@ -21,6 +22,8 @@ class RoleCompetenceService(
         RoleCompetenceCreate, RoleCompetenceRead, RoleCompetenceUpdate, RoleCompetence
     ]
 ):
+    reference_domains = (CATALOGUE, MINISTERE_ROLES)
+
     def __init__(self, db: Session):
         self.repo = RoleCompetenceRepository(db)
         super().__init__(self.repo, resource_name="Rôle Compétence")
@@ -36,7 +39,9 @@ class RoleCompetenceService(
             raise AppException(ErrorRegistry.ROLE_CAT_NOT_FOUND)
 
         db_obj = RoleCompetence.model_validate(data)
-        return self.repo.create(db_obj)
+        created = self.repo.create(db_obj)
+        self._invalidate_references()
+        return created
 
     def update(self, identifiant: str, data: RoleCompetenceUpdate) -> RoleCompetence:
         obj = self.get_one(identifiant)
@@ -48,7 +53,9 @@ class RoleCompetenceService(
             if not cat:
                 raise AppException(ErrorRegistry.ROLE_CAT_NOT_FOUND)
 
-        return self.repo.update(obj, update_data)
+        updated = self.repo.update(obj, update_data)
+        self._invalidate_references()
+        return updated
 
     def list_grouped_by_category(
         self, ministere_id: Optional[str] = None
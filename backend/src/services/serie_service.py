@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import List, Optional
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Set
 from uuid import uuid4
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
-from models.schema_db_model import Activite, PlanningService
+from models.schema_db_model import (
+    Activite,
+    Affectation,
+    MembreMinistereLink,
+    PlanningService,
+    PlanningTemplate,
+    Slot,
+)
 from models.serie_model import (
     ConflitDate,
     GenerateSeriesPreviewRequest,
@@ -20,8 +30,18 @@ from models.serie_model import (
     SerieRecurrence,
     SeriesPreviewResponse,
 )
+from repositories.activite_repository import ActiviteRepository
+from repositories.affectation_repository import AffectationRepository
+from repositories.planning_repository import PlanningRepository
+from repositories.planning_template_repository import PlanningTemplateRepository
+from repositories.slot_repository import SlotRepository
 from services.planning_template_service import PlanningTemplateSvc
 
+logger = logging.getLogger(__name__)
+
+# Heure de début des activités générées
+_HEURE_DEBUT = time(9, 0, 0)
+
 
 def _nth_weekday_of_month(
     year: int, month: int, weekday: int, n: int
@@ -36,11 +56,30 @@ def _nth_weekday_of_month(
     return target
 
 
+def _row(model: Any, **values: Any) -> Dict[str, Any]:
+    """Ligne complète d'une table (défauts + id pré-généré), hors session."""
+    return model(**values).model_dump()
+
+
+@dataclass
+class BulkWriteStats:
+    """Volumétrie de la dernière écriture en masse d'une série."""
+
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Débit d'écriture (0 si la durée n'est pas mesurable)."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
 class SerieService:
     """Service de génération de plannings en série."""
 
     def __init__(self, db: Optional[Session]) -> None:
         self.db = db
+        self.last_write_stats: Optional[BulkWriteStats] = None
 
     # ── Calcul des dates ──────────────────────────────────────────────────
 
@@ -121,49 +160,30 @@ class SerieService:
         *,
         ministere_id: str,
     ) -> List[ConflitDate]:
-        """Détecte les plannings existants sur les dates cibles."""
-        assert self.db is not None
-        conflits: List[ConflitDate] = []
-        for target_date in dates:
-            conflit = self._check_date_conflit(target_date, ministere_id=ministere_id)
-            if conflit is not None:
-                conflits.append(conflit)
-        return conflits
-
-    def _check_date_conflit(
-        self,
-        target_date: date,
-        *,
-        ministere_id: str,
-    ) -> Optional[ConflitDate]:
-        """Vérifie si un planning existe déjà pour cette date/ministère."""
+        """Détecte les plannings existants sur les dates cibles.
+
+        Une seule requête sur [min(dates), max(dates)], puis rapprochement
+        en mémoire : le premier planning actif du jour fait conflit.
+        """
         assert self.db is not None
-        day_start = datetime(
-            target_date.year, target_date.month, target_date.day, 0, 0, 0
-        )
-        day_end = datetime(
-            target_date.year, target_date.month, target_date.day, 23, 59, 59
-        )
-        stmt_a = select(Activite).where(
-            Activite.ministere_organisateur_id == ministere_id,
-            Activite.date_debut >= day_start,
-            Activite.date_debut <= day_end,
-        )
-        activite = self.db.exec(stmt_a).first()
-        if activite is None:
-            return None
-        stmt_p = select(PlanningService).where(
-            PlanningService.activite_id == activite.id,
-            PlanningService.deleted_at == None,  # noqa: E711
-        )
-        planning = self.db.exec(stmt_p).first()
-        if planning is None:
-            return None
-        return ConflitDate(
-            date=target_date,
-            planning_id=planning.id,
-            planning_titre=activite.type,
+        if not dates:
+            return []
+        day_start = datetime.combine(min(dates), time.min)
+        day_end = datetime.combine(max(dates), time.max)
+        rows = PlanningRepository(self.db).list_by_ministere_in_range(
+            ministere_id, day_start, day_end
         )
+        by_date: Dict[date, ConflitDate] = {}
+        for planning_id, activite_type, activite_debut in rows:
+            by_date.setdefault(
+                activite_debut.date(),
+                ConflitDate(
+                    date=activite_debut.date(),
+                    planning_id=planning_id,
+                    planning_titre=activite_type,
+                ),
+            )
+        return [by_date[d] for d in dates if d in by_date]
 
     # ── Génération ───────────────────────────────────────────────────────
 
@@ -174,27 +194,206 @@ class SerieService:
         created_by_id: str,
         ministere_id: str,
         campus_id: str,
+        bulk: bool = True,
     ) -> GenerateSeriesResponse:
-        """Génère les plannings d'une série depuis un template."""
+        """Génère les plannings d'une série depuis un template.
+
+        `bulk=True` (défaut) : toutes les lignes sont calculées en mémoire
+        puis écrites par INSERT multi-lignes, une série de lots par table.
+        `bulk=False` : chemin ORM historique, un planning à la fois.
+        """
         assert self.db is not None
         dates = self.compute_series_dates(request)
+        conflits = self._find_conflits(dates, ministere_id=ministere_id)
         serie_id = str(uuid4())
-        plannings: List[PlanningSerieItem] = []
-        for target_date in dates:
-            item = self._create_one_planning(
+        if bulk:
+            plannings = self._bulk_create_plannings(
                 request,
-                target_date=target_date,
+                dates=dates,
                 serie_id=serie_id,
-                created_by_id=created_by_id,
                 ministere_id=ministere_id,
                 campus_id=campus_id,
             )
-            plannings.append(item)
+        else:
+            plannings = [
+                self._create_one_planning(
+                    request,
+                    target_date=target_date,
+                    serie_id=serie_id,
+                    created_by_id=created_by_id,
+                    ministere_id=ministere_id,
+                    campus_id=campus_id,
+                )
+                for target_date in dates
+            ]
         self.db.commit()
         return GenerateSeriesResponse(
-            serie_id=serie_id, total=len(plannings), plannings=plannings
+            serie_id=serie_id,
+            total=len(plannings),
+            plannings=plannings,
+            conflits=conflits,
         )
 
+    # ── Génération en masse ──────────────────────────────────────────────
+
+    def _bulk_create_plannings(
+        self,
+        request: GenerateSeriesRequest,
+        *,
+        dates: List[date],
+        serie_id: str,
+        ministere_id: str,
+        campus_id: str,
+    ) -> List[PlanningSerieItem]:
+        """Pré-calcule activités, plannings, créneaux et affectations puis
+        les écrit par lots. Équivalent à `apply_to_planning` par date."""
+        assert self.db is not None
+        started = perf_counter()
+        template = PlanningTemplateRepository(self.db).get_with_slots(
+            request.template_id
+        )
+        if template is None:
+            raise AppException(ErrorRegistry.TMPL_003)
+        eligibles = self._eligible_membre_ids(template, ministere_id=ministere_id)
+        rows: Dict[str, List[Dict[str, Any]]] = {
+            "activites": [],
+            "plannings": [],
+            "slots": [],
+            "affectations": [],
+        }
+        items = [
+            self._append_planning_rows(
+                rows,
+                template,
+                target_date=target_date,
+                serie_id=serie_id,
+                campus_id=campus_id,
+                ministere_id=ministere_id,
+                eligibles=eligibles,
+            )
+            for target_date in dates
+        ]
+        stats = BulkWriteStats(rows=self._write_rows(rows))
+        stats.seconds = perf_counter() - started
+        logger.info(
+            f"Série {serie_id} : {stats.rows} lignes écrites "
+            f"({stats.rows_per_second:.0f} lignes/s)"
+        )
+        self.last_write_stats = stats
+        return items
+
+    def _append_planning_rows(
+        self,
+        rows: Dict[str, List[Dict[str, Any]]],
+        template: PlanningTemplate,
+        *,
+        target_date: date,
+        serie_id: str,
+        campus_id: str,
+        ministere_id: str,
+        eligibles: Set[str],
+    ) -> PlanningSerieItem:
+        """Ajoute activité, planning, créneaux et affectations d'une date."""
+        debut = datetime.combine(target_date, _HEURE_DEBUT)
+        activite = _row(
+            Activite,
+            type=template.activite_type,
+            date_debut=debut,
+            date_fin=debut + timedelta(minutes=template.duree_minutes),
+            campus_id=campus_id,
+            ministere_organisateur_id=ministere_id,
+        )
+        planning = _row(
+            PlanningService,
+            activite_id=activite["id"],
+            statut_code="BROUILLON",
+            template_id=template.id,
+            serie_id=serie_id,
+        )
+        rows["activites"].append(activite)
+        rows["plannings"].append(planning)
+        self._append_slot_rows(
+            rows,
+            template,
+            planning_id=planning["id"],
+            debut=debut,
+            eligibles=eligibles,
+            ministere_id=ministere_id,
+        )
+        return PlanningSerieItem(
+            id=planning["id"],
+            titre=template.activite_type,
+            date_debut=target_date,
+            statut="BROUILLON",
+        )
+
+    def _write_rows(self, rows: Dict[str, List[Dict[str, Any]]]) -> int:
+        """INSERT multi-lignes par table, dans l'ordre des clés étrangères."""
+        assert self.db is not None
+        written = ActiviteRepository(self.db).bulk_insert(rows["activites"])
+        written += PlanningRepository(self.db).bulk_insert(rows["plannings"])
+        written += SlotRepository(self.db).bulk_insert(rows["slots"])
+        written += AffectationRepository(self.db).bulk_insert(rows["affectations"])
+        return written
+
+    @staticmethod
+    def _append_slot_rows(
+        rows: Dict[str, List[Dict[str, Any]]],
+        template: PlanningTemplate,
+        *,
+        planning_id: str,
+        debut: datetime,
+        eligibles: Set[str],
+        ministere_id: str,
+    ) -> None:
+        """Ajoute les créneaux et affectations PROPOSE d'un planning."""
+        for tpl_slot in template.slots:
+            slot = _row(
+                Slot,
+                planning_id=planning_id,
+                nom_creneau=tpl_slot.nom_creneau,
+                date_debut=debut + timedelta(minutes=tpl_slot.offset_debut_minutes),
+                date_fin=debut + timedelta(minutes=tpl_slot.offset_fin_minutes),
+                nb_personnes_requis=tpl_slot.nb_personnes_requis,
+            )
+            rows["slots"].append(slot)
+            for role in tpl_slot.roles:
+                rows["affectations"].extend(
+                    _row(
+                        Affectation,
+                        slot_id=slot["id"],
+                        membre_id=ms.membre_id,
+                        role_code=role.role_code,
+                        statut_affectation_code="PROPOSE",
+                        ministere_id=ministere_id,
+                    )
+                    for ms in role.membres_suggeres
+                    if ms.membre_id in eligibles
+                )
+
+    def _eligible_membre_ids(
+        self, template: PlanningTemplate, *, ministere_id: str
+    ) -> Set[str]:
+        """Membres suggérés actifs et rattachés au ministère (1 requête)."""
+        # pylint: disable=no-member
+        assert self.db is not None
+        actifs = {
+            ms.membre_id
+            for tpl_slot in template.slots
+            for role in tpl_slot.roles
+            for ms in role.membres_suggeres
+            if ms.membre is not None and ms.membre.actif
+        }
+        if not actifs:
+            return set()
+        stmt = select(MembreMinistereLink.membre_id).where(
+            MembreMinistereLink.ministere_id == ministere_id,
+            col(MembreMinistereLink.membre_id).in_(actifs),
+        )
+        return set(self.db.exec(stmt).all())
+
+    # ── Génération unitaire (ORM) ────────────────────────────────────────
+
     def _build_activite(
         self,
         target_date: date,
@@ -206,14 +405,7 @@ class SerieService:
     ) -> Activite:
         """Construit et persiste une Activite pour la date cible."""
         assert self.db is not None
-        debut = datetime(
-            target_date.year,
-            target_date.month,
-            target_date.day,
-            9,
-            0,
-            0,
-        )
+        debut = datetime.combine(target_date, _HEURE_DEBUT)
         fin = debut + timedelta(minutes=duree_minutes)
         activite = Activite(
             type=activite_type,
@@ -1,13 +1,30 @@
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Set, Type
+from uuid import uuid4
 
-from sqlmodel import Session, select
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, col
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
-from models import PlanningService, Slot, SlotCreate, SlotRead
+from mla_enum.custom_enum import AffectationStatusCode, PlanningStatusCode
+from models import (
+    Activite,
+    Affectation,
+    Membre,
+    PlanningFillRead,
+    PlanningService,
+    Slot,
+    SlotCreate,
+    SlotFillRead,
+    SlotRead,
+    StaffingMetricsRead,
+)
 from models.membre_model import MemberAgendaEntryRead, MemberAgendaStats
+from repositories.affectation_repository import AffectationRepository
+from repositories.membre_role_repository import MembreRoleRepository
 from repositories.slot_repository import SlotRepository
 from services.affectation_service import AffectationService
 from utils.utils_func import extract_field
@@ -16,12 +33,70 @@ from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
+_POINTING_STATUSES = {
+    AffectationStatusCode.PRESENT,
+    AffectationStatusCode.ABSENT,
+    AffectationStatusCode.RETARD,
+}
+
+
+@dataclass
+class SlotSyncReport:
+    """Bilan d'une synchronisation : lignes écrites par table et requêtes émises."""
+
+    slots_inserted: int = 0
+    slots_updated: int = 0
+    slots_deleted: int = 0
+    affectations_inserted: int = 0
+    affectations_updated: int = 0
+    affectations_deleted: int = 0
+    statements: int = 0
+
+
+@dataclass
+class _SyncState:
+    """Photo de la base au début de la synchronisation."""
+
+    planning: PlanningService
+    activite: Activite
+    slots: Dict[str, Dict[str, Any]]
+    affectations: Dict[str, Dict[str, Any]]
+
+
+@dataclass
+class _SyncDiff:
+    """Diff payload ↔ base, validé en mémoire avant toute écriture."""
+
+    slot_deletes: Set[str]
+    slot_inserts: List[dict] = field(default_factory=list)
+    slot_updates: List[dict] = field(default_factory=list)
+    aff_inserts: List[dict] = field(default_factory=list)
+    aff_updates: List[dict] = field(default_factory=list)
+    aff_deletes: Set[str] = field(default_factory=set)
+    membre_ids: Set[str] = field(default_factory=set)
+
 
 class SlotService(BaseService[SlotCreate, SlotRead, Any, Slot]):
     def __init__(self, db: Session):
         super().__init__(SlotRepository(db), "Slot")
         self.db = db
         self.affectation_svc = AffectationService(self.db)
+        self.affectation_repo = AffectationRepository(self.db)
+
+    @staticmethod
+    def _check_slot_window(
+        activite: Activite, date_debut: datetime, date_fin: datetime
+    ) -> None:
+        """Chronologie du créneau et inclusion dans les bornes de l'activité."""
+        if date_fin <= date_debut:
+            raise AppException(ErrorRegistry.SLOT_CHRONOLOGY_ERROR)
+
+        if date_debut < activite.date_debut or date_fin > activite.date_fin:
+            raise AppException(
+                ErrorRegistry.SLOT_OUT_OF_BOUNDS,
+                debut=activite.date_debut,
+                fin=activite.date_fin,
+            )
 
     def _validate_slot_constraints(
         self,
@@ -31,26 +106,11 @@ class SlotService(BaseService[SlotCreate, SlotRead, Any, Slot]):
         exclude_slot_id: Optional[str] = None,
     ):
         """Valide les règles métier : cohérence et bornes activité."""
-
-        # 1. Vérification chronologique
-        if date_fin <= date_debut:
-            raise AppException(ErrorRegistry.SLOT_CHRONOLOGY_ERROR)
-
-        # 2. Vérification existence Planning/Activité
         planning = self.db.get(PlanningService, planning_id)
         if not planning or not planning.activite:
             raise AppException(ErrorRegistry.PLANNING_NOT_FOUND)
 
-        # 3. Vérification des bornes de l'activité
-        if (
-            date_debut < planning.activite.date_debut
-            or date_fin > planning.activite.date_fin
-        ):
-            raise AppException(
-                ErrorRegistry.SLOT_OUT_OF_BOUNDS,
-                debut=planning.activite.date_debut,
-                fin=planning.activite.date_fin,
-            )
+        self._check_slot_window(planning.activite, date_debut, date_fin)
 
     def update_slot_secure(self, slot_id: str, data: Any) -> Slot:
         """Met à jour un slot en validant les nouvelles contraintes temporelles."""
@@ -77,82 +137,310 @@ class SlotService(BaseService[SlotCreate, SlotRead, Any, Slot]):
         return self.repo.create(new_slot)
 
     def _prepare_slot_create_dict(self, s_data: Any) -> dict:
-        """Extrait les données pour la création d'un slot en excluant les relations."""
+        """Extrait les données pour la création d'un slot en excluant les relations.
+
+        Les champs optionnels laissés à None (SlotFullUpdate) prennent la
+        valeur par défaut de SlotCreate.
+        """
         exclude_fields = {"affectations", "id", "planning_id"}
         if hasattr(s_data, "model_dump"):
-            return s_data.model_dump(exclude=exclude_fields)
+            return s_data.model_dump(exclude=exclude_fields, exclude_none=True)
 
         return {k: v for k, v in s_data.items() if k not in exclude_fields}
 
-    def sync_planning_slots(self, planning_id: str, slots_data: List[Any]):
-        """Gère le cycle de vie complet (Sync) des slots et de leurs affectations."""
+    def sync_planning_slots(
+        self, planning_id: str, slots_data: List[Any]
+    ) -> SlotSyncReport:
+        """
+        Synchronise par diff les slots d'un planning et leurs affectations.
+
+        L'état courant est lu en deux requêtes colonnaires, le diff complet
+        est calculé et validé en mémoire (bornes, rôles, workflow), puis
+        appliqué en quelques DELETE / UPDATE / INSERT ensemblistes : le
+        nombre de requêtes ne dépend plus du nombre de slots. Une erreur
+        de validation ne laisse donc aucune écriture partielle.
+        """
+        self.db.flush()
+        report = SlotSyncReport()
+
+        def _count_statement(*_args) -> None:
+            report.statements += 1
+
+        connection = self.db.connection()
+        event.listen(connection, "before_cursor_execute", _count_statement)
+        try:
+            state = self._load_sync_state(planning_id)
+            payload_ids = {str(extract_field(s, "id")) for s in slots_data}
+            diff = _SyncDiff(slot_deletes=set(state.slots) - payload_ids)
+            for s_data in slots_data:
+                self._diff_slot(state, s_data, diff)
+            self._check_member_roles(diff.aff_inserts)
+            self._apply_diff(diff, report)
+        finally:
+            event.remove(connection, "before_cursor_execute", _count_statement)
+
+        self._expire_synced(state, diff)
+        logger.info(f"Sync slots du planning {planning_id} : {report}")
+        return report
+
+    def _load_sync_state(self, planning_id: str) -> _SyncState:
+        planning = self.db.get(PlanningService, planning_id)
+        if not planning or not planning.activite:
+            raise AppException(ErrorRegistry.PLANNING_NOT_FOUND)
+
+        slots = self.repo.get_sync_state(planning_id)
+        return _SyncState(
+            planning=planning,
+            activite=planning.activite,
+            slots=slots,
+            affectations=self.affectation_repo.get_sync_state(list(slots)),
+        )
 
-        db_slots = self.db.exec(
-            select(Slot).where(Slot.planning_id == planning_id)
-        ).all()
-        current_map = {str(s.id): s for s in db_slots}
+    def _diff_slot(self, state: _SyncState, s_data: Any, diff: _SyncDiff) -> None:
+        s_id = extract_field(s_data, "id")
+        current = state.slots.get(str(s_id)) if s_id else None
 
-        active_payload_ids = []
-        for s_data in slots_data:
-            p_id = extract_field(s_data, "id")
-            if p_id:
-                active_payload_ids.append(str(p_id))
+        if current is None:
+            s_create = SlotCreate(
+                **self._prepare_slot_create_dict(s_data),
+                planning_id=state.planning.id,
+            )
+            self._check_slot_window(
+                state.activite, s_create.date_debut, s_create.date_fin
+            )
+            slot_id = str(uuid4())
+            diff.slot_inserts.append({**s_create.model_dump(), "id": slot_id})
+        else:
+            slot_id = current["id"]
+            changes = self._slot_changes(state.activite, s_data, current)
+            if changes:
+                diff.slot_updates.append({"id": slot_id, **changes})
 
-        for s_id, slot_obj in current_map.items():
-            if s_id not in active_payload_ids:
-                self.affectation_svc.delete_by_slot(s_id)
-                self.db.delete(slot_obj)
+        self._diff_affectations(
+            state, slot_id, extract_field(s_data, "affectations", []) or [], diff
+        )
 
-        self.db.flush()
+    def _slot_changes(
+        self, activite: Activite, s_data: Any, current: Dict[str, Any]
+    ) -> dict:
+        """Colonnes réellement modifiées d'un slot existant (après validation)."""
+        new_start = extract_field(s_data, "date_debut") or current["date_debut"]
+        new_end = extract_field(s_data, "date_fin") or current["date_fin"]
+        self._check_slot_window(activite, new_start, new_end)
+
+        if hasattr(s_data, "model_dump"):
+            update_data = s_data.model_dump(
+                exclude={"affectations"}, exclude_unset=True
+            )
+        else:
+            update_data = {k: v for k, v in s_data.items() if k != "affectations"}
 
-        for s_data in slots_data:
-            s_id = extract_field(s_data, "id")
+        return {
+            key: value
+            for key, value in update_data.items()
+            if key != "id" and key in current and current[key] != value
+        }
 
-            if s_id and str(s_id) in current_map:
-                slot_db = self.update_slot_secure(str(s_id), s_data)
-            else:
-                s_create = SlotCreate(
-                    **self._prepare_slot_create_dict(s_data), planning_id=planning_id
+    def _diff_affectations(
+        self,
+        state: _SyncState,
+        slot_id: str,
+        affectations_data: List[Any],
+        diff: _SyncDiff,
+    ) -> None:
+        """Delta (Add/Update/Delete) des affectations d'un slot."""
+        existing = state.affectations.get(slot_id, {})
+        kept: Set[str] = set()
+        for a_data in affectations_data:
+            a_id = extract_field(a_data, "id")
+            raw_status = extract_field(a_data, "statut_affectation_code")
+            status = AffectationStatusCode(raw_status) if raw_status else None
+
+            if isinstance(a_id, str) and a_id in existing:
+                kept.add(a_id)
+                if status:
+                    self._diff_status(state.planning, existing[a_id], status, diff)
+                continue
+
+            row = self._new_affectation(slot_id, a_data, status)
+            if row:
+                self._check_pointing(
+                    state.planning,
+                    AffectationStatusCode(row["statut_affectation_code"]),
+                )
+                diff.aff_inserts.append(row)
+                diff.membre_ids.add(row["membre_id"])
+            elif not a_id:
+                logger.warning(
+                    ErrorRegistry.Affectation_DATA_INCOMPLETE.message.format(id=slot_id)
                 )
-                slot_db = self.add_slot_to_planning(planning_id, s_create)
 
-            self.db.flush()
+        for a_id, current in existing.items():
+            if a_id not in kept:
+                diff.aff_deletes.add(a_id)
+                diff.membre_ids.add(current["membre_id"])
 
-            self.affectation_svc.sync_affectations(
-                slot_db.id, extract_field(s_data, "affectations", [])
-            )
+    def _diff_status(
+        self,
+        planning: PlanningService,
+        current: Dict[str, Any],
+        status: AffectationStatusCode,
+        diff: _SyncDiff,
+    ) -> None:
+        current_status = AffectationStatusCode(current["statut_affectation_code"])
+        # Statut inchangé : rien à écrire
+        if status == current_status:
+            return
+        self._check_pointing(planning, status)
+        self.affectation_svc.workflow.validate_transition(current_status, status)
+        diff.aff_updates.append(
+            {"id": current["id"], "statut_affectation_code": status.value}
+        )
 
-    def delete_by_planning(self, planning_id: str) -> None:
-        """Supprime tous les créneaux et leurs affectations pour un planning donné."""
-        db_slots = self.db.exec(
-            select(Slot).where(Slot.planning_id == planning_id)
-        ).all()
+    @staticmethod
+    def _new_affectation(
+        slot_id: str, a_data: Any, status: Optional[AffectationStatusCode]
+    ) -> Optional[dict]:
+        """Ligne à insérer, ou None si membre_id / role_code manquent."""
+        membre_id = extract_field(a_data, "membre_id")
+        role_code = extract_field(a_data, "role_code")
+        if not isinstance(membre_id, str) or not isinstance(role_code, str):
+            return None
+        ministere_id = extract_field(a_data, "ministere_id")
+        return {
+            "id": str(uuid4()),
+            "slot_id": slot_id,
+            "membre_id": membre_id,
+            "role_code": role_code,
+            "statut_affectation_code": (status or AffectationStatusCode.PROPOSE).value,
+            "presence_confirmee": False,
+            "ministere_id": ministere_id if isinstance(ministere_id, str) else None,
+        }
+
+    @staticmethod
+    def _check_pointing(
+        planning: PlanningService, status: AffectationStatusCode
+    ) -> None:
+        """Le pointage (PRESENT/ABSENT/RETARD) requiert un planning publié."""
+        if (
+            status in _POINTING_STATUSES
+            and planning.statut_code != PlanningStatusCode.PUBLIE.value
+        ):
+            raise AppException(ErrorRegistry.PLANNING_NOT_PUBLISHED)
 
-        for slot in db_slots:
-            self.affectation_svc.delete_by_slot(slot.id)
-            self.db.delete(slot)
+    def _check_member_roles(self, aff_inserts: List[dict]) -> None:
+        """Vérifie en une requête que chaque membre ajouté détient son rôle."""
+        pairs = {(row["membre_id"], row["role_code"]) for row in aff_inserts}
+        missing = pairs - MembreRoleRepository(self.db).held_roles(pairs)
+        if missing:
+            raise AppException(
+                ErrorRegistry.ASGN_MEMBER_MISSING_ROLE, role=sorted(missing)[0][1]
+            )
 
-        self.db.flush()
+    def _apply_diff(self, diff: _SyncDiff, report: SlotSyncReport) -> None:
+        """Applique le diff : enfants supprimés d'abord, insérés en dernier."""
+        report.affectations_deleted = self.affectation_repo.delete_for_sync(
+            diff.slot_deletes, diff.aff_deletes
+        )
+        report.slots_deleted = self.repo.delete_by_ids(diff.slot_deletes)
+        report.slots_updated = self.repo.bulk_update(diff.slot_updates)
+        report.slots_inserted = self.repo.bulk_insert(diff.slot_inserts)
+        report.affectations_updated = self.affectation_repo.bulk_update(
+            diff.aff_updates
+        )
+        report.affectations_inserted = self.affectation_repo.bulk_insert(
+            diff.aff_inserts
+        )
 
-    def get_slots_metrics(self, slots: List[Slot]) -> tuple[int, int]:
-        """
-        Calcule les métriques globales pour une liste de slots.
+    def _expire_synced(self, state: _SyncState, diff: _SyncDiff) -> None:
+        """Les écritures ensemblistes contournent l'identity map : on la périme."""
+        self.db.expire(state.planning, ["slots"])
+        self._expire_cached(Slot, state.slots)
+        self._expire_cached(Affectation, [row["id"] for row in diff.aff_updates])
+        self._expire_cached(Membre, diff.membre_ids, ["affectations"])
 
-        Args:
-            slots: Liste des objets Slot à analyser.
+    def _expire_cached(
+        self,
+        model: Type[SQLModel],
+        ids: Collection[str],
+        attributes: Optional[List[str]] = None,
+    ) -> None:
+        for obj_id in ids:
+            obj = self.db.identity_map.get(self.db.identity_key(model, obj_id))
+            if obj is not None:
+                self.db.expire(obj, attributes)
+
+    def get_slots_metrics(self, planning_id: str) -> tuple[int, int]:
+        """
+        Calcule les métriques globales des slots d'un planning (COUNT groupé).
 
         Returns:
             tuple: (nombre_total_slots, nombre_slots_remplis)
         """
-        total = len(slots)
+        rows = self.repo.fill_counts(col(Slot.planning_id) == planning_id)
+        return len(rows), sum(1 for _, _, quota, count in rows if count >= quota)
 
-        # On utilise l'AffectationService pour vérifier la condition métier "rempli"
-        filled = sum(1 for s in slots if self.affectation_svc.is_slot_filled(s))
-
-        return total, filled
+    def get_fill_metrics(
+        self,
+        *,
+        planning_id: Optional[str] = None,
+        ministere_id: Optional[str] = None,
+        campus_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> StaffingMetricsRead:
+        """
+        Couverture des créneaux d'un planning, d'un ministère organisateur
+        ou d'un campus (filtres cumulables), sans charger les affectations.
+        La fenêtre [date_from, date_to[ porte sur le début de l'activité.
+        """
+        if not (planning_id or ministere_id or campus_id):
+            raise AppException(ErrorRegistry.PLAN_020)
+        conditions: List[Any] = []
+        if planning_id:
+            conditions.append(col(Slot.planning_id) == planning_id)
+        if ministere_id:
+            conditions.append(col(Activite.ministere_organisateur_id) == ministere_id)
+        if campus_id:
+            conditions.append(col(Activite.campus_id) == campus_id)
+        if date_from:
+            conditions.append(col(Activite.date_debut) >= date_from)
+        if date_to:
+            conditions.append(col(Activite.date_debut) < date_to)
+
+        slots = [
+            SlotFillRead(
+                slot_id=slot_id,
+                planning_id=plan_id,
+                nb_personnes_requis=quota,
+                nb_affectes=count,
+                rempli=count >= quota,
+            )
+            for slot_id, plan_id, quota, count in self.repo.fill_counts(*conditions)
+        ]
+        plannings: Dict[str, PlanningFillRead] = {}
+        for slot in slots:
+            agg = plannings.setdefault(
+                slot.planning_id,
+                PlanningFillRead(
+                    planning_id=slot.planning_id, total_slots=0, filled_slots=0
+                ),
+            )
+            agg.total_slots += 1
+            agg.filled_slots += slot.rempli
+        filled = sum(s.rempli for s in slots)
+        return StaffingMetricsRead(
+            total_slots=len(slots),
+            filled_slots=filled,
+            personnes_requises=sum(s.nb_personnes_requis for s in slots),
+            personnes_affectees=sum(s.nb_affectes for s in slots),
+            taux_remplissage=round(filled / len(slots) * 100, 2) if slots else 0.0,
+            plannings=list(plannings.values()),
+            slots=slots,
+        )
 
     def get_agenda_statistics(self, affectations: list) -> MemberAgendaStats:
-        # Cascade : Slot appelle Affectation
+        # Cascade : Slot appelle Affectation (affectations ou entrées d'agenda)
         raw_stats = self.affectation_svc.get_stats_from_list(affectations)
         return MemberAgendaStats(
             total_engagements=raw_stats["total"],
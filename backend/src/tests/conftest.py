@@ -5,4 +5,5 @@ pytest_plugins = [
     "src.tests.fixtures.planning",
     "src.tests.fixtures.mocks",
     "src.tests.fixtures.profile",
+    "src.tests.fixtures.notification",
 ]
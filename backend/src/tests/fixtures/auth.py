@@ -1,12 +1,25 @@
 import pytest
 from sqlmodel import Session, select
 
+from core.auth.principal_cache import principal_cache
+from core.auth.revoked_filter import revoked_filter
 from core.auth.security import create_access_token, get_password_hash
 from mla_enum import RoleName  # noqa: F401 — conservé pour token tests
 from models import AffectationRole, Role, Utilisateur
 
 
 # pylint: disable=redefined-outer-name
+@pytest.fixture(autouse=True)
+def _reset_auth_caches():
+    """Isole les caches d'authentification entre les tests (transactions annulées)."""
+    principal_cache.clear()
+    principal_cache.reset_stats()
+    revoked_filter.reset()
+    yield
+    principal_cache.clear()
+    revoked_filter.reset()
+
+
 @pytest.fixture
 def test_user(session: Session) -> Utilisateur:
     """Crée un utilisateur standard actif (Get or Create)."""
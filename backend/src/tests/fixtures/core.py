@@ -2,9 +2,11 @@ import os
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel
 
 from conf.db.database import Database
+from core.reference_cache import reference_cache
 from main import app
 
 # On récupère l'engine configuré par notre factory (Postgres en local ou CI)
@@ -47,6 +49,15 @@ def setup_database():
     yield
 
 
+@pytest.fixture(autouse=True)
+def _reset_reference_cache():
+    """Isole le cache des référentiels entre les tests (transactions annulées)."""
+    reference_cache.clear()
+    reference_cache.reset_stats()
+    yield
+    reference_cache.clear()
+
+
 @pytest.fixture(name="session")
 def session_fixture():
     connection = engine.connect()
@@ -78,3 +89,33 @@ def client_fixture(session: Session):
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
+
+
+class QueryCounter:
+    """Compte les requêtes SQL émises sur une connexion (context manager)."""
+
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self.count = 0
+
+    def _on_execute(self, *_args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        self.count = 0
+        event.listen(self.connection, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        event.remove(self.connection, "before_cursor_execute", self._on_execute)
+
+
+@pytest.fixture
+def query_counter(session: Session) -> QueryCounter:
+    """
+    Compteur de requêtes pour les benchmarks N+1.
+
+    Usage : `with query_counter as qc: ...` puis `qc.count`.
+    Penser à `session.flush()` avant pour ne pas compter l'autoflush.
+    """
+    return QueryCounter(session.get_bind())
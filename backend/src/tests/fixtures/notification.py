@@ -0,0 +1,79 @@
+import socket
+from email import message_from_bytes
+from email.message import Message
+from typing import List
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, Envelope, Session
+
+from notification.smtp_delivery import SmtpDeliveryEngine, SmtpEndpoint
+
+
+class SmtpStub:
+    """Handler aiosmtpd : mémorise les messages reçus et les sessions ouvertes.
+
+    fail_codes : réponses à renvoyer, dans l'ordre, aux prochains DATA
+    (ex : ["421 Try again"]) avant d'accepter à nouveau.
+    """
+
+    def __init__(self) -> None:
+        self.messages: List[Message] = []
+        self.sessions: set[int] = set()
+        self.fail_codes: List[str] = []
+        self.endpoint = SmtpEndpoint(hostname="127.0.0.1", port=0)
+
+    async def handle_EHLO(  # pylint: disable=invalid-name,R0917
+        self,
+        server: SMTP,  # pylint: disable=unused-argument
+        session: Session,
+        envelope: Envelope,  # pylint: disable=unused-argument
+        hostname: str,
+        responses: List[str],
+    ) -> List[str]:
+        session.host_name = hostname
+        self.sessions.add(id(session))
+        return responses
+
+    async def handle_DATA(  # pylint: disable=invalid-name
+        self,
+        server: SMTP,  # pylint: disable=unused-argument
+        session: Session,  # pylint: disable=unused-argument
+        envelope: Envelope,
+    ) -> str:
+        if self.fail_codes:
+            return self.fail_codes.pop(0)
+        self.messages.append(message_from_bytes(envelope.content))  # type: ignore
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def smtp_stub():
+    """Serveur SMTP local (aiosmtpd) pour tester et mesurer l'envoi groupé."""
+    stub = SmtpStub()
+    controller = Controller(stub, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    stub.endpoint = SmtpEndpoint(
+        hostname=controller.hostname, port=controller.port, start_tls=False
+    )
+    yield stub
+    controller.stop()
+
+
+@pytest.fixture
+def smtp_engine(smtp_stub: SmtpStub) -> SmtpDeliveryEngine:
+    """Moteur d'envoi branché sur le stub, backoff réduit pour les tests."""
+    return SmtpDeliveryEngine(
+        smtp_stub.endpoint,
+        pool_size=4,
+        batch_size=20,
+        max_retries=2,
+        backoff_seconds=0.01,
+    )
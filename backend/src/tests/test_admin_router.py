@@ -66,6 +66,27 @@ def test_list_capabilities_ok(admin_client: TestClient, superadmin_headers: dict
     assert isinstance(data, list)
 
 
+# ------------------------------------------------------------------ #
+#  GET /admin/cache-stats
+# ------------------------------------------------------------------ #
+
+
+def test_cache_stats_admin_only(
+    admin_client: TestClient, superadmin_headers: dict, user_headers: dict
+):
+    assert admin_client.get("/health").json() == {"status": "ok"}
+    assert admin_client.get("/admin/cache-stats").status_code == (
+        status.HTTP_401_UNAUTHORIZED
+    )
+    resp = admin_client.get("/admin/cache-stats", headers=user_headers)
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+    resp = admin_client.get("/admin/cache-stats", headers=superadmin_headers)
+    assert resp.status_code == status.HTTP_200_OK
+    assert set(resp.json()) == {"auth_cache", "revoked_filter", "reference_cache"}
+    assert "versions" in resp.json()["reference_cache"]
+
+
 # ------------------------------------------------------------------ #
 #  GET /admin/roles
 # ------------------------------------------------------------------ #
@@ -0,0 +1,183 @@
+"""Statistiques de charge par membre (agrégats SQL sur l'agenda matérialisé)."""
+
+# pylint: disable=redefined-outer-name
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from core.exceptions.app_exception import AppException
+from core.message import ErrorRegistry
+from models import Affectation, Membre, Ministere, Slot
+from models.schema_db_model import MembreMinistereLink
+from services.affectation_service import AffectationService
+
+DEBUT = datetime(2040, 3, 5, 10, 0)
+
+
+@pytest.fixture
+def historique(session, test_ministere, test_planning, test_role_comp):
+    """
+    Trois services hebdomadaires : « assidu » sert aux trois (PRESENT,
+    RETARD, ABSENT), « ponctuel » une fois (CONFIRME) et une fois pour un
+    autre ministère, « repos » n'a aucune affectation.
+    """
+    autre = Ministere(nom=f"Autre {uuid4()}", date_creation="2024-01-01")
+    assidu, ponctuel, repos = (
+        Membre(nom=nom, prenom="Stat", email=f"{uuid4()}@test.com")
+        for nom in ("Assidu", "Ponctuel", "Repos")
+    )
+    slots = [
+        Slot(
+            planning_id=test_planning.id,
+            nom_creneau=f"Semaine {w}",
+            date_debut=DEBUT + timedelta(weeks=w),
+            date_fin=DEBUT + timedelta(weeks=w, hours=2),
+            nb_personnes_requis=2,
+        )
+        for w in range(3)
+    ]
+    session.add_all([autre, assidu, ponctuel, repos, *slots])
+    session.flush()
+    session.add_all(
+        MembreMinistereLink(membre_id=m.id, ministere_id=test_ministere.id)
+        for m in (assidu, ponctuel, repos)
+    )
+
+    def affecter(slot, membre, statut, ministere_id=test_ministere.id):
+        return Affectation(
+            slot_id=slot.id,
+            membre_id=membre.id,
+            role_code=test_role_comp.code,
+            statut_affectation_code=statut,
+            ministere_id=ministere_id,
+        )
+
+    session.add_all(
+        [
+            affecter(slots[0], assidu, "PRESENT"),
+            affecter(slots[1], assidu, "RETARD"),
+            affecter(slots[2], assidu, "ABSENT"),
+            affecter(slots[1], ponctuel, "CONFIRME"),
+            affecter(slots[2], ponctuel, "PROPOSE", ministere_id=autre.id),
+        ]
+    )
+    session.flush()
+    return assidu, ponctuel, repos
+
+
+def test_statistiques_charge_par_ministere(
+    session, historique, test_ministere, query_counter
+):
+    assidu, ponctuel, repos = historique
+    with query_counter as qc:
+        stats = AffectationService(session).get_statistiques_charge(
+            DEBUT.date(),
+            DEBUT.date() + timedelta(weeks=3),
+            ministere_id=test_ministere.id,
+        )
+    # ministère, agrégat groupé, membres du ministère
+    assert qc.count == 3
+
+    assert [m.membre_id for m in stats.membres] == [assidu.id, ponctuel.id, repos.id]
+    premier, second, dernier = stats.membres
+    assert (premier.total, premier.confirmes, premier.presents) == (3, 3, 1)
+    assert (premier.retards, premier.absents) == (1, 1)
+    assert premier.taux_confirmation == 100.0
+    assert premier.taux_presence == 66.67
+    assert premier.ecart_moyen_jours == premier.ecart_min_jours == 7.0
+    assert premier.premier_service == DEBUT
+
+    # L'affectation de l'autre ministère est hors périmètre
+    assert (second.total, second.confirmes, second.taux_presence) == (1, 1, None)
+    assert second.ecart_moyen_jours is None
+    assert (dernier.total, dernier.taux_confirmation) == (0, None)
+    assert stats.total_affectations == 4
+    assert stats.moyenne_par_membre == 1.33
+
+
+def test_statistiques_charge_ministere_organisateur(
+    session, historique, test_ministere, test_planning, test_role_comp
+):
+    """Sans ministere_id, l'affectation compte pour l'organisateur de l'activité."""
+    _, _, repos = historique
+    slot = Slot(
+        planning_id=test_planning.id,
+        nom_creneau="Sans ministère",
+        date_debut=DEBUT + timedelta(days=1),
+        date_fin=DEBUT + timedelta(days=1, hours=2),
+    )
+    session.add(slot)
+    session.flush()
+    session.add(
+        Affectation(
+            slot_id=slot.id,
+            membre_id=repos.id,
+            role_code=test_role_comp.code,
+            statut_affectation_code="CONFIRME",
+            ministere_id=None,
+        )
+    )
+    session.flush()
+
+    stats = AffectationService(session).get_statistiques_charge(
+        DEBUT.date(), DEBUT.date() + timedelta(weeks=3), ministere_id=test_ministere.id
+    )
+    (ligne,) = [m for m in stats.membres if m.membre_id == repos.id]
+    assert (ligne.total, ligne.confirmes) == (1, 1)
+    assert stats.total_affectations == 5
+
+
+def test_statistiques_charge_par_campus(session, historique, test_campus):
+    assidu, ponctuel, _ = historique
+    stats = AffectationService(session).get_statistiques_charge(
+        DEBUT.date(), DEBUT.date() + timedelta(days=8), campus_id=test_campus.id
+    )
+    # Période bornée aux deux premières semaines, tous ministères confondus
+    charges = {m.membre_id: m.total for m in stats.membres}
+    assert charges == {assidu.id: 2, ponctuel.id: 1}
+
+    stats = AffectationService(session).get_statistiques_charge(
+        DEBUT.date(), DEBUT.date() + timedelta(weeks=3), campus_id=test_campus.id
+    )
+    (ligne,) = [m for m in stats.membres if m.membre_id == ponctuel.id]
+    assert (ligne.total, ligne.proposes, ligne.taux_confirmation) == (2, 1, 50.0)
+
+
+def test_statistiques_charge_erreurs(
+    session, client, admin_headers, test_ministere, test_campus
+):
+    svc = AffectationService(session)
+    with pytest.raises(AppException) as exc:
+        svc.get_statistiques_charge(date(2040, 1, 1), date(2040, 2, 1))
+    assert exc.value.code == ErrorRegistry.ASGN_STATS_SCOPE.code
+    with pytest.raises(AppException) as exc:
+        svc.get_statistiques_charge(
+            date(2040, 2, 1), date(2040, 1, 1), campus_id=test_campus.id
+        )
+    assert exc.value.code == ErrorRegistry.ASGN_STATS_CHRONOLOGY.code
+
+    response = client.get(
+        "/affectations/statistiques",
+        params={
+            "date_debut": "2040-01-01",
+            "date_fin": "2040-02-01",
+            "ministere_id": "inconnu",
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["error"]["code"] == "ASGN_010"
+
+    response = client.get(
+        "/affectations/statistiques",
+        params={
+            "date_debut": "2040-01-01",
+            "date_fin": "2040-02-01",
+            "ministere_id": test_ministere.id,
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total_affectations"] == 0
@@ -1,7 +1,13 @@
+from uuid import uuid4
+
 import pytest
+from sqlalchemy import func
+from sqlmodel import select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from models import Affectation, AffectationBulkCreate, Membre, Slot
+from models.schema_db_model import MembreRole
 from services.affectation_service import AffectationService
 
 # Importez vos fixtures de test et modèles ici
@@ -32,3 +38,144 @@ def test_assign_member_missing_role(session, test_membre, test_slot):
         service.assign_member_to_slot(test_slot.id, test_membre.id, "NON_EXISTANT_ROLE")
 
     assert exc.value.code == ErrorRegistry.ASGN_MEMBER_MISSING_ROLE.code
+
+
+# --- Affectation en lot ---
+
+
+def _bulk_membres(session, role_code: str, nb: int) -> list:
+    """Membres détenant role_code."""
+    membres = [
+        Membre(nom=f"Lot{i}", prenom="Test", email=f"{uuid4()}@test.com")
+        for i in range(nb)
+    ]
+    session.add_all(membres)
+    session.flush()
+    session.add_all(MembreRole(membre_id=m.id, role_code=role_code) for m in membres)
+    session.flush()
+    return membres
+
+
+def test_assign_bulk_reports_errors_per_item(
+    session, test_slot, test_membre_role, test_ministere
+):
+    role = test_membre_role.role_code
+    ok, deja, sans_role = _bulk_membres(session, role, 3)
+    session.add(
+        Affectation(
+            slot_id=test_slot.id,
+            membre_id=deja.id,
+            role_code=role,
+            statut_affectation_code="PROPOSE",
+        )
+    )
+    session.flush()
+    items = [
+        {"slot_id": test_slot.id, "membre_id": ok.id, "role_code": role},
+        {"slot_id": "inconnu", "membre_id": ok.id, "role_code": role},
+        {"slot_id": test_slot.id, "membre_id": sans_role.id, "role_code": "AUTRE"},
+        {"slot_id": test_slot.id, "membre_id": deja.id, "role_code": role},
+        {"slot_id": test_slot.id, "membre_id": ok.id, "role_code": role},
+        {
+            "slot_id": test_slot.id,
+            "membre_id": test_membre_role.membre_id,
+            "role_code": role,
+            "ministere_id": "inconnu",
+        },
+        {
+            "slot_id": test_slot.id,
+            "membre_id": test_membre_role.membre_id,
+            "role_code": role,
+            "ministere_id": test_ministere.id,
+        },
+    ]
+
+    result = AffectationService(session).assign_members_bulk(
+        AffectationBulkCreate(items=items)
+    )
+
+    assert [(e.index, e.code) for e in result.errors] == [
+        (1, ErrorRegistry.ASGN_SLOT_NOT_FOUND.code),
+        (2, ErrorRegistry.ASGN_MEMBER_MISSING_ROLE.code),
+        (3, ErrorRegistry.ASGN_ALREADY_ASSIGNED.code),
+        (4, ErrorRegistry.ASGN_ALREADY_ASSIGNED.code),
+        (5, ErrorRegistry.ASGN_MINISTERE_NOT_FOUND.code),
+    ]
+    assert {(a.membre_id, a.ministere_id) for a in result.created} == {
+        (ok.id, None),
+        (test_membre_role.membre_id, test_ministere.id),
+    }
+    assert all(a.statut_affectation_code == "PROPOSE" for a in result.created)
+    # La liste déjà chargée du slot voit les nouvelles lignes
+    assert len(test_slot.affectations) == 3
+
+
+def test_assign_bulk_all_or_nothing(session, test_slot, test_membre_role):
+    role = test_membre_role.role_code
+    (membre,) = _bulk_membres(session, role, 1)
+    payload = AffectationBulkCreate(
+        items=[
+            {"slot_id": test_slot.id, "membre_id": membre.id, "role_code": role},
+            {"slot_id": "inconnu", "membre_id": membre.id, "role_code": role},
+        ],
+        all_or_nothing=True,
+    )
+
+    result = AffectationService(session).assign_members_bulk(payload)
+
+    assert result.created == []
+    assert [e.index for e in result.errors] == [1]
+    count = session.exec(
+        select(func.count()).where(  # pylint: disable=not-callable
+            Affectation.slot_id == test_slot.id
+        )
+    ).one()
+    assert count == 0
+
+
+def test_assign_bulk_constant_queries(
+    session, test_planning, test_slot, test_membre_role, query_counter
+):
+    """Une requête par règle + un INSERT, quelle que soit la taille du lot."""
+    role = test_membre_role.role_code
+    membres = _bulk_membres(session, role, 10)
+    other_slot = Slot(
+        planning_id=test_planning.id,
+        nom_creneau="Autre",
+        date_debut=test_slot.date_debut,
+        date_fin=test_slot.date_fin,
+    )
+    session.add(other_slot)
+    session.flush()
+    items = [
+        {"slot_id": slot_id, "membre_id": m.id, "role_code": role}
+        for slot_id in (test_slot.id, other_slot.id)
+        for m in membres
+    ]
+    svc = AffectationService(session)
+
+    with query_counter as qc:
+        result = svc.assign_members_bulk(AffectationBulkCreate(items=items))
+
+    assert len(result.created) == 20 and result.errors == []
+    # slots, compétences, doublons (aucun ministère) + INSERT + agenda
+    assert qc.count == 5
+
+
+def test_assign_bulk_endpoint(client, admin_headers, test_slot):
+    response = client.post(
+        "/affectations/bulk",
+        json={
+            "items": [
+                {"slot_id": test_slot.id, "membre_id": "m", "role_code": "R"},
+            ]
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == []
+    assert body["errors"][0]["code"] == ErrorRegistry.ASGN_MEMBER_MISSING_ROLE.code
+
+    empty = client.post("/affectations/bulk", json={"items": []}, headers=admin_headers)
+    assert empty.status_code == 422
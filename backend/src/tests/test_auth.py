@@ -1,4 +1,5 @@
-from datetime import date, timedelta
+import threading
+from datetime import date, datetime, timedelta, timezone
 
 import casbin  # type: ignore[import-untyped]
 import pytest
@@ -6,7 +7,8 @@ from fastapi import HTTPException, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 from jose import jwt
-from sqlmodel import Session
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session, select
 
 from core.auth import casbin_enforcer as _casbin_mod
 from core.auth.auth_dependencies import (
@@ -15,12 +17,16 @@ from core.auth.auth_dependencies import (
     _affectation_valide,
     get_active_campus,
 )
+from core.auth.auth_repository import AuthRepository
 from core.auth.auth_service import AuthService
+from core.auth.principal_cache import PrincipalCache, principal_cache
+from core.auth.revoked_filter import BloomFilter, revoked_filter
 from core.auth.security import create_access_token
 from core.exceptions.app_exception import AppException
 from core.settings import settings as stng
 from mla_enum import RoleName
-from models import Utilisateur
+from models import AffectationRole, TokenBlacklist, Utilisateur
+from models.schema_db_model import Permission, Role, RolePermission
 
 # pylint: disable=redefined-outer-name, unused-argument, too-many-arguments
 # pylint: disable=too-many-positional-arguments
@@ -596,3 +602,295 @@ def test_login_response_contains_capabilities(
     user_data = response.json()["user"]
     assert "capabilities" in user_data
     assert isinstance(user_data["capabilities"], list)
+
+
+# --- CACHE DES PRINCIPAUX (jti) ---
+
+
+def _bearer(user: Utilisateur) -> dict[str, str]:
+    token, _ = create_access_token(data={"sub": user.username, "user_id": user.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_principal_cache_hit_skips_db(
+    client: TestClient, test_user: Utilisateur, query_counter
+) -> None:
+    """Requêtes en régime établi : ni blacklist ni chargement utilisateur."""
+    headers = _bearer(test_user)
+    assert client.get("/auth/users/me", headers=headers).status_code == 200
+    assert principal_cache.stats()["misses"] == 1
+
+    with query_counter as qc:
+        res = client.get("/auth/users/me", headers=headers)
+    assert res.status_code == 200
+    assert res.json()["username"] == "active_user"
+    assert qc.count == 0
+    assert principal_cache.stats()["hits"] == 1
+
+
+def test_principal_cache_logout_revokes(
+    client: TestClient, test_user: Utilisateur, query_counter
+) -> None:
+    """Après logout, le jti est servi révoqué depuis le cache."""
+    headers = _bearer(test_user)
+    client.get("/auth/users/me", headers=headers)
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+
+    with query_counter as qc:
+        res = client.get("/auth/users/me", headers=headers)
+    assert res.status_code == 401
+    assert qc.count == 0
+
+
+def test_principal_cache_change_password_invalidates(
+    client: TestClient, test_user: Utilisateur
+) -> None:
+    """Le changement de mot de passe purge les entrées de l'utilisateur."""
+    headers = _bearer(test_user)
+    client.get("/auth/users/me", headers=headers)
+    assert principal_cache.stats()["size"] == 1
+
+    res = client.patch(
+        f"/auth/utilisateurs/{test_user.id}/password",
+        json={"current_password": "password123", "new_password": "NewPass123!"},
+        headers=headers,
+    )
+    assert res.status_code == 200
+    assert principal_cache.stats()["size"] == 0
+
+
+def test_principal_cache_ttl_and_invalidation() -> None:
+    """Entrée expirée → miss ; invalidate_user ne touche pas aux révocations."""
+    cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+    user = Utilisateur(id="u1", username="u1", password="x", actif=True)
+    make_transient_to_detached(user)
+
+    cache.store("expired", user, token_exp=0)
+    assert cache.get("expired") is None
+
+    cache.store("live", user, token_exp=None)
+    cache.mark_revoked("revoked")
+    cache.invalidate_user("u1")
+    assert cache.get("live") is None
+    entry = cache.get("revoked")
+    assert entry is not None and entry.revoked
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_principal_cache_bounded() -> None:
+    """Au-delà de max_entries, les entrées les moins récentes sont évincées."""
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    for jti in ("a", "b", "c"):
+        cache.mark_revoked(jti)
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 2
+
+
+# --- FILTRE DE BLOOM DES JTI RÉVOQUÉS ---
+
+
+def test_bloom_filter_no_false_negative() -> None:
+    """Tout élément ajouté est retrouvé ; le taux de faux positifs reste bas."""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_is_token_revoked_skips_db_on_negative(session: Session, query_counter) -> None:
+    """Un JTI absent du filtre est résolu sans lecture de t_revoked_tokens."""
+    repo = AuthRepository(session)
+    revoked_filter.load(session)
+    session.flush()
+
+    with query_counter as qc:
+        assert repo.is_token_revoked("never-revoked") is False
+    assert qc.count == 0
+    assert revoked_filter.stats()["db_lookups"] == 0
+
+
+def test_add_to_blacklist_updates_filter(session: Session) -> None:
+    repo = AuthRepository(session)
+    revoked_filter.load(session)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    repo.add_to_blacklist("jti-logout", expires_at)
+
+    assert revoked_filter.might_contain("jti-logout")
+    assert repo.is_token_revoked("jti-logout") is True
+
+
+def test_revoked_filter_sync_picks_other_worker_rows(session: Session) -> None:
+    """Les révocations écrites hors du process sont intégrées par watermark."""
+    revoked_filter.load(session)
+    session.add(
+        TokenBlacklist(
+            jti="jti-other-worker",
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+    )
+    session.flush()
+    assert not revoked_filter.might_contain("jti-other-worker")
+
+    revoked_filter.sync(session)
+    assert revoked_filter.might_contain("jti-other-worker")
+
+
+def test_purge_expired_tokens_rebuilds_filter(session: Session) -> None:
+    repo = AuthRepository(session)
+    revoked_filter.load(session)
+    repo.add_to_blacklist(
+        "jti-expired", datetime.now(timezone.utc) - timedelta(minutes=1)
+    )
+    assert revoked_filter.might_contain("jti-expired")
+
+    repo.purge_expired_tokens()
+
+    assert not revoked_filter.might_contain("jti-expired")
+
+
+# --- CASBIN : MISES À JOUR DELTA ET CACHE NÉGATIF ---
+
+
+@pytest.fixture
+def memory_enforcer():
+    """Enforcer en mémoire injecté le temps du test, puis restauré."""
+    previous = _casbin_mod.get_enforcer()
+    enf = casbin.Enforcer(_casbin_mod.CONF_PATH)
+    _casbin_mod.set_enforcer(enf)
+    yield enf
+    _casbin_mod.set_enforcer(previous)
+
+
+def test_sync_user_groupings_adds_and_removes(
+    session: Session, test_admin: Utilisateur, memory_enforcer
+) -> None:
+    """Seules les groupings de l'utilisateur ciblé sont recalculées."""
+    memory_enforcer.add_grouping_policy("someone-else", RoleName.ADMIN.name, "*")
+
+    _casbin_mod.sync_user_groupings(session, test_admin.id)
+    assert memory_enforcer.has_grouping_policy(test_admin.id, RoleName.ADMIN.name, "*")
+
+    for aff in session.exec(
+        select(AffectationRole).where(AffectationRole.utilisateur_id == test_admin.id)
+    ).all():
+        session.delete(aff)
+    session.flush()
+    _casbin_mod.sync_user_groupings(session, test_admin.id)
+
+    assert not memory_enforcer.has_grouping_policy(
+        test_admin.id, RoleName.ADMIN.name, "*"
+    )
+    assert memory_enforcer.has_grouping_policy("someone-else", RoleName.ADMIN.name, "*")
+
+
+def test_sync_role_policies_custom_role(session: Session, memory_enforcer) -> None:
+    """Les permissions d'un rôle custom sont retraduites sans rebuild global."""
+    role = Role(libelle="Régisseur")
+    perm = session.exec(
+        select(Permission).where(Permission.code == "CHANT_READ")
+    ).first()
+    if perm is None:
+        perm = Permission(code="CHANT_READ")
+        session.add(perm)
+    session.add(role)
+    session.flush()
+    session.add(RolePermission(role_id=role.id, permission_id=perm.id))
+    session.flush()
+    memory_enforcer.add_policy("Régisseur", "*", "planning", "write")
+
+    _casbin_mod.sync_role_policies(session, role.id)
+
+    assert memory_enforcer.has_policy("Régisseur", "*", "chants", "read")
+    assert not memory_enforcer.has_policy("Régisseur", "*", "planning", "write")
+
+
+def test_sync_user_groupings_is_atomic_for_enforce(
+    session: Session, test_admin: Utilisateur, memory_enforcer
+) -> None:
+    """Une évaluation concurrente attend la fin du retrait + ré-ajout."""
+    # pylint: disable-next=protected-access
+    _casbin_mod._add_default_policies(memory_enforcer)
+    _casbin_mod.sync_user_groupings(session, test_admin.id)
+    request = (test_admin.id, "*", "chants", "write")
+    assert _casbin_mod.enforce(memory_enforcer, request)
+
+    results: list[bool] = []
+    reader = threading.Thread(
+        target=lambda: results.append(_casbin_mod.enforce(memory_enforcer, request))
+    )
+    remove = memory_enforcer.remove_filtered_grouping_policy
+
+    def remove_then_race(*args):  # type: ignore
+        removed = remove(*args)
+        reader.start()
+        reader.join(timeout=0.2)
+        assert reader.is_alive()  # bloqué sur policy_lock, pas d'état partiel
+        return removed
+
+    memory_enforcer.remove_filtered_grouping_policy = remove_then_race
+    _casbin_mod.sync_user_groupings(session, test_admin.id)
+    reader.join(timeout=5)
+
+    assert results == [True]
+
+
+def test_casbin_guard_denial_is_cached(  # type: ignore
+    monkeypatch, memory_enforcer
+) -> None:
+    """Un refus répété ne relance pas la resynchronisation de l'utilisateur."""
+    calls: list[str] = []
+    monkeypatch.setattr(
+        _casbin_mod, "sync_user_groupings", lambda _db, uid: calls.append(uid)
+    )
+    user = _FakeUser([_FakeAff(RoleName.ADMIN)])
+    user.id = "user-stale"
+    guard = CasbinGuard("chants", "write", fallback_roles=["ADMIN"])
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc:
+            guard(_FakeRequest(), user, db=None)  # type: ignore[arg-type]
+        assert exc.value.status_code == 403
+    assert calls == ["user-stale"]
+
+    _casbin_mod.clear_denials("user-stale")
+    with pytest.raises(HTTPException):
+        guard(_FakeRequest(), user, db=None)  # type: ignore[arg-type]
+    assert len(calls) == 2
+
+
+def test_refresh_policies_replays_published_changes(
+    session: Session, test_admin: Utilisateur, memory_enforcer
+) -> None:
+    """Un changement publié par un autre worker n'est rejoué qu'une fois."""
+    _casbin_mod.publish_policy_change(session, _casbin_mod.SUBJECT_USER, test_admin.id)
+    assert not memory_enforcer.has_grouping_policy(
+        test_admin.id, RoleName.ADMIN.name, "*"
+    )
+
+    assert _casbin_mod.refresh_policies(session) == 1
+    assert memory_enforcer.has_grouping_policy(test_admin.id, RoleName.ADMIN.name, "*")
+    assert _casbin_mod.refresh_policies(session) == 0
+
+
+def test_refresh_policies_if_due_is_throttled(  # type: ignore
+    monkeypatch, memory_enforcer
+) -> None:
+    """Le journal est relu au plus une fois par intervalle."""
+    calls: list[int] = []
+
+    def fake_refresh(_db) -> int:
+        calls.append(1)
+        return 0
+
+    monkeypatch.setattr(_casbin_mod, "refresh_policies", fake_refresh)
+    monkeypatch.setattr(stng, "CASBIN_SYNC_INTERVAL_MS", 60_000)
+    state = _casbin_mod._state  # pylint: disable=protected-access
+    monkeypatch.setattr(state, "last_check", 0.0)
+
+    _casbin_mod.refresh_policies_if_due()
+    _casbin_mod.refresh_policies_if_due()
+
+    assert calls == [1]
@@ -0,0 +1,186 @@
+"""Remplissage automatique des créneaux : solveur et service."""
+
+# pylint: disable=redefined-outer-name
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func
+from sqlmodel import select
+
+from core.exceptions.app_exception import AppException
+from core.message import ErrorRegistry
+from models import Affectation, AutoStaffingRequest, Membre, Slot
+from models.schema_db_model import (
+    Indisponibilite,
+    MembreMinistereLink,
+    MembreRole,
+    MinistereRoleConfig,
+)
+from services.auto_staffing_service import (
+    AutoStaffingService,
+    SlotDemand,
+    StaffingCandidate,
+    solve_staffing,
+)
+
+LUNDI = datetime(2040, 1, 2, 10, 0)  # 2040-01-02 est un lundi
+
+
+def _demande(semaine: int, manquants: int = 1, roles=("CHANT",)) -> SlotDemand:
+    debut = LUNDI + timedelta(weeks=semaine)
+    return SlotDemand(
+        f"s{semaine}",
+        "p",
+        debut,
+        debut + timedelta(hours=2),
+        manquants,
+        frozenset(roles),
+    )
+
+
+# --- Solveur (sans base) ---
+
+
+def test_solver_balances_load_and_avoids_consecutive_weeks():
+    candidats = [StaffingCandidate(f"m{i}", ("CHANT",)) for i in range(4)]
+    choix, manques = solve_staffing([_demande(w) for w in range(8)], candidats)
+
+    assert not manques
+    assert {c.charge for c in candidats} == {2}
+    assert not any(c.enchaine for c in choix)
+
+
+def test_solver_hard_constraints():
+    indispo = StaffingCandidate("indispo", ("CHANT",), indisponible={LUNDI.date()})
+    autre_role = StaffingCandidate("batterie", ("BATTERIE",))
+    occupe = StaffingCandidate(
+        "occupe", ("CHANT",), occupe=[(LUNDI, LUNDI + timedelta(hours=1))]
+    )
+    libre = StaffingCandidate("libre", ("BATTERIE", "CHANT"))
+
+    choix, manques = solve_staffing(
+        [_demande(0, manquants=2)], [indispo, autre_role, occupe, libre]
+    )
+
+    assert [(c.membre_id, c.role_code) for c in choix] == [("libre", "CHANT")]
+    assert manques == {"s0": 1}
+
+
+def test_solver_counts_existing_load():
+    charge = StaffingCandidate("charge", ("CHANT",), charge=3)
+    nouveau = StaffingCandidate("nouveau", ("CHANT",))
+    choix, _ = solve_staffing([_demande(0)], [charge, nouveau])
+    assert [c.membre_id for c in choix] == ["nouveau"]
+
+
+# --- Service ---
+
+
+@pytest.fixture
+def equipe(session, test_ministere, test_role_comp, test_planning):
+    """4 membres du ministère avec le rôle, 2 créneaux simultanés de 2 places."""
+    session.add(
+        MinistereRoleConfig(
+            ministere_id=test_ministere.id, role_code=test_role_comp.code
+        )
+    )
+    membres = [
+        Membre(nom=f"Auto{i}", prenom="Test", email=f"{uuid4()}@test.com")
+        for i in range(4)
+    ]
+    inactif = Membre(nom="Inactif", prenom="T", email=f"{uuid4()}@t.com", actif=False)
+    hors_ministere = Membre(nom="Hors", prenom="T", email=f"{uuid4()}@t.com")
+    session.add_all([*membres, inactif, hors_ministere])
+    session.flush()
+    session.add_all(
+        MembreRole(membre_id=m.id, role_code=test_role_comp.code)
+        for m in [*membres, inactif, hors_ministere]
+    )
+    session.add_all(
+        MembreMinistereLink(membre_id=m.id, ministere_id=test_ministere.id)
+        for m in [*membres, inactif]
+    )
+    debut = datetime.combine(date.today() + timedelta(days=30), datetime.min.time())
+    slots = [
+        Slot(
+            planning_id=test_planning.id,
+            nom_creneau=f"Créneau {h}",
+            date_debut=debut + timedelta(hours=h),
+            date_fin=debut + timedelta(hours=h + 2),
+            nb_personnes_requis=2,
+        )
+        for h in (9, 10)
+    ]
+    session.add_all(slots)
+    session.add(
+        Indisponibilite(
+            membre_id=membres[0].id,
+            date_debut=debut.date(),
+            date_fin=debut.date(),
+            validee=True,
+        )
+    )
+    session.flush()
+    return membres, slots
+
+
+def test_auto_staffing_proposes_then_applies(
+    session, equipe, test_ministere, test_planning, query_counter
+):
+    membres, slots = equipe
+    svc = AutoStaffingService(session)
+    payload = {"planning_id": test_planning.id, "ministere_id": test_ministere.id}
+
+    with query_counter as qc:
+        result = svc.propose(AutoStaffingRequest(**payload))
+    # ministère, créneaux, rôles du ministère, membres, rôles détenus,
+    # indisponibilités, occupations (template absent)
+    assert qc.count <= 7
+
+    # membres[0] indisponible, inactif et hors ministère exclus ; un membre
+    # ne tient pas deux créneaux qui se chevauchent
+    assert sorted(p.membre_id for p in result.propositions) == sorted(
+        m.id for m in membres[1:]
+    )
+    assert [m.manquants for m in result.non_pourvus] == [1]
+    assert not result.appliquee
+    assert not session.exec(
+        select(Affectation).where(
+            Affectation.slot_id.in_([s.id for s in slots])  # pylint: disable=no-member
+        )
+    ).all()
+
+    applied = svc.propose(AutoStaffingRequest(**payload, appliquer=True))
+    assert applied.appliquee
+    count = session.exec(
+        select(func.count())  # pylint: disable=not-callable
+        .select_from(Affectation)
+        .where(Affectation.ministere_id == test_ministere.id)
+    ).one()
+    assert count == 3
+
+    # Relance : seules les places restantes, sans doublon
+    again = svc.propose(AutoStaffingRequest(**payload))
+    assert not again.propositions
+    assert sum(m.manquants for m in again.non_pourvus) == 1
+
+
+def test_auto_staffing_scope_errors(session, client, admin_headers, test_ministere):
+    with pytest.raises(AppException) as exc:
+        AutoStaffingRequest(ministere_id=test_ministere.id)
+    assert exc.value.code == ErrorRegistry.ASGN_STAFFING_SCOPE.code
+
+    with pytest.raises(AppException) as exc:
+        AutoStaffingService(session).propose(
+            AutoStaffingRequest(serie_id="inconnue", ministere_id=test_ministere.id)
+        )
+    assert exc.value.code == ErrorRegistry.SERIE_004.code
+
+    response = client.post(
+        "/affectations/auto-staffing",
+        json={"planning_id": "inconnu", "ministere_id": test_ministere.id},
+        headers=admin_headers,
+    )
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "PLAN_010"
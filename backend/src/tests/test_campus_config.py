@@ -12,6 +12,7 @@ import pytest
 from sqlmodel import Session, select
 
 from core.exceptions.app_exception import AppException
+from core.reference_cache import ReferenceCache, reference_cache
 from models.schema_db_model import (
     Campus,
     CategorieRole,
@@ -21,6 +22,7 @@ from models.schema_db_model import (
     MinistereRoleConfig,
 )
 from services.campus_config_service import CampusConfigService
+from services.profile_service import ProfileService
 
 # ------------------------------------------------------------------ #
 #  Fixtures locales
@@ -342,6 +344,79 @@ def test_campus_config_summary_keys(
     assert isinstance(summary["statuts_affectation"], list)
 
 
+def _ministere_with_active_role(
+    session: Session, config_svc: CampusConfigService, campus: Campus
+) -> tuple:
+    """Helper : ministère lié avec une catégorie et un rôle actif."""
+    ministere = _create_linked_ministere(session, config_svc, campus)
+    cat, _ = config_svc.add_categorie_to_ministere(str(ministere.id), f"Cat-{uuid4()}")
+    code = f"RL{uuid4().hex[:4].upper()}"
+    role, _ = config_svc.add_role_competence_to_categorie(cat.code, code, "Rôle")
+    config_svc.activate_role_for_ministere(str(ministere.id), role.code)
+    return ministere, cat, role
+
+
+def test_campus_summary_constant_queries(
+    session: Session,
+    config_svc: CampusConfigService,
+    test_campus: Campus,
+    query_counter,
+) -> None:
+    """Le nombre de requêtes du résumé ne dépend pas du nombre de ministères."""
+    campus_id = str(test_campus.id)
+    _ministere_with_active_role(session, config_svc, test_campus)
+    session.flush()
+    config_svc.get_campus_summary(campus_id)  # statuts en cache, campus chargé
+    with query_counter as qc:
+        small = config_svc.get_campus_summary(campus_id)
+    small_count = qc.count
+
+    for _ in range(5):
+        _ministere_with_active_role(session, config_svc, test_campus)
+    session.flush()
+    with query_counter as qc:
+        large = config_svc.get_campus_summary(campus_id)
+
+    assert len(small["ministeres"]) == 1
+    assert len(large["ministeres"]) == 6
+    assert qc.count == small_count
+    for ministere in large["ministeres"]:
+        assert len(ministere["categories"]) == 1
+        assert len(ministere["categories"][0]["roles_actifs"]) == 1
+
+
+def test_campus_summary_cached_per_config_version(
+    session: Session,
+    config_svc: CampusConfigService,
+    test_campus: Campus,
+    query_counter,
+) -> None:
+    """Résumé servi depuis le cache, recalculé après une activation de rôle."""
+    campus_id = str(test_campus.id)
+    ministere, cat, role = _ministere_with_active_role(session, config_svc, test_campus)
+    other, _ = config_svc.add_role_competence_to_categorie(
+        cat.code, f"RL{uuid4().hex[:4].upper()}", "Autre rôle"
+    )
+    ministere_id = str(ministere.id)
+    session.commit()
+
+    first = config_svc.get_campus_summary(campus_id)
+    with query_counter as qc:
+        again = config_svc.get_campus_summary(campus_id)
+    assert qc.count == 0
+    assert again == first
+
+    # Une modification de la copie retournée n'altère pas le cache
+    again["ministeres"].clear()
+    assert config_svc.get_campus_summary(campus_id) == first
+
+    config_svc.activate_role_for_ministere(ministere_id, other.code)
+    session.commit()
+    (entry,) = config_svc.get_campus_summary(campus_id)["ministeres"]
+    codes = {r["code"] for r in entry["categories"][0]["roles_actifs"]}
+    assert codes == {role.code, other.code}
+
+
 # ------------------------------------------------------------------ #
 #  Listing global ministères / catégories
 # ------------------------------------------------------------------ #
@@ -547,3 +622,117 @@ def test_ministere_role_config_unused(
     )
     found = session.exec(stmt).first()
     assert found is not None
+
+
+# ------------------------------------------------------------------ #
+#  Cache des référentiels
+# ------------------------------------------------------------------ #
+
+
+def _active_codes(config_svc: CampusConfigService, ministere_id: str) -> set:
+    return {r.code for r in config_svc.list_roles_of_ministere(ministere_id)}
+
+
+def test_reference_cache_hit_emits_no_query(
+    session: Session,
+    config_svc: CampusConfigService,
+    test_campus: Campus,
+    query_counter,
+) -> None:
+    """Une fois en cache, catégories/rôles actifs/statuts ne relisent pas la DB."""
+    ministere = _create_linked_ministere(session, config_svc, test_campus)
+    role, _ = _setup_role(session, config_svc, test_campus)
+    config_svc.activate_role_for_ministere(str(ministere.id), role.code)
+    config_svc.init_statuts()
+    ministere_id = str(ministere.id)
+    session.commit()
+
+    def read() -> None:
+        config_svc.list_categories_with_active_roles(ministere_id)
+        config_svc._get_statut_planning_codes()  # pylint: disable=protected-access
+
+    read()
+    assert reference_cache.stats()["misses"] == 3
+
+    with query_counter as qc:
+        read()
+    assert qc.count == 0
+    assert reference_cache.stats()["hits"] == 3
+
+
+def test_reference_cache_sees_own_writes_and_rollback(
+    session: Session,
+    config_svc: CampusConfigService,
+    test_campus: Campus,
+) -> None:
+    """La session qui écrit lit sans cache ; un rollback ne laisse rien de périmé."""
+    ministere = _create_linked_ministere(session, config_svc, test_campus)
+    role, _ = _setup_role(session, config_svc, test_campus)
+    session.commit()
+    ministere_id = str(ministere.id)
+    assert role.code not in _active_codes(config_svc, ministere_id)
+
+    config_svc.activate_role_for_ministere(ministere_id, role.code)
+    assert role.code in _active_codes(config_svc, ministere_id)
+
+    session.rollback()
+    assert role.code not in _active_codes(config_svc, ministere_id)
+
+    config_svc.activate_role_for_ministere(ministere_id, role.code)
+    session.commit()
+    assert role.code in _active_codes(config_svc, ministere_id)
+
+
+def test_profile_role_validation_uses_cache(
+    session: Session,
+    config_svc: CampusConfigService,
+    test_campus: Campus,
+    query_counter,
+) -> None:
+    """_validate_roles_for_membre lit les rôles configurés depuis le cache."""
+    ministere = _create_linked_ministere(session, config_svc, test_campus)
+    role, _ = _setup_role(session, config_svc, test_campus)
+    config_svc.activate_role_for_ministere(str(ministere.id), role.code)
+    membre = Membre(nom="Cache", prenom="Ref", email=f"{uuid4()}@test.com")
+    membre.ministeres = [ministere]
+    session.add(membre)
+    session.commit()
+    profile_svc = ProfileService(session)
+    validate = profile_svc._validate_roles_for_membre  # pylint: disable=W0212
+
+    validate(membre, [role.code])
+    with query_counter as qc:
+        validate(membre, [role.code])
+        with pytest.raises(AppException):
+            validate(membre, ["INCONNU"])
+    assert qc.count == 0
+
+
+def test_reference_cache_drops_load_overtaken_by_invalidation(
+    session: Session,
+) -> None:
+    """Un chargement démarré avant une invalidation n'est pas mémorisé."""
+    cache = ReferenceCache(ttl_seconds=60, max_entries=10)
+
+    def stale_loader() -> str:
+        cache.invalidate(None, "domaine")
+        return "ancien"
+
+    assert cache.get_or_load(session, "domaine", "k", stale_loader) == "ancien"
+    assert cache.stats()["size"] == 0
+    assert cache.get_or_load(session, "domaine", "k", lambda: "neuf") == "neuf"
+    assert cache.get_or_load(session, "domaine", "k", lambda: "autre") == "neuf"
+    assert cache.stats()["versions"] == {"domaine": 1}
+
+
+def test_reference_cache_is_bounded(session: Session) -> None:
+    """Au-delà de max_entries, l'entrée la moins récemment lue est évincée."""
+    cache = ReferenceCache(ttl_seconds=60, max_entries=2)
+    cache.get_or_load(session, "d", "a", lambda: 1)
+    cache.get_or_load(session, "d", "b", lambda: 2)
+    cache.get_or_load(session, "d", "a", lambda: 0)
+    cache.get_or_load(session, "d", "c", lambda: 3)
+
+    assert cache.stats()["size"] == 2
+    assert cache.get_or_load(session, "d", "a", lambda: 0) == 1
+    assert cache.get_or_load(session, "d", "b", lambda: 20) == 20
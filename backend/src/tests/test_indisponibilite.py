@@ -1,16 +1,27 @@
 # tests/test_indisponibilite.py
 # pylint: disable=redefined-outer-name
+import importlib.util
+from datetime import date
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
 from fastapi import status
+from sqlalchemy import text
 from sqlmodel import Session
 
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
 from models.schema_db_model import (
     Campus,
+    Indisponibilite,
     Membre,
+    MembreMinistereLink,
+    MinistereRoleConfig,
     Utilisateur,
 )
+from repositories.indisponibilite_repository import IndisponibiliteRepository
+from services.indisponibilite_service import IndisponibiliteService
 
 # ---------------------------------------------------------------------------
 # Fixture locale : membre lié à test_user
@@ -311,3 +322,239 @@ def test_admin_delete(client, admin_headers, user_headers, linked_membre):
         headers=admin_headers,
     )
     assert r.status_code == status.HTTP_204_NO_CONTENT
+
+
+# ---------------------------------------------------------------------------
+# Tests : filtres et pagination SQL (service)
+# ---------------------------------------------------------------------------
+
+
+def _seed_indispos(session: Session, membre: Membre, n: int) -> None:
+    """n indisponibilités d'un jour, une sur deux validée."""
+    for i in range(n):
+        jour = date(2040, 1, i + 1)
+        session.add(
+            Indisponibilite(
+                membre_id=membre.id,
+                date_debut=jour,
+                date_fin=jour,
+                validee=i % 2 == 0,
+            )
+        )
+    session.flush()
+
+
+def test_get_for_campus_filters_and_paginates_in_sql(
+    session, query_counter, linked_membre, test_campus
+):
+    """Filtre validée + fenêtre + page : total exact, page triée, requêtes fixes."""
+    _seed_indispos(session, linked_membre, 20)
+    svc = IndisponibiliteService(session)
+
+    with query_counter as qc:
+        page = svc.get_for_campus(
+            test_campus.id,
+            validee_only=True,
+            date_debut=date(2040, 1, 5),
+            date_fin=date(2040, 1, 16),
+            limit=3,
+            offset=2,
+        )
+    # validées (jours impairs) dans [05, 16] : 05, 07, 09, 11, 13, 15
+    assert page.total == 6
+    assert [r.date_debut for r in page.data] == [
+        date(2040, 1, 9),
+        date(2040, 1, 11),
+        date(2040, 1, 13),
+    ]
+    assert all(r.membre_nom == "Dupont" for r in page.data)
+    # COUNT + page + selectin membre + selectin ministère
+    assert qc.count <= 4
+
+
+def test_get_validated_for_campus_period_sql(session, linked_membre, test_campus):
+    """Seules les indisponibilités validées qui chevauchent la période."""
+    _seed_indispos(session, linked_membre, 10)
+    svc = IndisponibiliteService(session)
+    rows = svc.get_validated_for_campus_period(
+        test_campus.id, date(2040, 1, 2), date(2040, 1, 6)
+    )
+    assert [r.date_debut for r in rows] == [date(2040, 1, 3), date(2040, 1, 5)]
+
+
+def test_get_membres_indisponibles_day_and_window(
+    session, query_counter, linked_membre, test_membre
+):
+    """Jour ou fenêtre, pour un lot de membres, en une requête."""
+    session.add(
+        Indisponibilite(
+            membre_id=linked_membre.id,
+            date_debut=date(2040, 3, 10),
+            date_fin=date(2040, 3, 12),
+        )
+    )
+    session.flush()
+    repo = IndisponibiliteRepository(session)
+    membres = [linked_membre.id, test_membre.id]
+
+    with query_counter as qc:
+        assert repo.get_membres_indisponibles(membres, date(2040, 3, 12)) == {
+            linked_membre.id
+        }
+    assert qc.count == 1
+    assert not repo.get_membres_indisponibles(membres, date(2040, 3, 13))
+    assert repo.get_membres_indisponibles(
+        membres, date(2040, 3, 1), date(2040, 3, 10)
+    ) == {linked_membre.id}
+    assert not repo.get_membres_indisponibles(
+        membres, date(2040, 3, 1), date(2040, 3, 10), validee_only=True
+    )
+
+
+def test_invalid_iso_date_rejected(client, user_headers, linked_membre):
+    """Date non ISO → INDISP_001."""
+    payload = {
+        "membre_id": linked_membre.id,
+        "date_debut": "01/10/2040",
+        "date_fin": "2040-10-05",
+    }
+    r = client.post("/indisponibilites/", json=payload, headers=user_headers)
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert r.json()["error"]["code"] == "INDISP_001"
+
+
+def _migration(revision_file: str):
+    path = Path(__file__).resolve().parents[2] / "alembic" / "versions"
+    spec = importlib.util.spec_from_file_location("migration", path / revision_file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_date_columns_migration_cleans_invalid_strings(session):
+    """Chaînes acceptées par l'ancien validateur : bornées au mois ou NULL."""
+    migration = _migration("f1a2b3c4d5e6_indisponibilite_date_columns.py")
+    connection = session.connection()
+    # Table temporaire : masque t_indisponibilite, annulée avec la transaction
+    connection.execute(
+        text(
+            "CREATE TEMP TABLE t_indisponibilite "
+            "(id varchar PRIMARY KEY, membre_id varchar, "
+            "date_debut varchar, date_fin varchar)"
+        )
+    )
+    connection.execute(
+        text("INSERT INTO t_indisponibilite VALUES (:id, 'm', :debut, :fin)"),
+        [
+            {"id": "valide", "debut": "2026-03-01", "fin": "2026-03-02"},
+            {"id": "fevrier", "debut": "2026-02-30", "fin": "2026-04-31"},
+            {"id": "court", "debut": "2026-2-3", "fin": "2024-02-31"},
+            {"id": "invalide", "debut": "", "fin": "demain"},
+        ],
+    )
+
+    with Operations.context(MigrationContext.configure(connection)):
+        migration.upgrade()
+
+    rows = dict(
+        (row[0], (row[1], row[2]))
+        for row in connection.execute(
+            text("SELECT id, date_debut, date_fin FROM t_indisponibilite")
+        )
+    )
+    assert rows == {
+        "valide": (date(2026, 3, 1), date(2026, 3, 2)),
+        "fevrier": (date(2026, 2, 28), date(2026, 4, 30)),
+        "court": (date(2026, 2, 3), date(2024, 2, 29)),
+        "invalide": (None, None),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Tests : matrice de disponibilité
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def matrice_ministere(  # pylint: disable=too-many-positional-arguments
+    session, test_ministere, test_role_comp, linked_membre, test_membre_role
+):
+    """Deux membres du ministère (Dupont sans rôle, Soro avec le rôle configuré)."""
+    session.add_all(
+        [
+            MinistereRoleConfig(
+                ministere_id=test_ministere.id, role_code=test_role_comp.code
+            ),
+            MembreMinistereLink(
+                membre_id=linked_membre.id, ministere_id=test_ministere.id
+            ),
+            MembreMinistereLink(
+                membre_id=test_membre_role.membre_id, ministere_id=test_ministere.id
+            ),
+            Indisponibilite(
+                membre_id=linked_membre.id,
+                date_debut=date(2040, 5, 3),
+                date_fin=date(2040, 5, 4),
+            ),
+            Indisponibilite(
+                membre_id=test_membre_role.membre_id,
+                date_debut=date(2040, 4, 28),
+                date_fin=date(2040, 5, 1),
+                validee=True,
+            ),
+        ]
+    )
+    session.flush()
+    return test_ministere
+
+
+def test_matrice_disponibilite_packed(
+    session, query_counter, matrice_ministere, test_role_comp
+):
+    """Lignes compactes par membre, calculées en requêtes ensemblistes."""
+    svc = IndisponibiliteService(session)
+    with query_counter as qc:
+        matrice = svc.get_matrice_disponibilite(
+            matrice_ministere.id, date(2040, 5, 1), date(2040, 5, 7)
+        )
+    # ministère + membres + rôles du ministère + rôles détenus + indisponibilités
+    assert qc.count <= 5
+
+    assert matrice.roles == [test_role_comp.code]
+    assert [m.nom for m in matrice.membres] == ["Dupont", "Soro"]
+    assert matrice.eligibilite == [0, 1]
+    assert matrice.disponibilite == ["1100111", "0111111"]
+
+    validees = svc.get_matrice_disponibilite(
+        matrice_ministere.id, date(2040, 5, 1), date(2040, 5, 7), validee_only=True
+    )
+    assert validees.disponibilite == ["1111111", "0111111"]
+
+
+def test_matrice_disponibilite_route(client, admin_headers, matrice_ministere):
+    """Fenêtre trop longue → INDISP_008 ; ministère inconnu → MINST_002."""
+    url = f"/indisponibilites/ministere/{matrice_ministere.id}/matrice"
+    r = client.get(
+        url,
+        params={"date_debut": "2040-05-01", "date_fin": "2040-05-02"},
+        headers=admin_headers,
+    )
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json()["disponibilite"] == ["11", "01"]
+
+    r = client.get(
+        url,
+        params={"date_debut": "2040-01-01", "date_fin": "2041-06-01"},
+        headers=admin_headers,
+    )
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert r.json()["error"]["code"] == "INDISP_008"
+
+    r = client.get(
+        "/indisponibilites/ministere/inconnu/matrice",
+        params={"date_debut": "2040-05-01", "date_fin": "2040-05-02"},
+        headers=admin_headers,
+    )
+    assert r.status_code == status.HTTP_404_NOT_FOUND
+    assert r.json()["error"]["code"] == "MINST_002"
@@ -0,0 +1,141 @@
+"""Agenda matérialisé (t_membre_agenda) : maintenance incrémentale et lecture."""
+
+# pylint: disable=redefined-outer-name
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import select
+
+from mla_enum.custom_enum import AffectationStatusCode
+from models import AffectationBulkCreate
+from models.schema_db_model import MembreAgenda
+from repositories.slot_repository import SlotRepository
+from services.affectation_service import AffectationService
+from services.planing_service import PlanningServiceSvc
+
+
+def _agenda(session, membre_id):
+    return session.exec(
+        select(MembreAgenda.affectation_id, MembreAgenda.statut_affectation_code)
+        .where(MembreAgenda.membre_id == membre_id)
+        .order_by(MembreAgenda.date_debut)
+    ).all()
+
+
+def _read(session, membre_id, campus_id):
+    start = datetime.now() - timedelta(days=1)
+    return PlanningServiceSvc(session).get_member_agenda_full(
+        membre_id, campus_id, start, start + timedelta(days=90)
+    )
+
+
+@pytest.fixture
+def affectation(session, test_slot, test_membre_role):
+    aff = AffectationService(session).assign_member_to_slot(
+        test_slot.id, test_membre_role.membre_id, test_membre_role.role_code
+    )
+    session.flush()
+    return aff
+
+
+def test_agenda_follows_orm_writes(session, affectation, test_slot, test_membre):
+    assert _agenda(session, test_membre.id) == [(affectation.id, "PROPOSE")]
+
+    AffectationService(session).update_affectation_status(
+        affectation.id, AffectationStatusCode.CONFIRME
+    )
+    assert _agenda(session, test_membre.id) == [(affectation.id, "CONFIRME")]
+
+    test_slot.nom_creneau = "Créneau renommé"
+    test_slot.planning.activite.lieu = "Salle B"
+    session.flush()
+    entry = _read(session, test_membre.id, test_slot.planning.activite.campus_id)
+    assert entry.entries[0].nom_creneau == "Créneau renommé"
+    assert entry.entries[0].lieu == "Salle B"
+
+    session.delete(affectation)
+    session.flush()
+    assert not _agenda(session, test_membre.id)
+
+
+def test_agenda_drops_deleted_planning(
+    session, affectation, test_planning, test_membre
+):
+    test_planning.deleted_at = datetime.now()
+    session.flush()
+    assert not _agenda(session, test_membre.id)
+
+    test_planning.deleted_at = None
+    session.flush()
+    assert _agenda(session, test_membre.id) == [(affectation.id, "PROPOSE")]
+
+
+def test_agenda_follows_campus_rename(session, affectation, test_campus, test_membre):
+    test_campus.nom = "Campus renommé"
+    session.flush()
+    agenda = _read(session, test_membre.id, test_campus.id)
+    assert [e.affectation_id for e in agenda.entries] == [affectation.id]
+    assert agenda.entries[0].campus_nom == "Campus renommé"
+
+
+def test_agenda_follows_set_based_writes(
+    session, test_slot, test_membre_role, test_membre
+):
+    result = AffectationService(session).assign_members_bulk(
+        AffectationBulkCreate(
+            items=[
+                {
+                    "slot_id": test_slot.id,
+                    "membre_id": test_membre.id,
+                    "role_code": test_membre_role.role_code,
+                }
+            ]
+        )
+    )
+    (created,) = result.created
+    assert _agenda(session, test_membre.id) == [(created.id, "PROPOSE")]
+
+    new_start = test_slot.date_debut + timedelta(days=2)
+    SlotRepository(session).bulk_update([{"id": test_slot.id, "date_debut": new_start}])
+    (row,) = session.exec(
+        select(MembreAgenda.date_debut).where(MembreAgenda.affectation_id == created.id)
+    ).all()
+    assert row == new_start
+
+
+def test_member_agenda_single_indexed_read(
+    session, affectation, test_membre, test_campus, query_counter
+):
+    session.flush()
+    with query_counter as qc:
+        agenda = _read(session, test_membre.id, test_campus.id)
+
+    assert qc.count == 1
+    (entry,) = agenda.entries
+    assert entry.affectation_id == affectation.id
+    assert entry.activite_nom == entry.activite_type == "Réunion"
+    assert agenda.statistics.total_engagements == 1
+    assert agenda.statistics.roles_distribution == {affectation.role_code: 1}
+
+    # Autre campus ou hors période : rien
+    assert not _read(session, test_membre.id, "autre-campus").entries
+    far = datetime.now() + timedelta(days=365)
+    assert not (
+        PlanningServiceSvc(session)
+        .get_member_agenda_full(
+            test_membre.id, test_campus.id, far, far + timedelta(days=1)
+        )
+        .entries
+    )
+
+
+def test_agenda_untouched_by_unrelated_flush(
+    session, affectation, test_slot, test_membre, query_counter
+):
+    """Un flush sans colonne projetée modifiée n'émet aucun rafraîchissement."""
+    test_membre.telephone = "0600000000"
+    test_slot.nb_personnes_requis = 3
+    with query_counter as qc:
+        session.flush()
+    assert qc.count == 2
+    assert _agenda(session, test_membre.id) == [(affectation.id, "PROPOSE")]
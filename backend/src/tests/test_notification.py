@@ -0,0 +1,273 @@
+import asyncio
+import json
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta, timezone
+from email.header import decode_header, make_header
+from email.message import EmailMessage
+
+from sqlmodel import select
+
+from mla_enum import OutboxStatus, PlanningStatusCode
+from models import NotificationOutbox
+from notification.notification_repository import EmailRepository
+from notification.notification_schemas import (
+    PlanningCancelledNotification,
+    PlanningPublishedNotification,
+)
+from notification.notification_service import EmailService
+from notification.outbox_worker import OutboxPolicy, OutboxWorker
+from notification.smtp_delivery import SmtpDeliveryEngine, SmtpEndpoint
+from repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from services.planing_service import PlanningServiceSvc
+
+# pylint: disable=redefined-outer-name, unused-argument
+
+
+def _messages(count: int) -> list[EmailMessage]:
+    return [
+        EmailRepository.build_html_message(
+            f"Sujet {i}", f"membre{i}@test.com", f"<p>Bonjour {i}</p>"
+        )
+        for i in range(count)
+    ]
+
+
+def _published(i: int) -> PlanningPublishedNotification:
+    return PlanningPublishedNotification(
+        email=f"membre{i}@test.com",
+        prenom="Jean",
+        nom=f"Dupont{i}",
+        type_activite="Culte",
+        date_activite=date(2026, 11, 8),
+        heure_debut="09:00",
+        heure_fin="12:00",
+        lieu="Salle A",
+        campus_nom="Lille",
+        ministere_nom="Louange",
+        nom_creneau="Chorale",
+        role_code="CHORISTE",
+        date_debut_dt=datetime(2026, 11, 8, 9, 0),
+        date_fin_dt=datetime(2026, 11, 8, 12, 0),
+    )
+
+
+def test_deliver_reuses_pooled_connections(smtp_stub, smtp_engine) -> None:
+    """80 messages → au plus pool_size connexions, tous délivrés."""
+    report = asyncio.run(smtp_engine.deliver(_messages(80)))
+
+    assert report.sent == 80
+    assert report.failed == 0
+    assert report.connections <= smtp_engine.pool_size
+    assert len(smtp_stub.sessions) == report.connections
+    assert len(smtp_stub.messages) == 80
+    assert report.messages_per_second > 0
+
+
+def test_deliver_retries_transient_errors(smtp_stub, smtp_engine) -> None:
+    """Un 421 est réessayé sur une nouvelle connexion."""
+    smtp_stub.fail_codes = ["421 Service not available", "451 Try again later"]
+
+    report = asyncio.run(smtp_engine.deliver(_messages(3)))
+
+    assert report.sent == 3
+    assert report.retries == 2
+    assert len(smtp_stub.messages) == 3
+
+
+def test_deliver_does_not_retry_permanent_errors(smtp_stub, smtp_engine) -> None:
+    """Un 550 est compté en échec sans nouvel essai ni exception."""
+    smtp_stub.fail_codes = ["550 Mailbox unavailable"]
+
+    report = asyncio.run(smtp_engine.deliver(_messages(2)))
+
+    assert report.failed == 1
+    assert report.sent == 1
+    assert report.retries == 0
+    (failure,) = report.failures
+    assert failure.permanent
+    assert "Mailbox unavailable" in failure.error
+
+
+def test_deliver_unreachable_server_reports_failures() -> None:
+    """Serveur injoignable : échecs comptés après les retries, pas d'exception."""
+    engine = SmtpDeliveryEngine(
+        SmtpEndpoint(hostname="127.0.0.1", port=1, timeout=1),
+        max_retries=1,
+        backoff_seconds=0.01,
+    )
+    report = asyncio.run(engine.deliver(_messages(2)))
+    assert report.failed == 2
+    assert report.sent == 0
+
+
+def test_published_batch_sends_ics_in_one_pool(smtp_stub, smtp_engine) -> None:
+    """La publication d'un planning envoie tous les emails en un seul lot."""
+    service = EmailService(EmailRepository(smtp_engine))
+
+    report = asyncio.run(
+        service.notify_planning_published_batch([_published(i) for i in range(25)])
+    )
+
+    assert report.sent == 25
+    assert report.connections <= smtp_engine.pool_size
+    received = smtp_stub.messages[0]
+    assert received["To"].endswith("@test.com")
+    assert any(part.get_content_type() == "text/calendar" for part in received.walk())
+
+
+def test_cancelled_batch(smtp_stub, smtp_engine) -> None:
+    service = EmailService(EmailRepository(smtp_engine))
+    notifs = [
+        PlanningCancelledNotification(
+            email="membre@test.com",
+            prenom="Jean",
+            nom="Dupont",
+            type_activite="Culte",
+            date_activite=date(2026, 11, 8),
+            campus_nom="Lille",
+            ministere_nom="Louange",
+            motif="Intempéries",
+        )
+    ]
+    report = asyncio.run(service.notify_planning_cancelled_batch(notifs))
+    assert report.sent == 1
+    subject = str(make_header(decode_header(smtp_stub.messages[0]["Subject"])))
+    assert "annulé" in subject
+
+
+def _outbox(session, planning_id: str) -> list[NotificationOutbox]:
+    return list(
+        session.exec(
+            select(NotificationOutbox).where(
+                NotificationOutbox.planning_id == planning_id
+            )
+        ).all()
+    )
+
+
+def _worker(session, smtp_engine) -> OutboxWorker:
+    return OutboxWorker(
+        EmailService(EmailRepository(smtp_engine)),
+        OutboxPolicy(batch_size=10, concurrency=2, retry_seconds=60),
+        session_factory=lambda: nullcontext(session),
+    )
+
+
+def test_status_change_writes_outbox_once_per_member(
+    session, test_planning, test_affectation
+) -> None:
+    """Publication → une ligne PENDING par membre ; un re-publish la réécrit."""
+    svc = PlanningServiceSvc(session)
+
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.ANNULE)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.BROUILLON)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+
+    rows = _outbox(session, test_planning.id)
+    assert len(rows) == 1
+    assert rows[0].membre_id == test_affectation.membre_id
+    assert rows[0].event == PlanningStatusCode.PUBLIE.value
+    assert rows[0].status == OutboxStatus.PENDING.value
+
+
+def test_outbox_worker_drains_pending_rows(
+    session, test_planning, test_affectation, smtp_stub, smtp_engine
+) -> None:
+    svc = PlanningServiceSvc(session)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.ANNULE, notify=True)
+
+    processed = asyncio.run(_worker(session, smtp_engine).drain())
+
+    assert processed == 2
+    assert len(smtp_stub.messages) == 2
+    rows = _outbox(session, test_planning.id)
+    assert {r.status for r in rows} == {OutboxStatus.SENT.value}
+    assert all(r.sent_at is not None for r in rows)
+
+
+def test_outbox_worker_reschedules_failed_delivery(
+    session, test_planning, test_affectation, smtp_stub, smtp_engine
+) -> None:
+    """Un échec transitoire persistant laisse la ligne PENDING, replanifiée."""
+    smtp_stub.fail_codes = ["451 Try again later"] * 3
+    svc = PlanningServiceSvc(session)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+
+    processed = asyncio.run(_worker(session, smtp_engine).drain())
+
+    assert processed == 1
+    row = _outbox(session, test_planning.id)[0]
+    assert row.status == OutboxStatus.PENDING.value
+    assert row.attempts == 1
+    assert "451" in (row.last_error or "")
+    available_at = row.available_at.replace(tzinfo=timezone.utc)
+    assert available_at > datetime.now(timezone.utc)
+
+
+def test_outbox_worker_permanent_refusal_fails_row(
+    session, test_planning, test_affectation, smtp_stub, smtp_engine
+) -> None:
+    """Un refus 5xx passe la ligne FAILED sans nouvel essai."""
+    smtp_stub.fail_codes = ["550 Mailbox unavailable"]
+    svc = PlanningServiceSvc(session)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+
+    asyncio.run(_worker(session, smtp_engine).drain())
+
+    row = _outbox(session, test_planning.id)[0]
+    assert row.status == OutboxStatus.FAILED.value
+    assert row.attempts == 1
+    assert "Mailbox unavailable" in (row.last_error or "")
+
+
+def test_outbox_worker_retries_only_undelivered_items(
+    session, test_planning, test_affectation, smtp_stub, smtp_engine
+) -> None:
+    """Seuls les emails non délivrés d'une ligne sont renvoyés au retry."""
+    items = [_published(i).model_dump(mode="json") for i in range(2)]
+    NotificationOutboxRepository(session).enqueue(
+        test_planning.id,
+        PlanningStatusCode.PUBLIE.value,
+        {test_affectation.membre_id: items},
+    )
+    smtp_stub.fail_codes = ["451 Try again later"] * 3
+    worker = _worker(session, smtp_engine)
+
+    asyncio.run(worker.drain())
+
+    (row,) = _outbox(session, test_planning.id)
+    assert row.status == OutboxStatus.PENDING.value
+    assert json.loads(row.payload) == items[:1]
+    assert [m["To"] for m in smtp_stub.messages] == ["membre1@test.com"]
+
+    row.available_at = datetime.now(timezone.utc)
+    session.add(row)
+    session.flush()
+    asyncio.run(worker.drain())
+
+    assert row.status == OutboxStatus.SENT.value
+    assert [m["To"] for m in smtp_stub.messages[1:]] == ["membre0@test.com"]
+
+
+def test_outbox_worker_purges_expired_sent_rows(
+    session, test_planning, test_affectation, smtp_stub, smtp_engine
+) -> None:
+    """Après un drainage, les lignes SENT hors rétention sont supprimées."""
+    svc = PlanningServiceSvc(session)
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.PUBLIE, notify=True)
+    worker = _worker(session, smtp_engine)
+    asyncio.run(worker.drain())
+    (old,) = _outbox(session, test_planning.id)
+    old.sent_at = datetime.now(timezone.utc) - timedelta(days=30)
+    session.add(old)
+    session.flush()
+
+    svc.update_planning_status(test_planning.id, PlanningStatusCode.ANNULE, notify=True)
+    asyncio.run(worker.drain())
+
+    rows = _outbox(session, test_planning.id)
+    assert [r.event for r in rows] == [PlanningStatusCode.ANNULE.value]
@@ -4,13 +4,15 @@ from uuid import uuid4
 import pytest
 from fastapi import status
 from pydantic import ValidationError
-from sqlmodel import select
+from sqlalchemy.orm import selectinload
+from sqlmodel import col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
-from mla_enum.custom_enum import PlanningStatusCode
-from models import Activite, PlanningService
-from models.planning_model import PlanningFullCreate
+from mla_enum.custom_enum import AffectationStatusCode, PlanningStatusCode
+from models import Activite, Ministere, PlanningService
+from models.planning_model import PlanningFullCreate, PlanningFullRead, PlanningWindow
+from models.schema_db_model import Affectation, Slot
 from services.planing_service import PlanningServiceSvc
 
 
@@ -289,3 +291,179 @@ def test_api_delete_full_planning_not_found(client, admin_headers):
     response = client.delete(f"/plannings/{fake_id}/full", headers=admin_headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def _add_plannings(session, campus_id: str, count: int) -> dict[str, str]:
+    """Crée `count` plannings, chacun organisé par un nouveau ministère."""
+    noms = {}
+    for i in range(count):
+        ministere = Ministere(nom=f"Ministere {uuid4()}", date_creation="2024-01-01")
+        session.add(ministere)
+        session.flush()
+        noms[ministere.id] = ministere.nom
+        activite = Activite(
+            type="Culte",
+            campus_id=campus_id,
+            ministere_organisateur_id=ministere.id,
+            date_debut=datetime.now() + timedelta(days=i + 1),
+            date_fin=datetime.now() + timedelta(days=i + 1, hours=2),
+        )
+        session.add(activite)
+        session.flush()
+        session.add(
+            PlanningService(
+                activite_id=activite.id,
+                statut_code=PlanningStatusCode.BROUILLON.value,
+            )
+        )
+    session.flush()
+    return noms
+
+
+def test_list_by_campus_resolves_names_in_constant_queries(
+    session, test_admin, test_campus, query_counter
+):
+    """Les noms campus/ministère sont résolus en lot : le nombre de requêtes
+    ne dépend pas du nombre de plannings."""
+    svc = PlanningServiceSvc(session)
+    svc.refs.rbac_role_names()  # référentiels en cache pour les deux mesures
+    noms = _add_plannings(session, test_campus.id, 2)
+    session.expire_all()
+    with query_counter as qc:
+        small = svc.list_by_campus(test_campus.id, test_admin).data
+    small_count = qc.count
+
+    noms.update(_add_plannings(session, test_campus.id, 6))
+    session.expire_all()
+    with query_counter as qc:
+        large = svc.list_by_campus(test_campus.id, test_admin).data
+
+    assert len(small) == 2
+    assert len(large) == 8
+    assert qc.count == small_count
+    for dto in large:
+        assert dto.activite.campus_nom == test_campus.nom
+        assert (
+            dto.activite.ministere_organisateur_nom
+            == noms[dto.activite.ministere_organisateur_id]
+        )
+
+
+def _orm_full_reads(session, svc: PlanningServiceSvc, ids: list[str]) -> list[dict]:
+    """Référence : graphe ORM (selectinload) + model_validate."""
+    query = (
+        select(PlanningService)
+        .where(col(PlanningService.id).in_(ids))  # pylint: disable=no-member
+        .options(
+            selectinload(PlanningService.activite),  # type: ignore[arg-type]
+            selectinload(PlanningService.slots)  # type: ignore[arg-type]
+            .selectinload(Slot.affectations)  # type: ignore[arg-type]
+            .selectinload(Affectation.membre),  # type: ignore[arg-type]
+            selectinload(PlanningService.slots)  # type: ignore[arg-type]
+            .selectinload(Slot.affectations)  # type: ignore[arg-type]
+            .selectinload(Affectation.ministere),  # type: ignore[arg-type]
+        )
+    )
+    result = []
+    for planning in session.exec(query).unique().all():
+        dto = PlanningFullRead.model_validate(planning)
+        dto.activite = svc._build_activite_full(  # pylint: disable=protected-access
+            planning.activite
+        )
+        result.append(dto.model_dump(mode="json"))
+    return result
+
+
+def _normalize(plannings: list[dict]) -> list[dict]:
+    for planning in plannings:
+        planning["slots"].sort(key=lambda s: (s["date_debut"], s["id"]))
+        for slot in planning["slots"]:
+            slot["affectations"].sort(key=lambda a: a["id"])
+    return sorted(plannings, key=lambda p: p["id"])
+
+
+def test_list_projection_matches_orm_graph(  # pylint: disable=R0917
+    session, test_admin, test_campus, test_ministere, test_planning, test_membre
+):
+    """La lecture en projection produit le même JSON que le graphe ORM."""
+    for h in range(3):
+        slot = Slot(
+            planning_id=test_planning.id,
+            nom_creneau=f"Créneau {h}",
+            date_debut=datetime.now() + timedelta(hours=h),
+            date_fin=datetime.now() + timedelta(hours=h + 1),
+            nb_personnes_requis=h + 1,
+        )
+        session.add(slot)
+        session.flush()
+        for ministere_id in ([None, test_ministere.id] if h else []):
+            session.add(
+                Affectation(
+                    slot_id=slot.id,
+                    membre_id=test_membre.id,
+                    role_code="CHORISTE",
+                    statut_affectation_code=AffectationStatusCode.PROPOSE.value,
+                    ministere_id=ministere_id,
+                )
+            )
+    session.flush()
+    session.expire_all()
+    svc = PlanningServiceSvc(session)
+
+    projected = [
+        p.model_dump(mode="json")
+        for p in svc.list_by_campus(test_campus.id, test_admin).data
+    ]
+    reference = _orm_full_reads(session, svc, [test_planning.id])
+
+    assert _normalize(projected) == _normalize(reference)
+    slots = projected[0]["slots"]
+    assert [s["nom_creneau"] for s in slots] == ["Créneau 0", "Créneau 1", "Créneau 2"]
+    assert sum(len(s["affectations"]) for s in slots) == 4
+
+
+def test_list_by_campus_keyset_pages(session, test_admin, test_campus):
+    """Le parcours par curseur renvoie chaque planning une fois, dans l'ordre."""
+    _add_plannings(session, test_campus.id, 7)
+    svc = PlanningServiceSvc(session)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = svc.list_by_campus(
+            test_campus.id, test_admin, PlanningWindow(cursor=cursor, limit=3)
+        )
+        pages += 1
+        seen.extend(page.data)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len({p.id for p in seen}) == 7
+    keys = [(p.activite.date_debut, p.id) for p in seen]
+    assert keys == sorted(keys)
+
+
+def test_list_by_campus_date_window(session, test_admin, test_campus):
+    """from/to bornent la liste : [J+2, J+5[ → J+2, J+3, J+4."""
+    _add_plannings(session, test_campus.id, 7)  # J+1 … J+7
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    window = PlanningWindow(
+        date_from=today + timedelta(days=2), date_to=today + timedelta(days=5)
+    )
+
+    page = PlanningServiceSvc(session).list_by_campus(
+        test_campus.id, test_admin, window
+    )
+
+    assert len(page.data) == 3
+    assert page.next_cursor is None
+
+
+def test_list_by_campus_invalid_cursor(session, test_admin, test_campus):
+    svc = PlanningServiceSvc(session)
+    with pytest.raises(AppException) as exc:
+        svc.list_by_campus(
+            test_campus.id, test_admin, PlanningWindow(cursor="pas-un-curseur")
+        )
+    assert exc.value.code == ErrorRegistry.PLAN_019.code
@@ -1,12 +1,16 @@
+# pylint: disable=redefined-outer-name
+from uuid import uuid4
+
 import pytest
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlmodel import col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from mla_enum.custom_enum import PlanningStatusCode
 from models import Activite, Affectation, PlanningService
-from models.schema_db_model import Slot
+from models.chant_model import Chant, ChantCategorie
+from models.schema_db_model import PlanningChantLink, Slot
 
 
 class TestPlanningDeleteRobust:
@@ -41,14 +45,16 @@ class TestPlanningDeleteRobust:
         p_id, a_id = planning.id, planning.activite_id
         session.commit()
 
-        original_delete = session.delete
+        original_exec = session.exec
 
-        def mock_delete(obj):
-            if isinstance(obj, Activite) and str(obj.id) == str(a_id):
+        def mock_exec(statement, *args, **kwargs):
+            if getattr(statement, "is_delete", False) and (
+                statement.table.name == Activite.__tablename__
+            ):
                 raise IntegrityError("Simulated Activity Failure", params={}, orig=None)
-            return original_delete(obj)
+            return original_exec(statement, *args, **kwargs)
 
-        monkeypatch.setattr(session, "delete", mock_delete)
+        monkeypatch.setattr(session, "exec", mock_exec)
 
         with pytest.raises(IntegrityError):
             planning_svc.delete_full_planning(p_id)
@@ -62,6 +68,7 @@ class TestPlanningDeleteRobust:
         assert db_p is not None
         db_slots = session.exec(select(Slot).where(Slot.planning_id == p_id)).all()
         assert len(db_slots) > 0
+        assert session.get(Activite, a_id) is not None
 
     def test_delete_workflow_security_lock(self, planning_svc, robust_data_factory):
         """Vérifie le blocage de suppression si le planning est PUBLIE."""
@@ -70,3 +77,97 @@ class TestPlanningDeleteRobust:
             planning_svc.delete_full_planning(planning.id)
 
         assert exc.value.code == ErrorRegistry.PLANNING_DELETE_IMPOSSIBLE.code
+
+
+def _make_serie(session, robust_data_factory, count: int, **statuses) -> str:
+    """Rattache `count` plannings complets à un même serie_id."""
+    serie_id = str(uuid4())
+    for i in range(count):
+        planning = robust_data_factory(status=statuses.get(str(i), "BROUILLON"))
+        planning.serie_id = serie_id
+        session.add(planning)
+    session.flush()
+    return serie_id
+
+
+@pytest.fixture
+def serie_avec_chant(session, robust_data_factory, test_campus):
+    """Série de 3 plannings, le premier avec un chant au répertoire."""
+    serie_id = _make_serie(session, robust_data_factory, 3)
+    plannings = session.exec(
+        select(PlanningService).where(PlanningService.serie_id == serie_id)
+    ).all()
+    session.merge(ChantCategorie(code="SERIE_DEL", libelle="Série", ordre=0))
+    chant = Chant(
+        titre="Chant série",
+        campus_id=test_campus.id,
+        categorie_code="SERIE_DEL",
+    )
+    session.add(chant)
+    session.flush()
+    session.add(PlanningChantLink(planning_id=plannings[0].id, chant_id=chant.id))
+    session.flush()
+    return serie_id, [p.id for p in plannings], [p.activite_id for p in plannings]
+
+
+class TestDeleteSerie:
+    """Suppression ensembliste d'une série de plannings."""
+
+    def test_delete_serie_one_statement_per_table(
+        self, session, planning_svc, serie_avec_chant, query_counter
+    ):
+        serie_id, p_ids, a_ids = serie_avec_chant
+
+        with query_counter as qc:
+            deleted = planning_svc.delete_serie(serie_id)
+
+        assert deleted == 3
+        # 1 lecture de la série + 1 DELETE par table
+        assert qc.count == 6
+        session.expire_all()
+        for model, column, ids in (
+            (PlanningService, PlanningService.id, p_ids),
+            (Activite, Activite.id, a_ids),
+            (Slot, Slot.planning_id, p_ids),
+            (PlanningChantLink, PlanningChantLink.planning_id, p_ids),
+        ):
+            assert session.exec(select(model).where(col(column).in_(ids))).all() == []
+
+    def test_delete_serie_refused_if_published(
+        self, session, planning_svc, robust_data_factory
+    ):
+        serie_id = _make_serie(
+            session, robust_data_factory, 2, **{"1": PlanningStatusCode.PUBLIE.value}
+        )
+
+        with pytest.raises(AppException) as exc:
+            planning_svc.delete_serie(serie_id)
+
+        assert exc.value.code == ErrorRegistry.PLANNING_DELETE_IMPOSSIBLE.code
+        remaining = session.exec(
+            select(PlanningService).where(PlanningService.serie_id == serie_id)
+        ).all()
+        assert len(remaining) == 2
+
+    def test_delete_serie_not_found(self, planning_svc):
+        with pytest.raises(AppException) as exc:
+            planning_svc.delete_serie(str(uuid4()))
+
+        assert exc.value.code == ErrorRegistry.SERIE_004.code
+
+    def test_api_delete_serie(
+        self, client, admin_headers, session, robust_data_factory
+    ):
+        serie_id = _make_serie(session, robust_data_factory, 2)
+        session.commit()
+
+        response = client.delete(f"/plannings/series/{serie_id}", headers=admin_headers)
+
+        assert response.status_code == 204
+        session.expire_all()
+        assert (
+            session.exec(
+                select(PlanningService).where(PlanningService.serie_id == serie_id)
+            ).all()
+            == []
+        )
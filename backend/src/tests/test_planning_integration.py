@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import status
 from sqlmodel import select
@@ -187,3 +187,43 @@ def test_list_by_campus_denies_unlinked_user(client, user_headers, test_campus):
         headers=user_headers,
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_list_by_ministere_paginates_with_cursor(
+    client, admin_headers, session, test_ministere, test_campus
+):
+    """limit + next_cursor : la seconde page reprend après la première."""
+    for day in (1, 2):
+        activite = Activite(
+            type="Culte",
+            campus_id=test_campus.id,
+            ministere_organisateur_id=test_ministere.id,
+            date_debut=datetime.now() + timedelta(days=day),
+            date_fin=datetime.now() + timedelta(days=day, hours=2),
+        )
+        session.add(activite)
+        session.flush()
+        session.add(PlanningService(activite_id=activite.id, statut_code="BROUILLON"))
+    session.commit()
+    url = f"/plannings/by-ministere/{test_ministere.id}"
+
+    first = client.get(url, params={"limit": 1}, headers=admin_headers).json()
+    second = client.get(
+        url,
+        params={"limit": 1, "cursor": first["next_cursor"]},
+        headers=admin_headers,
+    ).json()
+
+    assert first["limit"] == 1 and len(first["data"]) == 1
+    assert len(second["data"]) == 1
+    assert second["data"][0]["id"] != first["data"][0]["id"]
+    assert second["next_cursor"] is None
+
+
+def test_list_by_campus_rejects_invalid_cursor(client, admin_headers, test_campus):
+    response = client.get(
+        f"/plannings/by-campus/{test_campus.id}",
+        params={"cursor": "%%%"},
+        headers=admin_headers,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -312,6 +312,106 @@ def test_delete_template_forbidden_other_campus(
     assert exc.value.code == ErrorRegistry.TMPL_004.code
 
 
+def _add_templates(session, n, *, campus_id, ministere_id, membre_id):
+    """Crée n templates avec 2 créneaux chacun (pour le benchmark listing)."""
+    for i in range(n):
+        tpl = PlanningTemplate(
+            nom=f"Bench {i}",
+            activite_type="Culte",
+            duree_minutes=120,
+            campus_id=campus_id,
+            ministere_id=ministere_id,
+            created_by_id=membre_id,
+        )
+        session.add(tpl)
+        session.flush()
+        session.add_all(
+            [
+                PlanningTemplateSlot(
+                    template_id=tpl.id,
+                    nom_creneau=f"Slot {j}",
+                    offset_debut_minutes=j * 30,
+                    offset_fin_minutes=(j + 1) * 30,
+                )
+                for j in range(2)
+            ]
+        )
+    session.flush()
+
+
+def test_list_templates_stats(  # pylint: disable=R0917
+    session, test_admin, test_membre, test_campus, test_ministere, template_fixture
+):
+    """usage_count ignore les plannings supprimés, last_used_at = max date."""
+    test_admin.membre_id = test_membre.id
+    session.add(test_admin)
+    dates = [datetime(2026, 3, 1, 9), datetime(2026, 4, 5, 9), datetime(2026, 5, 1)]
+    for i, debut in enumerate(dates):
+        activite = Activite(
+            type="Culte",
+            date_debut=debut,
+            date_fin=debut + timedelta(hours=2),
+            campus_id=test_campus.id,
+            ministere_organisateur_id=test_ministere.id,
+        )
+        session.add(activite)
+        session.flush()
+        session.add(
+            PlanningService(
+                activite_id=activite.id,
+                statut_code="BROUILLON",
+                template_id=template_fixture.id,
+                deleted_at=datetime.now() if i == 2 else None,
+            )
+        )
+    session.flush()
+    svc = PlanningTemplateSvc(session)
+    items = {t.id: t for t in svc.list_templates(test_admin)}
+    item = items[template_fixture.id]
+    assert item.usage_count == 2
+    assert item.last_used_at == dates[1]
+    assert item.nb_creneaux == 2
+    assert item.section == "mes_templates"
+
+
+def test_list_templates_prive_hidden_from_others(
+    session, responsable_user, template_other_campus, test_campus
+):
+    """Un template PRIVE d'un autre membre n'est jamais listé."""
+    template_other_campus.visibilite = "PRIVE"
+    template_other_campus.campus_id = test_campus.id
+    session.add(template_other_campus)
+    session.flush()
+    svc = PlanningTemplateSvc(session)
+    ids = [t.id for t in svc.list_templates(responsable_user)]
+    assert template_other_campus.id not in ids
+
+
+def test_list_templates_query_count_constant(  # pylint: disable=R0917
+    session, query_counter, test_admin, test_membre, test_campus, test_ministere
+):
+    """Benchmark : le nombre de requêtes ne dépend pas du nombre de templates."""
+    test_admin.membre_id = test_membre.id
+    session.add(test_admin)
+    owner = {
+        "campus_id": test_campus.id,
+        "ministere_id": test_ministere.id,
+        "membre_id": test_membre.id,
+    }
+    svc = PlanningTemplateSvc(session)
+    _add_templates(session, 5, **owner)
+    svc.list_templates(test_admin)  # warm-up (lazy-load user.membre…)
+
+    with query_counter as small:
+        nb_small = len(svc.list_templates(test_admin))
+    _add_templates(session, 50, **owner)
+    with query_counter as large:
+        nb_large = len(svc.list_templates(test_admin))
+
+    assert nb_large == nb_small + 50
+    assert large.count == small.count == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests API
 # ---------------------------------------------------------------------------
@@ -672,3 +772,110 @@ def test_apply_template_membre_plusieurs_roles(  # pylint: disable=R0917
     svc = PlanningTemplateSvc(session)
     result = svc.apply_to_planning(tpl.id, planning.id)
     assert result["affectations_creees"] == 2
+
+
+def _template_suggerant(  # pylint: disable=R0917
+    session, campus, ministere, createur, nb_slots, membres
+) -> PlanningTemplate:
+    """Template de nb_slots créneaux, 2 rôles chacun, suggérant tous les membres."""
+    tpl = PlanningTemplate(
+        nom=f"Tpl {uuid4().hex[:4]}",
+        activite_type="Culte",
+        duree_minutes=180,
+        campus_id=campus.id,
+        ministere_id=ministere.id,
+        created_by_id=createur.id,
+    )
+    session.add(tpl)
+    session.flush()
+    for i in range(nb_slots):
+        slot = PlanningTemplateSlot(
+            template_id=tpl.id,
+            nom_creneau=f"Créneau {i}",
+            offset_debut_minutes=30 * i,
+            offset_fin_minutes=30 * i + 30,
+            nb_personnes_requis=2,
+        )
+        session.add(slot)
+        session.flush()
+        for rc in ("TENOR", "PIANO"):
+            role = PlanningTemplateRole(slot_id=slot.id, role_code=rc)
+            session.add(role)
+            session.flush()
+            session.add_all(
+                PlanningTemplateRoleMembre(template_role_id=role.id, membre_id=m.id)
+                for m in membres
+            )
+    session.flush()
+    session.expire_all()
+    return tpl
+
+
+def _planning_du(session, campus, ministere, jour: datetime) -> PlanningService:
+    act = Activite(
+        type="Culte",
+        date_debut=jour,
+        date_fin=jour + timedelta(hours=3),
+        campus_id=campus.id,
+        ministere_organisateur_id=ministere.id,
+    )
+    session.add(act)
+    session.flush()
+    planning = PlanningService(activite_id=act.id, statut_code="BROUILLON")
+    session.add(planning)
+    session.flush()
+    return planning
+
+
+def test_apply_template_batched_constant_queries(  # pylint: disable=R0917,R0914
+    session,
+    test_campus,
+    test_ministere,
+    test_membre,
+    membre_dans_ministere,
+    indispo_fixture,
+    query_counter,
+):
+    """Nombre de requêtes indépendant du nombre de slots et de membres suggérés."""
+    inactif = Membre(nom="Inactif", prenom="Paul", email=None, actif=False)
+    inactif.ministeres = [test_ministere]
+    session.add(inactif)
+    session.flush()
+    jour = datetime(2026, 7, 1, 9, 0)  # couvert par indispo_fixture
+    svc = PlanningTemplateSvc(session)
+    counts = []
+    for nb_slots, membres in (
+        (1, [membre_dans_ministere]),
+        (3, [membre_dans_ministere, test_membre, inactif]),
+    ):
+        tpl = _template_suggerant(
+            session, test_campus, test_ministere, test_membre, nb_slots, membres
+        )
+        planning = _planning_du(session, test_campus, test_ministere, jour)
+        session.flush()
+        with query_counter as qc:
+            result = svc.apply_to_planning(tpl.id, planning.id)
+        counts.append(qc.count)
+
+    assert counts[0] == counts[1]
+    # 3 slots × 2 rôles : seul membre_dans_ministere est affecté (indispo)
+    assert result["affectations_creees"] == 6
+    assert len(result["avertissements_indispo"]) == 6
+    assert {w["creneau_nom"] for w in result["avertissements_indispo"]} == {
+        "Créneau 0",
+        "Créneau 1",
+        "Créneau 2",
+    }
+    raisons = {(ig["membre_id"], ig["raison"]) for ig in result["membres_ignores"]}
+    assert raisons == {
+        (test_membre.id, "hors_ministere"),
+        (inactif.id, "introuvable"),
+    }
+    assert len(result["membres_ignores"]) == 12
+    slots = session.exec(select(Slot).where(Slot.planning_id == planning.id)).all()
+    assert sorted(s.nom_creneau for s in slots) == [
+        "Créneau 0",
+        "Créneau 1",
+        "Créneau 2",
+    ]
+    assert len(planning.slots) == 3
@@ -7,11 +7,11 @@ from uuid import uuid4
 
 import pytest
 from fastapi import status
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
-from models import Activite, PlanningService
+from models import Activite, Affectation, PlanningService, Slot
 from models.schema_db_model import (
     Membre,
     PlanningTemplate,
@@ -313,6 +313,173 @@ def test_generate_series_apply_template(
         assert p is not None
 
 
+def _add_planning_on(session, target, *, campus_id, ministere_id, deleted=False):
+    """Crée une activité à 9h le jour cible + son planning."""
+    debut = datetime(target.year, target.month, target.day, 9, 0)
+    activite = Activite(
+        type="Culte",
+        date_debut=debut,
+        date_fin=debut + timedelta(hours=2),
+        campus_id=campus_id,
+        ministere_organisateur_id=ministere_id,
+    )
+    session.add(activite)
+    session.flush()
+    planning = PlanningService(
+        activite_id=activite.id,
+        statut_code="BROUILLON",
+        deleted_at=datetime.now() if deleted else None,
+    )
+    session.add(planning)
+    session.flush()
+    return planning
+
+
+def test_preview_series_conflits_single_query(
+    session: Session, query_counter, test_ministere, test_campus
+):
+    """52 dates → une seule requête ; les plannings supprimés sont ignorés."""
+    first = date(2034, 1, 2)
+    owner = {"campus_id": test_campus.id, "ministere_id": test_ministere.id}
+    kept = _add_planning_on(session, first + timedelta(weeks=3), **owner)
+    _add_planning_on(session, first + timedelta(weeks=10), deleted=True, **owner)
+    _add_planning_on(session, first + timedelta(days=1), **owner)  # hors série
+    svc = SerieService(db=session)
+    req = GenerateSeriesPreviewRequest(
+        date_debut=first,
+        date_fin=first + timedelta(weeks=51),
+        recurrence=SerieRecurrence.HEBDOMADAIRE,
+        jour_semaine=first.weekday(),
+    )
+    with query_counter as qc:
+        result = svc.get_series_preview(req, ministere_id=test_ministere.id)
+    assert result.total == 52
+    assert [c.planning_id for c in result.conflits] == [kept.id]
+    assert qc.count == 1
+
+
+def test_generate_series_reports_conflits(
+    session: Session, test_ministere, test_campus, test_membre, template_serie
+):
+    """La génération retourne les conflits détectés avant création."""
+    target = date(2035, 5, 3)
+    existing = _add_planning_on(
+        session, target, campus_id=test_campus.id, ministere_id=test_ministere.id
+    )
+    svc = SerieService(db=session)
+    req = GenerateSeriesRequest(
+        date_debut=target,
+        date_fin=target + timedelta(weeks=1),
+        recurrence=SerieRecurrence.HEBDOMADAIRE,
+        jour_semaine=target.weekday(),
+        template_id=template_serie.id,
+    )
+    result = svc.generate_series(
+        req,
+        created_by_id=test_membre.id,
+        ministere_id=test_ministere.id,
+        campus_id=test_campus.id,
+    )
+    assert result.total == 2
+    assert [c.planning_id for c in result.conflits] == [existing.id]
+
+
+def _snapshot(session: Session, planning_id: str):
+    """Structure d'un planning généré, indépendante des ids."""
+    planning = session.get(PlanningService, planning_id)
+    assert planning is not None
+    activite = session.get(Activite, planning.activite_id)
+    assert activite is not None
+    slots = session.exec(select(Slot).where(Slot.planning_id == planning_id)).all()
+    return (
+        activite.type,
+        activite.date_debut.time(),
+        activite.date_fin - activite.date_debut,
+        planning.statut_code,
+        planning.template_id,
+        sorted(
+            (
+                s.nom_creneau,
+                s.date_debut - activite.date_debut,
+                s.date_fin - activite.date_debut,
+                s.nb_personnes_requis,
+                sorted(
+                    (a.membre_id, a.role_code, a.statut_affectation_code)
+                    for a in session.exec(
+                        select(Affectation).where(Affectation.slot_id == s.id)
+                    ).all()
+                ),
+            )
+            for s in slots
+        ),
+    )
+
+
+def test_generate_series_bulk_matches_orm(
+    session: Session,
+    test_ministere,
+    test_campus,
+    test_membre,
+    template_serie_avec_membre,
+):
+    """Le mode bulk produit la même réponse et les mêmes lignes que l'ORM."""
+    svc = SerieService(db=session)
+    ctx = {
+        "created_by_id": test_membre.id,
+        "ministere_id": test_ministere.id,
+        "campus_id": test_campus.id,
+    }
+
+    def _req(debut: date) -> GenerateSeriesRequest:
+        return GenerateSeriesRequest(
+            date_debut=debut,
+            date_fin=debut + timedelta(weeks=2),
+            recurrence=SerieRecurrence.HEBDOMADAIRE,
+            jour_semaine=debut.weekday(),
+            template_id=template_serie_avec_membre.id,
+        )
+
+    orm = svc.generate_series(_req(date(2036, 1, 7)), bulk=False, **ctx)
+    bulk = svc.generate_series(_req(date(2036, 6, 2)), **ctx)
+
+    assert bulk.total == orm.total == 3
+    assert [(p.titre, p.statut) for p in bulk.plannings] == [
+        (p.titre, p.statut) for p in orm.plannings
+    ]
+    assert [p.date_debut for p in bulk.plannings] == [
+        date(2036, 6, 2) + timedelta(weeks=i) for i in range(3)
+    ]
+    for p_orm, p_bulk in zip(orm.plannings, bulk.plannings):
+        assert _snapshot(session, p_bulk.id) == _snapshot(session, p_orm.id)
+        generated = session.get(PlanningService, p_bulk.id)
+        assert generated is not None and generated.serie_id == bulk.serie_id
+    # 3 × (activité + planning + 1 créneau + 1 affectation)
+    assert svc.last_write_stats is not None
+    assert svc.last_write_stats.rows == 12
+
+
+def test_generate_series_bulk_template_introuvable(
+    session: Session, test_ministere, test_campus, test_membre
+):
+    """Template inexistant → TMPL_003, rien n'est écrit."""
+    svc = SerieService(db=session)
+    req = GenerateSeriesRequest(
+        date_debut=date(2036, 9, 1),
+        date_fin=date(2036, 9, 1),
+        recurrence=SerieRecurrence.HEBDOMADAIRE,
+        jour_semaine=date(2036, 9, 1).weekday(),
+        template_id=str(uuid4()),
+    )
+    with pytest.raises(AppException) as exc:
+        svc.generate_series(
+            req,
+            created_by_id=test_membre.id,
+            ministere_id=test_ministere.id,
+            campus_id=test_campus.id,
+        )
+    assert exc.value.code == ErrorRegistry.TMPL_003.code
+
+
 # ---------------------------------------------------------------------------
 # Test API — droits
 # ---------------------------------------------------------------------------
@@ -330,3 +497,37 @@ def test_api_preview_series_forbidden_no_auth(client):
         },
     )
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_api_generate_series_reports_throughput(  # pylint: disable=R0917
+    client,
+    session: Session,
+    admin_headers,
+    test_admin,
+    test_membre,
+    test_ministere,
+    test_campus,
+    template_serie,
+):
+    """POST generate-series → 201 + en-têtes de débit."""
+    test_membre.campus_principal_id = test_campus.id
+    test_membre.ministeres = [test_ministere]
+    test_admin.membre_id = test_membre.id
+    session.add_all([test_membre, test_admin])
+    session.flush()
+    resp = client.post(
+        "/planning-templates/generate-series",
+        headers=admin_headers,
+        json={
+            "date_debut": "2037-03-02",
+            "date_fin": "2037-03-16",
+            "recurrence": "HEBDOMADAIRE",
+            "jour_semaine": 0,
+            "template_id": template_serie.id,
+        },
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert resp.json()["total"] == 3
+    # 3 × (activité + planning + 1 créneau), aucun membre suggéré
+    assert resp.headers["X-Rows-Written"] == "9"
+    assert int(resp.headers["X-Rows-Per-Second"]) >= 0
@@ -1,12 +1,17 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from uuid import uuid4
 
 import pytest
 
 # Import de la nouvelle exception et du registre
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
+from mla_enum.custom_enum import AffectationStatusCode, PlanningStatusCode
+from models import Activite, Affectation, Membre, Ministere, PlanningService, Slot
 from models.slot_model import SlotCreate
+from services.affectation_service import AffectationService
 from services.planing_service import PlanningServiceSvc
+from services.slot_service import SlotService
 
 
 def test_create_slot_success(session, test_planning):
@@ -159,3 +164,154 @@ def test_create_slot_arbitrary_minutes(session, test_planning):
         )
     )
     assert result.id is not None
+
+
+# ------------------------------------------------------------------ #
+#  Métriques de remplissage (COUNT groupé)
+# ------------------------------------------------------------------ #
+
+# pylint: disable=redefined-outer-name
+
+
+def _add_staffed_slot(session, planning, membres, requis: int, affectes: int) -> Slot:
+    """Slot du planning avec `affectes` affectations pour `requis` personnes."""
+    debut = planning.activite.date_debut
+    slot = Slot(
+        planning_id=planning.id,
+        nom_creneau=f"Créneau {uuid4().hex[:4]}",
+        date_debut=debut,
+        date_fin=debut + timedelta(minutes=30),
+        nb_personnes_requis=requis,
+    )
+    session.add(slot)
+    session.flush()
+    for membre in membres[:affectes]:
+        session.add(
+            Affectation(
+                slot_id=slot.id,
+                membre_id=membre.id,
+                role_code="ROLE_TEST",
+                statut_affectation_code=AffectationStatusCode.PROPOSE.value,
+            )
+        )
+    session.flush()
+    return slot
+
+
+def _other_planning(session, campus_id: str, ministere_id: str) -> PlanningService:
+    activite = Activite(
+        type="Culte",
+        campus_id=campus_id,
+        ministere_organisateur_id=ministere_id,
+        date_debut=datetime.now() + timedelta(days=30),
+        date_fin=datetime.now() + timedelta(days=30, hours=2),
+    )
+    session.add(activite)
+    session.flush()
+    planning = PlanningService(
+        activite_id=activite.id, statut_code=PlanningStatusCode.BROUILLON.value
+    )
+    session.add(planning)
+    session.flush()
+    return planning
+
+
+@pytest.fixture
+def staffing_membres(session):
+    membres = [
+        Membre(nom=f"Staff{i}", prenom="Test", email=f"{uuid4()}@test.com")
+        for i in range(3)
+    ]
+    session.add_all(membres)
+    session.flush()
+    return membres
+
+
+def test_fill_metrics_by_planning_and_campus(
+    session, test_planning, test_campus, test_ministere, staffing_membres
+):
+    """Compte par slot, par planning et au total, sur chaque périmètre."""
+    slots = [
+        _add_staffed_slot(session, test_planning, staffing_membres, requis, affectes)
+        for requis, affectes in ((1, 1), (3, 2), (2, 0))
+    ]
+    other_ministere = Ministere(nom=f"Autre {uuid4()}", date_creation="2024-01-01")
+    session.add(other_ministere)
+    session.flush()
+    other = _other_planning(session, test_campus.id, other_ministere.id)
+    _add_staffed_slot(session, other, staffing_membres, 2, 2)
+    svc = SlotService(session)
+
+    by_planning = svc.get_fill_metrics(planning_id=test_planning.id)
+    assert (by_planning.total_slots, by_planning.filled_slots) == (3, 1)
+    assert by_planning.personnes_requises == 6
+    assert by_planning.personnes_affectees == 3
+    assert by_planning.taux_remplissage == 33.33
+    counts = {s.slot_id: (s.nb_affectes, s.rempli) for s in by_planning.slots}
+    assert [counts[s.id] for s in slots] == [(1, True), (2, False), (0, False)]
+
+    by_campus = svc.get_fill_metrics(campus_id=test_campus.id)
+    per_planning = {p.planning_id: p for p in by_campus.plannings}
+    assert (by_campus.total_slots, by_campus.filled_slots) == (4, 2)
+    assert per_planning[other.id].filled_slots == 1
+    assert per_planning[test_planning.id].total_slots == 3
+
+    by_ministere = svc.get_fill_metrics(ministere_id=other_ministere.id)
+    assert [p.planning_id for p in by_ministere.plannings] == [other.id]
+
+    assert (
+        svc.get_fill_metrics(
+            campus_id=test_campus.id, date_from=datetime.now() + timedelta(days=1)
+        ).total_slots
+        == 1
+    )
+    assert svc.get_slots_metrics(test_planning.id) == (3, 1)
+
+
+def test_fill_metrics_single_query_without_hydration(
+    session, test_planning, test_campus, staffing_membres, query_counter
+):
+    """Une requête, quel que soit le volume, et aucune affectation chargée."""
+    svc = SlotService(session)
+    for _ in range(5):
+        _add_staffed_slot(session, test_planning, staffing_membres, 2, 3)
+    session.expunge_all()
+
+    with query_counter as qc:
+        metrics = svc.get_fill_metrics(campus_id=test_campus.id)
+
+    assert qc.count == 1
+    assert metrics.total_slots == metrics.filled_slots == 5
+    assert not any(
+        isinstance(obj, Affectation) for obj in session.identity_map.values()
+    )
+
+
+def test_fill_metrics_requires_scope(session):
+    with pytest.raises(AppException) as excinfo:
+        SlotService(session).get_fill_metrics()
+    assert excinfo.value.code == ErrorRegistry.PLAN_020.code
+
+
+def test_is_slot_filled_counts_in_sql(session, test_planning, staffing_membres):
+    slot = _add_staffed_slot(session, test_planning, staffing_membres, 2, 2)
+    session.expire(slot, ["affectations"])
+    assert AffectationService(session).is_slot_filled(slot) is True
+    assert "affectations" not in slot.__dict__
+
+
+def test_staffing_metrics_endpoint(
+    client, admin_headers, session, test_planning, staffing_membres
+):
+    _add_staffed_slot(session, test_planning, staffing_membres, 1, 1)
+    response = client.get(
+        "/plannings/metrics/staffing",
+        params={"planning_id": test_planning.id},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_slots"] == data["filled_slots"] == 1
+
+    missing = client.get("/plannings/metrics/staffing", headers=admin_headers)
+    assert missing.status_code == 422
@@ -1,9 +1,12 @@
+from datetime import timedelta
+
 import pytest
+from sqlmodel import col, select
 
 from core.exceptions.app_exception import AppException
 from core.message import ErrorRegistry
 from mla_enum import AffectationStatusCode, PlanningStatusCode
-from models import PlanningService
+from models import Affectation, PlanningService, Slot
 from models.planning_model import PlanningFullUpdate
 from models.schema_db_model import StatutPlanning
 from services.affectation_service import AffectationService
@@ -178,3 +181,158 @@ def test_valid_transition_triggers_hook(
     planning_svc.update_full_planning(test_planning.id, payload)
 
     assert hook_called is True
+
+
+def _editor_slots(planning, membre_role, count: int) -> list[dict]:
+    """Payload éditeur : `count` créneaux de 2 min avec une affectation chacun."""
+    debut = planning.activite.date_debut
+    return [
+        {
+            "nom_creneau": f"Créneau {i}",
+            "date_debut": debut + timedelta(minutes=2 * i),
+            "date_fin": debut + timedelta(minutes=2 * i + 2),
+            "affectations": [
+                {
+                    "membre_id": membre_role.membre_id,
+                    "role_code": membre_role.role_code,
+                }
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def _saved_payload(session, planning_id: str) -> list[dict]:
+    """Relit le planning au format éditeur (ids inclus), comme le front."""
+    session.expire_all()
+    slots = session.exec(
+        select(Slot)
+        .where(Slot.planning_id == planning_id)
+        .order_by(col(Slot.date_debut))
+    ).all()
+    return [
+        {
+            "id": s.id,
+            "nom_creneau": s.nom_creneau,
+            "date_debut": s.date_debut,
+            "date_fin": s.date_fin,
+            "affectations": [
+                {
+                    "id": a.id,
+                    "membre_id": a.membre_id,
+                    "role_code": a.role_code,
+                    "statut_affectation_code": a.statut_affectation_code,
+                }
+                for a in s.affectations
+            ],
+        }
+        for s in slots
+    ]
+
+
+def test_sync_slots_constant_statements(
+    session, planning_svc, test_planning, test_membre_role, query_counter
+):
+    slot_svc = planning_svc.slot_svc
+    session.flush()
+
+    with query_counter as qc:
+        report = slot_svc.sync_planning_slots(
+            test_planning.id, _editor_slots(test_planning, test_membre_role, 40)
+        )
+    assert (report.slots_inserted, report.affectations_inserted) == (40, 40)
+    # lecture état (2) + rôles (1) + INSERT slots + INSERT affectations
+    assert report.statements <= 6
+    assert qc.count <= report.statements + 2
+
+    # Édition : 10 créneaux retirés, 1 renommé, 1 affectation confirmée, 1 ajouté
+    payload = _saved_payload(session, test_planning.id)[10:]
+    payload[0]["nom_creneau"] = "Renommé"
+    payload[1]["affectations"][0]["statut_affectation_code"] = "CONFIRME"
+    payload.append(_editor_slots(test_planning, test_membre_role, 1)[0])
+
+    with query_counter as qc:
+        report = slot_svc.sync_planning_slots(test_planning.id, payload)
+    assert report.slots_deleted == 10
+    assert report.affectations_deleted == 10
+    assert report.slots_updated == 1
+    assert report.affectations_updated == 1
+    assert (report.slots_inserted, report.affectations_inserted) == (1, 1)
+    assert qc.count <= 12
+
+    session.expire_all()
+    slots = session.exec(select(Slot).where(Slot.planning_id == test_planning.id)).all()
+    assert len(slots) == 31
+    assert sum(s.nom_creneau == "Renommé" for s in slots) == 1
+    confirmed = [
+        a
+        for s in slots
+        for a in s.affectations
+        if a.statut_affectation_code == AffectationStatusCode.CONFIRME.value
+    ]
+    assert len(confirmed) == 1
+
+
+def test_sync_slots_unchanged_save_writes_nothing(
+    session, planning_svc, test_planning, test_membre_role
+):
+    slot_svc = planning_svc.slot_svc
+    slot_svc.sync_planning_slots(
+        test_planning.id, _editor_slots(test_planning, test_membre_role, 5)
+    )
+
+    report = slot_svc.sync_planning_slots(
+        test_planning.id, _saved_payload(session, test_planning.id)
+    )
+
+    writes = (
+        report.slots_inserted,
+        report.slots_updated,
+        report.slots_deleted,
+        report.affectations_inserted,
+        report.affectations_updated,
+        report.affectations_deleted,
+    )
+    assert writes == (0, 0, 0, 0, 0, 0)
+
+
+def test_sync_slots_validates_before_writing(
+    session, planning_svc, test_planning, test_slot, test_membre_role
+):
+    payload = _editor_slots(test_planning, test_membre_role, 3)
+    payload[-1]["date_fin"] = test_planning.activite.date_fin + timedelta(hours=1)
+
+    with pytest.raises(AppException) as exc:
+        planning_svc.update_full_planning(
+            test_planning.id, PlanningFullUpdate(slots=payload)
+        )
+
+    assert exc.value.code == ErrorRegistry.SLOT_OUT_OF_BOUNDS.code
+    session.expire_all()
+    slot_ids = session.exec(
+        select(Slot.id).where(Slot.planning_id == test_planning.id)
+    ).all()
+    assert slot_ids == [test_slot.id]
+    assert (
+        session.exec(
+            select(Affectation).where(Affectation.slot_id == test_slot.id)
+        ).all()
+        == []
+    )
+
+
+def test_sync_slots_rejects_member_without_role(
+    session, planning_svc, test_planning, test_membre_role
+):
+    payload = _editor_slots(test_planning, test_membre_role, 2)
+    payload[1]["affectations"][0]["role_code"] = "ROLE_NON_DETENU"
+
+    with pytest.raises(AppException) as exc:
+        planning_svc.slot_svc.sync_planning_slots(test_planning.id, payload)
+
+    assert exc.value.code == ErrorRegistry.ASGN_MEMBER_MISSING_ROLE.code
+    session.expire_all()
+    assert (
+        session.exec(select(Slot).where(Slot.planning_id == test_planning.id)).all()
+        == []
+    )
@@ -1,4 +1,6 @@
-from typing import Any
+import base64
+from datetime import datetime
+from typing import Any, Tuple
 
 
 def extract_field(data: Any, field: str, default: Any = None) -> Any:
@@ -8,4 +10,19 @@ def extract_field(data: Any, field: str, default: Any = None) -> Any:
     return getattr(data, field, default)
 
 
-__all__ = ["extract_field"]
+def encode_cursor(position: datetime, row_id: str) -> str:
+    """Encode une position keyset (date, id) en curseur opaque."""
+    raw = f"{position.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Décode un curseur produit par encode_cursor (ValueError si invalide)."""
+    try:
+        position, row_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+        return datetime.fromisoformat(position), row_id
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Curseur invalide : {cursor}") from e
+
+
+__all__ = ["extract_field", "encode_cursor", "decode_cursor"]
@@ -13,3 +13,10 @@ export interface PaginatedResponse<T> {
   offset: number
   data: T[]
 }
+
+/** Page keyset : `next_cursor` est absent (null) sur la dernière page. */
+export interface CursorPage<T> {
+  data: T[]
+  next_cursor?: string | null
+  limit: number
+}
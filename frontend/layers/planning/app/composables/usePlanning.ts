@@ -1,11 +1,13 @@
 import { ref, computed, watch } from 'vue'
 import type { EnhancedApiError } from '~~/layers/base/types/api'
+import type { CursorPage } from '~~/layers/base/types/shared'
 import type {
   CampusFilterParams,
   MinistereColor,
   PlanningEvent,
   PlanningFullRead,
   PlanningViewPerspective,
+  PlanningWindowQuery,
 } from '../types/planning.types'
 import { getMinistereColor } from '../types/planning.types'
 import { PlanningRepository } from '../repositories/PlanningRepository'
@@ -16,6 +18,9 @@ import type { MinistereSimple } from '~~/layers/base/types/ministere'
 import { useAuthStore } from '~~/layers/auth/app/stores/useAuthStore'
 import { useUIStore } from '~~/layers/base/app/stores/useUiStore'
 
+/** Une liste paginée à parcourir : retourne la page suivant `cursor`. */
+type PageSource = (cursor?: string) => Promise<CursorPage<PlanningFullRead>>
+
 export const usePlanning = () => {
   const authStore = useAuthStore()
   const uiStore = useUIStore()
@@ -34,6 +39,14 @@ export const usePlanning = () => {
   const isLoading = ref(false)
   const error = ref<string | null>(null)
 
+  /** Fenêtre visible du calendrier — rien n'est chargé tant qu'elle est inconnue. */
+  const range = ref<Omit<PlanningWindowQuery, 'cursor'> | null>(null)
+  /** Curseur de la page suivante, par source encore incomplète. */
+  const nextCursors = ref<Map<PageSource, string>>(new Map())
+  const hasMore = computed<boolean>(() => nextCursors.value.size > 0)
+  /** Numéro du chargement courant : une réponse plus ancienne est ignorée. */
+  let loadSeq = 0
+
   // -----------------------------------------------------------------------
   // Dérivés du profil
   // -----------------------------------------------------------------------
@@ -137,47 +150,93 @@ export const usePlanning = () => {
   }
 
   // -----------------------------------------------------------------------
-  // Chargement principal — déclenché par perspective + ministère actif
+  // Sources paginées de la perspective active, bornées à la fenêtre visible
+  // -----------------------------------------------------------------------
+
+  function currentSources(period: Omit<PlanningWindowQuery, 'cursor'>): PageSource[] {
+    const campusId = uiStore.selectedCampusId || undefined
+
+    if (perspective.value === 'PERSONAL') {
+      return [(cursor) => planningRepo.listMyCalendar({ ...period, cursor }, campusId)]
+    }
+    if (perspective.value === 'MINISTERE') {
+      // Aucun ministère actif → union de tous les ministères de l'utilisateur
+      const ids = activeMinistereId.value ? [activeMinistereId.value] : ministereIds.value
+      return ids.map(
+        (id): PageSource =>
+          (cursor) =>
+            planningRepo.listByMinistere(id, { ...period, cursor }, campusId),
+      )
+    }
+    // CAMPUS — utilise le campus sélectionné dans la navbar
+    const selected = uiStore.selectedCampusId
+    if (!selected) return []
+    return [(cursor) => planningRepo.listByCampus(selected, { ...period, cursor })]
+  }
+
+  /** Charge une page de chaque source et retient les curseurs suivants. */
+  async function fetchPages(
+    sources: [PageSource, string | undefined][],
+  ): Promise<{ plannings: PlanningFullRead[]; cursors: Map<PageSource, string> }> {
+    const pages = await Promise.all(sources.map(([source, cursor]) => source(cursor)))
+    const cursors = new Map<PageSource, string>()
+    pages.forEach((page, i) => {
+      if (page.next_cursor) cursors.set(sources[i]![0], page.next_cursor)
+    })
+    return { plannings: pages.flatMap((page) => page.data), cursors }
+  }
+
+  // -----------------------------------------------------------------------
+  // Chargement principal — déclenché par fenêtre, perspective, ministère actif
   // -----------------------------------------------------------------------
 
   async function refresh(): Promise<void> {
     if (!authStore.isAuthenticated) return
     if (!authStore.currentUser?.membreId) return
-    if (isLoading.value) return
+    if (!range.value) return
+    const seq = ++loadSeq
     isLoading.value = true
     error.value = null
 
     try {
       await ensureProfile()
 
-      const campusId = uiStore.selectedCampusId || undefined
-
-      if (perspective.value === 'PERSONAL') {
-        rawPlannings.value = await planningRepo.listMyCalendar(campusId)
-      } else if (perspective.value === 'MINISTERE') {
-        if (activeMinistereId.value) {
-          rawPlannings.value = await planningRepo.listByMinistere(activeMinistereId.value, campusId)
-        } else {
-          // Aucun ministère actif → union de tous les ministères de l'utilisateur
-          const results = await Promise.all(
-            ministereIds.value.map((id) => planningRepo.listByMinistere(id, campusId)),
-          )
-          rawPlannings.value = deduplicatePlannings(results.flat())
-        }
-      } else {
-        // CAMPUS — utilise le campus sélectionné dans la navbar
-        if (!uiStore.selectedCampusId) {
-          error.value = 'Aucun campus sélectionné.'
-          rawPlannings.value = []
-          return
-        }
-        rawPlannings.value = await planningRepo.listByCampus(uiStore.selectedCampusId)
+      if (perspective.value === 'CAMPUS' && !uiStore.selectedCampusId) {
+        error.value = 'Aucun campus sélectionné.'
+        rawPlannings.value = []
+        nextCursors.value = new Map()
+        return
       }
+      const sources = currentSources(range.value)
+      const { plannings, cursors } = await fetchPages(sources.map((s) => [s, undefined]))
+      if (seq !== loadSeq) return
+      rawPlannings.value = deduplicatePlannings(plannings)
+      nextCursors.value = cursors
     } catch (e) {
+      if (seq !== loadSeq) return
       error.value = e instanceof Error ? e.message : 'Erreur lors du chargement du planning'
       notifyError(e as EnhancedApiError)
     } finally {
-      isLoading.value = false
+      if (seq === loadSeq) isLoading.value = false
+    }
+  }
+
+  /** Page suivante de chaque source incomplète, ajoutée aux plannings affichés. */
+  async function loadMore(): Promise<void> {
+    if (!hasMore.value || isLoading.value) return
+    const seq = ++loadSeq
+    isLoading.value = true
+
+    try {
+      const { plannings, cursors } = await fetchPages([...nextCursors.value.entries()])
+      if (seq !== loadSeq) return
+      rawPlannings.value = deduplicatePlannings([...rawPlannings.value, ...plannings])
+      nextCursors.value = cursors
+    } catch (e) {
+      if (seq !== loadSeq) return
+      notifyError(e as EnhancedApiError)
+    } finally {
+      if (seq === loadSeq) isLoading.value = false
     }
   }
 
@@ -193,6 +252,12 @@ export const usePlanning = () => {
     activeMinistereId.value = id
   }
 
+  /** Fenêtre visible du calendrier (datesSet FullCalendar) — recharge si elle change. */
+  function setRange(from: string, to: string): void {
+    if (range.value?.from === from && range.value?.to === to) return
+    range.value = { from, to }
+  }
+
   /**
    * Mise à jour optimiste d'un planning en place (après PATCH status ou edit).
    * Évite un refetch complet et le clignotement du calendrier.
@@ -213,8 +278,8 @@ export const usePlanning = () => {
     rawPlannings.value = rawPlannings.value.filter((p) => p.id !== id)
   }
 
-  // Auto-refresh when perspective, active ministère or selected campus changes
-  watch([perspective, activeMinistereId, () => uiStore.selectedCampusId], () => {
+  // Auto-refresh when the visible range, perspective, active ministère or selected campus changes
+  watch([range, perspective, activeMinistereId, () => uiStore.selectedCampusId], () => {
     refresh()
   })
 
@@ -229,6 +294,8 @@ export const usePlanning = () => {
     isLoading,
     error,
     rawPlannings,
+    range,
+    hasMore,
 
     // Dérivés
     ministeres,
@@ -244,7 +311,9 @@ export const usePlanning = () => {
     // Actions
     setView,
     setMinistere,
+    setRange,
     refresh,
+    loadMore,
     patchLocalPlanning,
     removeLocalPlanning,
   }
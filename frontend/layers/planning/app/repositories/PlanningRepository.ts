@@ -1,9 +1,8 @@
 import { BaseRepository } from '~~/layers/base/app/repositories/BaseRepository'
-import type { PaginatedResponse } from '~~/layers/base/types/shared'
+import type { CursorPage, PaginatedResponse } from '~~/layers/base/types/shared'
 import type { MinistereSimple } from '~~/layers/base/types/ministere'
 import type {
   ApplyTemplateResult,
-  CampusFilterParams,
   CampusTeamRead,
   GenerateSeriesForm,
   GenerateSeriesResponse,
@@ -18,11 +17,15 @@ import type {
   PlanningTemplateListItem,
   PlanningTemplateRead,
   PlanningTemplateReadFull,
+  PlanningWindowQuery,
   RoleCompetenceRead,
   SaveAsTemplateRequest,
   SeriesPreviewResponse,
 } from '../types/planning.types'
 
+/** Taille de page maximale acceptée par les listes de plannings (backend : le=200). */
+const PLANNING_PAGE_SIZE = 200
+
 export class PlanningRepository extends BaseRepository {
   private readonly endpoint = '/plannings'
 
@@ -37,6 +40,21 @@ export class PlanningRepository extends BaseRepository {
     return (data as unknown as { data: T }).data
   }
 
+  /**
+   * Une page keyset d'une liste de plannings bornée à la fenêtre visible.
+   * L'appelant suit `next_cursor` à la demande (bouton « charger plus »).
+   */
+  private async listPage(
+    url: string,
+    period: PlanningWindowQuery,
+    query?: Record<string, unknown>,
+  ): Promise<CursorPage<PlanningFullRead>> {
+    const { data } = await this.apiRequest<CursorPage<PlanningFullRead>>(url, {
+      query: { ...query, ...period, limit: PLANNING_PAGE_SIZE },
+    })
+    return data as unknown as CursorPage<PlanningFullRead>
+  }
+
   // -----------------------------------------------------------------------
   // Lecture
   // -----------------------------------------------------------------------
@@ -45,22 +63,34 @@ export class PlanningRepository extends BaseRepository {
     return this.unwrap<PlanningFullRead>(`${this.endpoint}/${id}/full`)
   }
 
-  async listByMinistere(ministereId: string, campusId?: string): Promise<PlanningFullRead[]> {
-    return this.unwrap<PlanningFullRead[]>(`${this.endpoint}/by-ministere/${ministereId}`, {
-      query: campusId ? { campus_id: campusId } : undefined,
-    })
+  async listByMinistere(
+    ministereId: string,
+    period: PlanningWindowQuery,
+    campusId?: string,
+  ): Promise<CursorPage<PlanningFullRead>> {
+    return this.listPage(
+      `${this.endpoint}/by-ministere/${ministereId}`,
+      period,
+      campusId ? { campus_id: campusId } : undefined,
+    )
   }
 
-  async listMyCalendar(campusId?: string): Promise<PlanningFullRead[]> {
-    return this.unwrap<PlanningFullRead[]>(`${this.endpoint}/my/calendar`, {
-      query: campusId ? { campus_id: campusId } : undefined,
-    })
+  async listMyCalendar(
+    period: PlanningWindowQuery,
+    campusId?: string,
+  ): Promise<CursorPage<PlanningFullRead>> {
+    return this.listPage(
+      `${this.endpoint}/my/calendar`,
+      period,
+      campusId ? { campus_id: campusId } : undefined,
+    )
   }
 
-  async listByCampus(campusId: string, filters?: CampusFilterParams): Promise<PlanningFullRead[]> {
-    return this.unwrap<PlanningFullRead[]>(`${this.endpoint}/by-campus/${campusId}`, {
-      query: filters as Record<string, unknown>,
-    })
+  async listByCampus(
+    campusId: string,
+    period: PlanningWindowQuery,
+  ): Promise<CursorPage<PlanningFullRead>> {
+    return this.listPage(`${this.endpoint}/by-campus/${campusId}`, period)
   }
 
   // -----------------------------------------------------------------------
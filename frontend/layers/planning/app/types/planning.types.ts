@@ -245,6 +245,15 @@ export interface PlanningFullUpdate {
   slots?: SlotFullUpdate[]
 }
 
+// --- Listes paginées de plannings (my/calendar, by-ministere, by-campus) ---
+
+/** Fenêtre visible du calendrier (dates locales ISO, `to` exclusive) + page keyset. */
+export interface PlanningWindowQuery {
+  from: string
+  to: string
+  cursor?: string
+}
+
 // --- Agenda personnel (GET /plannings/my) ---
 
 export interface CampusFilterParams {
@@ -488,6 +497,7 @@ export interface GenerateSeriesResponse {
   serie_id: string
   total: number
   plannings: PlanningSerieItem[]
+  conflits: SeriesConflitDate[]
 }
 
 /** Types d'activité disponibles */